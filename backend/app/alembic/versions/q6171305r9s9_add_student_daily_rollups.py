@@ -0,0 +1,82 @@
+"""Add student_daily_rollups table for class analytics
+
+Revision ID: q6171305r9s9
+Revises: p5060294q8r8
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "q6171305r9s9"
+down_revision = "p5060294q8r8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "student_daily_rollups",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column(
+            "student_id",
+            sa.Uuid(),
+            sa.ForeignKey("students.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("activity_type", sa.String(100), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("scored_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("timed_count", sa.Integer(), nullable=False),
+        sa.Column("time_spent_minutes_sum", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "student_id", "day", "activity_type", name="uq_student_daily_rollup"
+        ),
+    )
+    op.create_index(
+        "ix_student_daily_rollups_student_id",
+        "student_daily_rollups",
+        ["student_id"],
+    )
+
+    # Backfill from existing completed submissions; from here on the rollups
+    # are maintained by the application on every flush
+    op.execute(
+        """
+        INSERT INTO student_daily_rollups (
+            id, student_id, day, activity_type, completed_count, scored_count,
+            score_sum, timed_count, time_spent_minutes_sum, updated_at
+        )
+        SELECT
+            gen_random_uuid(),
+            s.student_id,
+            s.completed_at::date,
+            COALESCE(
+                act.activity_type::text, a.activity_type::text, 'unknown'
+            ),
+            COUNT(*),
+            COUNT(s.score),
+            COALESCE(SUM(s.score), 0),
+            COUNT(*) FILTER (WHERE s.time_spent_minutes > 0),
+            COALESCE(
+                SUM(s.time_spent_minutes) FILTER (WHERE s.time_spent_minutes > 0),
+                0
+            ),
+            NOW()
+        FROM assignment_students s
+        JOIN assignments a ON a.id = s.assignment_id
+        LEFT JOIN activities act ON act.id = a.activity_id
+        WHERE s.status = 'completed' AND s.completed_at IS NOT NULL
+        GROUP BY s.student_id, s.completed_at::date, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_student_daily_rollups_student_id", table_name="student_daily_rollups"
+    )
+    op.drop_table("student_daily_rollups")
@@ -0,0 +1,44 @@
+"""Add benchmark_snapshots table for precomputed benchmarks
+
+Revision ID: r7282416s0t0
+Revises: q6171305r9s9
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "r7282416s0t0"
+down_revision = "q6171305r9s9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled by POST /admin/tasks/refresh-benchmarks; until the first refresh
+    # benchmarks are computed live
+    op.create_table(
+        "benchmark_snapshots",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("scope", sa.String(20), nullable=False),
+        sa.Column("scope_key", sa.String(64), nullable=False),
+        sa.Column("period", sa.String(20), nullable=False),
+        sa.Column("activity_type", sa.String(100), nullable=False),
+        sa.Column("class_id", sa.Uuid(), nullable=True),
+        sa.Column("submission_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("scored_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("class_count", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "idx_benchmark_snapshot_lookup",
+        "benchmark_snapshots",
+        ["scope", "scope_key", "period", "class_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_benchmark_snapshot_lookup", table_name="benchmark_snapshots")
+    op.drop_table("benchmark_snapshots")
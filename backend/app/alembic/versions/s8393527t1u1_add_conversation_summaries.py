@@ -0,0 +1,91 @@
+"""Add conversation_summaries table for the message inbox
+
+Revision ID: s8393527t1u1
+Revises: r7282416s0t0
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "s8393527t1u1"
+down_revision = "r7282416s0t0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conversation_summaries",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.Uuid(),
+            sa.ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "partner_id",
+            sa.Uuid(),
+            sa.ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_message_id",
+            sa.Uuid(),
+            sa.ForeignKey("direct_messages.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("last_message_preview", sa.String(100), nullable=False),
+        sa.Column("last_sent_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("unread_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("user_id", "partner_id", name="uq_conversation_summary"),
+    )
+    op.create_index(
+        "ix_conversation_summaries_user_recent",
+        "conversation_summaries",
+        ["user_id", sa.text("last_sent_at DESC"), sa.text("partner_id DESC")],
+    )
+
+    # Backfill both sides of every existing conversation; from here on the
+    # summaries are maintained by the application on every flush
+    op.execute(
+        """
+        INSERT INTO conversation_summaries (
+            id, user_id, partner_id, last_message_id, last_message_preview,
+            last_sent_at, unread_count, updated_at
+        )
+        SELECT
+            gen_random_uuid(),
+            latest.user_id,
+            latest.partner_id,
+            latest.id,
+            LEFT(latest.body, 100),
+            latest.sent_at,
+            (
+                SELECT COUNT(*)
+                FROM direct_messages u
+                WHERE u.recipient_id = latest.user_id
+                  AND u.sender_id = latest.partner_id
+                  AND u.is_read = false
+            ),
+            NOW()
+        FROM (
+            SELECT DISTINCT ON (sides.user_id, sides.partner_id)
+                sides.user_id, sides.partner_id, m.id, m.body, m.sent_at
+            FROM direct_messages m
+            CROSS JOIN LATERAL (
+                VALUES (m.sender_id, m.recipient_id), (m.recipient_id, m.sender_id)
+            ) AS sides (user_id, partner_id)
+            ORDER BY sides.user_id, sides.partner_id, m.sent_at DESC
+        ) AS latest
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_conversation_summaries_user_recent", table_name="conversation_summaries"
+    )
+    op.drop_table("conversation_summaries")
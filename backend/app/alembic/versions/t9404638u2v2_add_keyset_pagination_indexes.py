@@ -0,0 +1,53 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: t9404638u2v2
+Revises: s8393527t1u1
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "t9404638u2v2"
+down_revision = "s8393527t1u1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Supersedes ix_assignments_teacher_created: the id tiebreaker lets a
+    # cursor page start with an index seek
+    op.drop_index("ix_assignments_teacher_created", table_name="assignments")
+    op.create_index(
+        "ix_assignments_teacher_created_id",
+        "assignments",
+        ["teacher_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_assignments_created_id",
+        "assignments",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_report_jobs_teacher_created_id",
+        "report_jobs",
+        ["teacher_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_ai_usage_logs_errors_recent",
+        "ai_usage_logs",
+        [sa.text("timestamp DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("success = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_usage_logs_errors_recent", table_name="ai_usage_logs")
+    op.drop_index("ix_report_jobs_teacher_created_id", table_name="report_jobs")
+    op.drop_index("ix_assignments_created_id", table_name="assignments")
+    op.drop_index("ix_assignments_teacher_created_id", table_name="assignments")
+    op.create_index(
+        "ix_assignments_teacher_created",
+        "assignments",
+        ["teacher_id", sa.text("created_at DESC")],
+    )
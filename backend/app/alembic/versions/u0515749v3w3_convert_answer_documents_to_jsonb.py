@@ -0,0 +1,54 @@
+"""Convert answer and activity documents to JSONB
+
+Revision ID: u0515749v3w3
+Revises: t9404638u2v2
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "u0515749v3w3"
+down_revision = "t9404638u2v2"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs the answer analytics expand server-side
+DOCUMENT_COLUMNS = [
+    ("assignment_students", "answers_json"),
+    ("assignment_students", "progress_json"),
+    ("assignment_student_activities", "response_data"),
+    ("activities", "config_json"),
+    ("assignments", "activity_content"),
+]
+
+
+def upgrade() -> None:
+    # Rewrites the tables; jsonb_each / jsonb_array_elements then read the
+    # stored binary form instead of reparsing text on every row
+    for table, column in DOCUMENT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB "
+            f"USING {column}::jsonb"
+        )
+
+    # Answer analytics only read submissions with a non-empty answers
+    # document; the predicate matches app.core.projections.json_present, so
+    # those scans skip the not-started rows entirely
+    op.create_index(
+        "ix_assignment_students_answered",
+        "assignment_students",
+        ["assignment_id", "status"],
+        postgresql_where=sa.text(
+            "answers_json IS NOT NULL "
+            "AND CAST(answers_json AS TEXT) NOT IN ('null', '{}', '[]')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assignment_students_answered", table_name="assignment_students")
+    for table, column in DOCUMENT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json"
+        )
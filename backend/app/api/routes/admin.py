@@ -88,7 +88,7 @@ from app.services.benchmark_service import get_admin_benchmark_overview
 from app.services.bulk_import import validate_bulk_import
 from app.services.dcs_cache import get_dcs_cache
 from app.services.publisher_service_v2 import get_publisher_service
-from app.services.redis_cache import cache_get, cache_set
+from app.services.redis_cache import cache_get, cache_set, l1_cache_stats
 from app.services.skill_attribution_service import (
     backfill_all_skill_scores,
     recalculate_for_assignment,
@@ -2234,6 +2234,29 @@ def get_cache_stats(
     return cache.stats()
 
 
+@router.get(
+    "/cache/l1-stats",
+    summary="Get in-process L1 cache statistics",
+    description="Returns L1 (per-worker) cache statistics for monitoring. Admin only.",
+)
+@limiter.limit(RateLimits.ADMIN)
+def get_l1_cache_stats(
+    request: Request,
+    _: User = require_role(UserRole.admin),
+) -> dict[str, Any]:
+    """
+    Get statistics for the in-process L1 tier in front of Redis.
+
+    Figures are per worker process (whichever worker served the request).
+
+    Returns:
+    - entries / bytes / max_bytes: Current occupancy and budget
+    - hits / misses / evictions: Counters since startup
+    - hit_rate: Cache hit rate (0.0 to 1.0)
+    """
+    return l1_cache_stats()
+
+
 @router.post(
     "/cache/clear",
     status_code=status.HTTP_204_NO_CONTENT,
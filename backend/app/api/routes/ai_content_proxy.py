@@ -15,12 +15,12 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
 from starlette.requests import Request
 
 from app.api.deps import CurrentUser, require_role
 from app.core.rate_limit import RateLimits, limiter
 from app.models import User, UserRole
+from app.services.asset_cache import cached_asset_response
 from app.services.dcs_ai_content_client import (
     DCSAIContentClient,
     get_dcs_ai_content_client,
@@ -99,10 +99,17 @@ async def stream_ai_content_audio(
     )
 
     try:
-        audio_bytes = await ai_content_client.stream_audio(
-            book_id, content_id, filename
+        return await cached_asset_response(
+            book_id,
+            f"ai-content/{content_id}/audio/{filename}",
+            lambda: ai_content_client.stream_audio(book_id, content_id, filename),
+            media_type="audio/mpeg",
+            headers={
+                "Content-Disposition": f'inline; filename="{filename}"',
+                "Cache-Control": "public, max-age=86400",
+            },
+            if_none_match=request.headers.get("if-none-match"),
         )
-        return _audio_response(audio_bytes, filename)
     except Exception as e:
         logger.error(
             f"Failed to stream AI content audio: content_id={content_id}, "
@@ -115,20 +122,6 @@ async def stream_ai_content_audio(
     )
 
 
-def _audio_response(audio_bytes: bytes, filename: str) -> StreamingResponse:
-    async def audio_stream():
-        yield audio_bytes
-
-    return StreamingResponse(
-        audio_stream(),
-        media_type="audio/mpeg",
-        headers={
-            "Content-Disposition": f'inline; filename="{filename}"',
-            "Cache-Control": "public, max-age=86400",
-        },
-    )
-
-
 # ---------------------------------------------------------------------------
 # Book content CRUD proxy endpoints
 # ---------------------------------------------------------------------------
@@ -97,6 +97,7 @@ from app.services.ai_generation.word_builder_service import (
     WordBuilderError,
     WordBuilderService,
 )
+from app.services.assignment_fanout import fan_out_assignment
 from app.services.dcs_ai import DCSAIServiceClient, get_dcs_ai_client
 from app.services.dcs_ai.exceptions import (
     DCSAIDataAuthError,
@@ -2790,7 +2791,7 @@ async def assign_library_content(
     """
     from datetime import datetime, timezone
 
-    from app.models import ActivityType, Assignment, AssignmentStudent, Class, Student
+    from app.models import ActivityType, Assignment, Class, Student
 
     logger.info(
         f"Assign content requested: content_id={content_id}, user_id={current_user.id}"
@@ -2900,13 +2901,7 @@ async def assign_library_content(
         await db.flush()  # Get assignment ID
 
         # Create AssignmentStudent entries
-        for student in students:
-            assignment_student = AssignmentStudent(
-                assignment_id=assignment.id,
-                student_id=student.id,
-                status="not_started",
-            )
-            db.add(assignment_student)
+        await fan_out_assignment(db, assignment.id, [s.id for s in students])
 
         # Mark content as used
         content.is_used = True
@@ -9,7 +9,7 @@ import io
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from sqlmodel import select
 from starlette.requests import Request
 
@@ -263,11 +263,14 @@ async def get_errors(
     from_date: datetime | None = Query(None, description="Start date (ISO 8601)"),
     to_date: datetime | None = Query(None, description="End date (ISO 8601)"),
     limit: int = Query(100, ge=1, le=1000, description="Max errors to return"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
 ):
     """
     Get recent AI generation errors.
 
-    Requires admin role.
+    Requires admin role. Pass next_cursor back as cursor for older errors.
 
     Returns list of errors with:
         - id: Error log ID
@@ -281,7 +284,14 @@ async def get_errors(
     """
     service = UsageAnalyticsService(session)
     error_rate = await service.get_error_rate(from_date, to_date)
-    errors = await service.get_errors(from_date, to_date, limit)
+    try:
+        errors, next_cursor = await service.get_errors(
+            from_date, to_date, limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
     return {
         "error_statistics": error_rate,
@@ -298,6 +308,7 @@ async def get_errors(
             }
             for error in errors
         ],
+        "next_cursor": next_cursor,
     }
 
 
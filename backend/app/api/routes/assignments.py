@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from typing import Annotated, Any
 
 import jwt
-from fastapi import Depends, Header, HTTPException, Query, Request, status
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
 from fastapi.security import OAuth2PasswordBearer
@@ -21,6 +21,8 @@ from sqlmodel import func, select
 from app.api.deps import AsyncSessionDep, require_role
 from app.core import security
 from app.core.config import settings
+from app.core.pagination import keyset_page, parse_cursor, split_page
+from app.core.projections import without_blobs
 from app.core.rate_limit import RateLimits, limiter
 from app.models import (
     Activity,
@@ -103,10 +105,12 @@ from app.schemas.skill import (
     SkillCategoryPublic,
 )
 from app.services import book_assignment_service, feedback_service
+from app.services.analytics_queries import activity_progress_stats
 from app.services.analytics_service import (
     get_assignment_detailed_results,
     get_student_assignment_answers,
 )
+from app.services.assignment_fanout import fan_out_assignment
 from app.services.book_service_v2 import get_book_service
 from app.services.cache_events import invalidate_for_event
 from app.services.dream_storage_client import (
@@ -115,8 +119,8 @@ from app.services.dream_storage_client import (
     DreamStorageNotFoundError,
     get_dream_storage_client,
 )
-from app.services.redis_cache import cache_get, cache_set
-from app.services.skill_attribution_service import attribute_skill_scores
+from app.services.redis_cache import cache_get, cache_namespace_key, cache_set
+from app.services.submission_events import publish_submission_event
 
 router = APIRouter(prefix="/assignments", tags=["assignments"])
 logger = logging.getLogger(__name__)
@@ -419,6 +423,12 @@ async def list_assignments(
     current_user: User = require_role(UserRole.teacher),
     limit: int = Query(20, ge=1, le=500, description="Number of items to return"),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
+    include_total: bool = Query(
+        False, description="Also count all assignments when paging by cursor"
+    ),
 ) -> AssignmentListPaginatedResponse:
     """
     List all assignments for the current teacher with enriched data.
@@ -427,9 +437,17 @@ async def list_assignments(
     - Book and activity information
     - Student completion statistics
     - Sorted by created_at descending (newest first)
+
+    Pass next_cursor back as cursor to fetch the next page; offset is then
+    ignored and total is only counted when include_total is set.
     """
+    after = parse_cursor(cursor)
+
     # Redis cache (30s TTL) — teacher assignment list
-    cache_key = f"teacher:{current_user.id}:assignments:{limit}:{offset}"
+    cache_key = await cache_namespace_key(
+        f"teacher:{current_user.id}:assignments",
+        f"{limit}:{offset}:{cursor}:{include_total}",
+    )
     cached = await cache_get(cache_key)
     if cached is not None:
         return AssignmentListPaginatedResponse(**cached)
@@ -446,11 +464,13 @@ async def list_assignments(
             detail="Teacher record not found for this user",
         )
 
-    # Count total assignments for this teacher
-    count_result = await session.execute(
-        select(func.count()).where(Assignment.teacher_id == teacher.id)
-    )
-    total = count_result.scalar() or 0
+    # Count total assignments for this teacher (optional when paging by cursor)
+    total = None
+    if after is None or include_total:
+        count_result = await session.execute(
+            select(func.count()).where(Assignment.teacher_id == teacher.id)
+        )
+        total = count_result.scalar() or 0
 
     # SQL aggregation subquery — counts by status in DB instead of Python
     stats_subq = (
@@ -481,20 +501,24 @@ async def list_assignments(
 
     # Get assignments for this teacher with activity info (paginated)
     # Use LEFT JOIN (outerjoin) to include Content Library assignments without activity_id
-    result = await session.execute(
+    query = (
         select(Assignment, Activity, stats_subq)
         .outerjoin(Activity, Assignment.activity_id == Activity.id)
         .outerjoin(stats_subq, Assignment.id == stats_subq.c.assignment_id)
         .options(
             selectinload(Assignment.primary_skill),
             selectinload(Assignment.activity_format),
+            *without_blobs(Assignment, Activity),
         )
         .where(Assignment.teacher_id == teacher.id)
-        .order_by(Assignment.created_at.desc())
-        .offset(offset)
-        .limit(limit)
     )
-    assignments_data = result.all()
+    query = keyset_page(query, Assignment.created_at, Assignment.id, after, limit)
+    if after is None:
+        query = query.offset(offset)
+    result = await session.execute(query)
+    assignments_data, next_cursor = split_page(
+        result.all(), limit, lambda row: (row[0].created_at, row[0].id)
+    )
 
     # Batch-fetch all books in a single DCS call
     book_service = get_book_service()
@@ -593,7 +617,8 @@ async def list_assignments(
         total=total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(assignment_list) < total,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
     )
     await cache_set(cache_key, response.model_dump(), ttl=3600)
     return response
@@ -608,9 +633,16 @@ async def list_assignments(
 @limiter.limit(RateLimits.READ)
 async def list_all_assignments_admin(
     request: Request,
+    response: Response,
     *,
     session: AsyncSessionDep,
     current_user: User = require_role(UserRole.admin, UserRole.supervisor),
+    limit: int | None = Query(
+        None, ge=1, le=500, description="Page size (omit for all assignments)"
+    ),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's X-Next-Cursor"
+    ),
 ) -> list[AssignmentListItem]:
     """
     List all assignments in the system (admin/supervisor) with enriched data.
@@ -620,7 +652,12 @@ async def list_all_assignments_admin(
     - Student completion statistics
     - Teacher information
     - Sorted by created_at descending (newest first)
+
+    With limit set, one page is returned and the X-Next-Cursor response
+    header carries the cursor for the next page (absent on the last page).
     """
+    after = parse_cursor(cursor)
+
     # SQL aggregation subquery for admin view
     stats_subq = (
         select(
@@ -641,15 +678,21 @@ async def list_all_assignments_admin(
     )
 
     # Get all assignments with joins to get activity and teacher info
-    result = await session.execute(
+    query = (
         select(Assignment, Activity, Teacher, User, stats_subq)
         .join(Activity, Assignment.activity_id == Activity.id)
         .join(Teacher, Assignment.teacher_id == Teacher.id)
         .join(User, Teacher.user_id == User.id)
         .outerjoin(stats_subq, Assignment.id == stats_subq.c.assignment_id)
-        .order_by(Assignment.created_at.desc())
+        .options(*without_blobs(Assignment, Activity))
+    )
+    query = keyset_page(query, Assignment.created_at, Assignment.id, after, limit)
+    result = await session.execute(query)
+    assignments_data, next_cursor = split_page(
+        result.all(), limit, lambda row: (row[0].created_at, row[0].id)
     )
-    assignments_data = result.all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     # Get BookService to fetch book data from DCS
     book_service = get_book_service()
@@ -774,6 +817,7 @@ async def get_calendar_assignments(
         .outerjoin(
             activity_count_subq, activity_count_subq.c.assignment_id == Assignment.id
         )
+        .options(*without_blobs(Assignment))
         .where(Assignment.teacher_id == teacher.id)
         .where(
             # Include if due_date, scheduled_publish_date, OR created_at falls in range
@@ -931,6 +975,7 @@ async def create_assignment(
     5. Create AssignmentActivity records for each activity
     6. Create AssignmentStudent records for all target students
     7. Create AssignmentStudentActivity records for each student × activity
+       (deferred to the student's first start when ASSIGNMENT_PROGRESS_LAZY)
 
     **Request Body:**
     - **activity_id**: UUID of single activity (legacy, backward compatible)
@@ -1105,20 +1150,7 @@ async def create_assignment(
         await session.flush()
 
         # Create AssignmentStudent records (no AssignmentStudentActivity for AI content)
-        for student in students:
-            assignment_student = AssignmentStudent(
-                assignment_id=assignment.id,
-                student_id=student.id,
-                status=AssignmentStatus.not_started,
-                score=None,
-                answers_json=None,
-                progress_json=None,
-                started_at=None,
-                completed_at=None,
-                time_spent_minutes=0,
-                last_saved_at=None,
-            )
-            session.add(assignment_student)
+        await fan_out_assignment(session, assignment.id, [s.id for s in students])
 
         await session.commit()
         await session.refresh(assignment)
@@ -1197,49 +1229,14 @@ async def create_assignment(
     session.add(assignment)
     await session.flush()  # Get assignment.id for related records
 
-    # Create AssignmentActivity records for each activity (junction table)
-    for order_index, activity in enumerate(activities):
-        assignment_activity = AssignmentActivity(
-            assignment_id=assignment.id,
-            activity_id=activity.id,
-            order_index=order_index,
-        )
-        session.add(assignment_activity)
-
-    # Create AssignmentStudent records (batch insert, single flush)
-    assignment_students = []
-    for student in students:
-        assignment_student = AssignmentStudent(
-            assignment_id=assignment.id,
-            student_id=student.id,
-            status=AssignmentStatus.not_started,
-            score=None,
-            answers_json=None,
-            progress_json=None,
-            started_at=None,
-            completed_at=None,
-            time_spent_minutes=0,
-            last_saved_at=None,
-        )
-        session.add(assignment_student)
-        assignment_students.append(assignment_student)
-
-    await session.flush()  # Single flush to get all assignment_student.id values
-
-    # Create per-activity progress records (batch)
-    for assignment_student in assignment_students:
-        for activity in activities:
-            activity_progress = AssignmentStudentActivity(
-                assignment_student_id=assignment_student.id,
-                activity_id=activity.id,
-                status=AssignmentStudentActivityStatus.not_started,
-                score=None,
-                max_score=100.0,  # Default max score
-                response_data=None,
-                started_at=None,
-                completed_at=None,
-            )
-            session.add(activity_progress)
+    # Create AssignmentActivity, AssignmentStudent and per-activity progress
+    # records with bulk inserts
+    await fan_out_assignment(
+        session,
+        assignment.id,
+        [s.id for s in students],
+        [a.id for a in activities],
+    )
 
     # Commit transaction
     await session.commit()
@@ -1331,6 +1328,7 @@ async def create_bulk_assignments(
        - Create AssignmentActivity records for each activity
        - Create AssignmentStudent records for all target students
        - Create AssignmentStudentActivity records for each student × activity
+         (unless ASSIGNMENT_PROGRESS_LAZY)
 
     **Request Body:**
     - **date_groups**: List of date groups (required for Time Planning)
@@ -1391,6 +1389,7 @@ async def create_bulk_assignments(
         )
 
     now = datetime.now(UTC)
+    student_ids = [s.id for s in students]
     created_assignments: list[BulkAssignmentCreatedItem] = []
 
     # Create one assignment per date group
@@ -1432,49 +1431,14 @@ async def create_bulk_assignments(
         session.add(assignment)
         await session.flush()  # Get assignment.id
 
-        # Create AssignmentActivity records for each activity
-        for order_index, activity in enumerate(group_activities):
-            assignment_activity = AssignmentActivity(
-                assignment_id=assignment.id,
-                activity_id=activity.id,
-                order_index=order_index,
-            )
-            session.add(assignment_activity)
-
-        # Create AssignmentStudent records (batch insert, single flush)
-        group_assignment_students = []
-        for student in students:
-            assignment_student = AssignmentStudent(
-                assignment_id=assignment.id,
-                student_id=student.id,
-                status=AssignmentStatus.not_started,
-                score=None,
-                answers_json=None,
-                progress_json=None,
-                started_at=None,
-                completed_at=None,
-                time_spent_minutes=0,
-                last_saved_at=None,
-            )
-            session.add(assignment_student)
-            group_assignment_students.append(assignment_student)
-
-        await session.flush()  # Single flush to get all IDs
-
-        # Create per-activity progress records (batch)
-        for assignment_student in group_assignment_students:
-            for activity in group_activities:
-                activity_progress = AssignmentStudentActivity(
-                    assignment_student_id=assignment_student.id,
-                    activity_id=activity.id,
-                    status=AssignmentStudentActivityStatus.not_started,
-                    score=None,
-                    max_score=100.0,
-                    response_data=None,
-                    started_at=None,
-                    completed_at=None,
-                )
-                session.add(activity_progress)
+        # Create activity links, student rows and per-activity progress rows
+        # with bulk inserts; everything commits together below
+        await fan_out_assignment(
+            session,
+            assignment.id,
+            student_ids,
+            [a.id for a in group_activities],
+        )
 
         created_assignments.append(
             BulkAssignmentCreatedItem(
@@ -2286,7 +2250,8 @@ async def start_multi_activity_assignment(
                     )
                 )
             else:
-                # Create new AssignmentStudentActivity record
+                # Create new AssignmentStudentActivity record (its id is
+                # generated client-side; it is written with the commit below)
                 new_progress = AssignmentStudentActivity(
                     assignment_student_id=assignment_student.id,
                     activity_id=activity.id,
@@ -2294,7 +2259,6 @@ async def start_multi_activity_assignment(
                     max_score=100.0,
                 )
                 session.add(new_progress)
-                await session.flush()  # Get the ID
 
                 activity_progress.append(
                     ActivityProgressInfo(
@@ -2827,16 +2791,21 @@ async def save_activity_progress(
                 detail="Failed to save progress",
             )
 
-        # Story 30.12: Attribute skill scores on completion (non-blocking)
+        # Completion is a submission: skill attribution (Story 30.12) and the
+        # skill profile and badge invalidation run in the post-submission
+        # pipeline
         if progress.status == "completed":
-            try:
-                await attribute_skill_scores(assignment_student.id, session)
-                await session.commit()
-            except Exception as e:
-                logger.warning(f"Skill attribution failed (non-blocking): {e}")
-
+            await invalidate_for_event(
+                "assignment_submitted", user_id=str(current_user.id)
+            )
+            await publish_submission_event(
+                getattr(request.app.state, "arq_pool", None),
+                session,
+                assignment_student,
+                current_user.id,
+            )
         # Invalidate student assignment cache when status changes
-        if assignment_student.status != old_status:
+        elif assignment_student.status != old_status:
             await invalidate_for_event(
                 "assignment_progress_updated", user_id=str(current_user.id)
             )
@@ -3158,6 +3127,25 @@ async def submit_multi_activity_assignment(
             detail="Assignment not started yet",
         )
 
+    if not is_content_library:
+        # Progress rows may be created lazily; an activity without one was
+        # never opened and is submitted as not started (scoring 0)
+        result = await session.execute(
+            select(AssignmentActivity.activity_id)
+            .where(AssignmentActivity.assignment_id == assignment_id)
+            .order_by(AssignmentActivity.order_index)
+        )
+        opened = {ap.activity_id for ap in assignment_student.activity_progress}
+        for activity_id in result.scalars():
+            if activity_id not in opened:
+                assignment_student.activity_progress.append(
+                    AssignmentStudentActivity(
+                        activity_id=activity_id,
+                        status=AssignmentStudentActivityStatus.not_started,
+                        max_score=100.0,
+                    )
+                )
+
     # Check if all activities are completed
     if is_content_library:
         # Content Library: check if we have activity_states OR saved progress
@@ -3311,12 +3299,16 @@ async def submit_multi_activity_assignment(
             detail="Failed to submit assignment",
         )
 
-    # Story 30.12: Attribute skill scores (non-blocking)
-    try:
-        await attribute_skill_scores(assignment_student.id, session)
-        await session.commit()
-    except Exception as e:
-        logger.warning(f"Skill attribution failed (non-blocking): {e}")
+    await invalidate_for_event("assignment_submitted", user_id=str(current_user.id))
+
+    # Story 30.12: Skill attribution and the skill profile and badge
+    # invalidation run in the post-submission pipeline
+    await publish_submission_event(
+        getattr(request.app.state, "arq_pool", None),
+        session,
+        assignment_student,
+        current_user.id,
+    )
 
     # Calculate total and completed activities count
     if is_content_library:
@@ -3332,8 +3324,6 @@ async def submit_multi_activity_assignment(
             if ap.status == AssignmentStudentActivityStatus.completed
         )
 
-    await invalidate_for_event("assignment_submitted", user_id=str(current_user.id))
-
     return MultiActivitySubmitResponse(
         success=True,
         message="Assignment submitted successfully",
@@ -3571,15 +3561,17 @@ async def submit_assignment(
             detail="Failed to save submission",
         )
 
-    # Story 30.12: Attribute skill scores (non-blocking)
-    try:
-        await attribute_skill_scores(assignment_student.id, session)
-        await session.commit()
-    except Exception as e:
-        logger.warning(f"Skill attribution failed (non-blocking): {e}")
-
     await invalidate_for_event("assignment_submitted", user_id=str(current_user.id))
 
+    # Story 30.12: Skill attribution and the skill profile and badge
+    # invalidation run in the post-submission pipeline
+    await publish_submission_event(
+        getattr(request.app.state, "arq_pool", None),
+        session,
+        assignment_student,
+        current_user.id,
+    )
+
     return AssignmentSubmissionResponse(
         success=True,
         message="Assignment submitted successfully",
@@ -4062,61 +4054,36 @@ async def get_multi_activity_analytics(
             detail="No activities found for this assignment",
         )
 
-    # Get total students count
+    # Count assigned and submitted (completed) students
     result = await session.execute(
-        select(AssignmentStudent).where(
-            AssignmentStudent.assignment_id == assignment_id
-        )
-    )
-    all_assignment_students = result.scalars().all()
-    total_students = len(all_assignment_students)
-
-    # Count submitted (completed) students
-    submitted_count = sum(
-        1
-        for _astu in all_assignment_students
-        if astu.status == AssignmentStatus.completed
+        select(
+            func.count(AssignmentStudent.id),
+            func.count(AssignmentStudent.id).filter(
+                AssignmentStudent.status == AssignmentStatus.completed
+            ),
+        ).where(AssignmentStudent.assignment_id == assignment_id)
     )
+    total_students, submitted_count = result.one()
+
+    # Per-activity completion and average score, grouped in one query
+    progress_stats = await activity_progress_stats(session, assignment_id)
 
     # Build per-activity analytics
     activities_analytics: list[ActivityAnalyticsItem] = []
 
     for _aa, activity in assignment_activities:
-        # Get all student progress for this activity
-        result = await session.execute(
-            select(AssignmentStudentActivity)
-            .join(
-                AssignmentStudent,
-                AssignmentStudentActivity.assignment_student_id == AssignmentStudent.id,
-            )
-            .where(
-                AssignmentStudent.assignment_id == assignment_id,
-                AssignmentStudentActivity.activity_id == activity.id,
-            )
-        )
-        activity_progress_records = result.scalars().all()
-
-        # Calculate completion stats
-        completed_records = [
-            ap
-            for ap in activity_progress_records
-            if ap.status == AssignmentStudentActivityStatus.completed
-        ]
-        completed_count = len(completed_records)
-        total_assigned_count = (
-            len(activity_progress_records)
-            if activity_progress_records
-            else total_students
-        )
+        stats = progress_stats.get(activity.id)
+        completed_count = stats.completed if stats else 0
+        # Every assigned student has every activity, started or not
+        total_assigned_count = total_students
 
         # Calculate completion rate
         completion_rate = (
             completed_count / total_assigned_count if total_assigned_count > 0 else 0.0
         )
 
-        # Calculate class average (only from completed activities with scores)
-        scores = [ap.score for ap in completed_records if ap.score is not None]
-        class_average_score = sum(scores) / len(scores) if scores else None
+        # Class average (only from completed activities with scores)
+        class_average_score = stats.avg_score if stats else None
 
         activities_analytics.append(
             ActivityAnalyticsItem(
@@ -4152,25 +4119,42 @@ async def get_multi_activity_analytics(
                 detail="Activity not found in this assignment",
             )
 
-        # Get all student scores for this activity
+        # Get all student scores for this activity; students who have not
+        # opened it yet have no progress row
         result = await session.execute(
-            select(AssignmentStudentActivity, AssignmentStudent, Student, User)
-            .join(
-                AssignmentStudent,
-                AssignmentStudentActivity.assignment_student_id == AssignmentStudent.id,
+            select(AssignmentStudentActivity, Student, User)
+            .select_from(AssignmentStudent)
+            .outerjoin(
+                AssignmentStudentActivity,
+                (
+                    AssignmentStudentActivity.assignment_student_id
+                    == AssignmentStudent.id
+                )
+                & (AssignmentStudentActivity.activity_id == expand_activity_id),
             )
             .join(Student, AssignmentStudent.student_id == Student.id)
             .join(User, Student.user_id == User.id)
-            .where(
-                AssignmentStudent.assignment_id == assignment_id,
-                AssignmentStudentActivity.activity_id == expand_activity_id,
-            )
+            .where(AssignmentStudent.assignment_id == assignment_id)
             .order_by(User.full_name)
         )
         student_records = result.all()
 
         expanded_students = []
-        for ap, _astu, student, user in student_records:
+        for ap, student, user in student_records:
+            if ap is None:
+                expanded_students.append(
+                    StudentActivityScore(
+                        student_id=student.id,
+                        student_name=user.full_name or user.username or "Unknown",
+                        status=AssignmentStudentActivityStatus.not_started.value,
+                        score=None,
+                        max_score=100.0,
+                        time_spent_seconds=0,
+                        completed_at=None,
+                    )
+                )
+                continue
+
             # Calculate time spent in seconds (using completed_at - started_at if available)
             time_spent_seconds = 0
             if ap.started_at and ap.completed_at:
@@ -4515,20 +4499,18 @@ async def get_student_assignment_result(
 
     assignment_student, assignment = assignment_data
 
-    # Get per-activity progress with activity details
+    # Get every activity of the assignment with the student's progress on it
+    # (no progress row means the student never opened that activity)
     result = await session.execute(
-        select(AssignmentStudentActivity, Activity)
-        .join(Activity, AssignmentStudentActivity.activity_id == Activity.id)
-        .join(
-            AssignmentActivity,
-            (
-                (AssignmentActivity.assignment_id == assignment_id)
-                & (AssignmentActivity.activity_id == Activity.id)
-            ),
-        )
-        .where(
-            AssignmentStudentActivity.assignment_student_id == assignment_student.id,
+        select(Activity, AssignmentStudentActivity)
+        .select_from(AssignmentActivity)
+        .join(Activity, AssignmentActivity.activity_id == Activity.id)
+        .outerjoin(
+            AssignmentStudentActivity,
+            (AssignmentStudentActivity.assignment_student_id == assignment_student.id)
+            & (AssignmentStudentActivity.activity_id == Activity.id),
         )
+        .where(AssignmentActivity.assignment_id == assignment_id)
         .order_by(AssignmentActivity.order_index)
     )
     activity_records = result.all()
@@ -4537,7 +4519,23 @@ async def get_student_assignment_result(
     activity_scores: list[ActivityScoreItem] = []
     completed_count = 0
 
-    for ap, activity in activity_records:
+    for activity, ap in activity_records:
+        if ap is None:
+            activity_scores.append(
+                ActivityScoreItem(
+                    activity_id=activity.id,
+                    activity_title=activity.title,
+                    activity_type=activity.activity_type.value,
+                    score=None,
+                    max_score=100.0,
+                    status=AssignmentStudentActivityStatus.not_started.value,
+                    review_items=None,
+                    config_json=activity.config_json,
+                    response_data=None,
+                )
+            )
+            continue
+
         if ap.status == AssignmentStudentActivityStatus.completed:
             completed_count += 1
 
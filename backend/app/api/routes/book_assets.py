@@ -8,7 +8,7 @@ import logging
 import mimetypes
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
@@ -22,6 +22,7 @@ from app.models import (
     UserRole,
 )
 from app.schemas.book import BookPublic
+from app.services.asset_cache import cached_asset_response
 from app.services.book_service_v2 import get_book_service
 from app.services.dream_storage_client import (
     DreamStorageError,
@@ -244,6 +245,7 @@ async def get_book_asset_presigned_url(
     summary="Serve book asset (proxy fallback)",
 )
 async def serve_book_asset(
+    request: Request,
     book_id: Annotated[int, Path(description="Book ID")],
     asset_path: Annotated[
         str,
@@ -260,10 +262,17 @@ async def serve_book_asset(
 
     client = await get_dream_storage_client()
     try:
-        asset_data = await client.download_asset(
-            publisher_id=book.publisher_id,
-            book_name=book.name,
-            asset_path=asset_path,
+        return await cached_asset_response(
+            book_id,
+            asset_path,
+            lambda: client.download_asset(
+                publisher_id=book.publisher_id,
+                book_name=book.name,
+                asset_path=asset_path,
+            ),
+            media_type=_get_content_type_from_path(asset_path),
+            headers={"Cache-Control": "max-age=86400"},
+            if_none_match=request.headers.get("if-none-match"),
         )
     except DreamStorageNotFoundError:
         raise HTTPException(
@@ -276,13 +285,6 @@ async def serve_book_asset(
             detail="Failed to fetch asset from storage",
         )
 
-    content_type = _get_content_type_from_path(asset_path)
-    return Response(
-        content=asset_data,
-        media_type=content_type,
-        headers={"Cache-Control": "max-age=86400"},
-    )
-
 
 @router.get(
     "/{book_id}/page-image/{page_number}",
@@ -291,6 +293,7 @@ async def serve_book_asset(
     description="Convenience endpoint for serving page images",
 )
 async def serve_page_image(
+    request: Request,
     book_id: Annotated[int, Path(description="Book ID")],
     page_number: Annotated[int, Path(description="Page number", ge=1)],
     current_user: Annotated[User, Depends(get_current_user)],
@@ -311,4 +314,4 @@ async def serve_page_image(
     asset_path = f"images/M1/{page_number}.png"
 
     # Delegate to generic asset serving endpoint
-    return await serve_book_asset(book_id, asset_path, current_user, db)
+    return await serve_book_asset(request, book_id, asset_path, current_user, db)
@@ -5,13 +5,14 @@ import re
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import func, select
 from starlette.requests import Request
 
 from app.api.deps import AsyncSessionDep, require_role
+from app.core.http_cache import conditional_get
 from app.core.rate_limit import RateLimits, limiter
 from app.models import (
     Activity,
@@ -46,10 +47,11 @@ from app.schemas.book import (
     VideoMarker,
 )
 from app.services import book_assignment_service
+from app.services.asset_cache import cached_asset_response
 from app.services.book_service_v2 import get_book_service
 from app.services.config_parser import parse_book_config, parse_video_sections
 from app.services.dream_storage_client import get_dream_storage_client
-from app.services.redis_cache import cache_get, cache_set
+from app.services.redis_cache import cache_get, cache_namespace_key, cache_set
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -98,8 +100,6 @@ async def get_book_cover(request: Request, book_id: int) -> Any:
     Raises:
         HTTPException: 404 if cover not found
     """
-    from fastapi.responses import Response
-
     try:
         book_service = get_book_service()
         book = await book_service.get_book(book_id)
@@ -113,15 +113,17 @@ async def get_book_cover(request: Request, book_id: int) -> Any:
 
         # Proxy cover image through LMS (avoid redirect which breaks CORS)
         try:
-            cover_data = await client.download_asset(
-                publisher_id=book.publisher_id,
-                book_name=book.name,
-                asset_path="images/book_cover.png",
-            )
-            return Response(
-                content=cover_data,
+            return await cached_asset_response(
+                book_id,
+                "images/book_cover.png",
+                lambda: client.download_asset(
+                    publisher_id=book.publisher_id,
+                    book_name=book.name,
+                    asset_path="images/book_cover.png",
+                ),
                 media_type="image/png",
                 headers={"Cache-Control": "public, max-age=3600"},
+                if_none_match=request.headers.get("if-none-match"),
             )
         except Exception as e:
             logger.error(f"Error fetching cover for book {book_id} from DCS: {e}")
@@ -198,6 +200,7 @@ async def _verify_book_exists(book_id: int) -> BookPublic:
 @router.get(
     "",
     response_model=BookListResponse,
+    dependencies=[Depends(conditional_get())],
     summary="List accessible books",
     description="Returns books accessible to the authenticated user from DCS (admin/supervisor/publisher see all, teacher sees assigned books).",
 )
@@ -231,7 +234,10 @@ async def list_books(
     # Redis cache (30s TTL) — book assignments can change frequently
     search_key = search or ""
     type_key = activity_type or ""
-    cache_key = f"books:{current_user.role.value}:{current_user.id}:{skip}:{limit}:{search_key}:{type_key}"
+    cache_key = await cache_namespace_key(
+        "books",
+        f"{current_user.role.value}:{current_user.id}:{skip}:{limit}:{search_key}:{type_key}",
+    )
     cached = await cache_get(cache_key)
     if cached is not None:
         return BookListResponse(**cached)
@@ -698,6 +704,7 @@ def _extract_all_pages_from_config(
 @router.get(
     "/{book_id}/pages",
     response_model=BookPagesResponse,
+    dependencies=[Depends(conditional_get())],
     summary="Get book pages with activities",
     description="Returns pages grouped by module with activity counts and thumbnail URLs.",
 )
@@ -913,6 +920,7 @@ def _extract_activity_coords(config_json: dict) -> ActivityCoords | None:
 @router.get(
     "/{book_id}/pages/detail",
     response_model=BookPagesDetailResponse,
+    dependencies=[Depends(conditional_get())],
     summary="Get detailed book pages with activity markers",
     description="Returns pages grouped by module with full-size images and activity coordinates for the page viewer.",
 )
@@ -1084,6 +1092,7 @@ SUPPORTED_ACTIVITY_TYPES = {
 @router.get(
     "/{book_id}/structure",
     response_model=BookStructureResponse,
+    dependencies=[Depends(conditional_get())],
     summary="Get book structure with modules and pages for activity selection",
     description="Returns book structure with modules and pages including activity IDs for bulk selection in assignment creation.",
 )
@@ -23,7 +23,7 @@ from app.schemas.message import (
 )
 from app.services import message_service
 from app.services.cache_events import invalidate_for_event
-from app.services.redis_cache import cache_get, cache_invalidate_pattern, cache_set
+from app.services.redis_cache import cache_get, cache_namespace_key, cache_set
 
 logger = logging.getLogger(__name__)
 
@@ -223,12 +223,16 @@ async def get_conversations(
         20, ge=1, le=100, description="Number of conversations to return"
     ),
     offset: int = Query(0, ge=0, description="Number of conversations to skip"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
 ) -> ConversationListResponse:
     """
     Get list of conversations for the current user.
 
     Returns conversations grouped by participant with last message preview
-    and unread count.
+    and unread count. Pass next_cursor back as cursor to fetch the next page;
+    offset is still accepted but ignored when a cursor is given.
     """
     if current_user.role not in MESSAGING_ROLES:
         raise HTTPException(
@@ -237,25 +241,39 @@ async def get_conversations(
         )
 
     # Redis cache (20s TTL) — conversations list
-    cache_key = f"user:{current_user.id}:conversations:{limit}:{offset}"
+    cache_key = await cache_namespace_key(
+        f"user:{current_user.id}:conversations", f"{limit}:{offset}:{cursor}"
+    )
     cached = await cache_get(cache_key)
     if cached is not None:
         return ConversationListResponse(**cached)
 
-    conversations, total, total_unread = await message_service.get_conversations(
-        db=db,
-        user_id=current_user.id,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        (
+            conversations,
+            total,
+            total_unread,
+            next_cursor,
+        ) = await message_service.get_conversations(
+            db=db,
+            user_id=current_user.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
     result = ConversationListResponse(
         conversations=conversations,
         total=total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(conversations) < total,
+        has_more=next_cursor is not None,
         total_unread=total_unread,
+        next_cursor=next_cursor,
     )
     await cache_set(cache_key, result.model_dump(), ttl=3600)
     return result
@@ -289,8 +307,7 @@ async def get_message_thread(
     )
 
     # Invalidate conversations and unread count cache so UI reflects read status
-    await cache_invalidate_pattern(f"user:{current_user.id}:conversations:*")
-    await cache_invalidate_pattern(f"user:{current_user.id}:unread_count")
+    await invalidate_for_event("message_read", user_id=str(current_user.id))
 
     if not partner:
         raise HTTPException(
@@ -4,12 +4,13 @@ import logging
 import uuid
 from pathlib import Path
 
-from fastapi import BackgroundTasks, HTTPException, status
+from arq import ArqRedis
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
 from fastapi.routing import APIRouter
 from sqlmodel import select
 
-from app.api.deps import AsyncSessionDep, require_role
+from app.api.deps import AsyncSessionDep, get_arq_pool, require_role
 from app.models import (
     ReportJobStatusEnum,
     Teacher,
@@ -24,6 +25,7 @@ from app.schemas.reports import (
     SavedReportTemplate,
     SavedReportTemplateCreate,
 )
+from app.services.report_queue import enqueue_report
 from app.services.report_service import (
     create_report_job,
     delete_report_job,
@@ -34,7 +36,6 @@ from app.services.report_service import (
     get_report_job,
     get_report_status,
     get_report_templates,
-    process_report_job,
     save_report_template,
 )
 
@@ -55,41 +56,6 @@ async def _get_teacher_id(session: AsyncSessionDep, user: User) -> uuid.UUID:
     return teacher.id
 
 
-# Background task wrapper for processing
-def _process_report_background_sync(job_id: uuid.UUID):
-    """Sync wrapper for background task to process report job."""
-    import asyncio
-    import traceback
-
-    async def run_job():
-        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-
-        from app.core.config import settings
-
-        # Create a fresh engine for this background task
-        engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
-
-        logger.info(f"Starting background processing for job {job_id}")
-        async with AsyncSession(engine) as session:
-            try:
-                await process_report_job(session, job_id)
-                logger.info(f"Completed background processing for job {job_id}")
-            except Exception as e:
-                logger.error(f"Error processing report job {job_id}: {e}")
-                logger.error(traceback.format_exc())
-                # Try to mark job as failed
-                try:
-                    job = await get_report_job(session, job_id)
-                    if job:
-                        await fail_job(session, job, str(e))
-                except Exception:
-                    pass
-            finally:
-                await engine.dispose()
-
-    asyncio.run(run_job())
-
-
 @router.post(
     "/generate",
     response_model=ReportJobResponse,
@@ -100,7 +66,7 @@ def _process_report_background_sync(job_id: uuid.UUID):
 async def generate_report(
     *,
     session: AsyncSessionDep,
-    background_tasks: BackgroundTasks,
+    arq_pool: ArqRedis = Depends(get_arq_pool),
     request: ReportGenerateRequest,
     current_user: User = require_role(UserRole.teacher),
 ) -> ReportJobResponse:
@@ -115,9 +81,16 @@ async def generate_report(
     # Create the job
     job = await create_report_job(session, teacher_id, request)
 
-    # Schedule background processing
-    # Using a simple approach - in production would use Celery/RQ
-    background_tasks.add_task(_process_report_background_sync, job.id)
+    # Generated on the arq worker (app.tasks.reports)
+    try:
+        await enqueue_report(arq_pool, job.id)
+    except Exception as e:
+        logger.error(f"Failed to enqueue report job {job.id}: {e}")
+        await fail_job(session, job, "Report queue unavailable")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report generation is temporarily unavailable",
+        )
 
     logger.info(
         f"Report generation initiated: job_id={job.id}, "
@@ -377,18 +350,32 @@ async def list_report_history(
     *,
     session: AsyncSessionDep,
     current_user: User = require_role(UserRole.teacher),
+    limit: int | None = Query(
+        None, ge=1, le=100, description="Page size (omit for the whole history)"
+    ),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
 ) -> ReportHistoryResponse:
     """
     Get report generation history.
 
     Returns reports from the last 7 days with download links
-    for those still available.
+    for those still available. With limit set, pass next_cursor back as
+    cursor to fetch the next page.
     """
     teacher_id = await _get_teacher_id(session, current_user)
 
-    history = await get_report_history(session, teacher_id)
+    try:
+        history, next_cursor = await get_report_history(
+            session, teacher_id, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
-    return ReportHistoryResponse(reports=history)
+    return ReportHistoryResponse(reports=history, next_cursor=next_cursor)
 
 
 @router.post(
@@ -1,4 +1,9 @@
-"""Scheduled task endpoints for automated jobs - Story 6.2."""
+"""Scheduled task endpoints for automated jobs - Story 6.2.
+
+Assignment publishing, the deadline reminder checks and the benchmark
+snapshot refresh run on the arq worker's cron scheduler (app.tasks.scheduler);
+their endpoints remain for running them on demand.
+"""
 
 import logging
 from typing import Annotated
@@ -12,6 +17,7 @@ from app.core.config import settings
 from app.core.rate_limit import RateLimits, limiter
 from app.models import User, UserRole
 from app.services.assignment_scheduler import publish_scheduled_assignments
+from app.services.benchmark_snapshot_service import refresh_benchmark_snapshots
 from app.services.deadline_reminder_service import (
     check_approaching_deadlines,
     check_past_due_assignments,
@@ -75,7 +81,7 @@ async def verify_scheduler_access(
     response_model=DeadlineCheckResponse,
     summary="Run deadline reminder checks",
     description="Checks for approaching deadlines and past-due assignments, sending notifications as needed. "
-    "Should be called daily by external scheduler (e.g., at 8 AM).",
+    "Runs daily on the worker at DEADLINE_REMINDER_HOUR; call to run it on demand.",
 )
 @limiter.limit(RateLimits.ADMIN)
 async def run_deadline_reminders(
@@ -88,8 +94,8 @@ async def run_deadline_reminders(
     """
     Run deadline reminder checks and send notifications.
 
-    This endpoint is designed to be called by an external scheduler (cron, AWS Lambda,
-    GitHub Actions, etc.) at a regular interval (typically 8 AM daily).
+    The arq worker runs the same checks daily at DEADLINE_REMINDER_HOUR (UTC);
+    this endpoint runs them on demand.
 
     **Checks performed:**
     1. Approaching deadlines (assignments due within 24 hours)
@@ -236,7 +242,7 @@ class PublishAssignmentsResponse(BaseModel):
     response_model=PublishAssignmentsResponse,
     summary="Publish scheduled assignments",
     description="Publishes assignments whose scheduled_publish_date has passed. "
-    "Should be called periodically (e.g., every hour or once daily) by external scheduler.",
+    "Runs every SCHEDULER_PUBLISH_INTERVAL seconds on the worker; call to run it on demand.",
 )
 @limiter.limit(RateLimits.ADMIN)
 async def run_publish_scheduled_assignments(
@@ -253,9 +259,9 @@ async def run_publish_scheduled_assignments(
     - status = 'scheduled'
     - scheduled_publish_date <= now
 
-    For each matching assignment:
-    1. Updates status to 'published'
-    2. Sends notifications to all assigned students
+    and updates their status to 'published', then invalidates the assigned
+    students' assignment caches. The arq worker does the same every
+    SCHEDULER_PUBLISH_INTERVAL seconds.
 
     **Authorization:**
     Requires either:
@@ -283,3 +289,65 @@ async def run_publish_scheduled_assignments(
         assignments_published=result.assignments_published,
         message=f"Published {result.assignments_published} assignments",
     )
+
+
+class RefreshBenchmarksResponse(BaseModel):
+    """Response model for the benchmark snapshot refresh task."""
+
+    success: bool
+    rows_written: int
+    schools: int
+    publishers: int
+    message: str
+
+
+@router.post(
+    "/refresh-benchmarks",
+    response_model=RefreshBenchmarksResponse,
+    summary="Refresh benchmark snapshots",
+    description="Rebuilds the school, publisher and system benchmark snapshots. "
+    "Runs hourly on the worker; call to run it on demand. "
+    "Stale snapshots fall back to live calculation.",
+)
+@limiter.limit(RateLimits.ADMIN)
+async def run_refresh_benchmarks(
+    request: Request,
+    *,
+    session: AsyncSessionDep,
+    x_scheduler_key: Annotated[str | None, Header()] = None,
+    current_user: User = require_role(UserRole.admin),
+) -> RefreshBenchmarksResponse:
+    """
+    Refresh benchmark snapshots.
+
+    Recomputes submission and score totals per school, publisher, period and
+    activity type, plus each class's share of them, and replaces the previous
+    snapshot in one transaction.
+
+    **Authorization:**
+    Requires either:
+    - Valid X-Scheduler-Key header (configured via SCHEDULER_API_KEY env var)
+    - Authenticated admin user
+
+    **Returns:**
+    Number of snapshot rows written and scopes covered
+    """
+    logger.info("Starting benchmark snapshot refresh")
+
+    try:
+        result = await refresh_benchmark_snapshots(session)
+    except Exception as e:
+        logger.error(f"Error refreshing benchmark snapshots: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to refresh benchmark snapshots. Please try again.",
+        )
+
+    return RefreshBenchmarksResponse(
+        success=True,
+        rows_written=result.rows_written,
+        schools=result.schools,
+        publishers=result.publishers,
+        message=f"Refreshed benchmarks for {result.schools} schools "
+        f"and {result.publishers} publishers",
+    )
@@ -5,7 +5,7 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import File, HTTPException, Query, UploadFile, status
+from fastapi import Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import Response
 from fastapi.routing import APIRouter
 from openpyxl import Workbook
@@ -16,6 +16,9 @@ from starlette.requests import Request
 
 from app import crud
 from app.api.deps import AsyncSessionDep, SessionDep, require_role
+from app.core.http_cache import conditional_get
+from app.core.pagination import keyset_page, parse_cursor, split_page
+from app.core.projections import json_present, without_blobs
 from app.core.rate_limit import RateLimits, limiter
 from app.models import (
     Activity,
@@ -65,7 +68,7 @@ from app.schemas.student_import import (
 )
 from app.services import analytics_service, feedback_service
 from app.services.book_service_v2 import get_book_service
-from app.services.redis_cache import cache_get, cache_set
+from app.services.redis_cache import cache_get, cache_namespace_key, cache_set
 from app.services.skill_attribution_service import _ACTIVITY_TYPE_SKILL_SLUG
 from app.utils import (
     ensure_unique_username,
@@ -109,6 +112,7 @@ async def _get_student_for_user(
 @router.get(
     "/me/assignments",
     summary="Get student's assignments",
+    dependencies=[Depends(conditional_get())],
 )
 @limiter.limit(RateLimits.READ)
 async def get_student_assignments(
@@ -119,19 +123,30 @@ async def get_student_assignments(
     status_filter: str | None = Query(None, alias="status"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
+    include_total: bool = Query(
+        False, description="Also count all assignments when paging by cursor"
+    ),
 ) -> StudentAssignmentListResponse:
     """
     Get all assignments for authenticated student.
 
     Query parameters:
         status: Filter by assignment status (not_started, in_progress, completed)
+        cursor: next_cursor of the previous page (offset is then ignored and
+            total is only counted when include_total is set)
 
     Returns:
         List of assignments with enriched data (book, activity, progress)
     """
+    after = parse_cursor(cursor)
+
     # Check cache first
-    cache_key = (
-        f"student:{current_user.id}:assignments:{status_filter}:{limit}:{offset}"
+    cache_key = await cache_namespace_key(
+        f"student:{current_user.id}:assignments",
+        f"{status_filter}:{limit}:{offset}:{cursor}:{include_total}",
     )
     cached = await cache_get(cache_key)
     if cached is not None:
@@ -161,6 +176,7 @@ async def get_student_assignments(
             func.coalesce(activity_count_subq.c.activity_count, 1).label(
                 "activity_count"
             ),
+            json_present(Assignment.activity_content),
         )
         .where(AssignmentStudent.student_id == student.id)
         .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
@@ -169,6 +185,7 @@ async def get_student_assignments(
         .outerjoin(
             activity_count_subq, activity_count_subq.c.assignment_id == Assignment.id
         )
+        .options(*without_blobs(AssignmentStudent, Assignment, Activity))
     )
 
     # Apply optional status filter
@@ -182,18 +199,25 @@ async def get_student_assignments(
             )
         query = query.where(AssignmentStudent.status == status_filter)
 
-    # Count total before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await session.execute(count_query)
-    total = count_result.scalar() or 0
+    # Count total before pagination (optional when paging by cursor)
+    total = None
+    if after is None or include_total:
+        count_query = select(func.count()).select_from(
+            query.with_only_columns(AssignmentStudent.id).subquery()
+        )
+        count_result = await session.execute(count_query)
+        total = count_result.scalar() or 0
 
     # Apply ordering and pagination
-    query = query.order_by(Assignment.created_at.desc())
-    query = query.offset(offset).limit(limit)
+    query = keyset_page(query, Assignment.created_at, Assignment.id, after, limit)
+    if after is None:
+        query = query.offset(offset)
 
     # Execute query
     result = await session.execute(query)
-    rows = result.all()
+    rows, next_cursor = split_page(
+        result.all(), limit, lambda row: (row[1].created_at, row[1].id)
+    )
 
     # Batch-fetch all books in a single DCS call
     book_service = get_book_service()
@@ -207,12 +231,13 @@ async def get_student_assignments(
         assignment = row[1]
         activity = row[2]  # May be None for Content Library assignments
         activity_count = row[3]
+        has_activity_content = row[4]
 
         book = book_map.get(assignment.dcs_book_id)
 
         # Handle Content Library assignments (may not have book in DCS)
         if not book:
-            if assignment.activity_content:
+            if has_activity_content:
                 # Content Library assignment - use placeholder book info
                 book_id = assignment.dcs_book_id if assignment.dcs_book_id else 0
                 book_title = "AI Generated"
@@ -272,7 +297,8 @@ async def get_student_assignments(
         total=total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(assignments) < total,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
     )
     await cache_set(cache_key, response.model_dump(), ttl=3600)
     return response
@@ -316,7 +342,7 @@ async def get_student_progress(
         - Personalized improvement tips
     """
     # Check cache first
-    cache_key = f"student:{current_user.id}:progress:{period}"
+    cache_key = await cache_namespace_key(f"student:{current_user.id}:progress", period)
     cached = await cache_get(cache_key)
     if cached is not None:
         return StudentProgressResponse(**cached)
@@ -591,9 +617,13 @@ async def get_students(
     """
     # Check Redis cache first
     if current_user.role == UserRole.teacher:
-        cache_key = f"teacher:{current_user.id}:students:list:{limit}:{offset}"
+        cache_key = await cache_namespace_key(
+            f"teacher:{current_user.id}:students", f"list:{limit}:{offset}"
+        )
     else:
-        cache_key = f"admin:students:list:{limit}:{offset}"
+        cache_key = await cache_namespace_key(
+            "admin:students", f"list:{limit}:{offset}"
+        )
     cached = await cache_get(cache_key)
     if cached is not None:
         return [StudentPublic(**s) for s in cached]
@@ -772,7 +802,9 @@ async def get_student_calendar_assignments(
     # Redis cache (30s TTL) — calendar data
     start_key = start_date.strftime("%Y%m%d")
     end_key = end_date.strftime("%Y%m%d")
-    cache_key = f"student:{current_user.id}:calendar:{start_key}:{end_key}"
+    cache_key = await cache_namespace_key(
+        f"student:{current_user.id}:calendar", f"{start_key}:{end_key}"
+    )
     cached = await cache_get(cache_key)
     if cached is not None:
         return StudentCalendarAssignmentsResponse(**cached)
@@ -86,8 +86,9 @@ from app.services.pdf_processing_service import (
     get_pdf_processing_service,
 )
 from app.services.redis_cache import (
+    cache_bump_namespace_sync,
     cache_get_sync,
-    cache_invalidate_pattern_sync,
+    cache_namespace_key_sync,
     cache_set_sync,
 )
 
@@ -109,7 +110,7 @@ _media_oauth2_scheme = OAuth2PasswordBearer(
 
 def _invalidate_materials_cache(teacher_id: uuid.UUID) -> None:
     """Clear cached materials list for a teacher."""
-    cache_invalidate_pattern_sync(f"teacher:{teacher_id}:materials:*")
+    cache_bump_namespace_sync(f"teacher:{teacher_id}:materials")
 
 
 def get_teacher_id(session: SessionDep, current_user: CurrentUser) -> uuid.UUID:
@@ -424,7 +425,7 @@ async def list_materials(
     teacher_id = get_teacher_id(session, current_user)
 
     type_key = type.value if type else "all"
-    cache_key = f"teacher:{teacher_id}:materials:{type_key}"
+    cache_key = cache_namespace_key_sync(f"teacher:{teacher_id}:materials", type_key)
     cached = cache_get_sync(cache_key)
     if cached is not None:
         return MaterialListResponse(**cached)
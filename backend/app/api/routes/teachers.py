@@ -42,6 +42,7 @@ from app.services.bulk_import import validate_bulk_import
 from app.services.cache_events import invalidate_for_event_sync
 from app.services.redis_cache import (
     cache_get,
+    cache_namespace_key,
     cache_set,
 )
 from app.utils import (
@@ -332,7 +333,9 @@ async def list_my_students(
     - Enrolled in any of this teacher's classes
     """
     # Redis cache (60s TTL) — student list
-    cache_key = f"teacher:{current_user.id}:students:{limit}:{offset}"
+    cache_key = await cache_namespace_key(
+        f"teacher:{current_user.id}:students", f"{limit}:{offset}"
+    )
     cached = await cache_get(cache_key)
     if cached is not None:
         return StudentListResponse(**cached)
@@ -15,13 +15,9 @@ from pydantic import BaseModel, Field
 
 from app.api.deps import require_role
 from app.models import User, UserRole
-from app.services.dcs_ai import DCSAIServiceClient
+from app.services.dcs_ai import get_dcs_ai_client
 from app.services.dcs_ai.exceptions import DCSAIDataAuthError, DCSAIDataConnectionError
-from app.services.dcs_cache import DCSCache
-from app.services.dream_storage_client import (
-    DreamCentralStorageClient,
-    get_dream_storage_client,
-)
+from app.services.dream_storage_client import get_dream_storage_client
 
 logger = logging.getLogger(__name__)
 
@@ -95,18 +91,6 @@ class AudioUrlResponse(BaseModel):
     expires_at: str
 
 
-# ============================================================================
-# DEPENDENCIES
-# ============================================================================
-
-
-async def get_dcs_ai_client() -> DCSAIServiceClient:
-    """Get DCS AI client instance."""
-    dcs_client = DreamCentralStorageClient()
-    cache = DCSCache(default_ttl=300)
-    return DCSAIServiceClient(dcs_client, cache)
-
-
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -27,6 +27,7 @@ from app.models import (
 )
 
 # Book sync functions deprecated - books now fetched from DCS on-demand
+from app.services.asset_cache import get_asset_cache
 from app.services.dcs_cache import CacheKeys, get_dcs_cache
 from app.services.dream_storage_client import (
     DreamStorageNotFoundError,
@@ -152,6 +153,13 @@ async def _import_book_activities(book_id: int, db: AsyncSession) -> dict:
     }
 
 
+async def _invalidate_book_assets(book_id: int) -> None:
+    """Drop a book's cached asset files on every host."""
+    asset_cache = get_asset_cache()
+    if asset_cache is not None:
+        await asset_cache.invalidate_book(book_id)
+
+
 async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> None:
     """
     Process webhook event with retry logic.
@@ -195,7 +203,7 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
             # Get cache for invalidation
             cache = get_dcs_cache()
 
-            # ALSO invalidate DCS client's internal cache
+            # ALSO invalidate DCS client's internal cache (on every worker)
             from app.services.dream_storage_client import get_dream_storage_client
 
             dcs_client = await get_dream_storage_client()
@@ -213,7 +221,9 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                     )
                     await cache.invalidate(CacheKeys.BOOK_LIST)
                     await cache.invalidate_pattern("dcs:books:publisher:")
-                    dcs_client.invalidate_cache()
+                    # Drop "not found" tombstones (book and AI data lookups)
+                    await cache.clear_tombstones()
+                    await dcs_client.invalidate_cache_everywhere()
 
                     # Import activities for the new book
                     try:
@@ -237,7 +247,10 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                     await cache.invalidate(CacheKeys.book_by_id(book_id))
                     await cache.invalidate(CacheKeys.book_config(book_id))
                     await cache.invalidate(CacheKeys.BOOK_LIST)
-                    dcs_client.invalidate_cache()
+                    # AI data may have been processed since it was looked up
+                    await cache.clear_tombstones()
+                    await dcs_client.invalidate_cache_everywhere()
+                    await _invalidate_book_assets(int(book_id))
 
                     # Re-import activities for the updated book
                     try:
@@ -260,7 +273,8 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                     )
                     await cache.invalidate_pattern(f"dcs:books:id:{book_id}")
                     await cache.invalidate(CacheKeys.BOOK_LIST)
-                    dcs_client.invalidate_cache()
+                    await dcs_client.invalidate_cache_everywhere()
+                    await _invalidate_book_assets(int(book_id))
 
                     # Delete activities for the deleted book
                     try:
@@ -294,7 +308,8 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                 if event_log.event_type == WebhookEventType.publisher_created:
                     logger.info("🆕 PUBLISHER CREATED - Invalidating caches...")
                     await cache.invalidate(CacheKeys.PUBLISHER_LIST)
-                    dcs_client.invalidate_cache()
+                    await cache.clear_tombstones("dcs:publishers:")
+                    await dcs_client.invalidate_cache_everywhere()
                     logger.info(
                         f"✅ Invalidated publisher caches for new publisher {publisher_id}"
                     )
@@ -304,7 +319,7 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                     await cache.invalidate(CacheKeys.publisher_by_id(publisher_id))
                     await cache.invalidate(CacheKeys.publisher_logo(publisher_id))
                     await cache.invalidate(CacheKeys.PUBLISHER_LIST)
-                    dcs_client.invalidate_cache()
+                    await dcs_client.invalidate_cache_everywhere()
                     logger.info(
                         f"✅ Invalidated publisher caches for updated publisher {publisher_id}"
                     )
@@ -319,7 +334,7 @@ async def process_webhook_event(event_log_id: uuid.UUID, db: AsyncSession) -> No
                     await cache.invalidate_pattern(
                         f"dcs:books:publisher:{publisher_id}"
                     )
-                    dcs_client.invalidate_cache()
+                    await dcs_client.invalidate_cache_everywhere()
                     logger.info(
                         f"✅ Invalidated publisher caches for deleted publisher {publisher_id}"
                     )
@@ -65,10 +65,26 @@ class Settings(BaseSettings):
     DB_STATEMENT_TIMEOUT: int = 30000  # Kill queries after N ms
     DB_IDLE_TX_TIMEOUT: int = 30000  # Kill idle-in-transaction after N ms
 
+    # Per-request statement statistics (counts, DB time, repeated statements)
+    # exported as Prometheus metrics and appended to slow-request log lines.
+    # A statement repeated this often in one request is logged as a likely N+1.
+    DB_QUERY_STATS_ENABLED: bool = True
+    DB_REPEATED_STATEMENT_THRESHOLD: int = 10
+
     # Worker pool settings (ARQ background tasks)
     WORKER_DB_POOL_SIZE: int = 5  # Worker needs fewer connections
     WORKER_DB_MAX_OVERFLOW: int = 5
 
+    # Report generation on the arq worker: PDF/Excel rendering runs in a
+    # process pool; a teacher's extra reports wait until one finishes.
+    REPORT_RENDER_PROCESSES: int = 2
+    REPORT_MAX_CONCURRENT_PER_TEACHER: int = 2
+    REPORT_SLOT_RETRY_DELAY: int = 10  # seconds before a waiting report retries
+    REPORT_JOB_TIMEOUT: int = 600  # seconds
+    # Collected report data is reused across formats/templates until the
+    # target's data changes; this bounds what write hooks cannot see.
+    REPORT_DATA_CACHE_TTL: int = 3600  # seconds
+
     # DCS HTTP client settings
     DCS_MAX_CONNECTIONS: int = 20  # Max concurrent connections to FCS
     DCS_MAX_KEEPALIVE: int = 10  # Reusable keepalive connections
@@ -105,16 +121,68 @@ class Settings(BaseSettings):
     # Scheduled task API key for external schedulers (cron, Lambda, etc.)
     SCHEDULER_API_KEY: str | None = None
 
+    # The arq worker publishes due scheduled assignments every
+    # SCHEDULER_PUBLISH_INTERVAL seconds (a divisor of 60) and runs the
+    # deadline reminder checks daily at DEADLINE_REMINDER_HOUR (UTC).
+    SCHEDULER_PUBLISH_INTERVAL: int = 15
+    DEADLINE_REMINDER_HOUR: int = 8
+
+    # Benchmark snapshots are rebuilt hourly by the arq worker (and on demand by
+    # POST /admin/tasks/refresh-benchmarks); older snapshots are ignored and
+    # benchmarks are computed live instead.
+    BENCHMARK_SNAPSHOT_MAX_AGE: int = 21600  # 6 hours (refresh at least this often)
+
+    # Create a student's per-activity progress rows when they first open a
+    # multi-activity assignment instead of for every student when it is
+    # assigned; readers treat a missing row as not started.
+    ASSIGNMENT_PROGRESS_LAZY: bool = True
+
+    # Days of analytics rollups the worker rebuilds nightly from
+    # assignment_students, repairing refreshes that failed on submission
+    ROLLUP_RECONCILE_DAYS: int = 7
+
     # DCS Cache settings (in seconds)
     DCS_CACHE_DEFAULT_TTL: int = 300  # 5 minutes
-    DCS_CACHE_PUBLISHER_TTL: int = 600  # 10 minutes (publishers change rarely)
-    DCS_CACHE_BOOK_TTL: int = 600  # 10 minutes (books change rarely)
+    # Book/publisher entries are invalidated cluster-wide by DCS webhooks, so the
+    # TTL is only a safety net for missed webhooks.
+    DCS_CACHE_PUBLISHER_TTL: int = 1800  # 30 minutes (publishers change rarely)
+    DCS_CACHE_BOOK_TTL: int = 1800  # 30 minutes (books change rarely)
     DCS_CACHE_LOGO_TTL: int = 3600  # 1 hour (logos rarely change)
-    DCS_CACHE_WARMUP_ENABLED: bool = False  # Optional: pre-fetch data at startup
+    # Serve expired DCS entries for up to this long while one background refresh
+    # runs (stale-while-revalidate), so warm requests never block on DCS.
+    DCS_CACHE_STALE_TTL: int = 600  # 10 minutes
+    # Remember DCS 404s (missing books, unprocessed AI data) this long; webhook
+    # events clear them sooner.
+    DCS_CACHE_NEGATIVE_TTL: int = 60  # seconds
+    # Prefetch the most accessed DCS keys (ranked across workers in Redis) at
+    # startup so requests after a rolling restart do not hit a cold cache.
+    DCS_CACHE_WARMUP_ENABLED: bool = True
+    DCS_CACHE_WARMUP_TOP_N: int = 200
+    DCS_CACHE_WARMUP_CONCURRENCY: int = 8  # DCS fetches in flight per worker
+    DCS_CACHE_WARMUP_TIMEOUT: int = 30  # seconds startup waits before serving
+    DCS_CACHE_ACCESS_FLUSH_INTERVAL: int = 30  # seconds between ranking updates
+    # Per-worker memory budgets; least recently used entries are evicted beyond them.
+    DCS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MB
+    DCS_CLIENT_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32 MB
+
+    # On-disk cache of DCS asset bytes (covers, page images, AI audio), shared
+    # by the workers on a host. Least recently used files are evicted past the cap.
+    ASSET_CACHE_ENABLED: bool = True
+    ASSET_CACHE_DIR: str = "/tmp/flow-learn-asset-cache"
+    ASSET_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024  # 2 GB
+    ASSET_CACHE_TTL: int = 86400  # 1 day (webhooks invalidate changed books sooner)
 
     # Redis cache
     REDIS_URL: str = "redis://localhost:6380/0"
 
+    # In-process L1 cache in front of Redis for hot keys (auth, book lists).
+    # Kept coherent across workers via Redis pub/sub invalidation broadcasts.
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_TTL: int = 5  # seconds — bounds staleness if a broadcast is missed
+    CACHE_L1_MAX_BYTES: int = 16 * 1024 * 1024  # 16 MB per worker process
+    # How often expired entries are purged from in-process caches.
+    LOCAL_CACHE_SWEEP_INTERVAL: int = 60  # seconds
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_REDIS_URL: str = "redis://localhost:6380/1"
@@ -3,6 +3,7 @@ from sqlmodel import Session, create_engine, select
 
 from app import crud
 from app.core.config import settings
+from app.core.query_stats import instrument_engine
 from app.models import (
     ActivityFormat,
     SkillCategory,
@@ -48,6 +49,12 @@ async_engine: AsyncEngine = create_async_engine(
 )
 
 
+# Feed per-request statement statistics (app.core.query_stats)
+if settings.DB_QUERY_STATS_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+
 # make sure all SQLModel models are imported (app.models) before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
@@ -0,0 +1,188 @@
+"""
+HTTP conditional request support (ETag / If-None-Match, Last-Modified).
+
+ConditionalGetMiddleware answers GET/HEAD requests with ``304 Not Modified``
+when the response's validator matches what the client already holds, so
+repeat polls from the SPA cost a header exchange instead of a full body.
+
+Responses that set their own ETag (e.g. cached asset files, whose ETag is a
+content hash) are handled automatically. JSON endpoints opt in with the
+``conditional_get`` dependency, which makes the middleware hash the response
+body into an ETag and apply a revalidation-friendly Cache-Control and Vary.
+
+Usage:
+    @router.get("/{book_id}/structure", dependencies=[Depends(conditional_get())])
+"""
+
+import hashlib
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_STATE_KEY = "conditional_get"
+
+# Headers a 304 must carry if the 200 would have (RFC 9110 §15.4.5)
+_NOT_MODIFIED_HEADERS = {
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "vary",
+}
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may list several tags)
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == current for tag in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str | None, last_modified: str) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def conditional_get(
+    cache_control: str = "private, no-cache",
+    vary: str = "Authorization",
+) -> Callable[[Request], None]:
+    """
+    Dependency factory opting a JSON GET endpoint into ETag revalidation.
+
+    The default policy lets the browser keep the response but revalidate it
+    on every use, and keys it by the bearer token so users never share it.
+
+    Args:
+        cache_control: Cache-Control to send unless the endpoint sets one
+        vary: Vary to send unless the endpoint sets one
+
+    Returns:
+        Dependency to pass to ``Depends``
+    """
+
+    def dependency(request: Request) -> None:
+        setattr(request.state, _STATE_KEY, (cache_control, vary))
+
+    return dependency
+
+
+class ConditionalGetMiddleware:
+    """Pure ASGI middleware — turn matching GET/HEAD 200s into 304s."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if_modified_since = request_headers.get("if-modified-since")
+        start: Message | None = None
+        body_parts: list[bytes] = []
+        passthrough = False
+        finished = False
+
+        def is_current(headers: MutableHeaders) -> bool:
+            if "etag" in headers and if_none_match:
+                return etag_matches(if_none_match, headers["etag"])
+            # If-Modified-Since is ignored when If-None-Match is present
+            if "last-modified" in headers and not if_none_match:
+                return _not_modified_since(if_modified_since, headers["last-modified"])
+            return False
+
+        async def send_not_modified(headers: MutableHeaders) -> None:
+            nonlocal finished
+            finished = True
+            raw = [
+                (k, v)
+                for k, v in headers.raw
+                if k.decode("latin-1") in _NOT_MODIFIED_HEADERS
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": raw})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if finished:
+                return  # Drop the body of a response already answered with 304
+
+            if message["type"] == "http.response.start":
+                policy = scope.get("state", {}).get(_STATE_KEY)
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                    return
+                headers = MutableHeaders(scope=message)
+                if policy is not None:
+                    cache_control, vary = policy
+                    if "cache-control" not in headers:
+                        headers["cache-control"] = cache_control
+                    if vary and "vary" not in headers:
+                        headers["vary"] = vary
+                if (
+                    "etag" in headers
+                    or "last-modified" in headers
+                    or policy is None
+                    or scope["method"] == "HEAD"
+                ):
+                    if is_current(headers):
+                        await send_not_modified(headers)
+                    else:
+                        passthrough = True
+                        await send(message)
+                    return
+                # Opted in without a validator: buffer the body to hash it
+                start = message
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            assert start is not None
+            body = b"".join(body_parts)
+            headers = MutableHeaders(scope=start)
+            headers["etag"] = make_etag(body)
+            if is_current(headers):
+                await send_not_modified(headers)
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,132 @@
+"""
+Keyset (cursor) pagination for newest-first list endpoints.
+
+Offset pagination makes the database produce and discard every earlier row,
+so page N costs N pages of work, and each page also pays for a count over
+the whole filtered set. Keyset pagination instead remembers the sort key of
+the last row served and asks for rows strictly after it, which an index on
+(..., sort_column DESC, id DESC) answers directly at any depth.
+
+Cursors are opaque strings over a (timestamp, id) pair; the id breaks ties
+between rows sharing a timestamp so no row is skipped or repeated.
+
+Usage:
+    after = parse_cursor(cursor)
+    query = keyset_page(query, Assignment.created_at, Assignment.id, after, limit)
+    rows = (await session.execute(query)).all()
+    rows, next_cursor = split_page(
+        rows, limit, lambda row: (row[0].created_at, row[0].id)
+    )
+"""
+
+import base64
+import binascii
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+RowT = TypeVar("RowT")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Sort key of the last row on the previous page."""
+
+    sort_value: datetime
+    id: uuid.UUID
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Opaque cursor pointing just past the row with this sort key."""
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return Cursor(datetime.fromisoformat(sort_value), uuid.UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def parse_cursor(cursor: str | None) -> Cursor | None:
+    """Decode a cursor query parameter, answering 400 if it is malformed."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+def keyset_page(
+    query: Select,
+    sort_column: InstrumentedAttribute | Any,
+    id_column: InstrumentedAttribute | Any,
+    after: Cursor | None,
+    limit: int | None,
+) -> Select:
+    """
+    Order a query newest first and restrict it to the page after a cursor.
+
+    One row beyond ``limit`` is fetched so split_page can tell whether
+    another page follows without counting.
+
+    Args:
+        query: Filtered select to paginate
+        sort_column: Timestamp column rows are ordered by (descending)
+        id_column: Unique id column breaking ties on sort_column
+        after: Cursor from the previous page, or None for the first page
+        limit: Page size, or None for no limit
+
+    Returns:
+        The query with ordering, keyset filter and limit applied
+    """
+    query = query.order_by(sort_column.desc(), id_column.desc())
+    if after is not None:
+        query = query.where(
+            tuple_(sort_column, id_column) < (after.sort_value, after.id)
+        )
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def split_page(
+    rows: Sequence[RowT],
+    limit: int | None,
+    key: Callable[[RowT], tuple[datetime, uuid.UUID]],
+) -> tuple[list[RowT], str | None]:
+    """
+    Trim the look-ahead row from a keyset_page result.
+
+    Args:
+        rows: Rows returned by a keyset_page query
+        limit: The page size passed to keyset_page
+        key: Returns a row's (sort value, id)
+
+    Returns:
+        Tuple of (rows on this page, cursor for the next page or None on the
+        last page)
+    """
+    rows = list(rows)
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
@@ -0,0 +1,86 @@
+"""
+Column projections for list endpoints.
+
+Several models carry JSON documents that only the detail and submission
+views need: an assignment's generated ``activity_content`` and attached
+``resources``, an activity's ``config_json``, a student's ``answers_json``
+and ``progress_json``. Selecting whole entities in a list query drags every
+one of those documents over the wire and through JSON decoding, once per
+row, just to render a name and a due date.
+
+The columns stay loaded by default on the models: async sessions cannot
+lazy-load on attribute access, and most single-row code paths read them.
+List queries opt out instead, with ``without_blobs``. The blob columns are
+deferred with ``raiseload``, so a list handler that touches one fails loudly
+rather than silently issuing a query per row. A handler that only needs to
+know whether a document is present selects ``json_present`` instead.
+
+Usage:
+    query = (
+        select(Assignment, json_present(Assignment.activity_content))
+        .options(*without_blobs(Assignment))
+    )
+"""
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, Text, and_, cast, literal_column
+from sqlalchemy.orm import InstrumentedAttribute, defer
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models import (
+    Activity,
+    Assignment,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+)
+
+# Text forms of the JSON documents json_present treats as absent
+_EMPTY_DOCUMENTS = ("null", "{}", "[]")
+
+# JSON document columns left out of list projections, per model
+BLOB_COLUMNS: dict[type, tuple[InstrumentedAttribute, ...]] = {
+    Activity: (Activity.config_json,),
+    Assignment: (Assignment.activity_content, Assignment.resources),
+    AssignmentStudent: (
+        AssignmentStudent.answers_json,
+        AssignmentStudent.progress_json,
+    ),
+    AssignmentStudentActivity: (AssignmentStudentActivity.response_data,),
+}
+
+
+def without_blobs(*entities: type) -> list[LoaderOption]:
+    """
+    Loader options deferring the JSON blob columns of the given entities.
+
+    The deferred columns raise on access instead of lazy-loading.
+
+    Args:
+        entities: Models selected by the query
+
+    Returns:
+        Options to pass to ``Select.options``
+    """
+    return [
+        defer(column, raiseload=True)
+        for entity in entities
+        for column in BLOB_COLUMNS.get(entity, ())
+    ]
+
+
+def json_present(column: InstrumentedAttribute | Any) -> ColumnElement[bool]:
+    """
+    Whether a JSON column holds a non-empty document, evaluated in SQL.
+
+    A Python ``None`` assigned to a JSON column is stored as JSON ``null``
+    rather than SQL NULL, so both are treated as absent, as are empty
+    objects and arrays. The empty forms are rendered inline rather than as
+    parameters so a partial index declared with the same predicate applies.
+    """
+    return and_(
+        column.is_not(None),
+        cast(column, Text).not_in(
+            [literal_column(f"'{empty}'") for empty in _EMPTY_DOCUMENTS]
+        ),
+    ).label(f"has_{column.key}")
@@ -0,0 +1,184 @@
+"""
+Per-request database statement statistics.
+
+SQLAlchemy cursor events on the application engines feed a
+``QueryStats`` bound to the current request through a context variable:
+how many statements ran, how long they took in total, which statement was
+slowest, and how often each statement *fingerprint* repeated. The
+fingerprint is the SQL with parameters and literals replaced by ``?`` and
+expanded IN / VALUES lists collapsed, so the same query issued once per row
+of a loop (an N+1) shows up as one fingerprint with a high count.
+
+The context variable is copied into the threadpool for sync routes and into
+the greenlet the async engine runs on, so both engines report into the same
+request. Statements executed outside a tracked request (startup, the arq
+worker) are not recorded and cost one context variable lookup.
+
+Usage:
+    with track_queries() as stats:
+        await app(scope, receive, send)
+    logger.info("%d statements, %.1f ms", stats.statements, stats.db_time_ms)
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Longest fingerprint kept for logs
+FINGERPRINT_LENGTH = 200
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROW_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so repeats with different parameters match.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        The statement with parameters and literals replaced by ``?``,
+        parameter lists collapsed to ``(?)`` and whitespace collapsed
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?)", sql)
+    sql = _ROW_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while handling one request."""
+
+    statements: int = 0
+    db_time: float = 0.0  # seconds
+    slowest_time: float = 0.0  # seconds
+    slowest_statement: str | None = None
+    counts: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def db_time_ms(self) -> float:
+        return self.db_time * 1000
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Add one executed statement."""
+        normalized = fingerprint(statement)
+        self.statements += 1
+        self.db_time += elapsed
+        self.counts[normalized] += 1
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = normalized
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Fingerprints executed at least ``threshold`` times, most frequent first.
+
+        A query repeated this often within one request is almost always a
+        per-row lookup that should be a join or an IN query.
+        """
+        return [
+            (normalized, count)
+            for normalized, count in self.counts.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self, repeat_threshold: int) -> str:
+        """One-line description for log messages."""
+        parts = [f"{self.statements} statements", f"db={self.db_time_ms:.0f}ms"]
+        if self.slowest_statement is not None:
+            parts.append(
+                f"slowest={self.slowest_time * 1000:.0f}ms "
+                f"[{self.slowest_statement[:FINGERPRINT_LENGTH]}]"
+            )
+        for normalized, count in self.repeated(repeat_threshold):
+            parts.append(f"repeated x{count} [{normalized[:FINGERPRINT_LENGTH]}]")
+        return ", ".join(parts)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Statistics of the request being handled, if it is tracked."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record statements executed inside the block into a fresh QueryStats."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _many: bool,
+) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    _cursor: Any,
+    statement: str,
+    _parameters: Any,
+    _context: Any,
+    _many: bool,
+) -> None:
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+    stats.record(statement, time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # so the next statement on the connection is not timed from it
+    conn = exception_context.connection
+    if conn is not None and _current.get() is not None:
+        starts = conn.info.get("query_stats_start")
+        if starts:
+            starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Report statements executed on an engine into the current request's stats.
+
+    Pass ``AsyncEngine.sync_engine`` for async engines. Idempotent.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
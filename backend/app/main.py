@@ -24,8 +24,29 @@ from starlette.responses import JSONResponse
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.http_cache import ConditionalGetMiddleware
+from app.core.query_stats import (
+    FINGERPRINT_LENGTH,
+    QueryStats,
+    current_query_stats,
+    track_queries,
+)
 from app.core.rate_limit import limiter
-from app.services.redis_cache import close_redis, init_redis
+from app.services.analytics_rollup import register_rollup_maintenance
+from app.services.cache_warmup import (
+    start_access_flusher,
+    stop_access_flusher,
+    warm_dcs_cache,
+)
+from app.services.conversation_summary import register_summary_maintenance
+from app.services.local_cache import start_expiry_sweeper, stop_expiry_sweeper
+from app.services.redis_cache import (
+    close_redis,
+    init_redis,
+    start_invalidation_listener,
+)
+from app.services.report_data_cache import register_report_data_invalidation
+from app.services.report_queue import queue_depth as report_queue_depth
 
 # Note: Publisher sync no longer needed - publishers managed via DCS caching service
 from app.services.webhook_registration import webhook_registration_service
@@ -34,7 +55,13 @@ logger = logging.getLogger(__name__)
 
 
 class RequestTimingMiddleware:
-    """Pure ASGI middleware — log slow requests (>500ms) without BaseHTTPMiddleware overhead."""
+    """Pure ASGI middleware — log slow requests (>500ms) without BaseHTTPMiddleware overhead.
+
+    Also tracks the request's database statements (app.core.query_stats):
+    slow-request lines carry the statement count, DB time, slowest statement
+    and repeated statements, and any request repeating one statement past
+    DB_REPEATED_STATEMENT_THRESHOLD is logged as a likely N+1.
+    """
 
     SLOW_THRESHOLD_MS = 500
 
@@ -55,11 +82,31 @@ class RequestTimingMiddleware:
                 status_code = message["status"]
             await send(message)
 
-        await self.app(scope, receive, send_wrapper)
+        if not settings.DB_QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send_wrapper)
+            self._log_slow(scope, status_code, start, None)
+            return
 
+        with track_queries() as stats:
+            await self.app(scope, receive, send_wrapper)
+        self._log_slow(scope, status_code, start, stats)
+
+        threshold = settings.DB_REPEATED_STATEMENT_THRESHOLD
+        for statement, count in stats.repeated(threshold):
+            logger.warning(
+                "N+1 %s %s: statement repeated %d times [%s]",
+                scope.get("method", "GET"),
+                scope.get("path", ""),
+                count,
+                statement[:FINGERPRINT_LENGTH],
+            )
+
+    def _log_slow(self, scope, status_code, start, stats) -> None:
         duration_ms = (time.perf_counter() - start) * 1000
-        if duration_ms > self.SLOW_THRESHOLD_MS:
-            request = Request(scope)
+        if duration_ms <= self.SLOW_THRESHOLD_MS:
+            return
+        request = Request(scope)
+        if stats is None:
             logger.warning(
                 "SLOW %s %s → %d (%.0fms)",
                 request.method,
@@ -67,6 +114,15 @@ class RequestTimingMiddleware:
                 status_code,
                 duration_ms,
             )
+            return
+        logger.warning(
+            "SLOW %s %s → %d (%.0fms; %s)",
+            request.method,
+            request.url.path,
+            status_code,
+            duration_ms,
+            stats.summary(settings.DB_REPEATED_STATEMENT_THRESHOLD),
+        )
 
 
 class BotBlockerMiddleware:
@@ -101,6 +157,38 @@ REQUESTS_IN_PROGRESS = Gauge(
     "http_requests_in_progress",
     "Number of HTTP requests in progress",
 )
+# Filled from the statements RequestTimingMiddleware tracks per request
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "Database statements executed per HTTP request",
+    ["method", "endpoint"],
+    buckets=[0, 1, 2, 5, 10, 20, 50, 100, 200, 500],
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing database statements per HTTP request",
+    ["method", "endpoint"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+REQUEST_DB_SLOWEST_STATEMENT = Histogram(
+    "http_request_db_slowest_statement_seconds",
+    "Duration of the slowest database statement per HTTP request",
+    ["method", "endpoint"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+REPORT_JOBS_QUEUED = Gauge(
+    "report_jobs_queued",
+    "Report jobs waiting for the arq worker",
+)
+REPORT_JOBS_RUNNING = Gauge(
+    "report_jobs_running",
+    "Report jobs being generated by the arq worker",
+)
+REQUEST_DB_REPEATED_STATEMENTS = Counter(
+    "http_request_db_repeated_statements_total",
+    "Requests that repeated one database statement past the N+1 threshold",
+    ["method", "endpoint"],
+)
 
 
 def _normalize_path(path: str) -> str:
@@ -158,6 +246,19 @@ class PrometheusMiddleware:
                 method=method, endpoint=endpoint, status=status_group
             ).inc()
             REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(duration)
+            stats = current_query_stats()
+            if stats is not None:
+                _observe_query_stats(method, endpoint, stats)
+
+
+def _observe_query_stats(method: str, endpoint: str, stats: QueryStats) -> None:
+    labels = {"method": method, "endpoint": endpoint}
+    REQUEST_DB_STATEMENTS.labels(**labels).observe(stats.statements)
+    REQUEST_DB_DURATION.labels(**labels).observe(stats.db_time)
+    if stats.statements:
+        REQUEST_DB_SLOWEST_STATEMENT.labels(**labels).observe(stats.slowest_time)
+    if stats.repeated(settings.DB_REPEATED_STATEMENT_THRESHOLD):
+        REQUEST_DB_REPEATED_STATEMENTS.labels(**labels).inc()
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -175,6 +276,10 @@ async def lifespan(app: FastAPI):
 
     # Connect to Redis cache
     await init_redis()
+    # Keep this worker's in-process caches coherent with the other workers
+    await start_invalidation_listener()
+    # Purge expired entries from bounded in-process caches
+    start_expiry_sweeper(settings.LOCAL_CACHE_SWEEP_INTERVAL)
 
     # Create arq pool for background task queue
     from arq import create_pool
@@ -231,27 +336,27 @@ async def lifespan(app: FastAPI):
     # Publishers are fetched on-demand from DCS and cached (see publisher_service_v2.py)
     logger.info("Publisher data will be fetched on-demand from Dream Central Storage")
 
-    # Optional: Warm up cache for common data
-    if settings.DCS_CACHE_WARMUP_ENABLED:
-        from app.services.book_service_v2 import get_book_service
-        from app.services.dcs_cache import get_dcs_cache
-        from app.services.publisher_service_v2 import get_publisher_service
-
-        get_dcs_cache()
-        publisher_service = get_publisher_service()
-        get_book_service()
+    # Record which DCS keys are hot so the next restart can prefetch them
+    start_access_flusher(settings.DCS_CACHE_ACCESS_FLUSH_INTERVAL)
 
+    # Warm the DCS cache with the keys most accessed across all workers
+    if settings.DCS_CACHE_WARMUP_ENABLED:
+        logger.info("Warming up DCS cache from hot keys...")
         try:
-            # Pre-fetch publishers
-            logger.info("Warming up cache: fetching publishers...")
-            await publisher_service.list_publishers()
-            logger.info("✅ Cache warmed: publishers")
-
-            # Note: Book list can be large, only warmup if needed
-            # Uncomment if you want to pre-fetch all books at startup:
-            # logger.info("Warming up cache: fetching books...")
-            # await book_service.list_books()
-            # logger.info("✅ Cache warmed: books")
+            result = await asyncio.wait_for(
+                warm_dcs_cache(
+                    settings.DCS_CACHE_WARMUP_TOP_N,
+                    settings.DCS_CACHE_WARMUP_CONCURRENCY,
+                ),
+                timeout=settings.DCS_CACHE_WARMUP_TIMEOUT,
+            )
+            logger.info(
+                f"✅ Cache warmed: {result['warmed']} keys "
+                f"({result['failed']} failed, {result['skipped']} skipped)"
+            )
+        except TimeoutError:
+            # Shielded get_or_fetch fetches already started still fill the cache
+            logger.warning("⚠️  Cache warmup timed out, continuing in background")
         except Exception as e:
             logger.warning(f"⚠️  Cache warmup failed: {e}")
             logger.warning("   Cache will be populated on-demand")
@@ -270,12 +375,21 @@ async def lifespan(app: FastAPI):
         except OSError:
             pass
     await app.state.arq_pool.close()
+    await stop_expiry_sweeper()
+    await stop_access_flusher()
     await close_redis()
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+# Keep the class analytics rollups in step with every submission write
+register_rollup_maintenance()
+# ...and the inbox conversation summaries with every message write
+register_summary_maintenance()
+# Drop cached report data when its class, student or teacher data changes
+register_report_data_invalidation()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
@@ -302,9 +416,19 @@ def get_version():
 
 
 @app.get("/metrics", include_in_schema=False, tags=["system"])
-def metrics():
+async def metrics(request: Request):
     from starlette.responses import Response
 
+    # Report queue depth lives in Redis (the worker is another process)
+    arq_pool = getattr(request.app.state, "arq_pool", None)
+    if arq_pool is not None:
+        try:
+            queued, running = await report_queue_depth(arq_pool)
+            REPORT_JOBS_QUEUED.set(queued)
+            REPORT_JOBS_RUNNING.set(running)
+        except Exception as e:
+            logger.warning(f"Could not read report queue depth: {e}")
+
     return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
@@ -328,6 +452,10 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     )
 
 
+# Answer GET/HEAD revalidations with 304 (innermost, so outer middleware
+# still decorates the 304)
+app.add_middleware(ConditionalGetMiddleware)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -336,7 +464,8 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["Content-Disposition"],  # Expose filename header to browser
+        # Filename for downloads, next-page cursor for header-paginated lists
+        expose_headers=["Content-Disposition", "X-Next-Cursor"],
     )
 
 
@@ -365,7 +494,8 @@ app.add_middleware(BotBlockerMiddleware)
 # Prometheus metrics — track request count, duration, in-progress
 app.add_middleware(PrometheusMiddleware)
 
-# Log slow requests (>500ms) — outermost to capture full request time
+# Log slow requests (>500ms) — outermost to capture full request time, and
+# tracks DB statements for the Prometheus middleware inside it
 app.add_middleware(RequestTimingMiddleware)
 
 # Mount static files directory for serving uploaded content (logos, etc.)
@@ -1,12 +1,13 @@
 import re
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from pydantic import field_validator, model_validator
 from sqlalchemy import JSON, CheckConstraint, Column, Index, UniqueConstraint
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -28,6 +29,11 @@ if TYPE_CHECKING:
         TeacherStorageQuota,
     )
 
+# Documents the analytics query into (answers, progress, activity content) are
+# stored as JSONB on PostgreSQL so they can be expanded server-side; other
+# databases (the SQLite test suite) keep plain JSON
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class UserRole(str, Enum):
     """User role enumeration for RBAC"""
@@ -877,7 +883,7 @@ class ActivityBase(SQLModel):
     section_index: int
     activity_type: ActivityType
     title: str | None = Field(default=None, max_length=500)
-    config_json: dict = Field(sa_column=Column(JSON))
+    config_json: dict = Field(sa_column=Column(JSONDocument))
     order_index: int = Field(default=0)
 
 
@@ -1001,7 +1007,7 @@ class AssignmentBase(SQLModel):
     # Story 27.20: AI-generated activity content storage
     # For AI-generated activities, store activity type and content directly
     activity_type: ActivityType | None = Field(default=None)
-    activity_content: dict | None = Field(default=None, sa_column=Column(JSON))
+    activity_content: dict | None = Field(default=None, sa_column=Column(JSONDocument))
     generation_source: str | None = Field(
         default=None, max_length=50
     )  # "book" | "material" | "manual"
@@ -1202,8 +1208,8 @@ class AssignmentStudentBase(SQLModel):
 
     status: AssignmentStatus = Field(default=AssignmentStatus.not_started, index=True)
     score: float | None = Field(default=None, ge=0, le=100)
-    answers_json: dict | None = Field(default=None, sa_column=Column(JSON))
-    progress_json: dict | None = Field(default=None, sa_column=Column(JSON))
+    answers_json: dict | None = Field(default=None, sa_column=Column(JSONDocument))
+    progress_json: dict | None = Field(default=None, sa_column=Column(JSONDocument))
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None, index=True)
     # Deprecated: use time_spent_seconds
@@ -1345,7 +1351,7 @@ class AssignmentStudentActivityBase(SQLModel):
     )
     score: float | None = Field(default=None, ge=0)
     max_score: float = Field(default=100.0, ge=0)
-    response_data: dict | None = Field(default=None, sa_column=Column(JSON))
+    response_data: dict | None = Field(default=None, sa_column=Column(JSONDocument))
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
 
@@ -1757,6 +1763,39 @@ class DirectMessage(SQLModel, table=True):
     )
 
 
+class ConversationSummary(SQLModel, table=True):
+    """One user's view of a conversation: latest message and unread count.
+
+    Each pair of users has two rows, one per side. Maintained on every
+    message write (see app.services.conversation_summary), so the inbox and
+    unread badges read this table instead of grouping direct_messages.
+    """
+
+    __tablename__ = "conversation_summaries"
+    __table_args__ = (
+        UniqueConstraint("user_id", "partner_id", name="uq_conversation_summary"),
+        # Inbox order and keyset pagination
+        Index(
+            "ix_conversation_summaries_user_recent",
+            "user_id",
+            "last_sent_at",
+            "partner_id",
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    partner_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    last_message_id: uuid.UUID | None = Field(
+        default=None, foreign_key="direct_messages.id", ondelete="SET NULL"
+    )
+    last_message_preview: str = Field(default="", max_length=100)
+    last_sent_at: datetime
+    # Messages from partner to user that user has not read yet
+    unread_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
 # =============================================================================
 # Feedback Models (Story 6.4)
 # =============================================================================
@@ -2050,6 +2089,71 @@ class StudentSkillScore(SQLModel, table=True):
     )
 
 
+class StudentDailyRollup(SQLModel, table=True):
+    """Per-student, per-day, per-activity-type totals of completed work.
+
+    Maintained on every submission and grade change (see
+    app.services.analytics_rollup), so class analytics read a few rows per
+    student instead of every submission. Days are UTC dates of completed_at.
+    """
+
+    __tablename__ = "student_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "student_id", "day", "activity_type", name="uq_student_daily_rollup"
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    student_id: uuid.UUID = Field(
+        foreign_key="students.id", index=True, ondelete="CASCADE"
+    )
+    day: date
+    activity_type: str = Field(max_length=100)
+    completed_count: int = Field(default=0)
+    # Completed submissions that have a score, and the sum of those scores
+    scored_count: int = Field(default=0)
+    score_sum: float = Field(default=0.0)
+    # Completed submissions with time recorded, and the minutes they took
+    timed_count: int = Field(default=0)
+    time_spent_minutes_sum: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class BenchmarkSnapshot(SQLModel, table=True):
+    """Precomputed benchmark totals per school or publisher, period and activity type.
+
+    Rebuilt by the benchmark refresh job (see
+    app.services.benchmark_snapshot_service). Rows with class_id NULL hold the
+    scope totals; rows with a class_id hold that class's share, so a benchmark
+    that excludes one class is the totals minus its share. The scope "system"
+    (scope_key "") covers every submission for the admin overview.
+    """
+
+    __tablename__ = "benchmark_snapshots"
+    __table_args__ = (
+        Index(
+            "idx_benchmark_snapshot_lookup", "scope", "scope_key", "period", "class_id"
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    scope: str = Field(max_length=20)  # "school", "publisher" or "system"
+    scope_key: str = Field(max_length=64)  # School UUID or DCS publisher ID
+    period: str = Field(max_length=20)  # BenchmarkPeriod
+    activity_type: str = Field(max_length=100)  # "all" for every activity type
+    class_id: uuid.UUID | None = Field(default=None)
+    # Submissions completed in the period, how many are completed, and the
+    # count and sum of their scores
+    submission_count: int = Field(default=0)
+    completed_count: int = Field(default=0)
+    scored_count: int = Field(default=0)
+    score_sum: float = Field(default=0.0)
+    # Classes with at least one completed submission in the period
+    class_count: int = Field(default=0)
+    refreshed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
 class AIUsageLog(SQLModel, table=True):
     """AI usage tracking for monitoring LLM and TTS generation costs and patterns."""
 
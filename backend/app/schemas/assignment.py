@@ -565,10 +565,12 @@ class StudentAssignmentListResponse(BaseModel):
     """Paginated response for student assignment list."""
 
     items: list[StudentAssignmentResponse]
-    total: int
+    # None when paging by cursor without include_total
+    total: int | None
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class ActivityStartResponse(BaseModel):
@@ -89,6 +89,8 @@ class ConversationListResponse(BaseModel):
     offset: int
     has_more: bool
     total_unread: int
+    # Keyset cursor for the next page; None on the last page
+    next_cursor: str | None = None
 
 
 class MessageThreadResponse(BaseModel):
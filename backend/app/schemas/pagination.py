@@ -1,4 +1,9 @@
-"""Paginated list response schemas for scaling endpoints."""
+"""Paginated list response schemas for scaling endpoints.
+
+Offset-paginated lists report total/limit/offset/has_more. Lists that also
+support keyset pagination (see app.core.pagination) add next_cursor, and
+their total may be None when it was not requested in cursor mode.
+"""
 
 import uuid
 from datetime import datetime
@@ -64,10 +69,12 @@ class AssignmentListPaginatedResponse(BaseModel):
     """Paginated response for teacher assignment list."""
 
     items: list[AssignmentListItem]
-    total: int
+    # None when paging by cursor without include_total
+    total: int | None
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class TeacherWithCountsPaginatedResponse(BaseModel):
@@ -130,6 +130,8 @@ class ReportHistoryResponse(BaseModel):
     """Response containing report history list."""
 
     reports: list[ReportHistoryItem]
+    # Keyset cursor for the next page; None on the last (or only) page
+    next_cursor: str | None = None
 
 
 # --- Internal Data Schemas (for report generation) ---
@@ -0,0 +1,42 @@
+"""Rebuild the per-student daily analytics rollups from assignment_students.
+
+The worker reconciles the last ROLLUP_RECONCILE_DAYS days every night; run
+this to repair older history, e.g. after restoring assignment_students.
+
+Usage:
+    python app/scripts/rebuild_student_rollups.py            # all history
+    python app/scripts/rebuild_student_rollups.py --days 90  # last 90 days
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, ".")
+
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.core.db import async_engine  # noqa: E402
+from app.services.analytics_rollup import reconcile_rollups  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s %(levelname)-8s %(message)s"
+)
+logger = logging.getLogger("rebuild_student_rollups")
+
+
+async def rebuild(days: int | None) -> None:
+    since = (datetime.now(UTC) - timedelta(days=days)).date() if days else None
+    async with AsyncSession(async_engine, expire_on_commit=False) as s:
+        students = await reconcile_rollups(s, since=since)
+    logger.info(f"Rebuilt rollups of {students} students")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--days", type=int, default=None, help="Only rebuild this many recent days"
+    )
+    asyncio.run(rebuild(parser.parse_args().days))
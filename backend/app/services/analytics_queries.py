@@ -0,0 +1,891 @@
+"""
+SQL-side aggregations for the analytics, report and benchmark panels.
+
+Each query answers one panel in one round trip and returns typed rows, so a
+request holds O(result rows) in memory instead of every submission in the
+window. Sums, averages and counts are grouped in the database, period splits
+use aggregate FILTER clauses, leaderboards are ranked with a window function
+and score histograms are bucketed by ``score_bucket`` (``width_bucket`` on
+PostgreSQL, an equivalent CASE elsewhere so the queries also run on SQLite).
+Report queries that return a row per assignment are streamed from a
+server-side cursor rather than fetched whole.
+
+Answer analytics expand the JSON answer documents in the database the same
+way: ``jsonb_each`` / ``jsonb_array_elements`` over the JSONB columns on
+PostgreSQL, ``json_each`` on SQLite, and group by (question, answer), so
+per-question answer frequencies arrive already counted.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import pairwise
+from typing import Any
+
+from sqlalchemy import JSON, Integer, and_, case, distinct, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.selectable import Subquery
+
+from app.core.projections import json_present
+from app.models import (
+    Activity,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+    AssignmentStudentActivityStatus,
+    Class,
+    ClassStudent,
+    Student,
+    StudentDailyRollup,
+    User,
+)
+
+# Score histogram bands shared by class analytics and reports
+SCORE_BUCKETS: list[tuple[int, int, str]] = [
+    (0, 59, "0-59%"),
+    (60, 69, "60-69%"),
+    (70, 79, "70-79%"),
+    (80, 89, "80-89%"),
+    (90, 100, "90-100%"),
+]
+_SCORE_BUCKET_EDGES = [band[0] for band in SCORE_BUCKETS[1:]]
+
+# Rows fetched per round trip by the streaming queries
+STREAM_BATCH_SIZE = 500
+
+
+class score_bucket(FunctionElement[int]):
+    """Index into SCORE_BUCKETS for a score (0 below 60, 4 at 90 and above)."""
+
+    type = Integer()
+    name = "score_bucket"
+    inherit_cache = True
+
+
+@compiles(score_bucket)
+def _compile_score_bucket(element: score_bucket, compiler: Any, **kw: Any) -> str:
+    value = compiler.process(element.clauses, **kw)
+    whens = " ".join(
+        f"WHEN {value} < {edge} THEN {index}"
+        for index, edge in enumerate(_SCORE_BUCKET_EDGES)
+    )
+    return f"CASE {whens} ELSE {len(_SCORE_BUCKET_EDGES)} END"
+
+
+@compiles(score_bucket, "postgresql")
+def _compile_score_bucket_pg(element: score_bucket, compiler: Any, **kw: Any) -> str:
+    value = compiler.process(element.clauses, **kw)
+    edges = ", ".join(str(edge) for edge in _SCORE_BUCKET_EDGES)
+    return (
+        f"width_bucket(CAST({value} AS double precision), "
+        f"ARRAY[{edges}]::double precision[])"
+    )
+
+
+@dataclass(frozen=True)
+class StudentScoreRow:
+    """A student's average over scored work, ranked within the result."""
+
+    student_id: uuid.UUID
+    name: str
+    scored_count: int
+    avg_score: float
+    bucket: int
+    rank: int
+
+
+@dataclass(frozen=True)
+class PeriodSplitRow:
+    """Completed work in the current period versus the one before it."""
+
+    current_scored: int
+    current_score_sum: float
+    current_completed: int
+    previous_scored: int
+    previous_score_sum: float
+    previous_completed: int
+    active_students: int
+
+    @property
+    def current_avg(self) -> float:
+        return (
+            self.current_score_sum / self.current_scored if self.current_scored else 0.0
+        )
+
+    @property
+    def previous_avg(self) -> float:
+        return (
+            self.previous_score_sum / self.previous_scored
+            if self.previous_scored
+            else 0.0
+        )
+
+
+@dataclass(frozen=True)
+class ActivityTypeTotalsRow:
+    """Scored completions of one activity type."""
+
+    activity_type: str
+    scored_count: int
+    score_sum: float
+
+
+@dataclass(frozen=True)
+class AssignmentStatsRow:
+    """Submission totals for one assignment."""
+
+    assignment_id: uuid.UUID
+    name: str
+    total: int
+    completed: int
+    scored: int
+    score_sum: float
+    timed: int
+    time_spent_sum: int
+
+
+@dataclass(frozen=True)
+class AssignmentReportRow(AssignmentStatsRow):
+    """Submission totals for one assignment and the type of its activity."""
+
+    activity_type: str
+
+
+@dataclass(frozen=True)
+class SubmissionPeriodTotals:
+    """Report totals for assignments created in the current and previous period."""
+
+    current_completed: int
+    current_avg: float | None
+    current_assignments: int
+    previous_avg: float | None
+
+
+def score_bucket_counts(rows: Sequence[StudentScoreRow]) -> list[int]:
+    """Number of students in each SCORE_BUCKETS band."""
+    counts = [0] * len(SCORE_BUCKETS)
+    for row in rows:
+        counts[row.bucket] += 1
+    return counts
+
+
+async def _ranked_students(
+    session: AsyncSession, per_student: Subquery
+) -> list[StudentScoreRow]:
+    """Rank a (student_id, scored_count, avg_score) subquery and attach names."""
+    rank = func.row_number().over(
+        order_by=(per_student.c.avg_score.desc(), per_student.c.student_id)
+    )
+    result = await session.execute(
+        select(
+            per_student.c.student_id,
+            User.full_name,
+            User.username,
+            per_student.c.scored_count,
+            per_student.c.avg_score,
+            score_bucket(per_student.c.avg_score),
+            rank,
+        )
+        .join(Student, Student.id == per_student.c.student_id)
+        .join(User, Student.user_id == User.id)
+        .order_by(rank)
+    )
+    return [
+        StudentScoreRow(
+            student_id=student_id,
+            name=full_name or username or "Unknown",
+            scored_count=scored_count,
+            avg_score=float(avg_score),
+            bucket=bucket,
+            rank=position,
+        )
+        for (
+            student_id,
+            full_name,
+            username,
+            scored_count,
+            avg_score,
+            bucket,
+            position,
+        ) in result.all()
+    ]
+
+
+async def rollup_student_ranking(
+    session: AsyncSession, student_ids: Sequence[uuid.UUID], since: date
+) -> list[StudentScoreRow]:
+    """
+    Rank students by average score from their daily rollups.
+
+    Args:
+        session: Database session
+        student_ids: Students to rank
+        since: First UTC day to include
+
+    Returns:
+        Students with at least one scored completion, best first
+    """
+    scored = func.sum(StudentDailyRollup.scored_count)
+    per_student = (
+        select(
+            StudentDailyRollup.student_id,
+            scored.label("scored_count"),
+            (func.sum(StudentDailyRollup.score_sum) / scored).label("avg_score"),
+        )
+        .where(
+            StudentDailyRollup.student_id.in_(student_ids),
+            StudentDailyRollup.day >= since,
+        )
+        .group_by(StudentDailyRollup.student_id)
+        .having(scored > 0)
+        .subquery()
+    )
+    return await _ranked_students(session, per_student)
+
+
+async def rollup_period_split(
+    session: AsyncSession,
+    student_ids: Sequence[uuid.UUID],
+    since: date,
+    split: date,
+) -> PeriodSplitRow:
+    """
+    Totals of completed work before and from ``split``, from daily rollups.
+
+    Args:
+        session: Database session
+        student_ids: Students to include
+        since: First UTC day of the previous period
+        split: First UTC day of the current period
+
+    Returns:
+        PeriodSplitRow (active students are those completing work since split)
+    """
+    current = StudentDailyRollup.day >= split
+    previous = StudentDailyRollup.day < split
+
+    def total(column: Any, period: ColumnElement[bool]) -> ColumnElement[Any]:
+        return func.coalesce(func.sum(column).filter(period), 0)
+
+    result = await session.execute(
+        select(
+            total(StudentDailyRollup.scored_count, current),
+            total(StudentDailyRollup.score_sum, current),
+            total(StudentDailyRollup.completed_count, current),
+            total(StudentDailyRollup.scored_count, previous),
+            total(StudentDailyRollup.score_sum, previous),
+            total(StudentDailyRollup.completed_count, previous),
+            func.count(distinct(StudentDailyRollup.student_id)).filter(
+                and_(current, StudentDailyRollup.completed_count > 0)
+            ),
+        ).where(
+            StudentDailyRollup.student_id.in_(student_ids),
+            StudentDailyRollup.day >= since,
+        )
+    )
+    row = result.one()
+    return PeriodSplitRow(
+        current_scored=int(row[0]),
+        current_score_sum=float(row[1]),
+        current_completed=int(row[2]),
+        previous_scored=int(row[3]),
+        previous_score_sum=float(row[4]),
+        previous_completed=int(row[5]),
+        active_students=int(row[6]),
+    )
+
+
+async def rollup_activity_type_totals(
+    session: AsyncSession, student_ids: Sequence[uuid.UUID], since: date
+) -> list[ActivityTypeTotalsRow]:
+    """
+    Scored completions per activity type, from daily rollups.
+
+    Args:
+        session: Database session
+        student_ids: Students to include
+        since: First UTC day to include
+
+    Returns:
+        One row per activity type with at least one scored completion
+    """
+    scored = func.sum(StudentDailyRollup.scored_count)
+    result = await session.execute(
+        select(
+            StudentDailyRollup.activity_type,
+            scored,
+            func.sum(StudentDailyRollup.score_sum),
+        )
+        .where(
+            StudentDailyRollup.student_id.in_(student_ids),
+            StudentDailyRollup.day >= since,
+        )
+        .group_by(StudentDailyRollup.activity_type)
+        .having(scored > 0)
+    )
+    return [
+        ActivityTypeTotalsRow(
+            activity_type=activity_type,
+            scored_count=int(count),
+            score_sum=float(score_sum),
+        )
+        for activity_type, count, score_sum in result.all()
+    ]
+
+
+async def submission_student_ranking(
+    session: AsyncSession, *criteria: ColumnElement[bool]
+) -> list[StudentScoreRow]:
+    """
+    Rank students by average score over completed, scored submissions.
+
+    Args:
+        session: Database session
+        *criteria: Extra filters on AssignmentStudent / Assignment
+
+    Returns:
+        Students with at least one scored completion, best first
+    """
+    per_student = (
+        select(
+            AssignmentStudent.student_id,
+            func.count(AssignmentStudent.score).label("scored_count"),
+            func.avg(AssignmentStudent.score).label("avg_score"),
+        )
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(
+            AssignmentStudent.status == AssignmentStatus.completed,
+            AssignmentStudent.score.is_not(None),
+            *criteria,
+        )
+        .group_by(AssignmentStudent.student_id)
+        .subquery()
+    )
+    return await _ranked_students(session, per_student)
+
+
+def _assignment_totals() -> list[ColumnElement[Any]]:
+    """Aggregates behind AssignmentStatsRow, from ``total`` to ``time_spent_sum``."""
+    is_completed = AssignmentStudent.status == AssignmentStatus.completed
+    is_scored = and_(is_completed, AssignmentStudent.score.is_not(None))
+    is_timed = and_(is_completed, AssignmentStudent.time_spent_minutes > 0)
+    return [
+        func.count(AssignmentStudent.id),
+        func.count(AssignmentStudent.id).filter(is_completed),
+        func.count(AssignmentStudent.id).filter(is_scored),
+        func.coalesce(func.sum(AssignmentStudent.score).filter(is_scored), 0),
+        func.count(AssignmentStudent.id).filter(is_timed),
+        func.coalesce(
+            func.sum(AssignmentStudent.time_spent_minutes).filter(is_timed), 0
+        ),
+    ]
+
+
+async def assignment_stats(
+    session: AsyncSession, *criteria: ColumnElement[bool]
+) -> list[AssignmentStatsRow]:
+    """
+    Per-assignment submission totals.
+
+    "Scored" and "timed" count completed submissions with a score and with
+    time recorded respectively.
+
+    Args:
+        session: Database session
+        *criteria: Filters on AssignmentStudent / Assignment
+
+    Returns:
+        One row per assignment with matching submissions, ordered by name
+    """
+    result = await session.execute(
+        select(Assignment.id, Assignment.name, *_assignment_totals())
+        .select_from(AssignmentStudent)
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(*criteria)
+        .group_by(Assignment.id, Assignment.name)
+        .order_by(Assignment.name, Assignment.id)
+    )
+    return [
+        AssignmentStatsRow(
+            assignment_id=assignment_id,
+            name=name,
+            total=total,
+            completed=completed,
+            scored=scored,
+            score_sum=float(score_sum),
+            timed=timed,
+            time_spent_sum=int(time_spent_sum),
+        )
+        for (
+            assignment_id,
+            name,
+            total,
+            completed,
+            scored,
+            score_sum,
+            timed,
+            time_spent_sum,
+        ) in result.all()
+    ]
+
+
+async def stream_assignment_report_rows(
+    session: AsyncSession, *criteria: ColumnElement[bool]
+) -> AsyncIterator[AssignmentReportRow]:
+    """
+    Per-assignment submission totals of single-activity assignments, streamed.
+
+    Rows are read from a server-side cursor STREAM_BATCH_SIZE at a time, so
+    a report over a whole school year never holds more than one batch.
+    Nothing else may run on the session until the iterator is exhausted.
+
+    Args:
+        session: Database session
+        *criteria: Filters on Assignment / Activity
+
+    Returns:
+        One row per assignment (including those without submissions),
+        ordered by creation time
+    """
+    result = await session.stream(
+        select(
+            Assignment.id,
+            Assignment.name,
+            *_assignment_totals(),
+            Activity.activity_type,
+        )
+        .select_from(Assignment)
+        .join(Activity, Assignment.activity_id == Activity.id)
+        .outerjoin(AssignmentStudent, AssignmentStudent.assignment_id == Assignment.id)
+        .where(*criteria)
+        .group_by(
+            Assignment.id,
+            Assignment.name,
+            Assignment.created_at,
+            Activity.activity_type,
+        )
+        .order_by(Assignment.created_at, Assignment.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    async for (
+        assignment_id,
+        name,
+        total,
+        completed,
+        scored,
+        score_sum,
+        timed,
+        time_spent_sum,
+        activity_type,
+    ) in result:
+        yield AssignmentReportRow(
+            assignment_id=assignment_id,
+            name=name,
+            total=total,
+            completed=completed,
+            scored=scored,
+            score_sum=float(score_sum),
+            timed=timed,
+            time_spent_sum=int(time_spent_sum),
+            activity_type=activity_type,
+        )
+
+
+async def past_due_counts(
+    session: AsyncSession, now: datetime, *criteria: ColumnElement[bool]
+) -> dict[uuid.UUID, int]:
+    """
+    Count unfinished submissions past their due date, per student.
+
+    Args:
+        session: Database session
+        now: Reference time for "past due"
+        *criteria: Extra filters on AssignmentStudent / Assignment
+
+    Returns:
+        Dict of student_id to past-due count (students with none are omitted)
+    """
+    result = await session.execute(
+        select(AssignmentStudent.student_id, func.count(AssignmentStudent.id))
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(
+            AssignmentStudent.status != AssignmentStatus.completed,
+            Assignment.due_date < now,
+            *criteria,
+        )
+        .group_by(AssignmentStudent.student_id)
+    )
+    return dict(result.tuples().all())
+
+
+async def submission_period_totals(
+    session: AsyncSession,
+    student_ids: Sequence[uuid.UUID],
+    current: tuple[datetime, datetime],
+    previous: tuple[datetime, datetime],
+) -> SubmissionPeriodTotals:
+    """
+    Report totals for assignments created in the current and previous period.
+
+    Args:
+        session: Database session
+        student_ids: Students to include
+        current: (start, end) of the current period, inclusive
+        previous: (start, end) of the previous period, inclusive
+
+    Returns:
+        Completed count, average and assignment count for the current period
+        and the average for the previous one
+    """
+    in_current = Assignment.created_at.between(*current)
+    in_previous = Assignment.created_at.between(*previous)
+    is_completed = AssignmentStudent.status == AssignmentStatus.completed
+    result = await session.execute(
+        select(
+            func.count(AssignmentStudent.id).filter(in_current, is_completed),
+            func.avg(AssignmentStudent.score).filter(in_current, is_completed),
+            func.count(distinct(Assignment.id)).filter(in_current),
+            func.avg(AssignmentStudent.score).filter(in_previous, is_completed),
+        )
+        .select_from(AssignmentStudent)
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(
+            AssignmentStudent.student_id.in_(student_ids),
+            in_current | in_previous,
+        )
+    )
+    completed, current_avg, assignments, previous_avg = result.one()
+    return SubmissionPeriodTotals(
+        current_completed=completed,
+        current_avg=float(current_avg) if current_avg is not None else None,
+        current_assignments=assignments,
+        previous_avg=float(previous_avg) if previous_avg is not None else None,
+    )
+
+
+def period_index(
+    column: ColumnElement[datetime], boundaries: Sequence[datetime]
+) -> ColumnElement[int]:
+    """
+    Index of the period containing ``column``.
+
+    Period ``i`` is ``[boundaries[i], boundaries[i + 1])``; values outside
+    every period map to NULL, so callers filter on the outer boundaries.
+    """
+    return case(
+        *(
+            (and_(column >= start, column < end), index)
+            for index, (start, end) in enumerate(pairwise(boundaries))
+        ),
+        else_=None,
+    )
+
+
+async def average_score_by_period(
+    session: AsyncSession,
+    boundaries: Sequence[datetime],
+    *criteria: ColumnElement[bool],
+    through_classes: bool = False,
+) -> dict[int, float]:
+    """
+    Average score of completed submissions per period, in one query.
+
+    Args:
+        session: Database session
+        boundaries: Ascending period edges (see ``period_index``)
+        *criteria: Extra filters on AssignmentStudent / Assignment (and
+            ClassStudent / Class when ``through_classes`` is set)
+        through_classes: Join the students' class enrollments so criteria
+            can filter on Class (students count once per class)
+
+    Returns:
+        Dict of period index to average score (periods without data omitted)
+    """
+    period = period_index(AssignmentStudent.completed_at, boundaries)
+    query = (
+        select(period, func.avg(AssignmentStudent.score))
+        .select_from(AssignmentStudent)
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+    )
+    if through_classes:
+        query = query.join(
+            ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id
+        ).join(Class, Class.id == ClassStudent.class_id)
+    result = await session.execute(
+        query.where(
+            AssignmentStudent.status == AssignmentStatus.completed,
+            AssignmentStudent.score.is_not(None),
+            AssignmentStudent.completed_at >= boundaries[0],
+            AssignmentStudent.completed_at < boundaries[-1],
+            *criteria,
+        ).group_by(period)
+    )
+    return {index: float(avg) for index, avg in result.all() if index is not None}
+
+
+# --- Answer documents -------------------------------------------------------
+
+
+class json_object_members(FunctionElement[Any]):
+    """
+    Set-returning (key, value) rows of a JSON object.
+
+    ``jsonb_each`` on PostgreSQL, ``json_each`` elsewhere. Documents that are
+    not objects (NULL, JSON null, arrays) expand to no rows instead of
+    raising. Use with ``.table_valued("key", "value")``.
+    """
+
+    name = "json_object_members"
+    inherit_cache = True
+
+
+@compiles(json_object_members)
+def _compile_json_object_members(
+    element: json_object_members, compiler: Any, **kw: Any
+) -> str:
+    document = compiler.process(element.clauses, **kw)
+    return (
+        f"json_each(CASE WHEN json_type({document}) = 'object' "
+        f"THEN {document} ELSE '{{}}' END)"
+    )
+
+
+@compiles(json_object_members, "postgresql")
+def _compile_json_object_members_pg(
+    element: json_object_members, compiler: Any, **kw: Any
+) -> str:
+    document = compiler.process(element.clauses, **kw)
+    return (
+        f"jsonb_each(CASE WHEN jsonb_typeof({document}) = 'object' "
+        f"THEN {document} ELSE '{{}}'::jsonb END)"
+    )
+
+
+class json_array_members(FunctionElement[Any]):
+    """
+    Set-returning ``value`` rows, one per element of a JSON array.
+
+    ``jsonb_array_elements`` on PostgreSQL, ``json_each`` elsewhere. Anything
+    but an array expands to no rows. Use with ``.table_valued("value")``.
+    """
+
+    name = "json_array_members"
+    inherit_cache = True
+
+
+@compiles(json_array_members)
+def _compile_json_array_members(
+    element: json_array_members, compiler: Any, **kw: Any
+) -> str:
+    document = compiler.process(element.clauses, **kw)
+    return (
+        f"json_each(CASE WHEN json_type({document}) = 'array' "
+        f"THEN {document} ELSE '[]' END)"
+    )
+
+
+@compiles(json_array_members, "postgresql")
+def _compile_json_array_members_pg(
+    element: json_array_members, compiler: Any, **kw: Any
+) -> str:
+    document = compiler.process(element.clauses, **kw)
+    return (
+        f"jsonb_array_elements(CASE WHEN jsonb_typeof({document}) = 'array' "
+        f"THEN {document} ELSE '[]'::jsonb END)"
+    )
+
+
+class json_member_value(FunctionElement[Any]):
+    """
+    The ``value`` column of a member expansion, returned as a JSON document.
+
+    PostgreSQL already yields jsonb; SQLite's ``json_each`` yields bare SQL
+    values, which ``json_quote`` turns back into JSON.
+    """
+
+    type = JSON()
+    name = "json_member_value"
+    inherit_cache = True
+
+
+@compiles(json_member_value)
+def _compile_json_member_value(
+    element: json_member_value, compiler: Any, **kw: Any
+) -> str:
+    return f"json_quote({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_member_value, "postgresql")
+def _compile_json_member_value_pg(
+    element: json_member_value, compiler: Any, **kw: Any
+) -> str:
+    return compiler.process(element.clauses, **kw)
+
+
+@dataclass(frozen=True)
+class AnswerCountRow:
+    """How many submissions gave one answer to one question of an assignment."""
+
+    assignment_id: uuid.UUID
+    question_id: str
+    answer: Any
+    count: int
+
+
+async def answer_counts(
+    session: AsyncSession, *criteria: ColumnElement[bool]
+) -> list[AnswerCountRow]:
+    """
+    Count each answer given to each question, per assignment.
+
+    ``answers_json`` of zone, category and matching activities maps a
+    question id to the chosen answer. The documents are expanded and grouped
+    in the database, so only distinct (question, answer) pairs are returned
+    rather than every submission's document.
+
+    Args:
+        session: Database session
+        *criteria: Filters on AssignmentStudent / Assignment
+
+    Returns:
+        One row per (assignment, question, answer); answers are decoded JSON
+    """
+    members = json_object_members(AssignmentStudent.answers_json).table_valued(
+        "key", "value"
+    )
+    answer = json_member_value(members.c.value)
+    result = await session.execute(
+        select(
+            AssignmentStudent.assignment_id,
+            members.c.key,
+            answer,
+            func.count(),
+        )
+        .select_from(AssignmentStudent)
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .join(members, true())
+        .where(json_present(AssignmentStudent.answers_json), *criteria)
+        .group_by(AssignmentStudent.assignment_id, members.c.key, answer)
+    )
+    return [
+        AnswerCountRow(
+            assignment_id=assignment_id,
+            question_id=question_id,
+            answer=value,
+            count=count,
+        )
+        for assignment_id, question_id, value, count in result.all()
+    ]
+
+
+async def array_answer_counts(
+    session: AsyncSession, member: str, *criteria: ColumnElement[bool]
+) -> list[tuple[Any, int]]:
+    """
+    Count the elements of an array stored under ``member`` in answers_json.
+
+    Used for word search answers (``{"words": [...]}``).
+
+    Args:
+        session: Database session
+        member: Key of the array inside each answers document
+        *criteria: Filters on AssignmentStudent / Assignment
+
+    Returns:
+        (decoded element, number of occurrences) pairs
+    """
+    elements = json_array_members(AssignmentStudent.answers_json[member]).table_valued(
+        "value"
+    )
+    element = json_member_value(elements.c.value)
+    result = await session.execute(
+        select(element, func.count())
+        .select_from(AssignmentStudent)
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .join(elements, true())
+        .where(json_present(AssignmentStudent.answers_json), *criteria)
+        .group_by(element)
+    )
+    return list(result.tuples().all())
+
+
+async def answered_counts(
+    session: AsyncSession, *criteria: ColumnElement[bool]
+) -> dict[uuid.UUID, int]:
+    """
+    Count submissions with a non-empty answers document, per assignment.
+
+    Args:
+        session: Database session
+        *criteria: Filters on AssignmentStudent / Assignment
+
+    Returns:
+        Dict of assignment_id to answered submissions (zero counts omitted)
+    """
+    result = await session.execute(
+        select(AssignmentStudent.assignment_id, func.count(AssignmentStudent.id))
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(json_present(AssignmentStudent.answers_json), *criteria)
+        .group_by(AssignmentStudent.assignment_id)
+    )
+    return dict(result.tuples().all())
+
+
+@dataclass(frozen=True)
+class ActivityProgressRow:
+    """Per-activity progress totals within a multi-activity assignment."""
+
+    activity_id: uuid.UUID
+    completed: int
+    avg_score: float | None
+
+
+async def activity_progress_stats(
+    session: AsyncSession, assignment_id: uuid.UUID
+) -> dict[uuid.UUID, ActivityProgressRow]:
+    """
+    Progress totals for each activity of an assignment, in one query.
+
+    The average covers completed activities that have a score. Progress
+    rows may be created lazily, so count the assignment's students, not its
+    progress rows, to get how many were assigned each activity.
+
+    Args:
+        session: Database session
+        assignment_id: Multi-activity assignment
+
+    Returns:
+        Dict of activity_id to its totals (activities without progress rows
+        are omitted)
+    """
+    is_completed = (
+        AssignmentStudentActivity.status == AssignmentStudentActivityStatus.completed
+    )
+    result = await session.execute(
+        select(
+            AssignmentStudentActivity.activity_id,
+            func.count(AssignmentStudentActivity.id).filter(is_completed),
+            func.avg(AssignmentStudentActivity.score).filter(
+                is_completed, AssignmentStudentActivity.score.is_not(None)
+            ),
+        )
+        .join(
+            AssignmentStudent,
+            AssignmentStudentActivity.assignment_student_id == AssignmentStudent.id,
+        )
+        .where(AssignmentStudent.assignment_id == assignment_id)
+        .group_by(AssignmentStudentActivity.activity_id)
+    )
+    return {
+        activity_id: ActivityProgressRow(
+            activity_id=activity_id,
+            completed=completed,
+            avg_score=float(avg_score) if avg_score is not None else None,
+        )
+        for activity_id, completed, avg_score in result.all()
+    }
@@ -0,0 +1,285 @@
+"""
+Incremental per-student rollups of completed work for class analytics.
+
+``StudentDailyRollup`` holds, per student, UTC day and activity type, the
+number of completed submissions plus score and time totals. Class analytics
+read these rows instead of every submission in the comparison window, so
+their cost is bounded by students x days x activity types.
+
+Rollups are maintained by a session ``after_flush`` hook: whenever an
+AssignmentStudent row is inserted, deleted, or has its status, score,
+completion time or time spent changed, the affected (student, day) buckets
+are recomputed from assignment_students inside the same transaction. A
+re-grade or a reopened submission therefore needs no delta bookkeeping and
+the rollup commits (or rolls back) together with the submission.
+
+Rollups are keyed by student rather than by class, so enrolling or removing
+a student never requires a recompute — analytics filter by the current
+enrollment at read time.
+
+On PostgreSQL a refresh first takes a transaction-level advisory lock per
+student. Two submissions of one student committing concurrently therefore
+rebuild their buckets one after the other, and the second sees the first's
+row. Without the lock, both would rewrite the same rows from their own
+snapshots. A refresh that still fails is only logged, so
+``reconcile_rollups`` rebuilds recent rollups from assignment_students. The
+worker runs it nightly, and ``app/scripts/rebuild_student_rollups.py`` runs
+it on demand.
+"""
+
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, inspect, select, union
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Activity,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    StudentDailyRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+# AssignmentStudent columns that feed the rollups
+_TRACKED_ATTRS = (
+    "status",
+    "score",
+    "completed_at",
+    "time_spent_minutes",
+    "student_id",
+    "assignment_id",
+)
+
+
+# Students rebuilt per transaction by reconcile_rollups
+RECONCILE_BATCH_SIZE = 200
+
+
+def rollup_day(completed_at: datetime) -> date:
+    """UTC day a completion is counted in (naive values are taken as UTC)."""
+    if completed_at.tzinfo is not None:
+        completed_at = completed_at.astimezone(UTC)
+    return completed_at.date()
+
+
+def _activity_type_name(activity_type: Any) -> str:
+    if activity_type is None:
+        return "unknown"
+    return getattr(activity_type, "value", activity_type)
+
+
+def _touched_buckets(session: Session) -> set[tuple[uuid.UUID, date]]:
+    """(student, day) buckets affected by the AssignmentStudent changes just flushed."""
+    buckets: set[tuple[uuid.UUID, date]] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, AssignmentStudent):
+            continue
+        state = inspect(obj)
+        if obj in session.dirty and not any(
+            state.attrs[attr].history.has_changes() for attr in _TRACKED_ATTRS
+        ):
+            continue
+        # Both the old and new values matter: a moved completion time empties
+        # one bucket and fills another.
+        student_history = state.attrs.student_id.history
+        completed_history = state.attrs.completed_at.history
+        student_ids = {obj.student_id, *student_history.deleted}
+        completions = {obj.completed_at, *completed_history.deleted}
+        for student_id in student_ids:
+            for completed_at in completions:
+                if student_id is not None and completed_at is not None:
+                    buckets.add((student_id, rollup_day(completed_at)))
+    return buckets
+
+
+def refresh_rollups(
+    connection: Connection, buckets: Iterable[tuple[uuid.UUID, date]]
+) -> None:
+    """
+    Recompute the rollup rows for the given (student, day) buckets.
+
+    Every (student, day) combination of the given students and days is
+    rebuilt, which is a superset of the buckets and keeps this to one read,
+    one delete and one insert.
+
+    Args:
+        connection: Connection in the caller's transaction
+        buckets: (student_id, UTC day) pairs to rebuild
+    """
+    buckets = set(buckets)
+    if not buckets:
+        return
+    student_ids = {student_id for student_id, _ in buckets}
+    _lock_students(connection, student_ids)
+    days = {day for _, day in buckets}
+    range_start = datetime.combine(min(days), time.min, tzinfo=UTC)
+    range_end = datetime.combine(max(days) + timedelta(days=1), time.min, tzinfo=UTC)
+
+    rows = connection.execute(
+        select(
+            AssignmentStudent.student_id,
+            AssignmentStudent.completed_at,
+            AssignmentStudent.score,
+            AssignmentStudent.time_spent_minutes,
+            Activity.activity_type,
+            Assignment.activity_type,
+        )
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .outerjoin(Activity, Assignment.activity_id == Activity.id)
+        .where(
+            AssignmentStudent.student_id.in_(student_ids),
+            AssignmentStudent.status == AssignmentStatus.completed,
+            AssignmentStudent.completed_at >= range_start,
+            AssignmentStudent.completed_at < range_end,
+        )
+    ).all()
+
+    totals: dict[tuple[uuid.UUID, date, str], dict[str, Any]] = {}
+    for student_id, completed_at, score, minutes, activity_type, fallback in rows:
+        day = rollup_day(completed_at)
+        if day not in days:
+            continue
+        key = (student_id, day, _activity_type_name(activity_type or fallback))
+        bucket = totals.setdefault(
+            key,
+            {
+                "completed_count": 0,
+                "scored_count": 0,
+                "score_sum": 0.0,
+                "timed_count": 0,
+                "time_spent_minutes_sum": 0,
+            },
+        )
+        bucket["completed_count"] += 1
+        if score is not None:
+            bucket["scored_count"] += 1
+            bucket["score_sum"] += score
+        if minutes:
+            bucket["timed_count"] += 1
+            bucket["time_spent_minutes_sum"] += minutes
+
+    connection.execute(
+        delete(StudentDailyRollup).where(
+            StudentDailyRollup.student_id.in_(student_ids),
+            StudentDailyRollup.day.in_(days),
+        )
+    )
+    if totals:
+        now = datetime.now(UTC)
+        connection.execute(
+            insert(StudentDailyRollup),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "student_id": student_id,
+                    "day": day,
+                    "activity_type": activity_type,
+                    "updated_at": now,
+                    **values,
+                }
+                for (student_id, day, activity_type), values in totals.items()
+            ],
+        )
+
+
+def _lock_students(connection: Connection, student_ids: Iterable[uuid.UUID]) -> None:
+    """Serialize rollup refreshes per student until the transaction ends."""
+    if connection.dialect.name != "postgresql":
+        return
+    # Sorted, so two refreshes sharing students cannot deadlock
+    for student_id in sorted(student_ids):
+        key = int.from_bytes(student_id.bytes[:8], "big", signed=True)
+        connection.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def reconcile_rollups(session: AsyncSession, since: date | None = None) -> int:
+    """
+    Rebuild rollups from assignment_students, repairing failed refreshes.
+
+    Every bucket with completed work or a rollup row on or after ``since``
+    is recomputed, RECONCILE_BATCH_SIZE students per transaction.
+
+    Args:
+        session: Database session
+        since: First UTC day to rebuild (None rebuilds all history)
+
+    Returns:
+        Number of students whose rollups were rebuilt
+    """
+    completed = select(
+        AssignmentStudent.student_id, AssignmentStudent.completed_at
+    ).where(
+        AssignmentStudent.status == AssignmentStatus.completed,
+        AssignmentStudent.completed_at.isnot(None),
+    )
+    existing = select(StudentDailyRollup.student_id, StudentDailyRollup.day)
+    if since is not None:
+        completed = completed.where(
+            AssignmentStudent.completed_at
+            >= datetime.combine(since, time.min, tzinfo=UTC)
+        )
+        existing = existing.where(StudentDailyRollup.day >= since)
+
+    student_ids = sorted(
+        set(
+            (
+                await session.execute(
+                    union(
+                        completed.with_only_columns(AssignmentStudent.student_id),
+                        existing.with_only_columns(StudentDailyRollup.student_id),
+                    )
+                )
+            ).scalars()
+        )
+    )
+
+    for start in range(0, len(student_ids), RECONCILE_BATCH_SIZE):
+        batch = student_ids[start : start + RECONCILE_BATCH_SIZE]
+        buckets = {
+            (student_id, rollup_day(completed_at))
+            for student_id, completed_at in await session.execute(
+                completed.where(AssignmentStudent.student_id.in_(batch))
+            )
+        }
+        buckets |= set(
+            (
+                await session.execute(
+                    existing.where(StudentDailyRollup.student_id.in_(batch))
+                )
+            ).tuples()
+        )
+        await session.run_sync(
+            lambda sync_session, b: refresh_rollups(sync_session.connection(), b),
+            buckets,
+        )
+        await session.commit()
+
+    logger.info(f"Reconciled analytics rollups of {len(student_ids)} students")
+    return len(student_ids)
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    buckets = _touched_buckets(session)
+    if not buckets:
+        return
+    connection = session.connection()
+    # A savepoint keeps a rollup failure from aborting the submission itself
+    try:
+        with connection.begin_nested():
+            refresh_rollups(connection, buckets)
+    except Exception:
+        logger.exception("Failed to refresh analytics rollups")
+
+
+def register_rollup_maintenance() -> None:
+    """Install the flush hook on all sessions (sync and async); idempotent."""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
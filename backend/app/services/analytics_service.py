@@ -1,11 +1,13 @@
 """Analytics service for student performance calculations - Stories 5.1, 5.2, 5.3, 5.4."""
 
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 
 from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.projections import without_blobs
 from app.models import (
     Activity,
     Assignment,
@@ -66,6 +68,19 @@ from app.schemas.analytics import (
     WordMatchingError,
     WordSearchAnalysis,
 )
+from app.services.analytics_queries import (
+    SCORE_BUCKETS,
+    AnswerCountRow,
+    answer_counts,
+    answered_counts,
+    array_answer_counts,
+    assignment_stats,
+    past_due_counts,
+    rollup_activity_type_totals,
+    rollup_period_split,
+    rollup_student_ranking,
+    score_bucket_counts,
+)
 from app.services.book_service_v2 import get_book_service
 
 
@@ -419,10 +434,6 @@ async def get_class_analytics(
 
     # Get period dates
     current_period_start, previous_period_start = get_class_period_dates(period)
-    # Use naive datetime for SQLite compatibility
-    current_start_naive = current_period_start.replace(tzinfo=None)
-    previous_start_naive = previous_period_start.replace(tzinfo=None)
-    now_naive = datetime.now(UTC).replace(tzinfo=None)
 
     # Get all students enrolled in this class
     enrolled_result = await session.execute(
@@ -465,59 +476,31 @@ async def get_class_analytics(
             trends=[],
         )
 
-    # Base query joining all needed tables for students in this class
-    base_submissions_query = (
-        select(AssignmentStudent, Assignment, Activity, Student, User)
-        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
-        .outerjoin(Activity, Assignment.activity_id == Activity.id)
-        .join(Student, AssignmentStudent.student_id == Student.id)
-        .join(User, Student.user_id == User.id)
-        .where(AssignmentStudent.student_id.in_(enrolled_student_ids))
+    # Completed work comes from the per-student daily rollups and every panel
+    # is aggregated in the database. Periods are aligned to whole UTC days.
+    since_day = previous_period_start.date()
+    in_window = AssignmentStudent.student_id.in_(enrolled_student_ids) & (
+        AssignmentStudent.completed_at.is_(None)
+        | (AssignmentStudent.completed_at >= previous_period_start)
     )
-
-    # Fetch only submissions relevant to the analysis window (from previous_period_start onward)
-    # This avoids loading historical data outside the analysis range
-    filtered_query = base_submissions_query.where(
-        (AssignmentStudent.completed_at.is_(None))
-        | (AssignmentStudent.completed_at >= previous_start_naive)
+    ranking = await rollup_student_ranking(session, enrolled_student_ids, since_day)
+    split = await rollup_period_split(
+        session, enrolled_student_ids, since_day, current_period_start.date()
     )
-    submissions_result = await session.execute(filtered_query)
-    all_submissions = submissions_result.all()
-
-    # Filter for current period (in Python, from the already-filtered set)
-    current_period_submissions = [
-        (asgn_student, assignment, activity, student, user)
-        for asgn_student, assignment, activity, student, user in all_submissions
-        if asgn_student.completed_at
-        and asgn_student.completed_at >= current_start_naive
-    ]
-
-    # Filter for previous period (in Python, from the already-filtered set)
-    previous_period_submissions = [
-        (asgn_student, assignment, activity, student, user)
-        for asgn_student, assignment, activity, student, user in all_submissions
-        if asgn_student.completed_at
-        and asgn_student.completed_at >= previous_start_naive
-        and asgn_student.completed_at < current_start_naive
-    ]
+    assignment_rows = await assignment_stats(session, in_window)
 
     # Calculate summary metrics
-    total_submissions = len(all_submissions)
-    completed_submissions = [
-        s for s in all_submissions if s[0].status == AssignmentStatus.completed
-    ]
-    total_completed = len(completed_submissions)
+    total_submissions = sum(row.total for row in assignment_rows)
+    total_completed = sum(row.completed for row in assignment_rows)
+    total_assignments = len(assignment_rows)
 
-    # Get unique assignments in this class's scope
-    unique_assignments = {s[1].id for s in all_submissions}
-    total_assignments = len(unique_assignments)
-
-    # Active students (students with at least one submission in current period)
-    active_students = len({s[3].id for s in current_period_submissions})
-
-    # Calculate average score from completed submissions
-    scores = [s[0].score for s in completed_submissions if s[0].score is not None]
-    avg_score = sum(scores) / len(scores) if scores else 0.0
+    # Average score over completed submissions in the window
+    scored_count = split.current_scored + split.previous_scored
+    avg_score = (
+        (split.current_score_sum + split.previous_score_sum) / scored_count
+        if scored_count
+        else 0.0
+    )
 
     # Completion rate
     completion_rate = (
@@ -528,82 +511,40 @@ async def get_class_analytics(
         avg_score=round(avg_score, 1),
         completion_rate=round(completion_rate, 2),
         total_assignments=total_assignments,
-        active_students=active_students,
+        # Students with at least one completion in current period
+        active_students=split.active_students,
     )
 
     # Score distribution histogram (based on student averages)
-    student_scores: dict[uuid.UUID, list[float]] = {}
-    for asgn_student, _, _, student, _ in completed_submissions:
-        if asgn_student.score is not None:
-            if student.id not in student_scores:
-                student_scores[student.id] = []
-            student_scores[student.id].append(asgn_student.score)
-
-    student_averages = [sum(scores) / len(scores) for scores in student_scores.values()]
-
-    # Count students in each bucket
-    buckets = [
-        (0, 59, "0-59%"),
-        (60, 69, "60-69%"),
-        (70, 79, "70-79%"),
-        (80, 89, "80-89%"),
-        (90, 100, "90-100%"),
-    ]
-    score_distribution = []
-    for min_score, max_score, label in buckets:
-        count = sum(1 for avg in student_averages if min_score <= avg <= max_score)
-        score_distribution.append(
-            ScoreDistributionBucket(
-                range_label=label, min_score=min_score, max_score=max_score, count=count
-            )
+    score_distribution = [
+        ScoreDistributionBucket(
+            range_label=label, min_score=min_score, max_score=max_score, count=count
+        )
+        for (min_score, max_score, label), count in zip(
+            SCORE_BUCKETS, score_bucket_counts(ranking), strict=True
         )
-
-    # Leaderboard (top 10 students by avg score)
-    student_data: dict[uuid.UUID, tuple[str, list[float]]] = {}
-    for asgn_student, _, _, student, user in completed_submissions:
-        if asgn_student.score is not None:
-            if student.id not in student_data:
-                student_data[student.id] = (
-                    user.full_name or user.username or "Unknown",
-                    [],
-                )
-            student_data[student.id][1].append(asgn_student.score)
-
-    ranked_students = [
-        (student_id, name, sum(scores) / len(scores))
-        for student_id, (name, scores) in student_data.items()
     ]
-    ranked_students.sort(key=lambda x: x[2], reverse=True)
 
+    # Leaderboard (top 10 students by avg score)
     leaderboard = [
         StudentLeaderboardItem(
-            student_id=str(student_id),
-            name=name,
-            avg_score=round(avg, 1),
-            rank=idx + 1,
+            student_id=str(row.student_id),
+            name=row.name,
+            avg_score=round(row.avg_score, 1),
+            rank=row.rank,
         )
-        for idx, (student_id, name, avg) in enumerate(ranked_students[:10])
+        for row in ranking[:10]
     ]
 
     # Struggling students (avg < 70% OR past_due > 2)
     struggling_students = []
+    student_past_due = await past_due_counts(session, datetime.now(UTC), in_window)
 
-    # Calculate past due count per student
-    student_past_due: dict[uuid.UUID, int] = {}
-    for asgn_student, assignment, _, student, _ in all_submissions:
-        if (
-            asgn_student.status != AssignmentStatus.completed
-            and assignment.due_date
-            and assignment.due_date < now_naive
-        ):
-            student_past_due[student.id] = student_past_due.get(student.id, 0) + 1
-
-    for student_id, (name, scores) in student_data.items():
-        avg = sum(scores) / len(scores) if scores else 0.0
-        past_due = student_past_due.get(student_id, 0)
+    for row in ranking:
+        past_due = student_past_due.get(row.student_id, 0)
 
         alert_reasons = []
-        if avg < 70:
+        if row.avg_score < 70:
             alert_reasons.append("Low average score")
         if past_due >= 2:
             alert_reasons.append("Multiple past due assignments")
@@ -611,86 +552,58 @@ async def get_class_analytics(
         if alert_reasons:
             struggling_students.append(
                 StrugglingStudentItem(
-                    student_id=str(student_id),
-                    name=name,
-                    avg_score=round(avg, 1),
+                    student_id=str(row.student_id),
+                    name=row.name,
+                    avg_score=round(row.avg_score, 1),
                     past_due_count=past_due,
                     alert_reason=", ".join(alert_reasons),
                 )
             )
 
     # Assignment performance
-    assignment_data: dict[uuid.UUID, tuple[str, list[float], int, list[int]]] = {}
-    for asgn_student, assignment, _, _, _ in all_submissions:
-        if assignment.id not in assignment_data:
-            assignment_data[assignment.id] = (assignment.name, [], 0, [])
-
-        name, scores, total, times = assignment_data[assignment.id]
-        total += 1
-        if asgn_student.status == AssignmentStatus.completed:
-            if asgn_student.score is not None:
-                scores.append(asgn_student.score)
-            if asgn_student.time_spent_minutes:
-                times.append(asgn_student.time_spent_minutes)
-        assignment_data[assignment.id] = (name, scores, total, times)
-
     assignment_performance = [
         AssignmentPerformanceItem(
-            assignment_id=str(aid),
-            name=name,
-            avg_score=round(sum(scores) / len(scores), 1) if scores else 0.0,
-            completion_rate=round(len(scores) / total, 2) if total > 0 else 0.0,
-            avg_time_spent=round(sum(times) / len(times), 1) if times else 0.0,
+            assignment_id=str(row.assignment_id),
+            name=row.name,
+            avg_score=round(row.score_sum / row.scored, 1) if row.scored else 0.0,
+            completion_rate=round(row.scored / row.total, 2) if row.total else 0.0,
+            avg_time_spent=(
+                round(row.time_spent_sum / row.timed, 1) if row.timed else 0.0
+            ),
         )
-        for aid, (name, scores, total, times) in assignment_data.items()
+        for row in assignment_rows
     ]
 
     # Activity type performance — grouped by skill
     from app.services.skill_attribution_service import _ACTIVITY_TYPE_SKILL_SLUG
 
+    # display name -> [scored_count, score_sum]
     skill_perf_data: dict[str, list[float]] = {}
-    for asgn_student, assignment, activity, _, _ in completed_submissions:
-        if asgn_student.score is not None:
-            act_type = (
-                activity.activity_type
-                if activity
-                else (
-                    assignment.activity_type.value
-                    if assignment.activity_type
-                    else "unknown"
-                )
-            )
-            skill_name = _ACTIVITY_TYPE_SKILL_SLUG.get(act_type, act_type)
-            # Capitalize skill name for display
-            display_name = skill_name.replace("_", " ").title()
-            if display_name not in skill_perf_data:
-                skill_perf_data[display_name] = []
-            skill_perf_data[display_name].append(asgn_student.score)
+    for row in await rollup_activity_type_totals(
+        session, enrolled_student_ids, since_day
+    ):
+        skill_name = _ACTIVITY_TYPE_SKILL_SLUG.get(row.activity_type, row.activity_type)
+        # Capitalize skill name for display
+        display_name = skill_name.replace("_", " ").title()
+        skill = skill_perf_data.setdefault(display_name, [0, 0.0])
+        skill[0] += row.scored_count
+        skill[1] += row.score_sum
 
     activity_type_performance = [
         ActivityTypePerformanceItem(
             activity_type=skill_name,
-            avg_score=round(sum(scores) / len(scores), 1),
-            count=len(scores),
+            avg_score=round(score_sum / count, 1),
+            count=count,
         )
-        for skill_name, scores in sorted(skill_perf_data.items())
+        for skill_name, (count, score_sum) in sorted(skill_perf_data.items())
     ]
 
     # Trend analysis
     trends = []
 
     # Average score trend
-    current_scores = [
-        s[0].score for s in current_period_submissions if s[0].score is not None
-    ]
-    previous_scores = [
-        s[0].score for s in previous_period_submissions if s[0].score is not None
-    ]
-
-    current_avg = sum(current_scores) / len(current_scores) if current_scores else 0.0
-    previous_avg = (
-        sum(previous_scores) / len(previous_scores) if previous_scores else 0.0
-    )
+    current_avg = split.current_avg
+    previous_avg = split.previous_avg
 
     if previous_avg > 0:
         change_pct = ((current_avg - previous_avg) / previous_avg) * 100
@@ -714,8 +627,8 @@ async def get_class_analytics(
     )
 
     # Completion rate trend
-    current_completed = len(current_period_submissions)
-    previous_completed = len(previous_period_submissions)
+    current_completed = split.current_completed
+    previous_completed = split.previous_completed
 
     if previous_completed > 0:
         completion_change = (
@@ -808,6 +721,7 @@ async def get_assignment_detailed_results(
         .join(Student, AssignmentStudent.student_id == Student.id)
         .join(User, Student.user_id == User.id)
         .where(AssignmentStudent.assignment_id == assignment_id)
+        .options(*without_blobs(AssignmentStudent))
     )
     submissions = submissions_result.all()
 
@@ -888,13 +802,7 @@ async def get_assignment_detailed_results(
 
     # Calculate question-level analysis
     question_analysis = await _analyze_activity_answers(
-        activity_type,
-        config_json,
-        [
-            asgn_student
-            for asgn_student, _, _ in submissions
-            if asgn_student.answers_json
-        ],
+        session, assignment_id, activity_type, config_json
     )
 
     return AssignmentDetailedResultsResponse(
@@ -1046,34 +954,70 @@ async def get_student_assignment_answers(
     )
 
 
+def _answer_stats(
+    rows: Iterable[AnswerCountRow], empty_label: str
+) -> dict[str, dict[str, int]]:
+    """
+    Fold counted (question, answer) rows into per-question answer frequencies.
+
+    Answers are labelled as displayed: their string form, or ``empty_label``
+    for blank answers (distinct blank values are merged under it).
+    """
+    stats: dict[str, dict[str, int]] = {}
+    for row in rows:
+        label = str(row.answer) if row.answer else empty_label
+        answers = stats.setdefault(row.question_id, {})
+        answers[label] = answers.get(label, 0) + row.count
+    return stats
+
+
 async def _analyze_activity_answers(
+    session: AsyncSession,
+    assignment_id: uuid.UUID,
     activity_type: str,
     config_json: dict,
-    submissions: list[AssignmentStudent],
 ) -> ActivityTypeAnalysis | None:
     """
     Analyze answers based on activity type.
 
+    Answer frequencies are counted in the database (see analytics_queries);
+    only the per-question totals reach the analyzers.
+
     Args:
+        session: Database session
+        assignment_id: Assignment whose submissions to analyze
         activity_type: Activity type string
         config_json: Activity configuration
-        submissions: List of submissions with answers
 
     Returns:
-        Activity-type specific analysis or None if no submissions
+        Activity-type specific analysis or None if no submission has answers
     """
-    if not submissions:
+    criteria = (AssignmentStudent.assignment_id == assignment_id,)
+    answered = (await answered_counts(session, *criteria)).get(assignment_id, 0)
+    if not answered:
         return None
 
     # Route to appropriate analyzer based on activity type
     if activity_type in ("dragdroppicture", "circle", "markwithx"):
-        return _analyze_zone_based_activity(activity_type, config_json, submissions)
+        rows = await answer_counts(session, *criteria)
+        return _analyze_zone_based_activity(
+            activity_type, config_json, _answer_stats(rows, "(empty)")
+        )
     elif activity_type == "dragdroppicturegroup":
-        return _analyze_category_activity(activity_type, config_json, submissions)
+        rows = await answer_counts(session, *criteria)
+        return _analyze_category_activity(
+            activity_type, config_json, _answer_stats(rows, "(unplaced)")
+        )
     elif activity_type == "matchTheWords":
-        return _analyze_word_matching_activity(activity_type, config_json, submissions)
+        rows = await answer_counts(session, *criteria)
+        return _analyze_word_matching_activity(
+            activity_type, config_json, _answer_stats(rows, "(unmatched)")
+        )
     elif activity_type == "puzzleFindWords":
-        return _analyze_word_search_activity(activity_type, config_json, submissions)
+        found = await array_answer_counts(session, "words", *criteria)
+        return _analyze_word_search_activity(
+            activity_type, config_json, found, answered
+        )
     else:
         # Unknown activity type - return basic analysis
         return ActivityTypeAnalysis(activity_type=activity_type)
@@ -1082,11 +1026,12 @@ async def _analyze_activity_answers(
 def _analyze_zone_based_activity(
     activity_type: str,
     config_json: dict,
-    submissions: list[AssignmentStudent],
+    zone_stats: dict[str, dict[str, int]],
 ) -> ActivityTypeAnalysis:
     """
     Analyze zone-based activities (dragdroppicture, circle, markwithx).
-    Answers format: { "x-y": "word", ... }
+    Answers format: { "x-y": "word", ... }; zone_stats counts each answer
+    per zone (see _answer_stats).
     """
     # Get correct answers from config
     correct_answers = {}
@@ -1099,31 +1044,13 @@ def _analyze_zone_based_activity(
     if not correct_answers:
         return ActivityTypeAnalysis(activity_type=activity_type)
 
-    # Aggregate answers across all submissions
-    zone_stats: dict[str, dict[str, int]] = {}
-    total_responses_per_zone: dict[str, int] = {}
-
-    for submission in submissions:
-        if not submission.answers_json:
-            continue
-
-        answers = submission.answers_json
-        for zone_id, answer in answers.items():
-            if zone_id not in zone_stats:
-                zone_stats[zone_id] = {}
-                total_responses_per_zone[zone_id] = 0
-
-            total_responses_per_zone[zone_id] += 1
-            answer_str = str(answer) if answer else "(empty)"
-            zone_stats[zone_id][answer_str] = zone_stats[zone_id].get(answer_str, 0) + 1
-
     # Build question analysis
     questions = []
     for zone_id, correct_word in correct_answers.items():
         if zone_id not in zone_stats:
             continue
 
-        total = total_responses_per_zone[zone_id]
+        total = sum(zone_stats[zone_id].values())
         correct_count = zone_stats[zone_id].get(correct_word, 0)
         correct_percentage = (correct_count / total * 100) if total > 0 else 0.0
 
@@ -1176,11 +1103,12 @@ def _analyze_zone_based_activity(
 def _analyze_category_activity(
     activity_type: str,
     config_json: dict,
-    submissions: list[AssignmentStudent],
+    word_stats: dict[str, dict[str, int]],
 ) -> ActivityTypeAnalysis:
     """
     Analyze category-based activities (dragdroppicturegroup).
-    Answers format: { "word": "category", ... }
+    Answers format: { "word": "category", ... }; word_stats counts each
+    chosen category per word (see _answer_stats).
     """
     # Get correct answers from config
     correct_mappings = {}
@@ -1193,30 +1121,13 @@ def _analyze_category_activity(
     if not correct_mappings:
         return ActivityTypeAnalysis(activity_type=activity_type)
 
-    # Aggregate answers
-    word_stats: dict[str, dict[str, int]] = {}
-    total_responses: dict[str, int] = {}
-
-    for submission in submissions:
-        if not submission.answers_json:
-            continue
-
-        for word, chosen_category in submission.answers_json.items():
-            if word not in word_stats:
-                word_stats[word] = {}
-                total_responses[word] = 0
-
-            total_responses[word] += 1
-            cat_str = str(chosen_category) if chosen_category else "(unplaced)"
-            word_stats[word][cat_str] = word_stats[word].get(cat_str, 0) + 1
-
     # Build question analysis
     questions = []
     for word, correct_category in correct_mappings.items():
         if word not in word_stats:
             continue
 
-        total = total_responses[word]
+        total = sum(word_stats[word].values())
         correct_count = word_stats[word].get(correct_category, 0)
         correct_percentage = (correct_count / total * 100) if total > 0 else 0.0
 
@@ -1267,11 +1178,12 @@ def _analyze_category_activity(
 def _analyze_word_matching_activity(
     activity_type: str,
     config_json: dict,
-    submissions: list[AssignmentStudent],
+    word_stats: dict[str, dict[str, int]],
 ) -> ActivityTypeAnalysis:
     """
     Analyze word matching activities (matchTheWords).
-    Answers format: { "word": "matchedWord", ... }
+    Answers format: { "word": "matchedWord", ... }; word_stats counts each
+    match per word (see _answer_stats).
     """
     # Get correct pairs from config
     correct_pairs = {}
@@ -1283,23 +1195,6 @@ def _analyze_word_matching_activity(
     if not correct_pairs:
         return ActivityTypeAnalysis(activity_type=activity_type)
 
-    # Aggregate answers
-    word_stats: dict[str, dict[str, int]] = {}
-    total_responses: dict[str, int] = {}
-
-    for submission in submissions:
-        if not submission.answers_json:
-            continue
-
-        for word, matched in submission.answers_json.items():
-            if word not in word_stats:
-                word_stats[word] = {}
-                total_responses[word] = 0
-
-            total_responses[word] += 1
-            matched_str = str(matched) if matched else "(unmatched)"
-            word_stats[word][matched_str] = word_stats[word].get(matched_str, 0) + 1
-
     # Build question analysis and word matching errors
     questions = []
     word_matching_errors = []
@@ -1308,7 +1203,7 @@ def _analyze_word_matching_activity(
         if word not in word_stats:
             continue
 
-        total = total_responses[word]
+        total = sum(word_stats[word].values())
         correct_count = word_stats[word].get(correct_match, 0)
         correct_percentage = (correct_count / total * 100) if total > 0 else 0.0
 
@@ -1375,11 +1270,14 @@ def _analyze_word_matching_activity(
 def _analyze_word_search_activity(
     activity_type: str,
     config_json: dict,
-    submissions: list[AssignmentStudent],
+    found_counts: Iterable[tuple[object, int]],
+    total_attempts: int,
 ) -> ActivityTypeAnalysis:
     """
     Analyze word search activities (puzzleFindWords).
-    Answers format: { "words": ["word1", "word2", ...] }
+    Answers format: { "words": ["word1", "word2", ...] }; found_counts pairs
+    each found word with how often it was found, over total_attempts
+    answered submissions.
     """
     # Get target words from config
     target_words = set()
@@ -1391,17 +1289,9 @@ def _analyze_word_search_activity(
 
     # Count how many times each word was found
     word_found_count: dict[str, int] = dict.fromkeys(target_words, 0)
-    total_attempts = len(submissions)
-
-    for submission in submissions:
-        if not submission.answers_json:
-            continue
-
-        found_words = submission.answers_json.get("words", [])
-        if isinstance(found_words, list):
-            for word in found_words:
-                if word in word_found_count:
-                    word_found_count[word] += 1
+    for word, count in found_counts:
+        if isinstance(word, str) and word in word_found_count:
+            word_found_count[word] += count
 
     # Build word search analysis
     word_search = []
@@ -1635,71 +1525,53 @@ async def _detect_common_misconceptions(
     insights: list[InsightCard] = []
     now = datetime.now(UTC)
 
-    # Get all completed submissions for teacher's assignments
-    query = (
-        select(Assignment, Activity, AssignmentStudent)
-        .join(Activity, Assignment.activity_id == Activity.id)
-        .join(AssignmentStudent, Assignment.id == AssignmentStudent.assignment_id)
-        .where(
-            Assignment.teacher_id == teacher_id,
-            AssignmentStudent.status == AssignmentStatus.completed,
-            AssignmentStudent.answers_json.isnot(None),
-        )
+    # Count answers per question across the teacher's completed submissions
+    rows = await answer_counts(
+        session,
+        Assignment.teacher_id == teacher_id,
+        Assignment.activity_id.is_not(None),
+        AssignmentStudent.status == AssignmentStatus.completed,
     )
-
-    result = await session.execute(query)
-    submissions = result.all()
+    if not rows:
+        return insights
 
     # Group by assignment
-    assignment_submissions: dict[uuid.UUID, list[tuple]] = {}
-    for assignment, activity, asgn_student in submissions:
-        if assignment.id not in assignment_submissions:
-            assignment_submissions[assignment.id] = []
-        assignment_submissions[assignment.id].append(
-            (assignment, activity, asgn_student)
+    assignment_rows: dict[uuid.UUID, list[AnswerCountRow]] = {}
+    for row in rows:
+        assignment_rows.setdefault(row.assignment_id, []).append(row)
+
+    assignments_result = await session.execute(
+        select(
+            Assignment.id,
+            Assignment.name,
+            Activity.activity_type,
+            Activity.config_json,
         )
+        .join(Activity, Assignment.activity_id == Activity.id)
+        .where(Assignment.id.in_(assignment_rows))
+    )
 
     # Analyze each assignment
-    for assignment_id, assignment_data in assignment_submissions.items():
-        if not assignment_data:
-            continue
-
-        assignment = assignment_data[0][0]
-        activity = assignment_data[0][1]
-        asgn_students = [d[2] for d in assignment_data]
-
+    for (
+        assignment_id,
+        assignment_name,
+        activity_type,
+        config,
+    ) in assignments_result.all():
         # Get correct answers from config
-        config = activity.config_json
-        correct_answers = _extract_correct_answers(activity.activity_type, config)
+        correct_answers = _extract_correct_answers(activity_type, config)
 
         if not correct_answers:
             continue
 
-        # Count answer frequencies per question
-        question_stats: dict[str, dict[str, int]] = {}
-        question_totals: dict[str, int] = {}
-
-        for asgn_student in asgn_students:
-            if not asgn_student.answers_json:
-                continue
-
-            for question_id, answer in asgn_student.answers_json.items():
-                if question_id not in question_stats:
-                    question_stats[question_id] = {}
-                    question_totals[question_id] = 0
-
-                question_totals[question_id] += 1
-                answer_str = str(answer) if answer else "(empty)"
-                question_stats[question_id][answer_str] = (
-                    question_stats[question_id].get(answer_str, 0) + 1
-                )
+        question_stats = _answer_stats(assignment_rows[assignment_id], "(empty)")
 
         # Check for misconceptions
         for question_id, correct_answer in correct_answers.items():
             if question_id not in question_stats:
                 continue
 
-            total = question_totals[question_id]
+            total = sum(question_stats[question_id].values())
             if total < 3:  # Need at least 3 responses
                 continue
 
@@ -1731,7 +1603,7 @@ async def _detect_common_misconceptions(
                         type=InsightType.COMMON_MISCONCEPTION,
                         severity=severity,
                         title="Common Misconception Detected",
-                        description=f"{incorrect_percentage:.0f}% of students answered incorrectly on '{assignment.name}' - Question '{question_id}'",
+                        description=f"{incorrect_percentage:.0f}% of students answered incorrectly on '{assignment_name}' - Question '{question_id}'",
                         affected_count=total - correct_count,
                         recommended_action=f"Review this question - many students chose '{common_wrong}' instead of '{correct_answer}'",
                         created_at=now,
@@ -0,0 +1,409 @@
+"""
+On-disk blob cache for DCS book assets.
+
+Covers, page images and AI content audio are immutable between book updates,
+yet every request used to download them from DCS again. This cache keeps them
+on local disk so a classroom opening the same page hits DCS once and the
+bytes are then served from a file (FileResponse, zero-copy where the server
+supports it).
+
+Layout under ``ASSET_CACHE_DIR``::
+
+    blobs/<aa>/<sha256>          content-addressed file bodies
+    refs/book-<id>/<sha256(name)>  text file naming the blob for an asset
+
+Blobs are deduplicated by content hash, which doubles as a strong ETag.
+Writes go to a temp file and are renamed into place, so readers never see
+partial files. Blob mtimes are bumped on access and the least recently used
+blobs are deleted once the total size exceeds ``ASSET_CACHE_MAX_BYTES``.
+Blobs used within the last few minutes are never evicted, so a FileResponse
+returned for one still finds it when it opens the file.
+Refs expire after ``ASSET_CACHE_TTL`` and are dropped for a whole book when a
+DCS webhook reports it changed (broadcast to other hosts over the
+invalidation bus). The disk is shared by every worker on a host.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.http_cache import etag_matches
+from app.services.redis_cache import (
+    publish_invalidation,
+    register_invalidation_handler,
+)
+
+logger = logging.getLogger(__name__)
+
+ASSET_INVALIDATION_CHANNEL = "cache:assets:invalidate"
+
+# Evict down to this fraction of the budget so eviction does not run per write
+_EVICT_TARGET_RATIO = 0.9
+# Only bump a blob's mtime (its LRU position) once per interval
+_TOUCH_INTERVAL_SECONDS = 60
+# Never evict blobs used more recently than this: a response may still be
+# about to open them. Must exceed the touch interval.
+_EVICT_GRACE_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class CachedAsset:
+    """A cached asset body on local disk."""
+
+    path: Path
+    content_hash: str
+    size: int
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the content hash."""
+        return f'"{self.content_hash}"'
+
+
+class AssetDiskCache:
+    """
+    Content-addressed, size-capped LRU cache of asset bytes on local disk.
+
+    Concurrent misses for the same asset within a worker share one fetch.
+
+    Example:
+        cache = AssetDiskCache(Path("/var/cache/lms-assets"), max_bytes=2 * 1024**3)
+        asset = await cache.get_or_fetch(book_id, "images/M1/7.png", fetch)
+        return FileResponse(asset.path)
+    """
+
+    def __init__(self, root: Path, max_bytes: int, ttl: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding blobs and refs (created if missing)
+            max_bytes: Total size budget for blobs
+            ttl: Seconds a ref is trusted before the asset is fetched again
+        """
+        self._root = root
+        self._blobs = root / "blobs"
+        self._refs = root / "refs"
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._inflight: dict[str, asyncio.Task[CachedAsset]] = {}
+        # Estimated blob bytes on disk; recomputed by a scan on first write
+        # and after each eviction (other workers write to the same disk).
+        self._approx_bytes: int | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _ref_path(self, book_id: int, name: str) -> Path:
+        name_hash = hashlib.sha256(name.encode()).hexdigest()
+        return self._refs / f"book-{book_id}" / name_hash
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self._blobs / content_hash[:2] / content_hash
+
+    def lookup(self, book_id: int, name: str) -> CachedAsset | None:
+        """
+        Return the cached asset if present and fresh.
+
+        Args:
+            book_id: DCS book ID the asset belongs to
+            name: Asset name within the book (e.g. "images/M1/7.png")
+
+        Returns:
+            CachedAsset or None on a miss
+        """
+        ref = self._ref_path(book_id, name)
+        try:
+            ref_stat = ref.stat()
+            if time.time() - ref_stat.st_mtime > self._ttl:
+                return None
+            content_hash = ref.read_text().strip()
+            blob = self._blob_path(content_hash)
+            blob_stat = blob.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            # Missing ref, or a ref whose blob was evicted
+            return None
+        if time.time() - blob_stat.st_mtime > _TOUCH_INTERVAL_SECONDS:
+            try:
+                os.utime(blob)
+            except OSError:
+                pass
+        return CachedAsset(path=blob, content_hash=content_hash, size=blob_stat.st_size)
+
+    async def get_or_fetch(
+        self,
+        book_id: int,
+        name: str,
+        fetch_fn: Callable[[], Awaitable[bytes]],
+    ) -> CachedAsset:
+        """
+        Return the cached asset, fetching and storing it on a miss.
+
+        Args:
+            book_id: DCS book ID the asset belongs to
+            name: Asset name within the book
+            fetch_fn: Async function returning the asset bytes from DCS
+
+        Returns:
+            CachedAsset pointing at the blob on disk
+        """
+        asset = self.lookup(book_id, name)
+        if asset is not None:
+            self._hits += 1
+            return asset
+
+        self._misses += 1
+        key = f"{book_id}:{name}"
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def run() -> CachedAsset:
+                data = await fetch_fn()
+                return await self.store(book_id, name, data)
+
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Task[CachedAsset]) -> None:
+        """Drop a finished fetch unless a newer one already replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def store(self, book_id: int, name: str, data: bytes) -> CachedAsset:
+        """
+        Store asset bytes and point the book's ref at them.
+
+        Args:
+            book_id: DCS book ID the asset belongs to
+            name: Asset name within the book
+            data: Asset bytes
+
+        Returns:
+            CachedAsset for the stored blob
+        """
+        asset, written = await asyncio.to_thread(self._store_sync, book_id, name, data)
+        if written:
+            await self._account(asset.size)
+        return asset
+
+    def _store_sync(
+        self, book_id: int, name: str, data: bytes
+    ) -> tuple[CachedAsset, bool]:
+        content_hash = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(content_hash)
+        written = False
+        try:
+            # Already stored (e.g. shared with another book): mark it used
+            os.utime(blob)
+        except FileNotFoundError:
+            _atomic_write(blob, data)
+            written = True
+        _atomic_write(self._ref_path(book_id, name), content_hash.encode())
+        return CachedAsset(
+            path=blob, content_hash=content_hash, size=len(data)
+        ), written
+
+    async def _account(self, added: int) -> None:
+        if self._approx_bytes is None:
+            self._approx_bytes = await asyncio.to_thread(self._blob_bytes)
+        else:
+            self._approx_bytes += added
+        if self._approx_bytes > self._max_bytes:
+            self._approx_bytes = await asyncio.to_thread(self._evict)
+
+    def _blob_bytes(self) -> int:
+        return sum(size for _, size, _ in self._scan_blobs())
+
+    def _scan_blobs(self) -> list[tuple[Path, int, float]]:
+        blobs: list[tuple[Path, int, float]] = []
+        if not self._blobs.exists():
+            return blobs
+        for shard in self._blobs.iterdir():
+            for blob in shard.iterdir():
+                if blob.name.startswith(".tmp-"):
+                    continue  # write in progress
+                try:
+                    stat = blob.stat()
+                except FileNotFoundError:
+                    continue
+                blobs.append((blob, stat.st_size, stat.st_mtime))
+        return blobs
+
+    def _evict(self) -> int:
+        """Delete least recently used blobs down to the target size."""
+        blobs = sorted(self._scan_blobs(), key=lambda b: b[2])
+        total = sum(size for _, size, _ in blobs)
+        target = int(self._max_bytes * _EVICT_TARGET_RATIO)
+        cutoff = time.time() - _EVICT_GRACE_SECONDS
+        evicted = 0
+        for blob, size, mtime in blobs:
+            if total <= target or mtime > cutoff:
+                break
+            try:
+                blob.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        if evicted:
+            self._evictions += evicted
+            logger.info(f"Asset cache evicted {evicted} blobs ({total} bytes kept)")
+        return total
+
+    async def invalidate_book(self, book_id: int) -> None:
+        """Forget every cached asset of a book here and on other hosts."""
+        await self._invalidate_book_local(book_id)
+        await publish_invalidation(ASSET_INVALIDATION_CHANNEL, {"book_ids": [book_id]})
+
+    async def _invalidate_book_local(self, book_id: int) -> None:
+        # Blobs stay until evicted; they may be shared with other books
+        await asyncio.to_thread(
+            shutil.rmtree, self._refs / f"book-{book_id}", ignore_errors=True
+        )
+        logger.info(f"Asset cache invalidated for book {book_id}")
+
+    async def apply_remote_invalidation(self, payload: dict[str, Any]) -> None:
+        """Apply an invalidation broadcast by another worker (never re-broadcasts)."""
+        for book_id in payload.get("book_ids", []):
+            await self._invalidate_book_local(int(book_id))
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return cache statistics for monitoring.
+
+        Returns:
+            Dict containing hits, misses, hit rate, evictions and
+            the estimated bytes on disk
+        """
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+            "evictions": self._evictions,
+            "bytes": self._approx_bytes,
+            "max_bytes": self._max_bytes,
+            "inflight": len(self._inflight),
+        }
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+async def cached_asset_response(
+    book_id: int,
+    name: str,
+    fetch_fn: Callable[[], Awaitable[bytes]],
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Serve a book asset through the disk cache.
+
+    Falls back to returning the fetched bytes directly when the cache is
+    disabled or the disk is unavailable. ``fetch_fn`` is called at most once.
+    Errors from it propagate.
+
+    Args:
+        book_id: DCS book ID the asset belongs to
+        name: Asset name within the book
+        fetch_fn: Async function returning the asset bytes from DCS
+        media_type: Content type of the response
+        headers: Extra response headers (e.g. Cache-Control)
+        if_none_match: The request's If-None-Match header; a match with the
+            cached blob is answered with 304 without touching the file
+
+    Returns:
+        FileResponse (or 304) for cached assets, otherwise a plain Response
+    """
+    fetched: list[bytes] = []
+
+    async def fetch_once() -> bytes:
+        if not fetched:
+            fetched.append(await fetch_fn())
+        return fetched[0]
+
+    cache = get_asset_cache()
+    if cache is not None:
+        try:
+            asset = await cache.get_or_fetch(book_id, name, fetch_once)
+        except OSError as e:
+            logger.warning(f"Asset cache unavailable, serving directly: {e}")
+        else:
+            asset_headers = {**(headers or {}), "ETag": asset.etag}
+            if etag_matches(if_none_match, asset.etag):
+                return Response(status_code=304, headers=asset_headers)
+            return FileResponse(
+                asset.path, media_type=media_type, headers=asset_headers
+            )
+    return Response(content=await fetch_once(), media_type=media_type, headers=headers)
+
+
+# Singleton instance
+_asset_cache: AssetDiskCache | None = None
+
+
+def get_asset_cache() -> AssetDiskCache | None:
+    """
+    Get the singleton asset cache (None when ASSET_CACHE_ENABLED is off).
+
+    Returns:
+        AssetDiskCache singleton instance or None
+    """
+    global _asset_cache
+    if not settings.ASSET_CACHE_ENABLED:
+        return None
+    if _asset_cache is None:
+        _asset_cache = AssetDiskCache(
+            Path(settings.ASSET_CACHE_DIR),
+            max_bytes=settings.ASSET_CACHE_MAX_BYTES,
+            ttl=settings.ASSET_CACHE_TTL,
+        )
+    return _asset_cache
+
+
+def reset_asset_cache() -> None:
+    """
+    Reset the singleton cache instance.
+
+    Primarily used for testing to ensure clean state.
+    """
+    global _asset_cache
+    _asset_cache = None
+
+
+async def _apply_asset_invalidation(payload: dict[str, Any]) -> None:
+    """Invalidation bus handler for the singleton cache."""
+    if _asset_cache is not None:
+        await _asset_cache.apply_remote_invalidation(payload)
+
+
+register_invalidation_handler(ASSET_INVALIDATION_CHANNEL, _apply_asset_invalidation)
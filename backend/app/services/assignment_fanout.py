@@ -0,0 +1,121 @@
+"""
+Bulk creation of an assignment's per-student rows.
+
+Assigning work fans out to one AssignmentStudent per student and one
+AssignmentStudentActivity per student x activity; a time-planned bulk
+assignment repeats that for every date group. Building those as ORM objects
+and flushing them through the unit of work pays for identity-map entries,
+change tracking and per-object bookkeeping on rows the request never reads
+again.
+
+``fan_out_assignment`` writes them with bulk INSERTs instead. Ids are
+generated client-side (as the models' default factories would), so the
+progress rows can reference their AssignmentStudent without a RETURNING
+round trip, and SQLAlchemy batches each table into multi-row INSERT
+statements ("insertmanyvalues").
+
+With ``ASSIGNMENT_PROGRESS_LAZY`` (the default) the progress rows are not
+created here at all: most students never open most activities, so a row is
+created when a student first starts the assignment or saves an activity, and
+readers treat a missing row as not started.
+
+Rows are written through the caller's session, inside its transaction, so a
+fan-out commits or rolls back together with its assignment. Bulk INSERTs do
+not pass through the session's flush hooks; that is safe for the analytics
+rollups because the rows start not_started, which they do not count. Report
+data does count assigned students, so the fan-out records them for
+invalidation explicitly.
+"""
+
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import (
+    AssignmentActivity,
+    AssignmentStatus,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+    AssignmentStudentActivityStatus,
+)
+from app.services.report_data_cache import record_assigned_students
+
+
+async def fan_out_assignment(
+    session: AsyncSession,
+    assignment_id: uuid.UUID,
+    student_ids: Sequence[uuid.UUID],
+    activity_ids: Sequence[uuid.UUID] = (),
+) -> dict[uuid.UUID, uuid.UUID]:
+    """
+    Link activities and students to a flushed assignment in bulk.
+
+    Creates the ordered AssignmentActivity rows, one not-started
+    AssignmentStudent per student and, unless progress rows are created
+    lazily, one not-started AssignmentStudentActivity per student x
+    activity. Nothing is committed.
+
+    Args:
+        session: Session holding the assignment's transaction
+        assignment_id: Assignment already flushed to the database
+        student_ids: Students to assign
+        activity_ids: Activities in display order (empty for content
+            library assignments, which embed their activity)
+
+    Returns:
+        Dict of student_id to the created AssignmentStudent id
+    """
+    if activity_ids:
+        await session.execute(
+            insert(AssignmentActivity),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "assignment_id": assignment_id,
+                    "activity_id": activity_id,
+                    "order_index": order_index,
+                }
+                for order_index, activity_id in enumerate(activity_ids)
+            ],
+        )
+
+    assignment_student_ids = {student_id: uuid.uuid4() for student_id in student_ids}
+    if not assignment_student_ids:
+        return assignment_student_ids
+
+    await session.execute(
+        insert(AssignmentStudent),
+        [
+            {
+                "id": assignment_student_id,
+                "assignment_id": assignment_id,
+                "student_id": student_id,
+                "status": AssignmentStatus.not_started,
+                "time_spent_minutes": 0,
+                "time_spent_seconds": 0,
+            }
+            for student_id, assignment_student_id in assignment_student_ids.items()
+        ],
+    )
+    await record_assigned_students(session, assignment_student_ids)
+
+    if activity_ids and not settings.ASSIGNMENT_PROGRESS_LAZY:
+        await session.execute(
+            insert(AssignmentStudentActivity),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "assignment_student_id": assignment_student_id,
+                    "activity_id": activity_id,
+                    "status": AssignmentStudentActivityStatus.not_started,
+                    "max_score": 100.0,
+                }
+                for assignment_student_id in assignment_student_ids.values()
+                for activity_id in activity_ids
+            ],
+        )
+
+    return assignment_student_ids
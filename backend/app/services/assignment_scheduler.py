@@ -4,14 +4,19 @@ import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.models import (
     Assignment,
     AssignmentPublishStatus,
+    AssignmentStudent,
+    Student,
+    Teacher,
 )
+from app.services.cache_events import invalidate_for_events
+from app.services.report_data_cache import record_changed_assignments
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +35,14 @@ async def publish_scheduled_assignments(
     Publish scheduled assignments whose publish date has passed.
 
     This function:
-    1. Queries assignments with status='scheduled' and scheduled_publish_date <= now
-    2. Updates their status to 'published'
+    1. Flips every assignment with status='scheduled' and
+       scheduled_publish_date <= now to 'published' in one UPDATE ... RETURNING
+    2. Invalidates the assigned students' and the teachers' assignment caches
+       in one batch per call
 
-    Should be called periodically (e.g., every hour or once daily).
+    Runs every SCHEDULER_PUBLISH_INTERVAL seconds on the arq worker
+    (app.tasks.scheduler). Concurrent calls are safe: each assignment is
+    returned by exactly one UPDATE.
 
     Args:
         db: Database session
@@ -42,33 +51,59 @@ async def publish_scheduled_assignments(
         PublishResult with count of published assignments
     """
     now = datetime.now(UTC)
-    assignments_published = 0
 
-    # Query scheduled assignments that should be published
     result = await db.execute(
-        select(Assignment)
+        update(Assignment)
         .where(Assignment.status == AssignmentPublishStatus.scheduled)
         .where(Assignment.scheduled_publish_date <= now)
-        .options(selectinload(Assignment.assignment_students))
+        .values(status=AssignmentPublishStatus.published, updated_at=now)
+        .returning(Assignment.id, Assignment.teacher_id)
+        # Match loaded rows by the returned ids, not by re-evaluating the
+        # WHERE in Python (stored dates may be naive)
+        .execution_options(synchronize_session="fetch")
     )
-    assignments = result.scalars().all()
+    published = result.all()
 
-    if not assignments:
+    if not published:
+        await db.rollback()
         logger.info("No scheduled assignments ready to publish")
         return PublishResult(assignments_published=0)
 
-    logger.info(f"Found {len(assignments)} scheduled assignments to publish")
-
-    for assignment in assignments:
-        # Update status to published
-        assignment.status = AssignmentPublishStatus.published
-        assignment.updated_at = now
-        assignments_published += 1
-
-        logger.info(f"Published assignment {assignment.id}: {assignment.name}")
+    assignment_ids = [row.id for row in published]
+    teacher_ids = {row.teacher_id for row in published}
+
+    student_user_ids = (
+        (
+            await db.execute(
+                select(Student.user_id)
+                .join(AssignmentStudent, AssignmentStudent.student_id == Student.id)
+                .where(AssignmentStudent.assignment_id.in_(assignment_ids))
+                .distinct()
+            )
+        )
+        .scalars()
+        .all()
+    )
+    teacher_user_ids = (
+        (await db.execute(select(Teacher.user_id).where(Teacher.id.in_(teacher_ids))))
+        .scalars()
+        .all()
+    )
 
+    # The bulk UPDATE bypasses the flush hook that invalidates report data
+    await record_changed_assignments(db, assignment_ids)
     await db.commit()
 
-    logger.info(f"Scheduler complete: published {assignments_published} assignments")
+    await invalidate_for_events(
+        "assignment_assigned", [{"user_id": str(u)} for u in student_user_ids]
+    )
+    await invalidate_for_events(
+        "teacher_assignment_changed", [{"user_id": str(u)} for u in teacher_user_ids]
+    )
+
+    logger.info(
+        f"Scheduler complete: published {len(published)} assignments "
+        f"for {len(student_user_ids)} students"
+    )
 
-    return PublishResult(assignments_published=assignments_published)
+    return PublishResult(assignments_published=len(published))
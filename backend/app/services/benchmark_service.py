@@ -34,6 +34,13 @@ from app.schemas.benchmarks import (
     ClassMetrics,
     SchoolBenchmarkSummary,
 )
+from app.services.analytics_queries import average_score_by_period
+from app.services.benchmark_snapshot_service import (
+    ALL_ACTIVITY_TYPES,
+    BenchmarkTotals,
+    load_benchmark_snapshot,
+    load_scope_totals,
+)
 from app.services.book_service_v2 import get_book_service
 
 # Minimum number of classes required for benchmark data to be displayed (privacy threshold)
@@ -79,7 +86,7 @@ def get_period_start(period: BenchmarkPeriod) -> datetime:
         return now - timedelta(days=180)
     else:  # "all"
         # Very old date to include all data
-        return datetime(2000, 1, 1)
+        return datetime(2000, 1, 1, tzinfo=UTC)
 
 
 def _get_activity_type_label(activity_type: str) -> str:
@@ -151,6 +158,33 @@ def _generate_benchmark_message(
         )
 
 
+def _benchmark_from_totals(
+    level: Literal["school", "publisher"],
+    period: BenchmarkPeriod,
+    totals: BenchmarkTotals,
+) -> BenchmarkData:
+    """Build benchmark data from snapshot totals, applying the privacy threshold."""
+    average_score = totals.average_score
+    if totals.class_count < MIN_CLASSES_FOR_BENCHMARK or average_score is None:
+        return BenchmarkData(
+            level=level,
+            average_score=0.0,
+            completion_rate=0.0,
+            sample_size=totals.class_count,
+            period=period,
+            is_available=False,
+        )
+
+    return BenchmarkData(
+        level=level,
+        average_score=round(average_score, 1),
+        completion_rate=round(totals.completion_rate, 1),
+        sample_size=totals.class_count,
+        period=period,
+        is_available=True,
+    )
+
+
 async def calculate_school_benchmark(
     school_id: uuid.UUID,
     period: BenchmarkPeriod,
@@ -173,6 +207,13 @@ async def calculate_school_benchmark(
     """
     period_start = get_period_start(period)
 
+    # Served from the latest snapshot when it is fresh
+    snapshot = await load_benchmark_snapshot(
+        session, "school", str(school_id), period, period_start, exclude_class_id
+    )
+    if snapshot is not None:
+        return _benchmark_from_totals("school", period, snapshot[ALL_ACTIVITY_TYPES])
+
     # Count distinct classes in school that have completed assignments
     class_count_query = (
         select(func.count(distinct(Class.id)))
@@ -282,6 +323,13 @@ async def calculate_publisher_benchmark(
     """
     period_start = get_period_start(period)
 
+    # Served from the latest snapshot when it is fresh
+    snapshot = await load_benchmark_snapshot(
+        session, "publisher", str(publisher_id), period, period_start, exclude_class_id
+    )
+    if snapshot is not None:
+        return _benchmark_from_totals("publisher", period, snapshot[ALL_ACTIVITY_TYPES])
+
     # Get all books for this publisher from DCS
     book_service = get_book_service()
     publisher_books = await book_service.list_books(publisher_id=publisher_id)
@@ -386,6 +434,37 @@ async def calculate_publisher_benchmark(
     )
 
 
+async def _live_school_activity_scores(
+    school_id: uuid.UUID,
+    class_id: uuid.UUID,
+    period_start: datetime,
+    session: AsyncSession,
+) -> dict[str, float]:
+    """Average score per activity type across the school's other classes."""
+    school_scores_query = (
+        select(
+            Activity.activity_type,
+            func.avg(AssignmentStudent.score).label("avg_score"),
+        )
+        .select_from(AssignmentStudent)
+        .join(Assignment, Assignment.id == AssignmentStudent.assignment_id)
+        .join(Activity, Activity.id == Assignment.activity_id)
+        .join(ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id)
+        .join(Class, Class.id == ClassStudent.class_id)
+        .where(
+            Class.school_id == school_id,
+            Class.id != class_id,
+            AssignmentStudent.status == AssignmentStatus.completed,
+            AssignmentStudent.completed_at >= period_start,
+            AssignmentStudent.score.isnot(None),
+        )
+        .group_by(Activity.activity_type)
+    )
+
+    school_result = await session.execute(school_scores_query)
+    return {row.activity_type: float(row.avg_score) for row in school_result.all()}
+
+
 async def calculate_activity_type_benchmarks(
     class_id: uuid.UUID,
     school_id: uuid.UUID,
@@ -443,31 +522,21 @@ async def calculate_activity_type_benchmarks(
     if not class_scores:
         return []
 
-    # Calculate school benchmark averages by activity type (excluding this class)
-    school_scores_query = (
-        select(
-            Activity.activity_type,
-            func.avg(AssignmentStudent.score).label("avg_score"),
-        )
-        .select_from(AssignmentStudent)
-        .join(Assignment, Assignment.id == AssignmentStudent.assignment_id)
-        .join(Activity, Activity.id == Assignment.activity_id)
-        .join(ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id)
-        .join(Class, Class.id == ClassStudent.class_id)
-        .where(
-            Class.school_id == school_id,
-            Class.id != class_id,
-            AssignmentStudent.status == AssignmentStatus.completed,
-            AssignmentStudent.completed_at >= period_start,
-            AssignmentStudent.score.isnot(None),
-        )
-        .group_by(Activity.activity_type)
+    # School benchmark averages by activity type (excluding this class), from
+    # the latest snapshot when it is fresh
+    snapshot = await load_benchmark_snapshot(
+        session, "school", str(school_id), period, period_start, class_id
     )
-
-    school_result = await session.execute(school_scores_query)
-    school_scores = {
-        row.activity_type: float(row.avg_score) for row in school_result.all()
-    }
+    if snapshot is not None:
+        school_scores = {
+            activity_type: totals.average_score
+            for activity_type, totals in snapshot.items()
+            if activity_type != ALL_ACTIVITY_TYPES and totals.average_score is not None
+        }
+    else:
+        school_scores = await _live_school_activity_scores(
+            school_id, class_id, period_start, session
+        )
 
     # Build comparison list
     benchmarks = []
@@ -536,7 +605,10 @@ async def get_benchmark_trend(
         publisher_books = await book_service.list_books(publisher_id=publisher_id)
         book_ids = [book.id for book in publisher_books]
 
-    for i in range(periods - 1, -1, -1):  # Go from oldest to newest
+    # Contiguous periods, oldest to newest
+    period_labels: list[tuple[str, str]] = []
+    boundaries: list[datetime] = []
+    for i in range(periods - 1, -1, -1):
         if period_type == "weekly":
             period_end = now - timedelta(weeks=i)
             period_start = period_end - timedelta(weeks=1)
@@ -549,78 +621,58 @@ async def get_benchmark_trend(
             while month <= 0:
                 month += 12
                 year -= 1
-            period_start = datetime(year, month, 1)
+            period_start = datetime(year, month, 1, tzinfo=UTC)
             if month == 12:
-                period_end = datetime(year + 1, 1, 1)
+                period_end = datetime(year + 1, 1, 1, tzinfo=UTC)
             else:
-                period_end = datetime(year, month + 1, 1)
+                period_end = datetime(year, month + 1, 1, tzinfo=UTC)
             period_label = period_start.strftime("%B")
             period_key = period_start.strftime("%Y-%m")
+        period_labels.append((period_key, period_label))
+        if not boundaries:
+            boundaries.append(period_start)
+        boundaries.append(period_end)
+
+    # One grouped query per series instead of one per period
+    class_averages = await average_score_by_period(
+        session, boundaries, AssignmentStudent.student_id.in_(class_student_ids)
+    )
+    if not class_averages:
+        return []
 
-        # Class average for period
-        class_avg_query = select(func.avg(AssignmentStudent.score)).where(
-            AssignmentStudent.student_id.in_(class_student_ids),
-            AssignmentStudent.status == AssignmentStatus.completed,
-            AssignmentStudent.completed_at >= period_start,
-            AssignmentStudent.completed_at < period_end,
-            AssignmentStudent.score.isnot(None),
+    school_averages = await average_score_by_period(
+        session,
+        boundaries,
+        Class.school_id == school_id,
+        Class.id != class_id,
+        through_classes=True,
+    )
+
+    publisher_averages: dict[int, float] = {}
+    if publisher_id and book_ids:
+        publisher_averages = await average_score_by_period(
+            session,
+            boundaries,
+            Assignment.dcs_book_id.in_(book_ids),
+            Class.id != class_id,
+            through_classes=True,
         )
-        class_result = await session.execute(class_avg_query)
-        class_avg = class_result.scalar()
 
+    for index, (period_key, period_label) in enumerate(period_labels):
+        class_avg = class_averages.get(index)
         if class_avg is None:
             continue  # Skip periods with no data
-
-        # School benchmark for period
-        school_avg_query = (
-            select(func.avg(AssignmentStudent.score))
-            .select_from(AssignmentStudent)
-            .join(ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id)
-            .join(Class, Class.id == ClassStudent.class_id)
-            .where(
-                Class.school_id == school_id,
-                Class.id != class_id,
-                AssignmentStudent.status == AssignmentStatus.completed,
-                AssignmentStudent.completed_at >= period_start,
-                AssignmentStudent.completed_at < period_end,
-                AssignmentStudent.score.isnot(None),
-            )
-        )
-        school_result = await session.execute(school_avg_query)
-        school_avg = school_result.scalar()
-
-        # Publisher benchmark for period (if applicable)
-        publisher_avg = None
-        if publisher_id and book_ids:
-            publisher_avg_query = (
-                select(func.avg(AssignmentStudent.score))
-                .select_from(AssignmentStudent)
-                .join(Assignment, Assignment.id == AssignmentStudent.assignment_id)
-                .join(
-                    ClassStudent,
-                    ClassStudent.student_id == AssignmentStudent.student_id,
-                )
-                .join(Class, Class.id == ClassStudent.class_id)
-                .where(
-                    Assignment.dcs_book_id.in_(book_ids),
-                    Class.id != class_id,
-                    AssignmentStudent.status == AssignmentStatus.completed,
-                    AssignmentStudent.completed_at >= period_start,
-                    AssignmentStudent.completed_at < period_end,
-                    AssignmentStudent.score.isnot(None),
-                )
-            )
-            publisher_result = await session.execute(publisher_avg_query)
-            publisher_avg = publisher_result.scalar()
+        school_avg = school_averages.get(index)
+        publisher_avg = publisher_averages.get(index)
 
         trend_points.append(
             BenchmarkTrendPoint(
                 period=period_key,
                 period_label=period_label,
-                class_average=round(float(class_avg), 1),
-                school_benchmark=round(float(school_avg), 1) if school_avg else None,
+                class_average=round(class_avg, 1),
+                school_benchmark=round(school_avg, 1) if school_avg else None,
                 publisher_benchmark=(
-                    round(float(publisher_avg), 1) if publisher_avg else None
+                    round(publisher_avg, 1) if publisher_avg else None
                 ),
             )
         )
@@ -792,29 +844,10 @@ async def get_class_benchmarks(
     )
 
 
-async def get_admin_benchmark_overview(
+async def _live_admin_benchmark_stats(
     session: AsyncSession,
-) -> AdminBenchmarkOverview:
-    """
-    Get system-wide benchmark overview for admin dashboard.
-
-    [Source: Story 5.7 AC: 12]
-
-    Args:
-        session: Database session
-
-    Returns:
-        AdminBenchmarkOverview with system-wide statistics
-    """
-    # Get all schools with their settings
-    schools_result = await session.execute(
-        select(School).options(selectinload(School.classes))
-    )
-    schools = schools_result.scalars().all()
-
-    total_schools = len(schools)
-    schools_with_benchmarking = sum(1 for s in schools if s.benchmarking_enabled)
-
+) -> tuple[float, list[ActivityTypeStat], dict[uuid.UUID, tuple[float | None, int]]]:
+    """System average, activity type stats and per-school stats, computed live."""
     # Calculate system-wide average score
     system_avg_query = select(func.avg(AssignmentStudent.score)).where(
         AssignmentStudent.status == AssignmentStatus.completed,
@@ -850,6 +883,80 @@ async def get_admin_benchmark_overview(
         for row in activity_result.all()
     ]
 
+    # Every school's average and class count in one grouped query
+    school_stats_result = await session.execute(
+        select(
+            Class.school_id,
+            func.avg(AssignmentStudent.score),
+            func.count(distinct(Class.id)),
+        )
+        .select_from(AssignmentStudent)
+        .join(ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id)
+        .join(Class, Class.id == ClassStudent.class_id)
+        .where(
+            AssignmentStudent.status == AssignmentStatus.completed,
+            AssignmentStudent.score.isnot(None),
+        )
+        .group_by(Class.school_id)
+    )
+    school_stats = {
+        school_id: (float(avg) if avg else None, class_count)
+        for school_id, avg, class_count in school_stats_result.all()
+    }
+
+    return float(system_average), activity_type_stats, school_stats
+
+
+async def get_admin_benchmark_overview(
+    session: AsyncSession,
+) -> AdminBenchmarkOverview:
+    """
+    Get system-wide benchmark overview for admin dashboard.
+
+    [Source: Story 5.7 AC: 12]
+
+    Args:
+        session: Database session
+
+    Returns:
+        AdminBenchmarkOverview with system-wide statistics
+    """
+    # Get all schools with their settings
+    schools_result = await session.execute(select(School))
+    schools = schools_result.scalars().all()
+
+    total_schools = len(schools)
+    schools_with_benchmarking = sum(1 for s in schools if s.benchmarking_enabled)
+
+    # Served from the latest snapshots when they are fresh
+    system_snapshot = await load_benchmark_snapshot(
+        session, "system", "", "all", get_period_start("all")
+    )
+    if system_snapshot is not None:
+        system_average = system_snapshot[ALL_ACTIVITY_TYPES].average_score or 0.0
+        activity_type_stats = [
+            ActivityTypeStat(
+                activity_type=activity_type,
+                activity_label=_get_activity_type_label(activity_type),
+                system_average=round(totals.average_score, 1),
+                total_completions=totals.completed_count,
+            )
+            for activity_type, totals in system_snapshot.items()
+            if activity_type != ALL_ACTIVITY_TYPES and totals.average_score is not None
+        ]
+        school_stats = {
+            uuid.UUID(school_id): (totals.average_score, totals.class_count)
+            for school_id, totals in (
+                await load_scope_totals(session, "school", "all")
+            ).items()
+        }
+    else:
+        (
+            system_average,
+            activity_type_stats,
+            school_stats,
+        ) = await _live_admin_benchmark_stats(session)
+
     # Calculate school summaries
     school_summaries = []
     schools_above = 0
@@ -857,25 +964,7 @@ async def get_admin_benchmark_overview(
     schools_below = 0
 
     for school in schools:
-        # Get school's average score
-        school_avg_query = (
-            select(
-                func.avg(AssignmentStudent.score),
-                func.count(distinct(Class.id)),
-            )
-            .select_from(AssignmentStudent)
-            .join(ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id)
-            .join(Class, Class.id == ClassStudent.class_id)
-            .where(
-                Class.school_id == school.id,
-                AssignmentStudent.status == AssignmentStatus.completed,
-                AssignmentStudent.score.isnot(None),
-            )
-        )
-        result = await session.execute(school_avg_query)
-        row = result.first()
-        school_avg = float(row[0]) if row and row[0] else None
-        class_count = row[1] if row else 0
+        school_avg, class_count = school_stats.get(school.id, (None, 0))
 
         # Determine performance status
         performance_status = None
@@ -0,0 +1,458 @@
+"""
+Periodic benchmark snapshots for school, publisher and system comparisons.
+
+The benchmark panel compares a class against every other class in its school
+and against every class using its publisher's books. Computing that live
+scans all submissions in the scope, once per class being excluded. Instead a
+scheduled job (``refresh_benchmark_snapshots``, run hourly by the arq worker)
+stores, per scope, period and activity type, the submission and score sums
+and counts:
+
+* one totals row (``class_id`` NULL) per scope, period and activity type, and
+* one share row per contributing class.
+
+Because every stored measure is a sum or a count, the benchmark for "every
+class but this one" is the totals row minus the class's share row, so a
+benchmark read is two small indexed lookups regardless of submission volume.
+
+Snapshots older than ``BENCHMARK_SNAPSHOT_MAX_AGE``, or refreshed before the
+current period began, are ignored and callers fall back to the live queries.
+"""
+
+import logging
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+from app.models import (
+    Activity,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    BenchmarkSnapshot,
+    Class,
+    ClassStudent,
+    School,
+)
+from app.schemas.benchmarks import BenchmarkPeriod
+from app.services.book_service_v2 import get_book_service
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PERIODS: tuple[BenchmarkPeriod, ...] = ("weekly", "monthly", "semester", "all")
+
+# activity_type of the rows that cover every activity type
+ALL_ACTIVITY_TYPES = "all"
+
+
+@dataclass(frozen=True)
+class BenchmarkTotals:
+    """Additive benchmark measures for a scope or a single class's share of it."""
+
+    submission_count: int = 0
+    completed_count: int = 0
+    scored_count: int = 0
+    score_sum: float = 0.0
+    class_count: int = 0
+
+    def __add__(self, other: "BenchmarkTotals") -> "BenchmarkTotals":
+        return BenchmarkTotals(
+            submission_count=self.submission_count + other.submission_count,
+            completed_count=self.completed_count + other.completed_count,
+            scored_count=self.scored_count + other.scored_count,
+            score_sum=self.score_sum + other.score_sum,
+            class_count=self.class_count + other.class_count,
+        )
+
+    def __sub__(self, other: "BenchmarkTotals") -> "BenchmarkTotals":
+        return BenchmarkTotals(
+            submission_count=self.submission_count - other.submission_count,
+            completed_count=self.completed_count - other.completed_count,
+            scored_count=self.scored_count - other.scored_count,
+            score_sum=self.score_sum - other.score_sum,
+            class_count=self.class_count - other.class_count,
+        )
+
+    @property
+    def average_score(self) -> float | None:
+        """Mean score, or None when nothing was scored."""
+        return self.score_sum / self.scored_count if self.scored_count > 0 else None
+
+    @property
+    def completion_rate(self) -> float:
+        """Completed submissions as a percentage of all submissions."""
+        if self.submission_count <= 0:
+            return 0.0
+        return self.completed_count / self.submission_count * 100
+
+
+@dataclass
+class SnapshotRefreshResult:
+    """Result of a benchmark snapshot refresh."""
+
+    rows_written: int
+    schools: int
+    publishers: int
+
+
+def _activity_type_name(activity_type: Any) -> str:
+    return getattr(activity_type, "value", activity_type)
+
+
+async def _aggregate(
+    session: AsyncSession,
+    period_start: datetime,
+    group_columns: Sequence[ColumnElement[Any]],
+    *criteria: ColumnElement[bool],
+    through_classes: bool = True,
+    by_activity_type: bool = False,
+) -> list[tuple[tuple[Any, ...], str, BenchmarkTotals]]:
+    """
+    Sum submissions completed since period_start, grouped by group_columns.
+
+    Mirrors the live benchmark queries: with through_classes, a submission
+    counts once for every class its student is enrolled in. Activity type
+    rows only cover completed, scored submissions of activity-based
+    assignments.
+
+    Returns:
+        (group key, activity type, totals) per group
+    """
+    is_completed = AssignmentStudent.status == AssignmentStatus.completed
+    is_scored = AssignmentStudent.score.isnot(None)
+    activity_columns = [Activity.activity_type] if by_activity_type else []
+
+    query = (
+        select(
+            *group_columns,
+            *activity_columns,
+            func.count(AssignmentStudent.id),
+            func.count(AssignmentStudent.id).filter(is_completed),
+            func.count(AssignmentStudent.id).filter(is_scored),
+            func.coalesce(func.sum(AssignmentStudent.score), 0),
+        )
+        .select_from(AssignmentStudent)
+        .join(Assignment, Assignment.id == AssignmentStudent.assignment_id)
+        .where(AssignmentStudent.completed_at >= period_start, *criteria)
+    )
+    if through_classes:
+        query = query.join(
+            ClassStudent, ClassStudent.student_id == AssignmentStudent.student_id
+        ).join(Class, Class.id == ClassStudent.class_id)
+    if by_activity_type:
+        query = query.join(Activity, Activity.id == Assignment.activity_id).where(
+            is_completed, is_scored
+        )
+    if group_columns or activity_columns:
+        query = query.group_by(*group_columns, *activity_columns)
+
+    result = await session.execute(query)
+    key_width = len(group_columns)
+    aggregates = []
+    for row in result.all():
+        activity_type = (
+            _activity_type_name(row[key_width])
+            if by_activity_type
+            else ALL_ACTIVITY_TYPES
+        )
+        submissions, completed, scored, score_sum = row[-4:]
+        aggregates.append(
+            (
+                tuple(row[:key_width]),
+                activity_type,
+                BenchmarkTotals(
+                    submission_count=submissions,
+                    completed_count=completed,
+                    scored_count=scored,
+                    score_sum=float(score_sum),
+                ),
+            )
+        )
+    return aggregates
+
+
+def _add_share(
+    entries: dict[str, dict[uuid.UUID | None, BenchmarkTotals]],
+    activity_type: str,
+    class_id: uuid.UUID | None,
+    totals: BenchmarkTotals,
+) -> None:
+    shares = entries.setdefault(activity_type, {})
+    shares[class_id] = shares.get(class_id, BenchmarkTotals()) + totals
+
+
+def _snapshot_rows(
+    scope: str,
+    scope_key: str,
+    period: str,
+    entries: dict[str, dict[uuid.UUID | None, BenchmarkTotals]],
+    refreshed_at: datetime,
+) -> list[dict[str, Any]]:
+    """
+    Totals and share rows for one scope and period.
+
+    entries maps activity type to class shares; a class_id of None holds
+    totals that are not split by class (the system scope).
+    """
+    entries.setdefault(ALL_ACTIVITY_TYPES, {})
+    rows = []
+    for activity_type, shares in entries.items():
+        totals = shares.pop(None, BenchmarkTotals())
+        for class_id, share in shares.items():
+            # A class counts toward the sample once it has completed work
+            share = replace(share, class_count=1 if share.completed_count else 0)
+            totals += share
+            rows.append((class_id, activity_type, share))
+        rows.append((None, activity_type, totals))
+
+    return [
+        {
+            "id": uuid.uuid4(),
+            "scope": scope,
+            "scope_key": scope_key,
+            "period": period,
+            "activity_type": activity_type,
+            "class_id": class_id,
+            "submission_count": totals.submission_count,
+            "completed_count": totals.completed_count,
+            "scored_count": totals.scored_count,
+            "score_sum": totals.score_sum,
+            "class_count": totals.class_count,
+            "refreshed_at": refreshed_at,
+        }
+        for class_id, activity_type, totals in rows
+    ]
+
+
+async def refresh_benchmark_snapshots(session: AsyncSession) -> SnapshotRefreshResult:
+    """
+    Rebuild every benchmark snapshot and commit.
+
+    All rows are replaced in one transaction, so readers see either the
+    previous snapshot or the new one. Every school and every publisher whose
+    books could be listed gets a totals row even without submissions, which
+    tells readers "no data" apart from "not refreshed yet".
+
+    Args:
+        session: Database session
+
+    Returns:
+        SnapshotRefreshResult with the number of rows and scopes written
+    """
+    # Imported here because benchmark_service reads snapshots from this module
+    from app.services.benchmark_service import get_period_start
+
+    school_ids = (await session.execute(select(School.id))).scalars().all()
+    publisher_ids = (
+        (
+            await session.execute(
+                select(School.dcs_publisher_id)
+                .where(School.dcs_publisher_id.isnot(None))
+                .distinct()
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    # Publisher benchmarks cover the classes using the publisher's books
+    book_service = get_book_service()
+    book_publishers: dict[int, str] = {}
+    publisher_keys = []
+    for publisher_id in publisher_ids:
+        try:
+            books = await book_service.list_books(publisher_id=publisher_id)
+        except Exception as e:
+            # Without its book list the publisher keeps serving live benchmarks
+            logger.warning(
+                f"Skipping benchmark snapshot for publisher {publisher_id}: {e}"
+            )
+            continue
+        publisher_keys.append(str(publisher_id))
+        for book in books:
+            book_publishers[book.id] = str(publisher_id)
+
+    refreshed_at = datetime.now(UTC)
+    rows: list[dict[str, Any]] = []
+    for period in SNAPSHOT_PERIODS:
+        period_start = get_period_start(period)
+        scopes: dict[
+            tuple[str, str], dict[str, dict[uuid.UUID | None, BenchmarkTotals]]
+        ] = {("school", str(school_id)): {} for school_id in school_ids}
+        scopes.update({("publisher", key): {} for key in publisher_keys})
+        scopes[("system", "")] = {}
+
+        for by_activity_type in (False, True):
+            for (school_id, class_id), activity_type, totals in await _aggregate(
+                session,
+                period_start,
+                (Class.school_id, Class.id),
+                by_activity_type=by_activity_type,
+            ):
+                _add_share(
+                    scopes[("school", str(school_id))], activity_type, class_id, totals
+                )
+
+            if book_publishers:
+                # Grouped by book, then folded into each book's publisher
+                for (book_id, class_id), activity_type, totals in await _aggregate(
+                    session,
+                    period_start,
+                    (Assignment.dcs_book_id, Class.id),
+                    Assignment.dcs_book_id.in_(book_publishers),
+                    by_activity_type=by_activity_type,
+                ):
+                    scope = ("publisher", book_publishers[book_id])
+                    _add_share(scopes[scope], activity_type, class_id, totals)
+
+            for _, activity_type, totals in await _aggregate(
+                session,
+                period_start,
+                (),
+                through_classes=False,
+                by_activity_type=by_activity_type,
+            ):
+                _add_share(scopes[("system", "")], activity_type, None, totals)
+
+        for (scope, scope_key), entries in scopes.items():
+            rows.extend(_snapshot_rows(scope, scope_key, period, entries, refreshed_at))
+
+    await session.execute(delete(BenchmarkSnapshot))
+    if rows:
+        await session.execute(insert(BenchmarkSnapshot), rows)
+    await session.commit()
+
+    logger.info(
+        f"Benchmark snapshots refreshed: {len(rows)} rows for {len(school_ids)} "
+        f"schools and {len(publisher_keys)} publishers"
+    )
+    return SnapshotRefreshResult(
+        rows_written=len(rows),
+        schools=len(school_ids),
+        publishers=len(publisher_keys),
+    )
+
+
+async def load_benchmark_snapshot(
+    session: AsyncSession,
+    scope: str,
+    scope_key: str,
+    period: BenchmarkPeriod,
+    period_start: datetime,
+    exclude_class_id: uuid.UUID | None = None,
+) -> dict[str, BenchmarkTotals] | None:
+    """
+    Read a scope's snapshot totals per activity type.
+
+    Args:
+        session: Database session
+        scope: "school", "publisher" or "system"
+        scope_key: School UUID or publisher ID as a string ("" for system)
+        period: Benchmark period
+        period_start: Start of the current period; snapshots refreshed before
+            it cover an earlier period and are not used
+        exclude_class_id: Optional class whose share is subtracted
+
+    Returns:
+        Totals keyed by activity type ("all" for every type), or None when
+        no usable snapshot exists and the caller should compute live
+    """
+    class_filter = BenchmarkSnapshot.class_id.is_(None)
+    if exclude_class_id:
+        class_filter = or_(class_filter, BenchmarkSnapshot.class_id == exclude_class_id)
+
+    result = await session.execute(
+        select(
+            BenchmarkSnapshot.activity_type,
+            BenchmarkSnapshot.class_id,
+            BenchmarkSnapshot.submission_count,
+            BenchmarkSnapshot.completed_count,
+            BenchmarkSnapshot.scored_count,
+            BenchmarkSnapshot.score_sum,
+            BenchmarkSnapshot.class_count,
+            BenchmarkSnapshot.refreshed_at,
+        ).where(
+            BenchmarkSnapshot.scope == scope,
+            BenchmarkSnapshot.scope_key == scope_key,
+            BenchmarkSnapshot.period == period,
+            class_filter,
+        )
+    )
+    rows = result.all()
+    if not rows:
+        return None
+
+    oldest_usable = max(
+        period_start,
+        datetime.now(UTC) - timedelta(seconds=settings.BENCHMARK_SNAPSHOT_MAX_AGE),
+    )
+    refreshed_at = rows[0].refreshed_at
+    if refreshed_at.tzinfo is None:
+        # SQLite hands timestamps back naive; they were written as UTC
+        refreshed_at = refreshed_at.replace(tzinfo=UTC)
+    if refreshed_at < oldest_usable:
+        return None
+
+    totals: dict[str, BenchmarkTotals] = {}
+    shares: dict[str, BenchmarkTotals] = {}
+    for row in rows:
+        values = BenchmarkTotals(
+            submission_count=row.submission_count,
+            completed_count=row.completed_count,
+            scored_count=row.scored_count,
+            score_sum=row.score_sum,
+            class_count=row.class_count,
+        )
+        target = totals if row.class_id is None else shares
+        target[row.activity_type] = values
+
+    return {
+        activity_type: scope_totals - shares.get(activity_type, BenchmarkTotals())
+        for activity_type, scope_totals in totals.items()
+    }
+
+
+async def load_scope_totals(
+    session: AsyncSession, scope: str, period: BenchmarkPeriod
+) -> dict[str, BenchmarkTotals]:
+    """
+    Every snapshot totals row of a scope over all activity types.
+
+    All scopes are refreshed together, so callers check freshness once
+    through ``load_benchmark_snapshot`` (e.g. on the system scope).
+
+    Returns:
+        Totals keyed by scope_key
+    """
+    result = await session.execute(
+        select(
+            BenchmarkSnapshot.scope_key,
+            BenchmarkSnapshot.submission_count,
+            BenchmarkSnapshot.completed_count,
+            BenchmarkSnapshot.scored_count,
+            BenchmarkSnapshot.score_sum,
+            BenchmarkSnapshot.class_count,
+        ).where(
+            BenchmarkSnapshot.scope == scope,
+            BenchmarkSnapshot.period == period,
+            BenchmarkSnapshot.activity_type == ALL_ACTIVITY_TYPES,
+            BenchmarkSnapshot.class_id.is_(None),
+        )
+    )
+    return {
+        row.scope_key: BenchmarkTotals(
+            submission_count=row.submission_count,
+            completed_count=row.completed_count,
+            scored_count=row.scored_count,
+            score_sum=row.score_sum,
+            class_count=row.class_count,
+        )
+        for row in result.all()
+    }
@@ -8,8 +8,9 @@ All book data is cached with appropriate TTL to minimize DCS API calls.
 import logging
 from typing import Any
 
+from app.core.config import settings
 from app.schemas.book import BookPublic
-from app.services.dcs_cache import CacheKeys, get_dcs_cache
+from app.services.dcs_cache import NOT_FOUND, CacheKeys, get_dcs_cache
 from app.services.dream_storage_client import get_dream_storage_client
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,7 @@ class BookService:
         return await self.cache.get_or_fetch(
             cache_key,
             lambda: self._fetch_books(publisher_id),
-            ttl=600,  # 10 minutes
+            ttl=settings.DCS_CACHE_BOOK_TTL,
         )
 
     async def _fetch_books(self, publisher_id: int | None = None) -> list[BookPublic]:
@@ -86,7 +87,8 @@ class BookService:
         return await self.cache.get_or_fetch(
             cache_key,
             lambda: self._fetch_book(book_id),
-            ttl=600,  # 10 minutes
+            ttl=settings.DCS_CACHE_BOOK_TTL,
+            cache_not_found=True,
         )
 
     async def _fetch_book(self, book_id: int) -> BookPublic | None:
@@ -121,7 +123,9 @@ class BookService:
 
         for bid in book_ids:
             cache_key = CacheKeys.book_by_id(str(bid))
-            cached = await self.cache.get(cache_key)
+            cached = await self.cache.lookup(cache_key)
+            if cached is NOT_FOUND:
+                continue
             if cached is not None:
                 result[bid] = cached
             else:
@@ -139,7 +143,12 @@ class BookService:
                 result[dcs_book.id] = book_public
                 # Populate individual cache entries
                 cache_key = CacheKeys.book_by_id(str(dcs_book.id))
-                await self.cache.set(cache_key, book_public, ttl=600)
+                await self.cache.set(
+                    cache_key, book_public, ttl=settings.DCS_CACHE_BOOK_TTL
+                )
+            # Remember IDs DCS does not know so they are not requested again
+            for bid in set(missing_ids) - result.keys():
+                await self.cache.set_not_found(CacheKeys.book_by_id(str(bid)))
         except Exception as e:
             logger.warning(f"Batch book fetch failed, falling back to individual: {e}")
             import asyncio
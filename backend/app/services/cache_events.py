@@ -1,12 +1,17 @@
 """Event-driven cache invalidation registry.
 
 Maps domain events → cache key patterns to invalidate.
-Freshness comes from write-time invalidation, not TTL expiry.
+Freshness comes from write-time invalidation, not TTL expiry. Each event also
+publishes one broadcast so every worker drops its in-process L1 copies.
 
 Usage (async routes):
     from app.services.cache_events import invalidate_for_event
     await invalidate_for_event("message_sent", sender_id=str(sid), recipient_id=str(rid))
 
+Usage (many subjects of one event, e.g. a batch of students):
+    from app.services.cache_events import invalidate_for_events
+    await invalidate_for_events("assignment_assigned", [{"user_id": u} for u in ids])
+
 Usage (sync routes like teachers.py, users.py):
     from app.services.cache_events import invalidate_for_event_sync
     invalidate_for_event_sync("user_profile_updated", user_id=str(user_id))
@@ -17,9 +22,11 @@ import logging
 from typing import Any
 
 from app.services.redis_cache import (
+    cache_broadcast_invalidation,
+    cache_broadcast_invalidation_sync,
+    cache_bump_namespace,
+    cache_bump_namespace_sync,
     cache_invalidate,
-    cache_invalidate_pattern,
-    cache_invalidate_pattern_sync,
     cache_invalidate_sync,
 )
 
@@ -29,8 +36,9 @@ logger = logging.getLogger(__name__)
 # Event → cache key pattern registry
 # ---------------------------------------------------------------------------
 # Keys use Python str.format() placeholders matching **ctx kwargs.
-# Patterns ending with '*' use SCAN-based pattern invalidation.
-# Plain keys use direct DELETE.
+# Patterns ending with ':*' name a versioned namespace (see redis_cache):
+# invalidation is a single INCR of the namespace version, so readers of that
+# family must build keys with cache_namespace_key(). Plain keys use DELETE.
 
 _EVENT_REGISTRY: dict[str, list[str]] = {
     # Messages
@@ -55,6 +63,9 @@ _EVENT_REGISTRY: dict[str, list[str]] = {
         "student:{user_id}:assignments:*",
         "student:{user_id}:progress:*",
         "student:{user_id}:calendar:*",
+    ],
+    # After the post-submission pipeline attributed a submission's skills
+    "skill_scores_attributed": [
         "student:{user_id}:skill-profile",
         "student:{user_id}:badges",
     ],
@@ -100,6 +111,29 @@ _EVENT_REGISTRY: dict[str, list[str]] = {
 }
 
 
+_NAMESPACE_SUFFIX = ":*"
+
+
+def _namespace_of(key: str) -> str | None:
+    """Return the namespace for a resolved ``<namespace>:*`` entry, else None."""
+    if key.endswith(_NAMESPACE_SUFFIX):
+        return key[: -len(_NAMESPACE_SUFFIX)]
+    return None
+
+
+def _split_keys(keys: list[str]) -> tuple[list[str], list[str]]:
+    """Split resolved entries into (plain keys, namespaces)."""
+    plain_keys: list[str] = []
+    namespaces: list[str] = []
+    for key in keys:
+        namespace = _namespace_of(key)
+        if namespace is not None:
+            namespaces.append(namespace)
+        else:
+            plain_keys.append(key)
+    return plain_keys, namespaces
+
+
 def _resolve_keys(event: str, **ctx: Any) -> list[str]:
     """Resolve event to list of cache keys/patterns with context substituted."""
     patterns = _EVENT_REGISTRY.get(event)
@@ -132,14 +166,11 @@ async def invalidate_for_event(event: str, **ctx: Any) -> None:
         if not keys:
             return
 
-        tasks = []
-        for key in keys:
-            if "*" in key:
-                tasks.append(cache_invalidate_pattern(key))
-            else:
-                tasks.append(cache_invalidate(key))
-
+        plain_keys, namespaces = _split_keys(keys)
+        tasks = [cache_bump_namespace(ns) for ns in namespaces]
+        tasks += [cache_invalidate(key) for key in plain_keys]
         await asyncio.gather(*tasks, return_exceptions=True)
+        await cache_broadcast_invalidation(plain_keys, namespaces)
         logger.debug(
             "Cache invalidated for event=%s ctx=%s keys=%d", event, ctx, len(keys)
         )
@@ -147,6 +178,41 @@ async def invalidate_for_event(event: str, **ctx: Any) -> None:
         logger.debug("Cache event invalidation error: event=%s err=%s", event, e)
 
 
+async def invalidate_for_events(event: str, contexts: list[dict[str, Any]]) -> None:
+    """Invalidate an event's cache keys for many contexts at once (async).
+
+    Equivalent to one ``invalidate_for_event`` call per context, but duplicate
+    keys are dropped and every worker gets a single broadcast for the batch.
+    Fails silently — cache invalidation must never crash a write path.
+
+    Args:
+        event: Event name from the registry (e.g. "assignment_assigned")
+        contexts: Context dicts for pattern substitution, one per subject
+    """
+    try:
+        keys = list(
+            dict.fromkeys(
+                key for ctx in contexts for key in _resolve_keys(event, **ctx)
+            )
+        )
+        if not keys:
+            return
+
+        plain_keys, namespaces = _split_keys(keys)
+        tasks = [cache_bump_namespace(ns) for ns in namespaces]
+        tasks += [cache_invalidate(key) for key in plain_keys]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await cache_broadcast_invalidation(plain_keys, namespaces)
+        logger.debug(
+            "Cache invalidated for event=%s contexts=%d keys=%d",
+            event,
+            len(contexts),
+            len(keys),
+        )
+    except Exception as e:
+        logger.debug("Cache event invalidation error: event=%s err=%s", event, e)
+
+
 def invalidate_for_event_sync(event: str, **ctx: Any) -> None:
     """Invalidate all cache keys associated with an event (sync).
 
@@ -158,11 +224,12 @@ def invalidate_for_event_sync(event: str, **ctx: Any) -> None:
         if not keys:
             return
 
-        for key in keys:
-            if "*" in key:
-                cache_invalidate_pattern_sync(key)
-            else:
-                cache_invalidate_sync(key)
+        plain_keys, namespaces = _split_keys(keys)
+        for namespace in namespaces:
+            cache_bump_namespace_sync(namespace)
+        for key in plain_keys:
+            cache_invalidate_sync(key)
+        cache_broadcast_invalidation_sync(plain_keys, namespaces)
 
         logger.debug(
             "Sync cache invalidated for event=%s ctx=%s keys=%d", event, ctx, len(keys)
@@ -0,0 +1,266 @@
+"""
+Access-driven warmup of the DCS cache.
+
+Every worker starts with an empty in-process DCSCache, so right after a
+rolling restart the first requests for each book pay the full DCS round trip.
+This module learns which DCS keys are hot and refills them on boot:
+
+- DCSCache reports every lookup to ``record_access``. Counts are batched in
+  process and flushed periodically into a Redis sorted set shared by all
+  workers; scores decay over time so yesterday's hot books fade out.
+- At startup ``warm_dcs_cache`` reads the top N keys and prefetches them with
+  bounded concurrency through the regular services, so warmed entries are
+  indistinguishable from ones filled by real requests.
+
+Keys are mapped back to fetches by warmers registered per CacheKeys pattern;
+only keys with a warmer are recorded. Everything fails silently when Redis is
+unavailable — warmup is an optimisation.
+"""
+
+import asyncio
+import logging
+import re
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from app.services.redis_cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+HOT_KEYS_KEY = "cache:warmup:dcs:hot"
+_DECAY_LOCK_KEY = "cache:warmup:dcs:decay"
+# Halve every score this often so the ranking follows recent traffic
+_DECAY_INTERVAL_SECONDS = 6 * 3600
+_DECAY_FACTOR = 0.5
+# Upper bound on tracked keys; the coldest are trimmed on each flush
+_MAX_TRACKED_KEYS = 5000
+
+Warmer = Callable[..., Awaitable[Any]]
+
+_warmers: list[tuple[re.Pattern[str], Warmer]] = []
+_pending: Counter[str] = Counter()
+_flusher_task: asyncio.Task[None] | None = None
+# Set while warming so prefetches do not count as accesses
+_warming: ContextVar[bool] = ContextVar("cache_warming", default=False)
+
+
+def register_warmer(pattern: str, warmer: Warmer) -> None:
+    """
+    Register how to refill cache keys matching ``pattern``.
+
+    Args:
+        pattern: Regex that must match the whole key; its groups are passed
+            to the warmer as positional string arguments
+        warmer: Async function that fetches (and thereby caches) the key
+    """
+    _warmers.append((re.compile(pattern), warmer))
+
+
+def _find_warmer(key: str) -> tuple[Warmer, tuple[str, ...]] | None:
+    for pattern, warmer in _warmers:
+        match = pattern.fullmatch(key)
+        if match is not None:
+            return warmer, match.groups()
+    return None
+
+
+def record_access(key: str) -> None:
+    """Count a lookup of ``key`` (cheap; flushed to Redis in the background)."""
+    if not _warming.get() and _find_warmer(key) is not None:
+        _pending[key] += 1
+
+
+async def flush_access_counts() -> int:
+    """
+    Add the pending access counts to the shared hot-key ranking.
+
+    Returns:
+        Number of distinct keys flushed (0 if Redis is unavailable)
+    """
+    if not _pending:
+        return 0
+    client = await get_redis()
+    if client is None:
+        _pending.clear()
+        return 0
+    counts = dict(_pending)
+    _pending.clear()
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, count in counts.items():
+            pipe.zincrby(HOT_KEYS_KEY, count, key)
+        pipe.zremrangebyrank(HOT_KEYS_KEY, 0, -(_MAX_TRACKED_KEYS + 1))
+        await pipe.execute()
+        # One worker per interval decays the shared ranking
+        if await client.set(_DECAY_LOCK_KEY, 1, nx=True, ex=_DECAY_INTERVAL_SECONDS):
+            await client.zunionstore(HOT_KEYS_KEY, {HOT_KEYS_KEY: _DECAY_FACTOR})
+    except Exception as e:
+        logger.debug("Cache access flush error: %s", e)
+        return 0
+    return len(counts)
+
+
+async def hot_keys(limit: int) -> list[str]:
+    """
+    Return the ``limit`` most accessed DCS keys, hottest first.
+
+    Returns:
+        Key list (empty if Redis is unavailable)
+    """
+    client = await get_redis()
+    if client is None or limit <= 0:
+        return []
+    try:
+        return list(await client.zrevrange(HOT_KEYS_KEY, 0, limit - 1))
+    except Exception as e:
+        logger.debug("Hot key lookup error: %s", e)
+        return []
+
+
+async def warm_dcs_cache(top_n: int, concurrency: int) -> dict[str, int]:
+    """
+    Prefetch the hottest DCS keys into this worker's cache.
+
+    The publisher list is always included so a fresh deployment (no ranking
+    yet) still gets the previous startup behaviour.
+
+    Args:
+        top_n: Number of hot keys to prefetch
+        concurrency: Maximum DCS fetches in flight at once
+
+    Returns:
+        Dict with "warmed", "failed" and "skipped" (no warmer) counts
+    """
+    from app.services.dcs_cache import CacheKeys
+
+    keys = list(dict.fromkeys([CacheKeys.PUBLISHER_LIST, *await hot_keys(top_n)]))
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    result = {"warmed": 0, "failed": 0, "skipped": 0}
+
+    async def warm(key: str) -> None:
+        found = _find_warmer(key)
+        if found is None:
+            result["skipped"] += 1
+            return
+        warmer, args = found
+        async with semaphore:
+            try:
+                await warmer(*args)
+                result["warmed"] += 1
+            except Exception as e:
+                result["failed"] += 1
+                logger.debug("Cache warmup failed for %s: %s", key, e)
+
+    token = _warming.set(True)
+    try:
+        await asyncio.gather(*(warm(key) for key in keys))
+    finally:
+        _warming.reset(token)
+    return result
+
+
+async def _flusher_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await flush_access_counts()
+
+
+def start_access_flusher(interval: float) -> None:
+    """Start periodically flushing access counts to Redis (call at startup)."""
+    global _flusher_task
+    if _flusher_task is None:
+        _flusher_task = asyncio.create_task(_flusher_loop(interval))
+
+
+async def stop_access_flusher() -> None:
+    """Stop the flusher and flush what is pending (call at shutdown)."""
+    global _flusher_task
+    task = _flusher_task
+    _flusher_task = None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await flush_access_counts()
+
+
+# ---------------------------------------------------------------------------
+# Warmers for the CacheKeys families served by the DCS services
+# ---------------------------------------------------------------------------
+# Services are imported lazily: dcs_cache imports this module.
+
+
+async def _warm_publishers() -> None:
+    from app.services.publisher_service_v2 import get_publisher_service
+
+    await get_publisher_service().list_publishers()
+
+
+async def _warm_publisher(publisher_id: str) -> None:
+    from app.services.publisher_service_v2 import get_publisher_service
+
+    await get_publisher_service().get_publisher(int(publisher_id))
+
+
+async def _warm_books(publisher_id: str | None = None) -> None:
+    from app.services.book_service_v2 import get_book_service
+
+    await get_book_service().list_books(int(publisher_id) if publisher_id else None)
+
+
+async def _warm_book(book_id: str) -> None:
+    from app.services.book_service_v2 import get_book_service
+
+    await get_book_service().get_book(int(book_id))
+
+
+async def _warm_book_config(book_id: str) -> None:
+    from app.services.book_service_v2 import get_book_service
+
+    await get_book_service().get_book_config(int(book_id))
+
+
+async def _ai_client() -> Any:
+    from app.services.dcs_ai import get_dcs_ai_client
+
+    return await get_dcs_ai_client()
+
+
+async def _warm_ai_metadata(book_id: str) -> None:
+    await (await _ai_client()).get_processing_status(int(book_id))
+
+
+async def _warm_ai_modules(book_id: str) -> None:
+    await (await _ai_client()).get_modules(int(book_id))
+
+
+async def _warm_ai_modules_metadata(book_id: str) -> None:
+    await (await _ai_client()).get_modules_metadata(int(book_id))
+
+
+async def _warm_ai_module_detail(book_id: str, module_id: str) -> None:
+    await (await _ai_client()).get_module_detail(int(book_id), int(module_id))
+
+
+async def _warm_ai_vocabulary(book_id: str, module_id: str | None = None) -> None:
+    await (await _ai_client()).get_vocabulary(
+        int(book_id), int(module_id) if module_id else None
+    )
+
+
+register_warmer(r"dcs:publishers:list", _warm_publishers)
+register_warmer(r"dcs:publishers:id:(\d+)", _warm_publisher)
+register_warmer(r"dcs:books:list", _warm_books)
+register_warmer(r"dcs:books:publisher:(\d+)", _warm_books)
+register_warmer(r"dcs:books:id:(\d+)", _warm_book)
+register_warmer(r"dcs:books:config:(\d+)", _warm_book_config)
+register_warmer(r"dcs:ai:metadata:(\d+)", _warm_ai_metadata)
+register_warmer(r"dcs:ai:modules:(\d+)", _warm_ai_modules)
+register_warmer(r"dcs:ai:modules:metadata:(\d+)", _warm_ai_modules_metadata)
+register_warmer(r"dcs:ai:module:(\d+):(\d+)", _warm_ai_module_detail)
+register_warmer(r"dcs:ai:vocabulary:(\d+)", _warm_ai_vocabulary)
+register_warmer(r"dcs:ai:vocabulary:(\d+):(\d+)", _warm_ai_vocabulary)
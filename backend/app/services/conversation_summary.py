@@ -0,0 +1,255 @@
+"""
+Per-user conversation summaries behind the message inbox.
+
+``ConversationSummary`` holds, for each side of a conversation, the latest
+message (id, preview, time) and how many of the partner's messages are still
+unread. The inbox and the unread badge read these rows instead of grouping
+every direct message the user ever sent or received.
+
+Summaries are maintained by a session ``after_flush`` hook, the same way the
+analytics rollups are: a new message moves both sides' latest message
+forward, a read-state change recounts the reader's unread messages for that
+partner, and a deleted or rewritten message rebuilds the pair from
+direct_messages. Everything runs inside the flushing transaction, so the
+summaries commit (or roll back) together with the messages.
+"""
+
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, event, func, inspect, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models import ConversationSummary, DirectMessage
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_LENGTH = 100
+
+# DirectMessage columns that decide which conversation a message belongs to
+# and what its summary shows
+_THREAD_ATTRS = ("sender_id", "recipient_id", "body", "sent_at")
+
+SummaryKey = tuple[uuid.UUID, uuid.UUID]
+
+
+def _sides(sender_id: uuid.UUID, recipient_id: uuid.UUID) -> set[SummaryKey]:
+    """(user, partner) keys of both sides of a conversation."""
+    return {(sender_id, recipient_id), (recipient_id, sender_id)}
+
+
+def _summary_values(key: SummaryKey, message: Any, now: datetime) -> dict[str, Any]:
+    user_id, partner_id = key
+    return {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "partner_id": partner_id,
+        "last_message_id": message.id,
+        "last_message_preview": (message.body or "")[:PREVIEW_LENGTH],
+        "last_sent_at": message.sent_at,
+        "unread_count": 0,
+        "updated_at": now,
+    }
+
+
+def _upsert_latest(
+    connection: Connection, rows: list[dict[str, Any]], only_if_newer: bool
+) -> None:
+    """Insert summaries, or move an existing summary's latest message."""
+    if not rows:
+        return
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(ConversationSummary)
+    table = ConversationSummary.__table__
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "partner_id"],
+        set_={
+            "last_message_id": stmt.excluded.last_message_id,
+            "last_message_preview": stmt.excluded.last_message_preview,
+            "last_sent_at": stmt.excluded.last_sent_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        # Concurrent senders may flush out of order; never move backwards
+        where=(table.c.last_sent_at <= stmt.excluded.last_sent_at)
+        if only_if_newer
+        else None,
+    )
+    connection.execute(stmt, rows)
+
+
+def refresh_unread_counts(connection: Connection, keys: Iterable[SummaryKey]) -> None:
+    """
+    Recount unread messages for the given (user, partner) summaries.
+
+    Args:
+        connection: Connection in the caller's transaction
+        keys: (user_id, partner_id) pairs whose unread_count to recount
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    unread = (
+        select(func.count(DirectMessage.id))
+        .where(
+            DirectMessage.recipient_id == ConversationSummary.user_id,
+            DirectMessage.sender_id == ConversationSummary.partner_id,
+            DirectMessage.is_read == False,  # noqa: E712
+        )
+        .correlate(ConversationSummary)
+        .scalar_subquery()
+    )
+    connection.execute(
+        update(ConversationSummary)
+        .where(
+            tuple_(ConversationSummary.user_id, ConversationSummary.partner_id).in_(
+                keys
+            )
+        )
+        .values(unread_count=unread, updated_at=datetime.now(UTC))
+    )
+
+
+def record_messages(connection: Connection, messages: Iterable[Any]) -> None:
+    """
+    Fold newly inserted messages into both sides' summaries.
+
+    Args:
+        connection: Connection in the caller's transaction
+        messages: Inserted DirectMessage rows (anything with the same fields)
+    """
+    latest: dict[SummaryKey, Any] = {}
+    unread_keys: set[SummaryKey] = set()
+    for message in messages:
+        for key in _sides(message.sender_id, message.recipient_id):
+            current = latest.get(key)
+            if current is None or current.sent_at <= message.sent_at:
+                latest[key] = message
+        if not message.is_read:
+            unread_keys.add((message.recipient_id, message.sender_id))
+    if not latest:
+        return
+
+    now = datetime.now(UTC)
+    _upsert_latest(
+        connection,
+        [_summary_values(key, message, now) for key, message in latest.items()],
+        only_if_newer=True,
+    )
+    refresh_unread_counts(connection, unread_keys)
+
+
+def rebuild_summaries(connection: Connection, keys: Iterable[SummaryKey]) -> None:
+    """
+    Recompute the given (user, partner) summaries from direct_messages.
+
+    Summaries whose conversation no longer has any message are removed.
+
+    Args:
+        connection: Connection in the caller's transaction
+        keys: (user_id, partner_id) pairs to rebuild
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    directed = {
+        pair for user_id, partner_id in keys for pair in _sides(user_id, partner_id)
+    }
+
+    # Latest message per direction; each side takes the newer of its two
+    ranked = (
+        select(
+            DirectMessage.id,
+            DirectMessage.sender_id,
+            DirectMessage.recipient_id,
+            DirectMessage.body,
+            DirectMessage.sent_at,
+            func.row_number()
+            .over(
+                partition_by=(DirectMessage.sender_id, DirectMessage.recipient_id),
+                order_by=DirectMessage.sent_at.desc(),
+            )
+            .label("rank"),
+        ).where(
+            tuple_(DirectMessage.sender_id, DirectMessage.recipient_id).in_(directed)
+        )
+    ).subquery()
+    rows = connection.execute(select(ranked).where(ranked.c.rank == 1)).all()
+
+    latest: dict[SummaryKey, Any] = {}
+    for row in rows:
+        for key in _sides(row.sender_id, row.recipient_id) & keys:
+            current = latest.get(key)
+            if current is None or current.sent_at < row.sent_at:
+                latest[key] = row
+
+    emptied = keys - latest.keys()
+    if emptied:
+        connection.execute(
+            delete(ConversationSummary).where(
+                tuple_(ConversationSummary.user_id, ConversationSummary.partner_id).in_(
+                    emptied
+                )
+            )
+        )
+    now = datetime.now(UTC)
+    _upsert_latest(
+        connection,
+        [_summary_values(key, row, now) for key, row in latest.items()],
+        only_if_newer=False,
+    )
+    refresh_unread_counts(connection, latest.keys())
+
+
+def _touched(
+    session: Session,
+) -> tuple[list[DirectMessage], set[SummaryKey], set[SummaryKey]]:
+    """New messages, summaries to recount and summaries to rebuild after a flush."""
+    inserted: list[DirectMessage] = []
+    recount: set[SummaryKey] = set()
+    rebuild: set[SummaryKey] = set()
+    for obj in session.new:
+        if isinstance(obj, DirectMessage):
+            inserted.append(obj)
+    for obj in session.deleted:
+        if isinstance(obj, DirectMessage):
+            rebuild |= _sides(obj.sender_id, obj.recipient_id)
+    for obj in session.dirty:
+        if not isinstance(obj, DirectMessage):
+            continue
+        state = inspect(obj)
+        if any(state.attrs[attr].history.has_changes() for attr in _THREAD_ATTRS):
+            # Both the old and new participants' conversations may change
+            senders = {obj.sender_id, *state.attrs.sender_id.history.deleted}
+            recipients = {obj.recipient_id, *state.attrs.recipient_id.history.deleted}
+            for sender_id in senders:
+                for recipient_id in recipients:
+                    rebuild |= _sides(sender_id, recipient_id)
+        elif state.attrs.is_read.history.has_changes():
+            recount.add((obj.recipient_id, obj.sender_id))
+    return inserted, recount - rebuild, rebuild
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    inserted, recount, rebuild = _touched(session)
+    if not (inserted or recount or rebuild):
+        return
+    connection = session.connection()
+    # A savepoint keeps a summary failure from aborting the message itself
+    try:
+        with connection.begin_nested():
+            record_messages(connection, inserted)
+            refresh_unread_counts(connection, recount)
+            rebuild_summaries(connection, rebuild)
+    except Exception:
+        logger.exception("Failed to refresh conversation summaries")
+
+
+def register_summary_maintenance() -> None:
+    """Install the flush hook on all sessions (sync and async); idempotent."""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
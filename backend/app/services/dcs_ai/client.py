@@ -21,7 +21,7 @@ from app.services.dcs_ai.exceptions import (
     DCSAIDataAuthError,
     DCSAIDataConnectionError,
 )
-from app.services.dcs_cache import CacheKeys, DCSCache
+from app.services.dcs_cache import NOT_FOUND, CacheKeys, DCSCache
 from app.services.dream_storage_client import (
     DreamStorageAuthError,
     DreamStorageNotFoundError,
@@ -88,7 +88,9 @@ class DCSAIServiceClient:
             DCSAIDataConnectionError: If connection to DCS fails.
         """
         cache_key = CacheKeys.ai_metadata(book_id)
-        cached = await self._cache.get(cache_key)
+        cached = await self._cache.lookup(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             logger.debug(f"Cache hit for AI metadata: book_id={book_id}")
             return cached
@@ -107,6 +109,7 @@ class DCSAIServiceClient:
 
         except DreamStorageNotFoundError:
             logger.info(f"AI metadata not found: book_id={book_id}")
+            await self._cache.set_not_found(cache_key)
             return None
 
         except DreamStorageAuthError as e:
@@ -143,7 +146,9 @@ class DCSAIServiceClient:
             DCSAIDataConnectionError: If connection to DCS fails.
         """
         cache_key = CacheKeys.ai_modules(book_id)
-        cached = await self._cache.get(cache_key)
+        cached = await self._cache.lookup(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             logger.debug(f"Cache hit for AI modules: book_id={book_id}")
             return cached
@@ -162,6 +167,7 @@ class DCSAIServiceClient:
 
         except DreamStorageNotFoundError:
             logger.info(f"AI modules not found: book_id={book_id}")
+            await self._cache.set_not_found(cache_key)
             return None
 
         except DreamStorageAuthError as e:
@@ -202,7 +208,9 @@ class DCSAIServiceClient:
             DCSAIDataConnectionError: If connection to DCS fails.
         """
         cache_key = CacheKeys.ai_modules_metadata(book_id)
-        cached = await self._cache.get(cache_key)
+        cached = await self._cache.lookup(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             logger.debug(f"Cache hit for AI modules metadata: book_id={book_id}")
             return cached
@@ -222,6 +230,7 @@ class DCSAIServiceClient:
 
         except DreamStorageNotFoundError:
             logger.info(f"AI modules metadata not found: book_id={book_id}")
+            await self._cache.set_not_found(cache_key)
             return None
 
         except DreamStorageAuthError as e:
@@ -263,7 +272,9 @@ class DCSAIServiceClient:
             DCSAIDataConnectionError: If connection to DCS fails.
         """
         cache_key = CacheKeys.ai_module_detail(book_id, module_id)
-        cached = await self._cache.get(cache_key)
+        cached = await self._cache.lookup(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             logger.debug(
                 f"Cache hit for AI module detail: book_id={book_id}, module_id={module_id}"
@@ -288,6 +299,7 @@ class DCSAIServiceClient:
             logger.info(
                 f"AI module detail not found: book_id={book_id}, module_id={module_id}"
             )
+            await self._cache.set_not_found(cache_key)
             return None
 
         except DreamStorageAuthError as e:
@@ -331,7 +343,9 @@ class DCSAIServiceClient:
             DCSAIDataConnectionError: If connection to DCS fails.
         """
         cache_key = CacheKeys.ai_vocabulary(book_id, module_id)
-        cached = await self._cache.get(cache_key)
+        cached = await self._cache.lookup(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             logger.debug(
                 f"Cache hit for AI vocabulary: book_id={book_id}, module_id={module_id}"
@@ -360,6 +374,7 @@ class DCSAIServiceClient:
             logger.info(
                 f"AI vocabulary not found: book_id={book_id}, module_id={module_id}"
             )
+            await self._cache.set_not_found(cache_key)
             return None
 
         except DreamStorageAuthError as e:
@@ -387,7 +402,8 @@ class DCSAIServiceClient:
         Check if audio exists for a vocabulary word in DCS.
 
         Note: DCS now streams audio directly. This method just checks
-        if the audio file exists by making a HEAD request.
+        if the audio file exists by making a HEAD request. Missing audio
+        is remembered with a tombstone for the negative TTL.
 
         Args:
             book_id: The DCS book ID.
@@ -397,6 +413,9 @@ class DCSAIServiceClient:
         Returns:
             True if audio exists, False otherwise.
         """
+        cache_key = CacheKeys.ai_audio_url(book_id, lang, word)
+        if await self._cache.lookup(cache_key) is NOT_FOUND:
+            return False
         try:
             # URL-encode the word to handle special characters (apostrophes, spaces, etc.)
             encoded_word = quote(word, safe="")
@@ -408,6 +427,10 @@ class DCSAIServiceClient:
             )
             return response.status_code == 200
 
+        except DreamStorageNotFoundError:
+            await self._cache.set_not_found(cache_key)
+            return False
+
         except Exception:
             return False
 
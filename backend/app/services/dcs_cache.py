@@ -2,7 +2,20 @@
 DCS Cache Module.
 
 Provides an in-memory caching layer for DCS API responses to reduce
-excessive API calls and improve performance.
+excessive API calls and improve performance. Entries live in a byte-bounded
+LocalLRUCache, so memory per worker is capped however many books are seen.
+
+The singleton cache broadcasts invalidations over the Redis invalidation bus
+so a webhook received by one gunicorn worker clears every worker, and reports
+its lookups to the access-driven warmup (see cache_warmup).
+
+get_or_fetch coalesces concurrent misses into one DCS call per key and, once
+an entry passes its TTL, keeps serving it for a stale window while a single
+background refresh runs, so warm callers never wait on DCS latency.
+
+DCS 404s can be cached too: a tombstone (NOT_FOUND) is stored for a short
+negative TTL so repeated lookups of missing books or unprocessed AI data do
+not reach DCS. Webhook events clear tombstones via clear_tombstones.
 """
 
 import asyncio
@@ -11,30 +24,66 @@ from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any, Generic, TypeVar
 
+from app.services.cache_warmup import record_access
+from app.services.local_cache import LocalLRUCache, estimate_size
+from app.services.redis_cache import (
+    publish_invalidation,
+    register_invalidation_handler,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+DCS_INVALIDATION_CHANNEL = "cache:dcs:invalidate"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _NotFound:
+    """Type of the NOT_FOUND tombstone."""
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+
+# Cached marker for "DCS answered 404"; returned by DCSCache.lookup
+NOT_FOUND: Any = _NotFound()
+
 
 class CacheEntry(Generic[T]):
-    """Represents a single cache entry with TTL expiration."""
+    """
+    Represents a single cache entry with TTL expiration.
 
-    def __init__(self, value: T, ttl_seconds: int) -> None:
+    ``expires_at`` is the soft TTL (the value is fresh until then);
+    ``stale_until`` is the hard TTL, after which the value must not be served
+    even while a refresh is running.
+    """
+
+    def __init__(self, value: T, ttl_seconds: int, stale_ttl_seconds: int = 0) -> None:
         self.value = value
         self.expires_at = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+        self.stale_until = self.expires_at + timedelta(seconds=stale_ttl_seconds)
 
     @property
     def is_expired(self) -> bool:
         """Check if this cache entry has expired."""
         return datetime.now(UTC) > self.expires_at
 
+    @property
+    def is_dead(self) -> bool:
+        """Check if this entry is past its stale window and unusable."""
+        return datetime.now(UTC) > self.stale_until
+
 
 class DCSCache:
     """
     In-memory cache for DCS API responses.
 
-    Provides thread-safe caching with configurable TTL, pattern-based
-    invalidation, and cache statistics for monitoring.
+    Provides thread-safe caching with configurable TTL, a byte budget with
+    LRU eviction, pattern-based invalidation, and cache statistics for
+    monitoring. With ``broadcast`` enabled, invalidations are also applied on
+    every other worker.
 
     Example:
         cache = DCSCache(default_ttl=300)  # 5 minutes
@@ -42,24 +91,57 @@ class DCSCache:
         result = await cache.get("dcs:publishers:list")
     """
 
-    def __init__(self, default_ttl: int = 300) -> None:
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        broadcast: bool = False,
+        stale_ttl: int = 0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        name: str | None = None,
+        track_access: bool = False,
+        negative_ttl: int = 60,
+    ) -> None:
         """
         Initialize DCS cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
+            broadcast: Publish invalidations to other workers (singleton only)
+            stale_ttl: Seconds past the TTL that get_or_fetch may serve a stale
+                value while refreshing it in the background (default: 0)
+            max_bytes: Memory budget; least recently used entries are evicted
+                once the estimated size of all values exceeds it
+            name: Metrics label for the underlying LocalLRUCache
+            track_access: Report lookups to the warmup ranking (singleton only)
+            negative_ttl: Default TTL in seconds for not-found tombstones
         """
-        self._cache: dict[str, CacheEntry[Any]] = {}
+        # Entries are held until their hard TTL; soft expiry is CacheEntry's job
+        self._cache = LocalLRUCache(
+            max_bytes=max_bytes, default_ttl=default_ttl + stale_ttl, name=name
+        )
         self._default_ttl = default_ttl
+        self._stale_ttl = stale_ttl
+        self._negative_ttl = negative_ttl
+        self._broadcast = broadcast
+        self._track_access = track_access
         self._lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        # Bumped on every invalidation so in-flight fetches started before it
+        # do not write their (possibly outdated) result back.
+        self._generation = 0
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
 
     async def get(self, key: str) -> Any | None:
         """
         Get value from cache.
 
-        Returns None if key is missing or expired.
+        Returns None if key is missing or expired, or holds a tombstone.
 
         Args:
             key: Cache key to retrieve
@@ -67,18 +149,34 @@ class DCSCache:
         Returns:
             Cached value or None if not found/expired
         """
+        value = await self.lookup(key)
+        return None if value is NOT_FOUND else value
+
+    async def lookup(self, key: str) -> Any | None:
+        """
+        Get value from cache, distinguishing cached 404s from misses.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached value, NOT_FOUND for a live tombstone, or None on a miss
+        """
+        if self._track_access:
+            record_access(key)
         entry = self._cache.get(key)
         if entry is None:
             self._misses += 1
             return None
         if entry.is_expired:
-            async with self._lock:
-                # Double-check after acquiring lock
-                if key in self._cache and self._cache[key].is_expired:
-                    del self._cache[key]
+            if entry.is_dead:
+                self._cache.invalidate(key)
             self._misses += 1
             return None
-        self._hits += 1
+        if entry.value is NOT_FOUND:
+            self._negative_hits += 1
+        else:
+            self._hits += 1
         return entry.value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
@@ -90,8 +188,27 @@ class DCSCache:
             value: Value to cache
             ttl: Optional TTL in seconds (uses default if not provided)
         """
-        async with self._lock:
-            self._cache[key] = CacheEntry(value, ttl or self._default_ttl)
+        ttl = ttl or self._default_ttl
+        self._cache.set(
+            key, CacheEntry(value, ttl, self._stale_ttl), ttl=ttl + self._stale_ttl
+        )
+
+    async def set_not_found(self, key: str, ttl: int | None = None) -> None:
+        """
+        Store a tombstone recording that DCS has no data for ``key``.
+
+        Tombstones get no stale window: once expired, DCS is asked again.
+        They are charged for their key and entry so that many misses (e.g.
+        one per unknown audio word) stay within the byte budget.
+
+        Args:
+            key: Cache key
+            ttl: Optional TTL in seconds (uses the negative TTL if not provided)
+        """
+        ttl = ttl or self._negative_ttl
+        entry = CacheEntry(NOT_FOUND, ttl)
+        size = estimate_size(key) + estimate_size(entry)
+        self._cache.set(key, entry, size=size, ttl=ttl)
 
     async def invalidate(self, key: str) -> bool:
         """
@@ -103,9 +220,15 @@ class DCSCache:
         Returns:
             True if key was found and removed, False otherwise
         """
+        removed = await self._invalidate_local(key)
+        if self._broadcast:
+            await publish_invalidation(DCS_INVALIDATION_CHANNEL, {"keys": [key]})
+        return removed
+
+    async def _invalidate_local(self, key: str) -> bool:
         async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            self._generation += 1
+            if self._cache.invalidate(key):
                 logger.info(f"Cache invalidated: {key}")
                 return True
             return False
@@ -120,71 +243,212 @@ class DCSCache:
         Returns:
             Number of entries invalidated
         """
+        count = await self._invalidate_pattern_local(pattern)
+        if self._broadcast:
+            await publish_invalidation(
+                DCS_INVALIDATION_CHANNEL, {"patterns": [pattern]}
+            )
+        return count
+
+    async def _invalidate_pattern_local(self, pattern: str) -> int:
         async with self._lock:
-            keys_to_delete = [k for k in self._cache.keys() if k.startswith(pattern)]
-            for key in keys_to_delete:
-                del self._cache[key]
-            if keys_to_delete:
-                logger.info(
-                    f"Cache invalidated {len(keys_to_delete)} entries matching: {pattern}"
-                )
-            return len(keys_to_delete)
+            self._generation += 1
+            count = self._cache.invalidate_prefix(pattern)
+            if count:
+                logger.info(f"Cache invalidated {count} entries matching: {pattern}")
+            return count
 
     async def get_or_fetch(
         self,
         key: str,
         fetch_fn: Callable[[], Awaitable[T]],
         ttl: int | None = None,
+        cache_not_found: bool = False,
     ) -> T:
         """
         Get from cache or fetch and cache.
 
         This is the primary method for cache-aside pattern. If the value
-        exists in cache and hasn't expired, return it. Otherwise, call
-        fetch_fn to get fresh data and cache it.
+        exists in cache and hasn't expired, return it. If it has expired but
+        is still inside the stale window, return it immediately and refresh
+        it in the background. Otherwise, call fetch_fn to get fresh data and
+        cache it.
+
+        Concurrent calls for the same key share a single in-flight fetch.
 
         Args:
             key: Cache key
             fetch_fn: Async function to call if cache miss
             ttl: Optional TTL for cached result
+            cache_not_found: If fetch_fn returns None (DCS 404), store a
+                tombstone for the negative TTL and return None until it expires
 
         Returns:
             Cached or freshly fetched value
         """
-        value = await self.get(key)
-        if value is not None:
+        if self._track_access:
+            record_access(key)
+        entry = self._cache.get(key)
+        if entry is not None and entry.value is NOT_FOUND:
+            if not entry.is_expired:
+                self._negative_hits += 1
+                return None  # type: ignore[return-value]
+            entry = None
+        if entry is not None and entry.value is not None and not entry.is_dead:
+            if not entry.is_expired:
+                self._hits += 1
+                return entry.value
+            # Stale-while-revalidate: serve now, refresh once in the background
+            self._stale_hits += 1
+            if key not in self._inflight:
+                self._refreshes += 1
+                task = self._start_fetch(key, fetch_fn, ttl, cache_not_found)
+                task.add_done_callback(self._on_refresh_done)
+            return entry.value
+
+        self._misses += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = self._start_fetch(key, fetch_fn, ttl, cache_not_found)
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _start_fetch(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[T]],
+        ttl: int | None,
+        cache_not_found: bool = False,
+    ) -> asyncio.Task[T]:
+        """Start the single in-flight fetch for ``key``."""
+
+        generation = self._generation
+
+        async def run() -> T:
+            value = await fetch_fn()
+            if generation == self._generation:
+                if value is None and cache_not_found:
+                    await self.set_not_found(key)
+                else:
+                    await self.set(key, value, ttl)
             return value
 
-        value = await fetch_fn()
-        await self.set(key, value, ttl)
-        return value
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return task
+
+    def _forget_inflight(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished fetch unless a newer one already replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _on_refresh_done(self, task: asyncio.Task[Any]) -> None:
+        """Record background refresh failures (the stale value stays cached)."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._refresh_failures += 1
+            logger.warning(f"Background cache refresh failed: {error}")
 
     def stats(self) -> dict[str, Any]:
         """
         Return cache statistics for monitoring.
 
         Returns:
-            Dict containing entries count, hits, misses, and hit rate
+            Dict containing entries count, memory use, evictions, hits, misses,
+            hit rate, stale hits, tombstone hits, coalesced waiters and
+            background refresh counts
         """
         total = self._hits + self._misses
+        storage = self._cache.stats()
         return {
-            "entries": len(self._cache),
+            "entries": storage["entries"],
+            "bytes": storage["bytes"],
+            "max_bytes": storage["max_bytes"],
+            "evictions": storage["evictions"],
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": self._hits / total if total > 0 else 0.0,
+            "stale_hits": self._stale_hits,
+            "negative_hits": self._negative_hits,
+            "coalesced": self._coalesced,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+            "inflight": len(self._inflight),
         }
 
+    async def clear_tombstones(self, prefix: str = "") -> int:
+        """
+        Drop not-found tombstones (e.g. when DCS reports new or changed data).
+
+        Args:
+            prefix: Only drop tombstones whose key starts with this prefix
+
+        Returns:
+            Number of tombstones dropped
+        """
+        count = await self._clear_tombstones_local(prefix)
+        if self._broadcast:
+            await publish_invalidation(DCS_INVALIDATION_CHANNEL, {"tombstones": prefix})
+        return count
+
+    async def _clear_tombstones_local(self, prefix: str) -> int:
+        async with self._lock:
+            self._generation += 1
+            count = self._cache.invalidate_where(
+                lambda key, entry: key.startswith(prefix) and entry.value is NOT_FOUND
+            )
+            if count:
+                logger.info(f"Cache dropped {count} tombstones matching: {prefix!r}")
+            return count
+
     async def clear(self) -> None:
         """Clear all cache entries."""
+        await self._clear_local()
+        if self._broadcast:
+            await publish_invalidation(DCS_INVALIDATION_CHANNEL, {"clear": True})
+
+    async def _clear_local(self) -> None:
         async with self._lock:
+            self._generation += 1
             count = len(self._cache)
             self._cache.clear()
             logger.info(f"Cache cleared ({count} entries)")
 
+    async def apply_remote_invalidation(self, payload: dict[str, Any]) -> None:
+        """
+        Apply an invalidation broadcast by another worker.
+
+        Only touches this worker's entries; never re-broadcasts.
+
+        Args:
+            payload: Message with optional "keys", "patterns", "tombstones"
+                (a key prefix) and "clear"
+        """
+        if payload.get("clear"):
+            await self._clear_local()
+            return
+        for key in payload.get("keys", []):
+            await self._invalidate_local(key)
+        for pattern in payload.get("patterns", []):
+            await self._invalidate_pattern_local(pattern)
+        if "tombstones" in payload:
+            await self._clear_tombstones_local(payload["tombstones"])
+
     def reset_stats(self) -> None:
         """Reset cache statistics counters."""
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._cache.reset_stats()
 
 
 # Cache key patterns for consistent naming
@@ -300,7 +564,15 @@ def get_dcs_cache() -> DCSCache:
         # Import here to avoid circular imports
         from app.core.config import settings
 
-        _dcs_cache = DCSCache(default_ttl=settings.DCS_CACHE_DEFAULT_TTL)
+        _dcs_cache = DCSCache(
+            default_ttl=settings.DCS_CACHE_DEFAULT_TTL,
+            broadcast=True,
+            stale_ttl=settings.DCS_CACHE_STALE_TTL,
+            max_bytes=settings.DCS_CACHE_MAX_BYTES,
+            name="dcs",
+            track_access=True,
+            negative_ttl=settings.DCS_CACHE_NEGATIVE_TTL,
+        )
     return _dcs_cache
 
 
@@ -312,3 +584,20 @@ def reset_dcs_cache() -> None:
     """
     global _dcs_cache
     _dcs_cache = None
+
+
+async def _apply_dcs_invalidation(payload: dict[str, Any]) -> None:
+    """Invalidation bus handler for the singleton cache."""
+    if _dcs_cache is not None:
+        await _dcs_cache.apply_remote_invalidation(payload)
+
+
+async def _resync_dcs_cache() -> None:
+    """Drop the singleton's entries after missed broadcasts."""
+    if _dcs_cache is not None:
+        await _dcs_cache.apply_remote_invalidation({"clear": True})
+
+
+register_invalidation_handler(
+    DCS_INVALIDATION_CHANNEL, _apply_dcs_invalidation, on_resync=_resync_dcs_cache
+)
@@ -19,9 +19,17 @@ from pydantic import BaseModel
 
 from app.core.config import settings
 from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from app.services.local_cache import LocalLRUCache
+from app.services.redis_cache import (
+    publish_invalidation,
+    register_invalidation_handler,
+)
 
 logger = logging.getLogger(__name__)
 
+# Invalidation bus channel for the per-worker response cache
+DCS_CLIENT_INVALIDATION_CHANNEL = "cache:dcs-client:invalidate"
+
 # Module-level circuit breaker for DCS external calls
 _dcs_circuit_breaker = CircuitBreaker("DCS", failure_threshold=5, recovery_timeout=30)
 
@@ -176,8 +184,12 @@ class DreamCentralStorageClient:
         self._token_expires_at: datetime | None = None
         self._token_lock = asyncio.Lock()
 
-        # Response cache
-        self._cache: dict[str, dict[str, Any]] = {}
+        # Response cache (byte-bounded LRU)
+        self._cache = LocalLRUCache(
+            max_bytes=settings.DCS_CLIENT_CACHE_MAX_BYTES,
+            default_ttl=15 * 60,
+            name="dcs_client",
+        )
 
         auth_mode = "API key" if self._use_api_key else "JWT (email/password)"
         logger.info(f"DreamCentralStorageClient initialized (auth: {auth_mode})")
@@ -307,30 +319,29 @@ class DreamCentralStorageClient:
 
     def _get_cached(self, key: str) -> Any | None:
         """Get cached value if not expired."""
-        if key in self._cache:
-            cache_entry = self._cache[key]
-            if datetime.now(timezone.utc) < cache_entry["expires_at"]:
-                logger.debug(f"Cache hit: {key}")
-                return cache_entry["data"]
-            else:
-                # Expired, remove from cache
-                logger.debug(f"Cache expired: {key}")
-                del self._cache[key]
+        data = self._cache.get(key)
+        if data is not None:
+            logger.debug(f"Cache hit: {key}")
+            return data
 
         logger.debug(f"Cache miss: {key}")
         return None
 
     def _set_cached(self, key: str, data: Any, ttl_seconds: int) -> None:
-        """Set cached value with TTL."""
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
-        self._cache[key] = {"data": data, "expires_at": expires_at}
+        """Set cached value with TTL (evicting least recently used entries)."""
+        self._cache.set(key, data, ttl=ttl_seconds)
         logger.debug(f"Cache set: {key} (TTL: {ttl_seconds}s)")
 
     def invalidate_cache(self) -> None:
-        """Invalidate all cached data."""
+        """Invalidate all cached data in this worker."""
         self._cache.clear()
         logger.info("Cache invalidated")
 
+    async def invalidate_cache_everywhere(self) -> None:
+        """Invalidate cached data in this worker and broadcast to the others."""
+        self.invalidate_cache()
+        await publish_invalidation(DCS_CLIENT_INVALIDATION_CHANNEL, {"clear": True})
+
     # ========================================================================
     # Retry Logic
     # ========================================================================
@@ -627,8 +638,14 @@ class DreamCentralStorageClient:
         """Get a presigned URL for a book asset from DCS.
 
         Returns a direct MinIO URL that bypasses the API proxy.
-        Returns None if the asset is not found.
+        Returns None if the asset is not found; that answer is remembered for
+        DCS_CACHE_NEGATIVE_TTL (book webhooks clear it sooner).
         """
+        not_found_key = self._generate_cache_key(
+            "presigned_url_not_found", publisher_id, book_name, path
+        )
+        if self._get_cached(not_found_key) is not None:
+            return None
         try:
             url = f"/storage/books/{publisher_id}/{book_name}/presigned"
             response = await self._make_request(
@@ -637,6 +654,9 @@ class DreamCentralStorageClient:
             data = response.json()
             return data.get("url")
         except DreamStorageNotFoundError:
+            self._set_cached(
+                not_found_key, True, ttl_seconds=settings.DCS_CACHE_NEGATIVE_TTL
+            )
             return None
         except Exception as e:
             logger.warning(
@@ -1592,3 +1612,22 @@ async def get_dream_storage_client() -> DreamCentralStorageClient:
     if _client_instance is None:
         _client_instance = DreamCentralStorageClient()
     return _client_instance
+
+
+def _apply_client_invalidation(payload: dict[str, Any]) -> None:
+    """Invalidation bus handler: clear this worker's singleton response cache."""
+    if _client_instance is not None and payload.get("clear"):
+        _client_instance.invalidate_cache()
+
+
+def _resync_client_cache() -> None:
+    """Drop the singleton's response cache after missed broadcasts."""
+    if _client_instance is not None:
+        _client_instance.invalidate_cache()
+
+
+register_invalidation_handler(
+    DCS_CLIENT_INVALIDATION_CHANNEL,
+    _apply_client_invalidation,
+    on_resync=_resync_client_cache,
+)
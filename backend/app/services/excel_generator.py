@@ -1,10 +1,23 @@
-"""Excel report generator using openpyxl - Story 5.6."""
-
+"""
+Excel report generator using openpyxl - Story 5.6.
+
+Workbooks are written in openpyxl's write-only mode: each sheet streams its
+rows to disk as they are appended, with styles set on ``WriteOnlyCell``s,
+so memory stays flat however many rows a report has. Rows are produced by
+iterating the report data, and a sheet's column widths are set before its
+first row, as write-only sheets require.
+"""
+
+from collections.abc import Iterable, Sequence
+from copy import copy
 from datetime import datetime
+from typing import Any
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import BarChart, Reference
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.styles.cell_style import StyleArray
 
 # Template type display names
 TEMPLATE_NAMES = {
@@ -36,6 +49,7 @@ BORDER = Border(
 )
 TITLE_FONT = Font(bold=True, size=14, color="1A365D")
 SECTION_FONT = Font(bold=True, size=12, color="2C5282")
+WRAP_ALIGNMENT = Alignment(wrap_text=True)
 
 
 def generate_excel_report(
@@ -53,11 +67,7 @@ def generate_excel_report(
         template_type: Optional template type
         output_path: Path to write Excel file
     """
-    wb = Workbook()
-
-    # Remove default sheet
-    default_sheet = wb.active
-    wb.remove(default_sheet)
+    wb = Workbook(write_only=True)
 
     # Create Summary sheet
     _create_summary_sheet(wb, data, report_type, template_type)
@@ -77,11 +87,84 @@ def generate_excel_report(
     wb.save(output_path)
 
 
+class _SheetWriter:
+    """Appends styled rows to a write-only worksheet, tracking the row number."""
+
+    def __init__(self, wb: Workbook, title: str, widths: Sequence[float]) -> None:
+        self.ws = wb.create_sheet(title)
+        for col, width in enumerate(widths):
+            self.ws.column_dimensions[chr(ord("A") + col)].width = width
+        self.row = 0
+        self._styles: dict[tuple[int, int, int], StyleArray] = {}
+
+    def cell(
+        self,
+        value: Any,
+        font: Font | None = None,
+        fill: PatternFill | None = None,
+        border: Border | None = None,
+    ) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.ws, value=value)
+        # Assigning a style hashes it into the workbook's style tables, which
+        # would dominate the cost of a row; do that once per combination
+        key = (id(font), id(fill), id(border))
+        style = self._styles.get(key)
+        if style is not None:
+            cell._style = copy(style)
+            return cell
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if border:
+            cell.border = border
+        self._styles[key] = copy(cell._style)
+        return cell
+
+    def append(self, row: Sequence[Any] = ()) -> None:
+        self.ws.append(row)
+        self.row += 1
+
+    def skip(self, rows: int = 1) -> None:
+        for _ in range(rows):
+            self.append()
+
+    def section(self, title: str) -> None:
+        self.append([self.cell(title, font=SECTION_FONT)])
+
+    def header(self, headers: Sequence[str], border: Border | None = BORDER) -> None:
+        self.append(
+            [
+                self.cell(header, font=HEADER_FONT, fill=HEADER_FILL, border=border)
+                for header in headers
+            ]
+        )
+
+    def bordered(self, *values: Any) -> None:
+        self.append([self.cell(value, border=BORDER) for value in values])
+
+    def table(
+        self, title: str, headers: Sequence[str], rows: Iterable[Sequence[Any]]
+    ) -> None:
+        """Section title, header row and bordered rows with alternating fill."""
+        self.section(title)
+        self.header(headers)
+        for i, values in enumerate(rows):
+            fill = ALT_ROW_FILL if i % 2 == 1 else None
+            self.append(
+                [self.cell(value, fill=fill, border=BORDER) for value in values]
+            )
+
+    def merge(self, start_col: str, end_col: str) -> None:
+        """Merge columns of the last written row."""
+        self.ws.merged_cells.add(f"{start_col}{self.row}:{end_col}{self.row}")
+
+
 def _create_summary_sheet(
     wb: Workbook, data: dict, report_type: str, template_type: str | None
 ) -> None:
     """Create the summary sheet."""
-    ws = wb.create_sheet("Summary")
+    sheet = _SheetWriter(wb, "Summary", [25, 35, 20, 20])
 
     # Title
     if template_type and template_type in TEMPLATE_NAMES:
@@ -89,421 +172,222 @@ def _create_summary_sheet(
     else:
         title = REPORT_TYPE_NAMES.get(report_type, "Report")
 
-    ws["A1"] = title
-    ws["A1"].font = TITLE_FONT
-    ws.merge_cells("A1:D1")
+    sheet.append([sheet.cell(title, font=TITLE_FONT)])
+    sheet.merge("A", "D")
 
     # Report info
-    row = 3
-    ws[f"A{row}"] = "Report Generated:"
-    ws[f"B{row}"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    sheet.skip()
+    sheet.append(["Report Generated:", datetime.now().strftime("%Y-%m-%d %H:%M")])
+    sheet.append(
+        ["Period:", f"{data.get('period_start', '')} to {data.get('period_end', '')}"]
+    )
 
-    row += 1
-    ws[f"A{row}"] = "Period:"
-    ws[f"B{row}"] = f"{data.get('period_start', '')} to {data.get('period_end', '')}"
-
-    row += 1
     if report_type == "student":
-        ws[f"A{row}"] = "Student:"
-        ws[f"B{row}"] = data.get("student_name", "Unknown")
-        row += 1
-        ws[f"A{row}"] = "Class:"
-        ws[f"B{row}"] = data.get("class_name", "N/A")
+        sheet.append(["Student:", data.get("student_name", "Unknown")])
+        sheet.append(["Class:", data.get("class_name", "N/A")])
     elif report_type == "class":
-        ws[f"A{row}"] = "Class:"
-        ws[f"B{row}"] = data.get("class_name", "Unknown")
-        row += 1
-        ws[f"A{row}"] = "Teacher:"
-        ws[f"B{row}"] = data.get("teacher_name", "N/A")
-        row += 1
-        ws[f"A{row}"] = "Students:"
-        ws[f"B{row}"] = data.get("student_count", 0)
+        sheet.append(["Class:", data.get("class_name", "Unknown")])
+        sheet.append(["Teacher:", data.get("teacher_name", "N/A")])
+        sheet.append(["Students:", data.get("student_count", 0)])
     else:
-        ws[f"A{row}"] = "Teacher:"
-        ws[f"B{row}"] = data.get("teacher_name", "Unknown")
-        row += 1
-        ws[f"A{row}"] = "Total Assignments:"
-        ws[f"B{row}"] = data.get("total_assignments", 0)
+        sheet.append(["Teacher:", data.get("teacher_name", "Unknown")])
+        sheet.append(["Total Assignments:", data.get("total_assignments", 0)])
 
     # Summary Statistics section
-    row += 2
-    ws[f"A{row}"] = "Summary Statistics"
-    ws[f"A{row}"].font = SECTION_FONT
+    sheet.skip()
+    sheet.section("Summary Statistics")
 
     summary = data.get("summary", {})
     if isinstance(summary, dict):
-        row += 1
-        headers = ["Metric", "Value"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        metrics = [
-            ("Average Score", f"{summary.get('avg_score', 0):.1f}%"),
-            ("Total Completed", summary.get("total_completed", 0)),
-            ("Completion Rate", f"{summary.get('completion_rate', 0) * 100:.0f}%"),
-            ("Total Assigned", summary.get("total_assigned", 0)),
-        ]
-
-        for metric, value in metrics:
-            row += 1
-            ws.cell(row=row, column=1, value=metric).border = BORDER
-            ws.cell(row=row, column=2, value=value).border = BORDER
+        sheet.header(["Metric", "Value"])
+        sheet.bordered("Average Score", f"{summary.get('avg_score', 0):.1f}%")
+        sheet.bordered("Total Completed", summary.get("total_completed", 0))
+        sheet.bordered(
+            "Completion Rate", f"{summary.get('completion_rate', 0) * 100:.0f}%"
+        )
+        sheet.bordered("Total Assigned", summary.get("total_assigned", 0))
 
     # Trend Analysis section
     trend = data.get("trend", {})
     if trend:
-        row += 2
-        ws[f"A{row}"] = "Trend Analysis"
-        ws[f"A{row}"].font = SECTION_FONT
+        sheet.skip()
+        sheet.section("Trend Analysis")
 
-        row += 1
         direction = trend.get("direction", "new")
         change = trend.get("change")
         current = trend.get("current", 0)
         previous = trend.get("previous")
 
-        ws.cell(row=row, column=1, value="Direction").border = BORDER
-        ws.cell(row=row, column=2, value=direction.capitalize()).border = BORDER
-        row += 1
-        ws.cell(row=row, column=1, value="Current Period Avg").border = BORDER
-        ws.cell(row=row, column=2, value=f"{current:.1f}%").border = BORDER
-        row += 1
-        ws.cell(row=row, column=1, value="Previous Period Avg").border = BORDER
-        ws.cell(
-            row=row, column=2, value=f"{previous:.1f}%" if previous else "N/A"
-        ).border = BORDER
-        row += 1
-        ws.cell(row=row, column=1, value="Change").border = BORDER
-        ws.cell(
-            row=row, column=2, value=f"{change:+.1f}%" if change else "N/A"
-        ).border = BORDER
+        sheet.bordered("Direction", direction.capitalize())
+        sheet.bordered("Current Period Avg", f"{current:.1f}%")
+        sheet.bordered("Previous Period Avg", f"{previous:.1f}%" if previous else "N/A")
+        sheet.bordered("Change", f"{change:+.1f}%" if change else "N/A")
 
     # Narrative section
     narrative = data.get("narrative", "")
     if narrative:
-        row += 2
-        ws[f"A{row}"] = "Summary"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-        ws[f"A{row}"] = narrative
-        ws.merge_cells(f"A{row}:D{row}")
-        ws[f"A{row}"].alignment = Alignment(wrap_text=True)
-
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 25
-    ws.column_dimensions["B"].width = 35
-    ws.column_dimensions["C"].width = 20
-    ws.column_dimensions["D"].width = 20
+        sheet.skip()
+        sheet.section("Summary")
+        cell = sheet.cell(narrative)
+        cell.alignment = WRAP_ALIGNMENT
+        sheet.append([cell])
+        sheet.merge("A", "D")
 
 
 def _create_student_data_sheet(wb: Workbook, data: dict) -> None:
     """Create student data detail sheet."""
-    ws = wb.create_sheet("Details")
-
-    row = 1
+    sheet = _SheetWriter(wb, "Details", [40, 15, 15, 15])
 
     # Skill Breakdown
     skill_breakdown = data.get("skill_breakdown", [])
     if skill_breakdown:
-        ws[f"A{row}"] = "Skill Performance"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Skill", "Average Score", "Activities"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(skill_breakdown):
-            row += 1
-            ws.cell(
-                row=row,
-                column=1,
-                value=item.get("skill_name", "Unknown"),
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{item.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            ws.cell(row=row, column=3, value=item.get("count", 0)).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Skill Performance",
+            ["Skill", "Average Score", "Activities"],
+            (
+                (
+                    item.get("skill_name", "Unknown"),
+                    f"{item.get('avg_score', 0):.1f}%",
+                    item.get("count", 0),
+                )
+                for item in skill_breakdown
+            ),
+        )
+        sheet.skip()
 
     # Assignment List
     assignments = data.get("assignments", [])
     if assignments:
-        ws[f"A{row}"] = "Assignment Details"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Assignment", "Score", "Time Spent", "Completed"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(assignments):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=item.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(row=row, column=2, value=f"{item.get('score', 0)}%").border = BORDER
-            ws.cell(
-                row=row, column=3, value=f"{item.get('time_spent', 0)} min"
-            ).border = BORDER
-            completed = item.get("completed_at", "")
-            ws.cell(
-                row=row, column=4, value=completed[:10] if completed else "N/A"
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 5):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 40
-    ws.column_dimensions["B"].width = 15
-    ws.column_dimensions["C"].width = 15
-    ws.column_dimensions["D"].width = 15
+        sheet.table(
+            "Assignment Details",
+            ["Assignment", "Score", "Time Spent", "Completed"],
+            (
+                (
+                    item.get("name", "Unknown"),
+                    f"{item.get('score', 0)}%",
+                    f"{item.get('time_spent', 0)} min",
+                    item["completed_at"][:10] if item.get("completed_at") else "N/A",
+                )
+                for item in assignments
+            ),
+        )
 
 
 def _create_class_data_sheet(wb: Workbook, data: dict) -> None:
     """Create class data detail sheet."""
-    ws = wb.create_sheet("Details")
-
-    row = 1
+    sheet = _SheetWriter(wb, "Details", [35, 20, 20])
 
     # Score Distribution
     score_distribution = data.get("score_distribution", [])
     if score_distribution:
-        ws[f"A{row}"] = "Score Distribution"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Score Range", "Number of Students"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, bucket in enumerate(score_distribution):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=bucket.get("range_label", "Unknown")
-            ).border = BORDER
-            ws.cell(row=row, column=2, value=bucket.get("count", 0)).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 3):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Score Distribution",
+            ["Score Range", "Number of Students"],
+            (
+                (bucket.get("range_label", "Unknown"), bucket.get("count", 0))
+                for bucket in score_distribution
+            ),
+        )
+        sheet.skip()
 
     # Top Students
     top_students = data.get("top_students", [])
     if top_students:
-        ws[f"A{row}"] = "Top Performing Students"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Rank", "Student", "Average Score"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, student in enumerate(top_students):
-            row += 1
-            ws.cell(row=row, column=1, value=student.get("rank", "")).border = BORDER
-            ws.cell(
-                row=row, column=2, value=student.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=3, value=f"{student.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Top Performing Students",
+            ["Rank", "Student", "Average Score"],
+            (
+                (
+                    student.get("rank", ""),
+                    student.get("name", "Unknown"),
+                    f"{student.get('avg_score', 0):.1f}%",
+                )
+                for student in top_students
+            ),
+        )
+        sheet.skip()
 
     # Struggling Students
     struggling_students = data.get("struggling_students", [])
     if struggling_students:
-        ws[f"A{row}"] = "Students Needing Support"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Student", "Average Score", "Alert"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, student in enumerate(struggling_students):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=student.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{student.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            ws.cell(
-                row=row, column=3, value=student.get("alert_reason", "")
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Students Needing Support",
+            ["Student", "Average Score", "Alert"],
+            (
+                (
+                    student.get("name", "Unknown"),
+                    f"{student.get('avg_score', 0):.1f}%",
+                    student.get("alert_reason", ""),
+                )
+                for student in struggling_students
+            ),
+        )
+        sheet.skip()
 
     # Assignment Performance
     assignments = data.get("assignments", [])
     if assignments:
-        ws[f"A{row}"] = "Assignment Performance"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Assignment", "Average Score", "Completion Rate"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(assignments):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=item.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{item.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            ws.cell(
-                row=row, column=3, value=f"{item.get('completion_rate', 0) * 100:.0f}%"
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 35
-    ws.column_dimensions["B"].width = 20
-    ws.column_dimensions["C"].width = 20
+        sheet.table(
+            "Assignment Performance",
+            ["Assignment", "Average Score", "Completion Rate"],
+            (
+                (
+                    item.get("name", "Unknown"),
+                    f"{item.get('avg_score', 0):.1f}%",
+                    f"{item.get('completion_rate', 0) * 100:.0f}%",
+                )
+                for item in assignments
+            ),
+        )
 
 
 def _create_assignment_data_sheet(wb: Workbook, data: dict) -> None:
     """Create assignment overview data sheet."""
-    ws = wb.create_sheet("Details")
-
-    row = 1
+    sheet = _SheetWriter(wb, "Details", [40, 15, 15, 15, 20])
 
     # Assignment Metrics
     assignments = data.get("assignments", [])
     if assignments:
-        ws[f"A{row}"] = "Assignment Performance"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Assignment", "Avg Score", "Completion", "Avg Time", "Activity Type"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(assignments):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=item.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{item.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            ws.cell(
-                row=row, column=3, value=f"{item.get('completion_rate', 0) * 100:.0f}%"
-            ).border = BORDER
-            ws.cell(
-                row=row, column=4, value=f"{item.get('time_spent', 0):.0f} min"
-            ).border = BORDER
-            ws.cell(
-                row=row, column=5, value=item.get("activity_type", "Unknown")
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 6):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Assignment Performance",
+            ["Assignment", "Avg Score", "Completion", "Avg Time", "Activity Type"],
+            (
+                (
+                    item.get("name", "Unknown"),
+                    f"{item.get('avg_score', 0):.1f}%",
+                    f"{item.get('completion_rate', 0) * 100:.0f}%",
+                    f"{item.get('time_spent', 0):.0f} min",
+                    item.get("activity_type", "Unknown"),
+                )
+                for item in assignments
+            ),
+        )
+        sheet.skip()
 
     # Most Successful
     most_successful = data.get("most_successful", [])
     if most_successful:
-        ws[f"A{row}"] = "Most Successful Assignments"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Assignment", "Average Score"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(most_successful):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=item.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{item.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 3):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-        row += 2
+        sheet.table(
+            "Most Successful Assignments",
+            ["Assignment", "Average Score"],
+            (
+                (item.get("name", "Unknown"), f"{item.get('avg_score', 0):.1f}%")
+                for item in most_successful
+            ),
+        )
+        sheet.skip()
 
     # Least Successful
     least_successful = data.get("least_successful", [])
     if least_successful:
-        ws[f"A{row}"] = "Assignments Needing Attention"
-        ws[f"A{row}"].font = SECTION_FONT
-        row += 1
-
-        headers = ["Assignment", "Average Score"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = BORDER
-
-        for i, item in enumerate(least_successful):
-            row += 1
-            ws.cell(
-                row=row, column=1, value=item.get("name", "Unknown")
-            ).border = BORDER
-            ws.cell(
-                row=row, column=2, value=f"{item.get('avg_score', 0):.1f}%"
-            ).border = BORDER
-            if i % 2 == 1:
-                for col in range(1, 3):
-                    ws.cell(row=row, column=col).fill = ALT_ROW_FILL
-
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 40
-    ws.column_dimensions["B"].width = 15
-    ws.column_dimensions["C"].width = 15
-    ws.column_dimensions["D"].width = 15
-    ws.column_dimensions["E"].width = 20
+        sheet.table(
+            "Assignments Needing Attention",
+            ["Assignment", "Average Score"],
+            (
+                (item.get("name", "Unknown"), f"{item.get('avg_score', 0):.1f}%")
+                for item in least_successful
+            ),
+        )
 
 
 def _create_charts_sheet(wb: Workbook, data: dict, report_type: str) -> None:
@@ -523,64 +407,49 @@ def _create_charts_sheet(wb: Workbook, data: dict, report_type: str) -> None:
     if not chart_data:
         return
 
-    ws = wb.create_sheet("Charts")
+    sheet = _SheetWriter(wb, "Charts", [25, 15])
 
     # Set up data for book/activity chart
-    ws["A1"] = chart_title
-    ws["A1"].font = SECTION_FONT
-
-    ws["A3"] = x_title
-    ws["B3"] = "Average Score"
-    ws["A3"].fill = HEADER_FILL
-    ws["A3"].font = HEADER_FONT
-    ws["B3"].fill = HEADER_FILL
-    ws["B3"].font = HEADER_FONT
-
-    for i, item in enumerate(chart_data, 4):
+    sheet.section(chart_title)
+    sheet.skip()
+    sheet.header([x_title, "Average Score"], border=None)
+    header_row = sheet.row
+    for item in chart_data:
         label = item.get(label_key, item.get("activity_type", "Unknown"))
-        score = item.get("avg_score", 0)
-        ws[f"A{i}"] = label
-        ws[f"B{i}"] = score
+        sheet.append([label, item.get("avg_score", 0)])
 
     # Create bar chart
-    if len(chart_data) > 0:
-        chart = BarChart()
-        chart.type = "col"
-        chart.style = 10
-        chart.title = chart_title
-        chart.y_axis.title = "Score (%)"
-        chart.x_axis.title = x_title
+    chart = BarChart()
+    chart.type = "col"
+    chart.style = 10
+    chart.title = chart_title
+    chart.y_axis.title = "Score (%)"
+    chart.x_axis.title = x_title
 
-        data_ref = Reference(ws, min_col=2, min_row=3, max_row=3 + len(chart_data))
-        cats_ref = Reference(ws, min_col=1, min_row=4, max_row=3 + len(chart_data))
+    data_ref = Reference(sheet.ws, min_col=2, min_row=header_row, max_row=sheet.row)
+    cats_ref = Reference(sheet.ws, min_col=1, min_row=header_row + 1, max_row=sheet.row)
 
-        chart.add_data(data_ref, titles_from_data=True)
-        chart.set_categories(cats_ref)
-        chart.shape = 4
-        chart.width = 15
-        chart.height = 10
+    chart.add_data(data_ref, titles_from_data=True)
+    chart.set_categories(cats_ref)
+    chart.shape = 4
+    chart.width = 15
+    chart.height = 10
 
-        ws.add_chart(chart, "D3")
+    sheet.ws.add_chart(chart, f"D{header_row}")
 
     # Add score distribution chart for class reports
     if report_type == "class":
         score_dist = data.get("score_distribution", [])
         if score_dist:
-            start_row = 4 + len(chart_data) + 3
-
-            ws[f"A{start_row}"] = "Score Distribution"
-            ws[f"A{start_row}"].font = SECTION_FONT
+            sheet.skip(3)
+            start_row = sheet.row + 1
 
-            ws[f"A{start_row + 2}"] = "Score Range"
-            ws[f"B{start_row + 2}"] = "Students"
-            ws[f"A{start_row + 2}"].fill = HEADER_FILL
-            ws[f"A{start_row + 2}"].font = HEADER_FONT
-            ws[f"B{start_row + 2}"].fill = HEADER_FILL
-            ws[f"B{start_row + 2}"].font = HEADER_FONT
-
-            for i, bucket in enumerate(score_dist):
-                ws[f"A{start_row + 3 + i}"] = bucket.get("range_label", "")
-                ws[f"B{start_row + 3 + i}"] = bucket.get("count", 0)
+            sheet.section("Score Distribution")
+            sheet.skip()
+            sheet.header(["Score Range", "Students"], border=None)
+            header_row = sheet.row
+            for bucket in score_dist:
+                sheet.append([bucket.get("range_label", ""), bucket.get("count", 0)])
 
             chart2 = BarChart()
             chart2.type = "col"
@@ -590,16 +459,10 @@ def _create_charts_sheet(wb: Workbook, data: dict, report_type: str) -> None:
             chart2.x_axis.title = "Score Range"
 
             data_ref2 = Reference(
-                ws,
-                min_col=2,
-                min_row=start_row + 2,
-                max_row=start_row + 2 + len(score_dist),
+                sheet.ws, min_col=2, min_row=header_row, max_row=sheet.row
             )
             cats_ref2 = Reference(
-                ws,
-                min_col=1,
-                min_row=start_row + 3,
-                max_row=start_row + 2 + len(score_dist),
+                sheet.ws, min_col=1, min_row=header_row + 1, max_row=sheet.row
             )
 
             chart2.add_data(data_ref2, titles_from_data=True)
@@ -607,8 +470,4 @@ def _create_charts_sheet(wb: Workbook, data: dict, report_type: str) -> None:
             chart2.width = 15
             chart2.height = 10
 
-            ws.add_chart(chart2, f"D{start_row}")
-
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 25
-    ws.column_dimensions["B"].width = 15
+            sheet.ws.add_chart(chart2, f"D{start_row}")
@@ -0,0 +1,415 @@
+"""
+Bounded in-process cache.
+
+A small LRU keyed by string with per-entry TTL and a byte budget. It backs
+every in-process cache in the app (the Redis L1 tier, DCSCache, the DCS
+client's response cache and the TTS AudioCache) so worker memory stays flat
+no matter how many distinct books, vocabulary lists or audio clips are seen.
+
+Optional TinyLFU admission keeps one-off keys from flushing frequently used
+ones once the budget is full. Expired entries are dropped on access and by a
+periodic sweeper (start_expiry_sweeper) so idle entries do not pin memory.
+
+Thread-safe: sync route handlers run in a threadpool alongside the event loop,
+so all mutations happen under a ``threading.Lock``. Critical sections are O(1)
+apart from prefix invalidation and sweeps.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
+
+from prometheus_client import Counter, Gauge
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_BYTES = Gauge(
+    "local_cache_bytes",
+    "Estimated bytes held by an in-process cache",
+    ["cache"],
+)
+LOCAL_CACHE_ENTRIES = Gauge(
+    "local_cache_entries",
+    "Entries held by an in-process cache",
+    ["cache"],
+)
+LOCAL_CACHE_EVICTIONS = Counter(
+    "local_cache_evictions_total",
+    "Entries removed from an in-process cache without being invalidated",
+    ["cache", "reason"],
+)
+
+# Named caches, swept and reported by the sweeper. Weak so short-lived caches
+# (e.g. per-request clients) vanish with their owner.
+_registry: "weakref.WeakSet[LocalLRUCache]" = weakref.WeakSet()
+_sweeper_task: asyncio.Task[None] | None = None
+
+_MAX_SIZE_DEPTH = 6
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Walks containers and pydantic models a few levels deep. Not exact, but
+    stable and cheap enough to call on every set.
+    """
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value) + 33
+    if isinstance(value, str):
+        return len(value) + 49
+    if value is None or isinstance(value, bool | int | float):
+        return 28
+    if _depth >= _MAX_SIZE_DEPTH:
+        return sys.getsizeof(value)
+    if isinstance(value, BaseModel):
+        return 64 + estimate_size(value.__dict__, _depth + 1)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return sys.getsizeof(value) + sum(
+            estimate_size(item, _depth + 1) for item in value
+        )
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value), _depth + 1)
+    return sys.getsizeof(value)
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch of recent key frequencies for TinyLFU admission.
+
+    4-bit-style saturating counters (max 15) that are halved after a fixed
+    number of increments, so popularity ages out.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, width: int = 4096) -> None:
+        self._width = width
+        self._rows = [[0] * width for _ in range(self._DEPTH)]
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key)
+        return [((h >> (8 * i)) ^ (h * (i + 1))) % self._width for i in range(4)]
+
+    def increment(self, key: str) -> None:
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        return min(
+            row[index]
+            for row, index in zip(self._rows, self._indexes(key), strict=True)
+        )
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+
+
+class _LocalEntry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: float) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class LocalLRUCache:
+    """
+    Byte-bounded LRU cache with TTL expiry.
+
+    Entries are evicted least-recently-used first once ``max_bytes`` is
+    exceeded. With ``admission="tinylfu"`` a new key is only admitted over a
+    full budget if it has been requested more often recently than the entry
+    it would evict. Sizes are supplied by the caller (e.g. the length of a
+    serialized payload) or estimated with ``estimate_size``.
+
+    Named caches are reported to Prometheus and swept by the expiry sweeper.
+
+    Example:
+        l1 = LocalLRUCache(max_bytes=16 * 1024 * 1024, default_ttl=5)
+        l1.set("auth:user:123", user_dict, size=len(raw))
+        l1.get("auth:user:123")
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: float,
+        name: str | None = None,
+        admission: Literal["lru", "tinylfu"] = "lru",
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Total size budget across all entries
+            default_ttl: Default time-to-live in seconds
+            name: Metrics label; named caches are swept periodically
+            admission: "lru" admits everything; "tinylfu" filters one-off keys
+        """
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._name = name
+        self._sketch = _FrequencySketch() if admission == "tinylfu" else None
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+        if name is not None:
+            _registry.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def keys(self) -> list[str]:
+        """Snapshot of current keys (including not-yet-swept expired ones)."""
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._record_expired(1)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int | None = None,
+        ttl: float | None = None,
+    ) -> bool:
+        """
+        Store a value.
+
+        Values larger than the whole budget are not cached.
+
+        Args:
+            key: Cache key
+            value: Value to store (treated as read-only by readers)
+            size: Size of the entry in bytes (estimated when omitted)
+            ttl: Optional TTL in seconds (uses default if not provided)
+
+        Returns:
+            True if the value was stored, False if it was rejected
+        """
+        if size is None:
+            size = estimate_size(value)
+        if size > self._max_bytes:
+            return False
+        expires_at = time.monotonic() + (ttl if ttl is not None else self._default_ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            elif not self._admit(key, size):
+                self._rejections += 1
+                self._record_eviction("rejected", 1)
+                return False
+            self._entries[key] = _LocalEntry(value, size, expires_at)
+            self._bytes += size
+            evicted = 0
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                evicted += 1
+            if evicted:
+                self._evictions += evicted
+                self._record_eviction("capacity", evicted)
+            return True
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a single key. Returns True if it was present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+
+    def invalidate_many(self, keys: Iterable[str]) -> int:
+        """Remove several keys. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix``. Returns the number removed."""
+        with self._lock:
+            matching = [k for k in self._entries if k.startswith(prefix)]
+            for key in matching:
+                self._remove(key)
+            return len(matching)
+
+    def invalidate_where(self, predicate: Callable[[str, Any], bool]) -> int:
+        """Remove every entry for which ``predicate(key, value)`` is true."""
+        with self._lock:
+            matching = [k for k, e in self._entries.items() if predicate(k, e.value)]
+            for key in matching:
+                self._remove(key)
+            return len(matching)
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self._record_expired(len(expired))
+            return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/eviction counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return cache statistics for monitoring.
+
+        Returns:
+            Dict containing entries, bytes, hits, misses, evictions,
+            expirations, admission rejections and hit rate
+        """
+        total = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "rejections": self._rejections,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+        }
+
+    def _admit(self, key: str, size: int) -> bool:
+        """TinyLFU: admit a new key over budget only if it beats the LRU victim."""
+        if self._sketch is None or self._bytes + size <= self._max_bytes:
+            return True
+        if not self._entries:
+            return True
+        victim = next(iter(self._entries))
+        return self._sketch.frequency(key) > self._sketch.frequency(victim)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _record_eviction(self, reason: str, count: int) -> None:
+        if self._name is not None and count:
+            LOCAL_CACHE_EVICTIONS.labels(cache=self._name, reason=reason).inc(count)
+
+    def _record_expired(self, count: int) -> None:
+        if count:
+            self._expirations += count
+            self._record_eviction("expired", count)
+
+
+def sweep_registered_caches() -> int:
+    """
+    Purge expired entries from every named cache and refresh the gauges.
+
+    Caches sharing a name are reported as one series.
+
+    Returns:
+        Number of expired entries removed
+    """
+    removed = 0
+    totals: dict[str, tuple[int, int]] = {}
+    for cache in list(_registry):
+        removed += cache.purge_expired()
+        name = cache._name or ""
+        entries, size = totals.get(name, (0, 0))
+        totals[name] = (entries + len(cache), size + cache._bytes)
+    for name, (entries, size) in totals.items():
+        LOCAL_CACHE_ENTRIES.labels(cache=name).set(entries)
+        LOCAL_CACHE_BYTES.labels(cache=name).set(size)
+    return removed
+
+
+async def _expiry_sweeper_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = sweep_registered_caches()
+            if removed:
+                logger.debug("Local cache sweep removed %d expired entries", removed)
+        except Exception as e:
+            logger.warning("Local cache sweep failed: %s", e)
+
+
+def start_expiry_sweeper(interval: float) -> None:
+    """Start the periodic expiry sweeper for named caches (call at startup)."""
+    global _sweeper_task
+    if _sweeper_task is None:
+        _sweeper_task = asyncio.create_task(_expiry_sweeper_loop(interval))
+
+
+async def stop_expiry_sweeper() -> None:
+    """Stop the expiry sweeper (call at shutdown)."""
+    global _sweeper_task
+    task = _sweeper_task
+    _sweeper_task = None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
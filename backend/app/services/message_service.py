@@ -9,12 +9,14 @@ import bleach
 
 if TYPE_CHECKING:
     from arq import ArqRedis
-from sqlmodel import and_, case, func, or_, select
+from sqlmodel import and_, func, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.pagination import decode_cursor, keyset_page, split_page
 from app.models import (
     Class,
     ClassStudent,
+    ConversationSummary,
     DirectMessage,
     Student,
     Teacher,
@@ -430,117 +432,63 @@ async def get_conversations(
     user_id: uuid.UUID,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[ConversationPublic], int, int]:
+    cursor: str | None = None,
+) -> tuple[list[ConversationPublic], int, int, str | None]:
     """
-    Get list of conversations for a user, grouped by conversation partner.
+    Get list of conversations for a user, most recent first.
+
+    Reads the user's conversation summaries, which are kept current on every
+    message write (see app.services.conversation_summary).
 
     Args:
         db: Database session
         user_id: UUID of the current user
         limit: Maximum number of conversations to return
-        offset: Number of conversations to skip
+        offset: Number of conversations to skip (ignored when cursor is given)
+        cursor: Keyset cursor from a previous page's next_cursor
 
     Returns:
-        Tuple of (list of conversations, total count, total unread count)
-    """
-    # Subquery to get the partner ID for each message
-    partner_id_case = case(
-        (DirectMessage.sender_id == user_id, DirectMessage.recipient_id),
-        else_=DirectMessage.sender_id,
-    )
-
-    # Get all messages involving this user with partner info
-    messages_with_partner = (
-        select(
-            partner_id_case.label("partner_id"),
-            DirectMessage.body,
-            DirectMessage.sent_at,
-            DirectMessage.is_read,
-            DirectMessage.sender_id,
-        ).where(
-            or_(
-                DirectMessage.sender_id == user_id,
-                DirectMessage.recipient_id == user_id,
-            )
-        )
-    ).subquery()
+        Tuple of (list of conversations, total count, total unread count,
+        cursor for the next page or None on the last page)
 
-    # Get latest message per partner
-    latest_per_partner = (
-        select(
-            messages_with_partner.c.partner_id,
-            func.max(messages_with_partner.c.sent_at).label("max_sent_at"),
-        ).group_by(messages_with_partner.c.partner_id)
-    ).subquery()
-
-    # Get unread count per partner (messages received from partner that are unread)
-    unread_counts = (
-        select(
-            DirectMessage.sender_id.label("partner_id"),
-            func.count(DirectMessage.id).label("unread_count"),
-        )
-        .where(
-            and_(
-                DirectMessage.recipient_id == user_id,
-                DirectMessage.is_read == False,  # noqa: E712
-            )
-        )
-        .group_by(DirectMessage.sender_id)
-    ).subquery()
-
-    # Total unread count
-    total_unread_query = select(func.count(DirectMessage.id)).where(
-        and_(
-            DirectMessage.recipient_id == user_id,
-            DirectMessage.is_read == False,  # noqa: E712
-        )
-    )
-    total_unread_result = await db.execute(total_unread_query)
-    total_unread = total_unread_result.scalar() or 0
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    after = decode_cursor(cursor) if cursor is not None else None
 
-    # Count total unique conversation partners
-    count_query = select(func.count(func.distinct(latest_per_partner.c.partner_id)))
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    totals_query = select(
+        func.count(ConversationSummary.id),
+        func.coalesce(func.sum(ConversationSummary.unread_count), 0),
+    ).where(ConversationSummary.user_id == user_id)
+    totals_result = await db.execute(totals_query)
+    total, total_unread = totals_result.one()
 
-    # Main query: join with user info and latest message
     query = (
         select(
-            latest_per_partner.c.partner_id,
+            ConversationSummary.partner_id,
+            ConversationSummary.last_message_preview,
+            ConversationSummary.last_sent_at,
+            ConversationSummary.unread_count,
             User.full_name,
             User.role,
-            DirectMessage.body.label("last_message"),
-            latest_per_partner.c.max_sent_at,
-            func.coalesce(unread_counts.c.unread_count, 0).label("unread_count"),
-        )
-        .join(User, User.id == latest_per_partner.c.partner_id)
-        .join(
-            DirectMessage,
-            and_(
-                or_(
-                    and_(
-                        DirectMessage.sender_id == user_id,
-                        DirectMessage.recipient_id == latest_per_partner.c.partner_id,
-                    ),
-                    and_(
-                        DirectMessage.sender_id == latest_per_partner.c.partner_id,
-                        DirectMessage.recipient_id == user_id,
-                    ),
-                ),
-                DirectMessage.sent_at == latest_per_partner.c.max_sent_at,
-            ),
-        )
-        .outerjoin(
-            unread_counts,
-            unread_counts.c.partner_id == latest_per_partner.c.partner_id,
         )
-        .order_by(latest_per_partner.c.max_sent_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .join(User, User.id == ConversationSummary.partner_id)
+        .where(ConversationSummary.user_id == user_id)
     )
+    query = keyset_page(
+        query,
+        ConversationSummary.last_sent_at,
+        ConversationSummary.partner_id,
+        after,
+        limit,
+    )
+    if after is None:
+        query = query.offset(offset)
 
     result = await db.execute(query)
-    rows = result.all()
+    rows, next_cursor = split_page(
+        result.all(), limit, lambda row: (row.last_sent_at, row.partner_id)
+    )
 
     conversations = [
         ConversationPublic(
@@ -548,14 +496,14 @@ async def get_conversations(
             participant_name=row.full_name or "Unknown",
             participant_email=None,
             participant_role=row.role.value,
-            last_message_preview=row.last_message[:100] if row.last_message else "",
-            last_message_timestamp=row.max_sent_at,
+            last_message_preview=row.last_message_preview,
+            last_message_timestamp=row.last_sent_at,
             unread_count=row.unread_count,
         )
         for row in rows
     ]
 
-    return conversations, total, total_unread
+    return conversations, total, total_unread, next_cursor
 
 
 async def get_thread(
@@ -713,9 +661,8 @@ async def get_unread_messages_count(
     Returns:
         Count of unread messages
     """
-    query = select(func.count(DirectMessage.id)).where(
-        DirectMessage.recipient_id == user_id,
-        DirectMessage.is_read == False,  # noqa: E712
+    query = select(func.coalesce(func.sum(ConversationSummary.unread_count), 0)).where(
+        ConversationSummary.user_id == user_id
     )
 
     result = await db.execute(query)
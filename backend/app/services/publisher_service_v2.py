@@ -7,6 +7,7 @@ with caching for performance.
 
 import logging
 
+from app.core.config import settings
 from app.schemas.publisher import PublisherPublic
 from app.services.dcs_cache import CacheKeys, get_dcs_cache
 from app.services.dream_storage_client import get_dream_storage_client
@@ -32,12 +33,12 @@ class PublisherService:
         Get all publishers from DCS.
 
         Returns cached data if available, otherwise fetches from DCS.
-        Cache TTL: 10 minutes.
+        Cache TTL: DCS_CACHE_PUBLISHER_TTL.
         """
         return await self.cache.get_or_fetch(
             CacheKeys.PUBLISHER_LIST,
             self._fetch_publishers,
-            ttl=600,  # 10 minutes
+            ttl=settings.DCS_CACHE_PUBLISHER_TTL,
         )
 
     async def _fetch_publishers(self) -> list[PublisherPublic]:
@@ -61,7 +62,7 @@ class PublisherService:
         Get single publisher by DCS ID.
 
         Returns cached data if available, otherwise fetches from DCS.
-        Cache TTL: 10 minutes.
+        Cache TTL: DCS_CACHE_PUBLISHER_TTL.
 
         Args:
             publisher_id: Publisher ID in DCS
@@ -71,7 +72,10 @@ class PublisherService:
         """
         cache_key = CacheKeys.publisher_by_id(str(publisher_id))
         return await self.cache.get_or_fetch(
-            cache_key, lambda: self._fetch_publisher(publisher_id), ttl=600
+            cache_key,
+            lambda: self._fetch_publisher(publisher_id),
+            ttl=settings.DCS_CACHE_PUBLISHER_TTL,
+            cache_not_found=True,
         )
 
     async def _fetch_publisher(self, publisher_id: int) -> PublisherPublic | None:
@@ -6,13 +6,25 @@ Graceful degradation: if Redis is down, falls through to DB.
 Single-flight locking prevents thundering herd on cold starts:
   - On cache miss, one request acquires a SETNX lock, fetches from DB, populates cache.
   - Other requests poll cache until populated (or timeout → direct fetch).
+
+An optional in-process L1 tier (LocalLRUCache) sits in front of Redis for
+hot key families (auth users, book lists). Entries live a few seconds and are
+dropped on every worker via a pub/sub broadcast from cache_events. The same
+invalidation bus keeps the other in-process caches coherent across workers.
+
+Versioned namespaces make family-wide invalidation O(1):
+  - A key family such as ``student:{id}:assignments`` has a version counter.
+  - Keys in the family embed the current version (``...:assignments:v7:...``).
+  - Invalidation is a single INCR; orphaned entries age out through their TTL.
 """
 
 import asyncio
+import inspect
 import logging
 import random
+import time
 import uuid
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any
 
 import orjson
@@ -20,11 +32,30 @@ import redis as redis_sync
 import redis.asyncio as redis
 
 from app.core.config import settings
+from app.services.local_cache import LocalLRUCache
 
 logger = logging.getLogger(__name__)
 
 _redis_client: redis.Redis | None = None
 _redis_sync_client: redis_sync.Redis | None = None
+# Raw-bytes client for binary payloads (e.g. TTS audio); shares REDIS_URL
+_redis_binary_client: redis.Redis | None = None
+
+# L1 tier: only these hot, read-mostly key families are held in-process.
+# Namespaced families match on "<namespace>:" so their version counters are
+# served from L1 as well.
+_L1_PREFIXES = ("auth:user:", "books:")
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
+_l1_cache: LocalLRUCache | None = (
+    LocalLRUCache(
+        max_bytes=settings.CACHE_L1_MAX_BYTES,
+        default_ttl=settings.CACHE_L1_TTL,
+        name="redis_l1",
+    )
+    if settings.CACHE_L1_ENABLED
+    else None
+)
 
 # Lua script for atomic lock release (only release if we own the lock)
 _RELEASE_LOCK_SCRIPT = """
@@ -35,6 +66,19 @@ else
 end
 """
 
+# Prefix for namespace version counters (kept out of any family's key space)
+_NAMESPACE_VERSION_PREFIX = "__ns__:"
+
+# Lua script for namespace bumps. A missing counter (never set, or evicted by
+# allkeys-lru) is seeded from the clock before INCR so a reset can never land
+# on a version that still has live entries.
+_BUMP_NAMESPACE_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    redis.call("set", KEYS[1], ARGV[1])
+end
+return redis.call("incr", KEYS[1])
+"""
+
 
 async def get_redis() -> redis.Redis | None:
     """Get the Redis client singleton. Returns None if not connected."""
@@ -43,7 +87,7 @@ async def get_redis() -> redis.Redis | None:
 
 async def init_redis() -> None:
     """Initialize Redis connection on startup."""
-    global _redis_client, _redis_sync_client
+    global _redis_client, _redis_sync_client, _redis_binary_client
     try:
         _redis_client = redis.from_url(
             settings.REDIS_URL,
@@ -55,9 +99,17 @@ async def init_redis() -> None:
         # Test connection
         await _redis_client.ping()
         logger.info("Redis async client connected: %s", settings.REDIS_URL)
+        _redis_binary_client = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            retry_on_timeout=True,
+        )
     except Exception as e:
         logger.warning("Redis async unavailable, caching disabled: %s", e)
         _redis_client = None
+        _redis_binary_client = None
 
     # Sync client for sync endpoints (get_current_user, teacher routes)
     try:
@@ -77,10 +129,14 @@ async def init_redis() -> None:
 
 async def close_redis() -> None:
     """Close Redis connections on shutdown."""
-    global _redis_client, _redis_sync_client
+    global _redis_client, _redis_sync_client, _redis_binary_client
+    await stop_invalidation_listener()
     if _redis_client:
         await _redis_client.aclose()
         _redis_client = None
+    if _redis_binary_client:
+        await _redis_binary_client.aclose()
+        _redis_binary_client = None
     if _redis_sync_client:
         _redis_sync_client.close()
         _redis_sync_client = None
@@ -88,7 +144,16 @@ async def close_redis() -> None:
 
 
 async def cache_get(key: str) -> Any | None:
-    """Get a value from cache. Returns None on miss or error."""
+    """Get a value from cache (L1 first for hot keys). Returns None on miss or error.
+
+    Values served from L1 are shared between requests — treat them as read-only.
+    """
+    l1 = _l1_for(key)
+    if l1 is not None:
+        value = l1.get(key)
+        if value is not None:
+            return value
+
     client = _redis_client
     if not client:
         return None
@@ -96,7 +161,10 @@ async def cache_get(key: str) -> Any | None:
         raw = await client.get(key)
         if raw is None:
             return None
-        return orjson.loads(raw)
+        value = orjson.loads(raw)
+        if l1 is not None:
+            l1.set(key, value, size=len(raw))
+        return value
     except Exception as e:
         logger.debug("Cache get error for %s: %s", key, e)
         return None
@@ -110,15 +178,44 @@ async def cache_set(key: str, value: Any, ttl: int = 3600) -> None:
     try:
         # Add ±20% jitter to prevent all caches expiring simultaneously
         jittered_ttl = int(ttl * (0.8 + random.random() * 0.4))
-        await client.setex(
-            key, max(jittered_ttl, 1), orjson.dumps(value, default=str).decode()
-        )
+        payload = orjson.dumps(value, default=str).decode()
+        await client.setex(key, max(jittered_ttl, 1), payload)
+        _l1_store(key, value, len(payload), ttl)
+    except Exception as e:
+        logger.debug("Cache set error for %s: %s", key, e)
+
+
+async def cache_get_many_bytes(keys: list[str]) -> list[bytes | None]:
+    """Get raw binary values for ``keys`` in one round trip. Misses are None."""
+    client = _redis_binary_client
+    if not client or not keys:
+        return [None] * len(keys)
+    try:
+        return await client.mget(keys)
+    except Exception as e:
+        logger.debug("Cache mget error for %d keys: %s", len(keys), e)
+        return [None] * len(keys)
+
+
+async def cache_set_bytes(key: str, value: bytes, ttl: int = 3600) -> None:
+    """Store a raw binary value with TTL (seconds). Fails silently."""
+    client = _redis_binary_client
+    if not client:
+        return
+    try:
+        await client.setex(key, max(ttl, 1), value)
     except Exception as e:
         logger.debug("Cache set error for %s: %s", key, e)
 
 
 async def cache_invalidate(key: str) -> None:
-    """Delete a specific cache key. Fails silently."""
+    """Delete a specific cache key. Fails silently.
+
+    Only drops this worker's L1 copy; use cache_events.invalidate_for_event
+    (or cache_broadcast_invalidation) to reach every worker.
+    """
+    if _l1_cache is not None:
+        _l1_cache.invalidate(key)
     client = _redis_client
     if not client:
         return
@@ -208,13 +305,328 @@ async def cache_get_or_fetch(
         return await fetch_fn()
 
 
+# ---------------------------------------------------------------------------
+# Versioned namespaces
+# ---------------------------------------------------------------------------
+
+
+def _namespace_version_key(namespace: str) -> str:
+    return f"{_NAMESPACE_VERSION_PREFIX}{namespace}"
+
+
+def _namespace_seed() -> str:
+    """Initial version for a missing counter (milliseconds since epoch)."""
+    return str(time.time_ns() // 1_000_000)
+
+
+def _build_namespaced_key(namespace: str, version: str, suffix: str) -> str:
+    return f"{namespace}:v{version}:{suffix}" if suffix else f"{namespace}:v{version}"
+
+
+async def cache_namespace_key(namespace: str, suffix: str = "") -> str:
+    """Build a cache key inside a versioned namespace.
+
+    The namespace's current version is folded into the key, so a single
+    ``cache_bump_namespace`` call makes every previously written key in the
+    family unreachable.
+
+    Usage:
+        key = await cache_namespace_key(
+            f"student:{user_id}:assignments", f"{status}:{limit}:{offset}"
+        )
+        cached = await cache_get(key)
+    """
+    client = _redis_client
+    if not client:
+        return _build_namespaced_key(namespace, "0", suffix)
+
+    version_key = _namespace_version_key(namespace)
+    l1 = _l1_for(f"{namespace}:")
+    version = l1.get(version_key) if l1 is not None else None
+    if version is not None:
+        return _build_namespaced_key(namespace, version, suffix)
+
+    try:
+        version = await client.get(version_key)
+        if version is None:
+            await client.set(version_key, _namespace_seed(), nx=True)
+            version = await client.get(version_key)
+    except Exception as e:
+        logger.debug("Cache namespace version error for %s: %s", namespace, e)
+        version = None
+    if version is not None and l1 is not None:
+        l1.set(version_key, version, size=len(version))
+    return _build_namespaced_key(namespace, version or "0", suffix)
+
+
+async def cache_bump_namespace(namespace: str) -> None:
+    """Invalidate every key in a namespace with one INCR. Fails silently."""
+    if _l1_cache is not None:
+        _l1_cache.invalidate(_namespace_version_key(namespace))
+    client = _redis_client
+    if not client:
+        return
+    try:
+        await client.eval(
+            _BUMP_NAMESPACE_SCRIPT,
+            1,
+            _namespace_version_key(namespace),
+            _namespace_seed(),
+        )
+    except Exception as e:
+        logger.debug("Cache namespace bump error for %s: %s", namespace, e)
+
+
+# ---------------------------------------------------------------------------
+# Cross-worker invalidation bus
+# ---------------------------------------------------------------------------
+# In-process caches (L1 here, DCSCache, the DCS client's response cache) are
+# kept coherent across gunicorn workers by publishing invalidations on a Redis
+# pub/sub channel. Each worker runs one listener that dispatches messages to
+# the handler registered for the channel. Messages carry the publishing
+# worker's id so the sender, which already applied the change, skips them.
+# Broadcasts published while the listener is disconnected are lost, so on
+# resubscribing every consumer drops what it holds.
+
+InvalidationHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
+InvalidationResync = Callable[[], Awaitable[None] | None]
+
+_WORKER_ID = uuid.uuid4().hex
+_invalidation_handlers: dict[str, InvalidationHandler] = {}
+_invalidation_resyncs: dict[str, InvalidationResync] = {}
+_invalidation_listener_task: asyncio.Task[None] | None = None
+
+
+def register_invalidation_handler(
+    channel: str,
+    handler: InvalidationHandler,
+    on_resync: InvalidationResync | None = None,
+) -> None:
+    """Apply invalidation messages published on ``channel`` in this worker.
+
+    Register at import time; the listener subscribes to every registered
+    channel when it starts. ``on_resync`` should clear the handler's whole
+    cache; it is called each time the listener resubscribes after losing
+    its connection.
+    """
+    _invalidation_handlers[channel] = handler
+    if on_resync is not None:
+        _invalidation_resyncs[channel] = on_resync
+
+
+def _encode_invalidation(payload: dict[str, Any]) -> bytes:
+    return orjson.dumps({**payload, "origin": _WORKER_ID})
+
+
+async def _dispatch_invalidation(channel: Any, data: Any) -> None:
+    """Decode a bus message and hand it to the channel's handler."""
+    if isinstance(channel, bytes):
+        channel = channel.decode()
+    handler = _invalidation_handlers.get(channel)
+    if handler is None or not data:
+        return
+    try:
+        payload = orjson.loads(data)
+        if payload.get("origin") == _WORKER_ID:
+            return
+        result = handler(payload)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug("Invalid invalidation message on %s %r: %s", channel, data, e)
+
+
+async def _resync_invalidation_consumers() -> None:
+    """Clear every consumer's cache after broadcasts may have been missed."""
+    for channel, resync in list(_invalidation_resyncs.items()):
+        try:
+            result = resync()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning("Invalidation resync failed for %s: %s", channel, e)
+
+
+async def publish_invalidation(channel: str, payload: dict[str, Any]) -> None:
+    """Publish an invalidation to every other worker. Fails silently."""
+    client = _redis_client
+    if not client:
+        return
+    try:
+        await client.publish(channel, _encode_invalidation(payload))
+    except Exception as e:
+        logger.debug("Invalidation publish error on %s: %s", channel, e)
+
+
+def publish_invalidation_sync(channel: str, payload: dict[str, Any]) -> None:
+    """Synchronous variant of ``publish_invalidation``."""
+    client = _redis_sync_client
+    if not client:
+        return
+    try:
+        client.publish(channel, _encode_invalidation(payload))
+    except Exception as e:
+        logger.debug("Sync invalidation publish error on %s: %s", channel, e)
+
+
+async def _invalidation_listener_loop() -> None:
+    """Dispatch bus messages to their handlers until cancelled.
+
+    Uses polling ``get_message`` with a timeout rather than ``listen()`` so
+    the client's socket timeout does not tear down an idle subscription.
+    """
+    missed = False
+    while True:
+        client = _redis_client
+        if client is None or not _invalidation_handlers:
+            return
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(*_invalidation_handlers)
+            if missed:
+                # Cleared only once subscribed again, so nothing published
+                # in between can be lost
+                await _resync_invalidation_consumers()
+                missed = False
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
+                    await _dispatch_invalidation(
+                        message.get("channel"), message.get("data")
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Invalidation listener error, resubscribing: %s", e)
+            missed = True
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+async def start_invalidation_listener() -> None:
+    """Subscribe this worker to the invalidation bus (call at startup)."""
+    global _invalidation_listener_task
+    if (
+        _redis_client is None
+        or not _invalidation_handlers
+        or _invalidation_listener_task is not None
+    ):
+        return
+    _invalidation_listener_task = asyncio.create_task(_invalidation_listener_loop())
+
+
+async def stop_invalidation_listener() -> None:
+    """Cancel the invalidation listener (call at shutdown)."""
+    global _invalidation_listener_task
+    task = _invalidation_listener_task
+    _invalidation_listener_task = None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception):
+        pass
+    if _l1_cache is not None:
+        _l1_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# L1 tier
+# ---------------------------------------------------------------------------
+
+
+def _l1_for(key: str) -> LocalLRUCache | None:
+    """Return the L1 cache if ``key`` belongs to an L1-eligible family."""
+    if _l1_cache is not None and key.startswith(_L1_PREFIXES):
+        return _l1_cache
+    return None
+
+
+def _l1_store(key: str, value: Any, size: int, ttl: int) -> None:
+    l1 = _l1_for(key)
+    if l1 is not None:
+        l1.set(key, value, size=size, ttl=min(ttl, settings.CACHE_L1_TTL))
+
+
+def _l1_keys_for(keys: list[str], namespaces: list[str]) -> list[str]:
+    return keys + [_namespace_version_key(ns) for ns in namespaces]
+
+
+def _apply_l1_invalidation(payload: dict[str, Any]) -> None:
+    """Drop the keys named in a broadcast payload from this worker's L1."""
+    if _l1_cache is None:
+        return
+    _l1_cache.invalidate_many(
+        _l1_keys_for(payload.get("keys", []), payload.get("namespaces", []))
+    )
+
+
+def _clear_l1() -> None:
+    if _l1_cache is not None:
+        _l1_cache.clear()
+
+
+if _l1_cache is not None:
+    register_invalidation_handler(
+        L1_INVALIDATION_CHANNEL, _apply_l1_invalidation, on_resync=_clear_l1
+    )
+
+
+async def cache_broadcast_invalidation(
+    keys: list[str], namespaces: list[str] | None = None
+) -> None:
+    """Drop keys (and namespace versions) from the L1 tier of every worker.
+
+    Applied locally first so the calling worker reads its own writes, then
+    published once on the invalidation bus. Fails silently.
+    """
+    namespaces = namespaces or []
+    if _l1_cache is None or (not keys and not namespaces):
+        return
+    _l1_cache.invalidate_many(_l1_keys_for(keys, namespaces))
+    await publish_invalidation(
+        L1_INVALIDATION_CHANNEL, {"keys": keys, "namespaces": namespaces}
+    )
+
+
+def cache_broadcast_invalidation_sync(
+    keys: list[str], namespaces: list[str] | None = None
+) -> None:
+    """Synchronous variant of ``cache_broadcast_invalidation``."""
+    namespaces = namespaces or []
+    if _l1_cache is None or (not keys and not namespaces):
+        return
+    _l1_cache.invalidate_many(_l1_keys_for(keys, namespaces))
+    publish_invalidation_sync(
+        L1_INVALIDATION_CHANNEL, {"keys": keys, "namespaces": namespaces}
+    )
+
+
+def l1_cache_stats() -> dict[str, Any]:
+    """Return L1 hit/miss/eviction statistics (empty when disabled)."""
+    return _l1_cache.stats() if _l1_cache is not None else {}
+
+
 # ---------------------------------------------------------------------------
 # Synchronous helpers (native sync Redis client — no threads/event loops)
 # ---------------------------------------------------------------------------
 
 
 def cache_get_sync(key: str) -> Any | None:
-    """Synchronous cache get using native sync Redis client."""
+    """Synchronous cache get using native sync Redis client (L1 first)."""
+    l1 = _l1_for(key)
+    if l1 is not None:
+        value = l1.get(key)
+        if value is not None:
+            return value
+
     client = _redis_sync_client
     if not client:
         return None
@@ -222,7 +634,10 @@ def cache_get_sync(key: str) -> Any | None:
         raw = client.get(key)
         if raw is None:
             return None
-        return orjson.loads(raw)
+        value = orjson.loads(raw)
+        if l1 is not None:
+            l1.set(key, value, size=len(raw))
+        return value
     except Exception as e:
         logger.debug("Sync cache get error for %s: %s", key, e)
         return None
@@ -235,15 +650,17 @@ def cache_set_sync(key: str, value: Any, ttl: int = 3600) -> None:
         return
     try:
         jittered_ttl = int(ttl * (0.8 + random.random() * 0.4))
-        client.setex(
-            key, max(jittered_ttl, 1), orjson.dumps(value, default=str).decode()
-        )
+        payload = orjson.dumps(value, default=str).decode()
+        client.setex(key, max(jittered_ttl, 1), payload)
+        _l1_store(key, value, len(payload), ttl)
     except Exception as e:
         logger.debug("Sync cache set error for %s: %s", key, e)
 
 
 def cache_invalidate_sync(key: str) -> None:
-    """Synchronous cache invalidate. Fails silently."""
+    """Synchronous cache invalidate (this worker's L1 only). Fails silently."""
+    if _l1_cache is not None:
+        _l1_cache.invalidate(key)
     client = _redis_sync_client
     if not client:
         return
@@ -268,3 +685,46 @@ def cache_invalidate_pattern_sync(pattern: str) -> None:
                 break
     except Exception as e:
         logger.debug("Sync cache invalidate_pattern error for %s: %s", pattern, e)
+
+
+def cache_namespace_key_sync(namespace: str, suffix: str = "") -> str:
+    """Synchronous variant of ``cache_namespace_key``."""
+    client = _redis_sync_client
+    if not client:
+        return _build_namespaced_key(namespace, "0", suffix)
+
+    version_key = _namespace_version_key(namespace)
+    l1 = _l1_for(f"{namespace}:")
+    version = l1.get(version_key) if l1 is not None else None
+    if version is not None:
+        return _build_namespaced_key(namespace, version, suffix)
+
+    try:
+        version = client.get(version_key)
+        if version is None:
+            client.set(version_key, _namespace_seed(), nx=True)
+            version = client.get(version_key)
+    except Exception as e:
+        logger.debug("Sync cache namespace version error for %s: %s", namespace, e)
+        version = None
+    if version is not None and l1 is not None:
+        l1.set(version_key, version, size=len(version))
+    return _build_namespaced_key(namespace, version or "0", suffix)
+
+
+def cache_bump_namespace_sync(namespace: str) -> None:
+    """Synchronous namespace bump (single INCR). Fails silently."""
+    if _l1_cache is not None:
+        _l1_cache.invalidate(_namespace_version_key(namespace))
+    client = _redis_sync_client
+    if not client:
+        return
+    try:
+        client.eval(
+            _BUMP_NAMESPACE_SCRIPT,
+            1,
+            _namespace_version_key(namespace),
+            _namespace_seed(),
+        )
+    except Exception as e:
+        logger.debug("Sync cache namespace bump error for %s: %s", namespace, e)
@@ -0,0 +1,303 @@
+"""
+Reuse of computed report data between ReportJobs.
+
+Teachers regenerate the same report in another format, with another
+template, or a little later for the same rolling period. The collected data
+does not depend on the format or template, so ``process_report_job`` caches
+it in Redis under ``report_data_key`` and only renders on a hit.
+
+The key embeds the version of the report target's namespace, its *data
+version*: ``student:<id>:report-data``, ``class:<id>:report-data`` or
+``teacher:<id>:report-data`` for assignment overviews. Period bounds are
+keyed by day, the granularity reports show, so a rolling period requested
+again the same day hits.
+
+Versions are bumped by a session ``after_flush`` hook, the same way the
+analytics rollups are maintained. It records the namespaces a transaction
+touches and bumps them once the transaction commits:
+
+- an AssignmentStudent change bumps its student, the student's classes and
+  the assignment's teacher; updates count only while the row is or was
+  completed, so in-progress autosaves keep the cache
+- an Assignment change bumps its teacher and, through its submissions, the
+  students and classes it is assigned to
+- a ClassStudent change bumps the class and the student; a Class change
+  bumps the class
+
+Bulk INSERTs and UPDATEs bypass the hook, so writers using them call
+``record_assigned_students`` or ``record_changed_assignments``. Renamed
+users are not tracked; cached data also expires after
+REPORT_DATA_CACHE_TTL.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    Class,
+    ClassStudent,
+)
+from app.services.redis_cache import (
+    cache_bump_namespace,
+    cache_bump_namespace_sync,
+    cache_namespace_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the namespaces to bump on commit
+_PENDING_KEY = "report_data_namespaces"
+
+# AssignmentStudent columns that feed report data
+_TRACKED_ATTRS = (
+    "status",
+    "score",
+    "completed_at",
+    "time_spent_minutes",
+    "student_id",
+    "assignment_id",
+)
+
+# Bumps scheduled from async commits, referenced until they finish
+_bump_tasks: set[asyncio.Task] = set()
+
+
+def report_data_namespace(kind: str, target_id: uuid.UUID) -> str:
+    """Namespace of one report target ("student", "class" or "teacher")."""
+    return f"{kind}:{target_id}:report-data"
+
+
+async def report_data_key(
+    kind: str,
+    target_id: uuid.UUID,
+    report_type: str,
+    period: Iterable[datetime],
+) -> str:
+    """
+    Cache key for a report's collected data at the target's data version.
+
+    Args:
+        kind: Namespace kind of the target ("student", "class" or "teacher")
+        target_id: Student, class or teacher UUID
+        report_type: Report type value
+        period: Current and previous period bounds
+    """
+    bounds = ":".join(bound.date().isoformat() for bound in period)
+    return await cache_namespace_key(
+        report_data_namespace(kind, target_id), f"{report_type}:{bounds}"
+    )
+
+
+def _history_values(obj: Any, attr: str) -> set[Any]:
+    """Current and pre-flush values of an attribute."""
+    return {getattr(obj, attr), *inspect(obj).attrs[attr].history.deleted} - {None}
+
+
+def _student_class_ids(
+    connection: Connection, student_ids: set[uuid.UUID]
+) -> set[uuid.UUID]:
+    if not student_ids:
+        return set()
+    return set(
+        connection.execute(
+            select(ClassStudent.class_id)
+            .where(ClassStudent.student_id.in_(student_ids))
+            .distinct()
+        ).scalars()
+    )
+
+
+def _touched_namespaces(session: Session) -> set[str]:
+    """Report data namespaces affected by the changes just flushed."""
+    student_ids: set[uuid.UUID] = set()
+    class_ids: set[uuid.UUID] = set()
+    teacher_ids: set[uuid.UUID] = set()
+    # Students whose classes are affected as well
+    submitter_ids: set[uuid.UUID] = set()
+    submitted_assignment_ids: set[uuid.UUID] = set()
+    changed_assignment_ids: set[uuid.UUID] = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, AssignmentStudent):
+            # Reports count completed work: in-progress autosaves only matter
+            # once the row is, or stops being, completed. Inserted and
+            # deleted rows change the assigned totals either way.
+            if obj in session.dirty and (
+                AssignmentStatus.completed not in _history_values(obj, "status")
+                or not any(
+                    inspect(obj).attrs[attr].history.has_changes()
+                    for attr in _TRACKED_ATTRS
+                )
+            ):
+                continue
+            submitter_ids |= _history_values(obj, "student_id")
+            submitted_assignment_ids |= _history_values(obj, "assignment_id")
+        elif isinstance(obj, Assignment):
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            teacher_ids |= _history_values(obj, "teacher_id")
+            changed_assignment_ids.add(obj.id)
+        elif isinstance(obj, ClassStudent):
+            class_ids |= _history_values(obj, "class_id")
+            student_ids |= _history_values(obj, "student_id")
+        elif isinstance(obj, Class):
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            class_ids.add(obj.id)
+
+    if not (submitter_ids or changed_assignment_ids or class_ids or student_ids):
+        return set()
+
+    connection = session.connection()
+    # A savepoint keeps a failed lookup from aborting the flushing transaction
+    with connection.begin_nested():
+        if submitted_assignment_ids:
+            teacher_ids |= set(
+                connection.execute(
+                    select(Assignment.teacher_id).where(
+                        Assignment.id.in_(submitted_assignment_ids)
+                    )
+                ).scalars()
+            )
+        if changed_assignment_ids:
+            submitter_ids |= set(
+                connection.execute(
+                    select(AssignmentStudent.student_id).where(
+                        AssignmentStudent.assignment_id.in_(changed_assignment_ids)
+                    )
+                ).scalars()
+            )
+        class_ids |= _student_class_ids(connection, submitter_ids)
+    student_ids |= submitter_ids
+
+    return {
+        *(report_data_namespace("student", i) for i in student_ids),
+        *(report_data_namespace("class", i) for i in class_ids),
+        *(report_data_namespace("teacher", i) for i in teacher_ids),
+    }
+
+
+def _record(session: Session, namespaces: set[str]) -> None:
+    if namespaces:
+        session.info.setdefault(_PENDING_KEY, set()).update(namespaces)
+
+
+async def record_assigned_students(
+    session: AsyncSession, student_ids: Iterable[uuid.UUID]
+) -> None:
+    """
+    Invalidate report data of students assigned work with a bulk INSERT.
+
+    Bumps the students' and their classes' namespaces when the session
+    commits. Nothing is bumped if it rolls back.
+    """
+    student_ids = set(student_ids)
+    if not student_ids:
+        return
+
+    def record(sync_session: Session) -> None:
+        class_ids = _student_class_ids(sync_session.connection(), student_ids)
+        _record(
+            sync_session,
+            {
+                *(report_data_namespace("student", i) for i in student_ids),
+                *(report_data_namespace("class", i) for i in class_ids),
+            },
+        )
+
+    await session.run_sync(record)
+
+
+async def record_changed_assignments(
+    session: AsyncSession, assignment_ids: Iterable[uuid.UUID]
+) -> None:
+    """
+    Invalidate report data of assignments changed with a bulk UPDATE.
+
+    Bumps the assignments' teachers and the students and classes they are
+    assigned to, as a flushed Assignment change would, when the session
+    commits. Nothing is bumped if it rolls back.
+    """
+    assignment_ids = set(assignment_ids)
+    if not assignment_ids:
+        return
+
+    def record(sync_session: Session) -> None:
+        connection = sync_session.connection()
+        teacher_ids = set(
+            connection.execute(
+                select(Assignment.teacher_id).where(Assignment.id.in_(assignment_ids))
+            ).scalars()
+        )
+        student_ids = set(
+            connection.execute(
+                select(AssignmentStudent.student_id)
+                .where(AssignmentStudent.assignment_id.in_(assignment_ids))
+                .distinct()
+            ).scalars()
+        )
+        class_ids = _student_class_ids(connection, student_ids)
+        _record(
+            sync_session,
+            {
+                *(report_data_namespace("student", i) for i in student_ids),
+                *(report_data_namespace("class", i) for i in class_ids),
+                *(report_data_namespace("teacher", i) for i in teacher_ids),
+            },
+        )
+
+    await session.run_sync(record)
+
+
+async def _bump_namespaces(namespaces: set[str]) -> None:
+    await asyncio.gather(*(cache_bump_namespace(ns) for ns in namespaces))
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    # A failed lookup only loses this invalidation (its savepoint is rolled
+    # back); the TTL bounds staleness
+    try:
+        _record(session, _touched_namespaces(session))
+    except Exception:
+        logger.exception("Failed to collect report data invalidations")
+
+
+def _after_commit(session: Session) -> None:
+    namespaces = session.info.pop(_PENDING_KEY, None)
+    if not namespaces:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync session outside the event loop (threadpool routes, scripts)
+        for namespace in namespaces:
+            cache_bump_namespace_sync(namespace)
+        return
+    task = loop.create_task(_bump_namespaces(namespaces))
+    _bump_tasks.add(task)
+    task.add_done_callback(_bump_tasks.discard)
+
+
+def _after_soft_rollback(session: Session, previous_transaction: Any) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def register_report_data_invalidation() -> None:
+    """Install the flush and commit hooks on all sessions; idempotent."""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_soft_rollback", _after_soft_rollback)
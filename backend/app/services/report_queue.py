@@ -0,0 +1,114 @@
+"""
+Queue bookkeeping for report jobs run on the arq worker.
+
+``generate_report`` enqueues ``task_generate_report`` (app.tasks.reports)
+instead of rendering inside the API process. Around that, Redis (the arq
+database) holds:
+
+- ``reports:queued`` / ``reports:running``: sorted sets of job ids scored by
+  when they entered the state. Their sizes are the queue-depth gauges served
+  on /metrics. Entries left behind by a crashed worker age out.
+- ``reports:teacher:<id>:running``: how many of a teacher's reports are being
+  generated. A job that would exceed REPORT_MAX_CONCURRENT_PER_TEACHER is
+  deferred, so one teacher exporting a whole school cannot occupy every
+  worker slot.
+"""
+
+import time
+import uuid
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from arq import ArqRedis
+    from redis.asyncio import Redis
+
+QUEUED_KEY = "reports:queued"
+RUNNING_KEY = "reports:running"
+
+# Queued entries older than this were lost (e.g. the Redis queue was flushed)
+QUEUED_STALE_AFTER = 24 * 3600  # seconds
+
+
+def _teacher_key(teacher_id: uuid.UUID) -> str:
+    return f"reports:teacher:{teacher_id}:running"
+
+
+async def enqueue_report(arq_pool: "ArqRedis", job_id: uuid.UUID) -> None:
+    """
+    Queue a created ReportJob for generation on the worker.
+
+    The arq job id is derived from the report job, so enqueueing the same
+    report twice runs it once.
+    """
+    # Marked queued first: a worker picking the job up at once moves it to
+    # running, which a later ZADD would undo
+    await arq_pool.zadd(QUEUED_KEY, {str(job_id): time.time()})
+    try:
+        await arq_pool.enqueue_job(
+            "task_generate_report", str(job_id), _job_id=f"report:{job_id}"
+        )
+    except Exception:
+        # Never queued: keep it out of the queue-depth gauge
+        with suppress(Exception):
+            await arq_pool.zrem(QUEUED_KEY, str(job_id))
+        raise
+
+
+async def acquire_teacher_slot(redis: "Redis", teacher_id: uuid.UUID) -> bool:
+    """
+    Claim one of the teacher's concurrent report slots.
+
+    Returns:
+        True if claimed (release it with release_teacher_slot), False if the
+        teacher already has REPORT_MAX_CONCURRENT_PER_TEACHER reports running
+    """
+    key = _teacher_key(teacher_id)
+    running = await redis.incr(key)
+    # Bounds a slot leaked by a killed worker to one job timeout
+    await redis.expire(key, settings.REPORT_JOB_TIMEOUT)
+    if running > settings.REPORT_MAX_CONCURRENT_PER_TEACHER:
+        await redis.decr(key)
+        return False
+    return True
+
+
+async def release_teacher_slot(redis: "Redis", teacher_id: uuid.UUID) -> None:
+    """Give back a slot claimed with acquire_teacher_slot."""
+    await redis.decr(_teacher_key(teacher_id))
+
+
+async def mark_running(redis: "Redis", job_id: uuid.UUID) -> None:
+    """Move a job from the queued to the running set."""
+    member = str(job_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.zrem(QUEUED_KEY, member)
+        pipe.zadd(RUNNING_KEY, {member: time.time()})
+        await pipe.execute()
+
+
+async def mark_finished(redis: "Redis", job_id: uuid.UUID) -> None:
+    """Drop a job from the queue bookkeeping, however it ended."""
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.zrem(QUEUED_KEY, str(job_id))
+        pipe.zrem(RUNNING_KEY, str(job_id))
+        await pipe.execute()
+
+
+async def queue_depth(redis: "Redis") -> tuple[int, int]:
+    """
+    Count queued and running report jobs.
+
+    Returns:
+        (queued, running)
+    """
+    now = time.time()
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zremrangebyscore(QUEUED_KEY, "-inf", now - QUEUED_STALE_AFTER)
+        pipe.zremrangebyscore(RUNNING_KEY, "-inf", now - settings.REPORT_JOB_TIMEOUT)
+        pipe.zcard(QUEUED_KEY)
+        pipe.zcard(RUNNING_KEY)
+        *_, queued, running = await pipe.execute()
+    return queued, running
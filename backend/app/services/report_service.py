@@ -4,6 +4,7 @@ import logging
 import os
 import re
 import uuid
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -13,8 +14,9 @@ from sqlmodel import select
 
 logger = logging.getLogger(__name__)
 
+from app.core.config import settings
+from app.core.pagination import decode_cursor, keyset_page, split_page
 from app.models import (
-    Activity,
     Assignment,
     AssignmentStatus,
     AssignmentStudent,
@@ -43,6 +45,17 @@ from app.schemas.reports import (
     StudentReportData,
     TrendAnalysis,
 )
+from app.services.analytics_queries import (
+    SCORE_BUCKETS,
+    StudentScoreRow,
+    assignment_stats,
+    score_bucket_counts,
+    stream_assignment_report_rows,
+    submission_period_totals,
+    submission_student_ranking,
+)
+from app.services.redis_cache import cache_get, cache_set
+from app.services.report_data_cache import report_data_key
 
 # Activity type label mapping (reused from analytics_service)
 ACTIVITY_TYPE_LABELS = {
@@ -452,29 +465,38 @@ async def get_report_status(
 async def get_report_history(
     session: AsyncSession,
     teacher_id: uuid.UUID,
-) -> list[ReportHistoryItem]:
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[ReportHistoryItem], str | None]:
     """
-    Get report history for a teacher (last 7 days).
+    Get report history for a teacher (last 7 days), newest first.
 
     Args:
         session: Database session
         teacher_id: Teacher UUID
+        limit: Page size, or None for the whole history
+        cursor: Keyset cursor from a previous page's next_cursor
 
     Returns:
-        List of ReportHistoryItem
+        Tuple of (list of ReportHistoryItem, cursor for the next page or None
+        on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
+    after = decode_cursor(cursor) if cursor is not None else None
     now = datetime.now(UTC)
     seven_days_ago = now - timedelta(days=7)
 
-    result = await session.execute(
-        select(ReportJob)
-        .where(
-            ReportJob.teacher_id == teacher_id,
-            ReportJob.created_at >= seven_days_ago,
-        )
-        .order_by(ReportJob.created_at.desc())
+    query = select(ReportJob).where(
+        ReportJob.teacher_id == teacher_id,
+        ReportJob.created_at >= seven_days_ago,
+    )
+    query = keyset_page(query, ReportJob.created_at, ReportJob.id, after, limit)
+    result = await session.execute(query)
+    jobs, next_cursor = split_page(
+        result.scalars().all(), limit, lambda job: (job.created_at, job.id)
     )
-    jobs = result.scalars().all()
 
     history = []
     for job in jobs:
@@ -520,7 +542,7 @@ async def get_report_history(
             )
         )
 
-    return history
+    return history, next_cursor
 
 
 async def cleanup_expired_reports(session: AsyncSession) -> int:
@@ -790,160 +812,93 @@ async def generate_class_report_data(
 
     # Get students in class
     students_result = await session.execute(
-        select(Student, User)
-        .join(ClassStudent, ClassStudent.student_id == Student.id)
-        .join(User, Student.user_id == User.id)
-        .where(ClassStudent.class_id == class_id)
-    )
-    students = students_result.all()
-    student_ids = [s.id for s, _ in students]
-
-    # Get assignments that have been assigned to students in this class
-    # Use subquery for DISTINCT on ID only (avoids JSON column comparison issue)
-    assignment_ids_result = await session.execute(
-        select(Assignment.id)
-        .distinct()
-        .join(AssignmentStudent, AssignmentStudent.assignment_id == Assignment.id)
-        .where(
-            AssignmentStudent.student_id.in_(student_ids),
-            Assignment.created_at >= current_start,
-            Assignment.created_at <= current_end,
-        )
-    )
-    assignment_ids = [a[0] for a in assignment_ids_result.all()]
-
-    assignments_result = await session.execute(
-        select(Assignment).where(Assignment.id.in_(assignment_ids))
-    )
-    assignments = assignments_result.scalars().all()
-
-    # Get all student submissions for these assignments
-    # Use only Assignment join (no Activity) since most assignments are multi-activity
-    submissions_result = await session.execute(
-        select(AssignmentStudent, Assignment)
-        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
-        .where(
-            AssignmentStudent.student_id.in_(student_ids),
-            AssignmentStudent.assignment_id.in_(assignment_ids),
-            AssignmentStudent.status == AssignmentStatus.completed,
-        )
-    )
-    submissions = submissions_result.all()
-
-    # Calculate class average
-    current_scores = [sub.score for sub, _ in submissions if sub.score is not None]
-    current_avg = sum(current_scores) / len(current_scores) if current_scores else 0
-
-    # Get previous period for trend
-    prev_assignments_result = await session.execute(
-        select(Assignment.id)
-        .distinct()
-        .join(AssignmentStudent, AssignmentStudent.assignment_id == Assignment.id)
-        .where(
-            AssignmentStudent.student_id.in_(student_ids),
-            Assignment.created_at >= previous_start,
-            Assignment.created_at <= previous_end,
-        )
+        select(ClassStudent.student_id).where(ClassStudent.class_id == class_id)
     )
-    prev_assignment_ids = [a[0] for a in prev_assignments_result.all()]
-
-    prev_submissions_result = await session.execute(
-        select(AssignmentStudent.score).where(
-            AssignmentStudent.student_id.in_(student_ids),
-            AssignmentStudent.assignment_id.in_(prev_assignment_ids),
-            AssignmentStudent.status == AssignmentStatus.completed,
-            AssignmentStudent.score.isnot(None),
-        )
+    student_ids = list(students_result.scalars().all())
+
+    # Every panel below is aggregated in the database over completed work on
+    # assignments created in the period
+    in_class = AssignmentStudent.student_id.in_(student_ids)
+    in_current = Assignment.created_at.between(current_start, current_end)
+    totals = await submission_period_totals(
+        session,
+        student_ids,
+        current=(current_start, current_end),
+        previous=(previous_start, previous_end),
     )
-    prev_scores = [s[0] for s in prev_submissions_result.all()]
-    prev_avg = sum(prev_scores) / len(prev_scores) if prev_scores else None
-
-    trend = calculate_trend(current_avg, prev_avg)
+    current_avg = totals.current_avg or 0
+    trend = calculate_trend(current_avg, totals.previous_avg)
 
     # Completion rate
     total_expected = (
-        len(student_ids) * len(assignment_ids) if student_ids and assignment_ids else 1
+        len(student_ids) * totals.current_assignments
+        if student_ids and totals.current_assignments
+        else 1
     )
-    completion_rate = len(submissions) / total_expected if total_expected > 0 else 0
+    completion_rate = totals.current_completed / total_expected
 
     summary = ReportSummaryStats(
         avg_score=round(current_avg, 1),
-        total_completed=len(submissions),
+        total_completed=totals.current_completed,
         completion_rate=round(completion_rate, 2),
         total_assigned=total_expected,
     )
 
-    # Per-student averages (used for distribution, top/struggling)
-    student_avgs = {}
-    for sub, _ in submissions:
-        if sub.student_id not in student_avgs:
-            student_avgs[sub.student_id] = []
-        if sub.score is not None:
-            student_avgs[sub.student_id].append(sub.score)
-
-    student_scores = [
-        (sid, sum(scores) / len(scores))
-        for sid, scores in student_avgs.items()
-        if scores
-    ]
-    student_scores.sort(key=lambda x: x[1], reverse=True)
+    # Per-student averages, best first (used for distribution, top/struggling)
+    student_scores = await submission_student_ranking(session, in_class, in_current)
 
     # Score distribution based on per-student averages (not individual submissions)
-    student_avg_scores = [avg for _, avg in student_scores]
-    score_distribution = _calculate_score_distribution(student_avg_scores)
-
-    # Get student names
-    student_names = {s.id: u.full_name or u.username or "Unknown" for s, u in students}
+    score_distribution = _calculate_score_distribution(student_scores)
 
     top_students = [
         {
-            "name": student_names.get(sid, "Unknown"),
-            "avg_score": round(avg, 1),
-            "rank": i + 1,
+            "name": row.name,
+            "avg_score": round(row.avg_score, 1),
+            "rank": row.rank,
         }
-        for i, (sid, avg) in enumerate(student_scores[:5])
+        for row in student_scores[:5]
     ]
 
     struggling_students = [
         {
-            "name": student_names.get(sid, "Unknown"),
-            "avg_score": round(avg, 1),
-            "alert_reason": "Low average score" if avg < 70 else "Below class average",
+            "name": row.name,
+            "avg_score": round(row.avg_score, 1),
+            "alert_reason": (
+                "Low average score" if row.avg_score < 70 else "Below class average"
+            ),
         }
-        for sid, avg in student_scores[-5:][::-1]
-        if avg < current_avg
+        for row in student_scores[-5:][::-1]
+        if row.avg_score < current_avg
     ]
 
     # Assignment performance
-    assignment_perf = []
-    for assignment in assignments:
-        assignment_subs = [sub for sub, a in submissions if a.id == assignment.id]
-        if assignment_subs:
-            avg = sum(s.score for s in assignment_subs if s.score) / len(
-                assignment_subs
-            )
-            comp_rate = len(assignment_subs) / len(student_ids) if student_ids else 0
-            assignment_perf.append(
-                {
-                    "name": assignment.name,
-                    "avg_score": round(avg, 1),
-                    "completion_rate": round(comp_rate, 2),
-                }
-            )
+    assignment_rows = await assignment_stats(
+        session,
+        in_class,
+        in_current,
+        AssignmentStudent.status == AssignmentStatus.completed,
+    )
+    assignment_perf = [
+        {
+            "name": row.name,
+            "avg_score": round(row.score_sum / row.completed, 1),
+            "completion_rate": (
+                round(row.completed / len(student_ids), 2) if student_ids else 0
+            ),
+        }
+        for row in assignment_rows
+    ]
 
     # Skill breakdown - infer from assignment names
-    class_assignments_list = [
-        {"name": assignment.name, "score": sub.score} for sub, assignment in submissions
-    ]
-    skill_breakdown = _calculate_skill_breakdown_from_assignments(
-        class_assignments_list
+    skill_breakdown = _calculate_skill_breakdown(
+        (row.name, row.scored, row.score_sum) for row in assignment_rows
     )
 
     data = ClassReportData(
         class_name=class_obj.name,
         class_id=str(class_obj.id),
         teacher_name=teacher_user.full_name or teacher_user.username or "Unknown",
-        student_count=len(students),
+        student_count=len(student_ids),
         period_start=current_start.date().isoformat(),
         period_end=current_end.date().isoformat(),
         summary=summary,
@@ -996,100 +951,75 @@ async def generate_assignment_report_data(
 
     teacher, teacher_user = teacher_row
 
-    # Get all assignments for this teacher in current period
-    assignments_result = await session.execute(
-        select(Assignment, Activity)
-        .join(Activity, Assignment.activity_id == Activity.id)
-        .where(
-            Assignment.teacher_id == teacher_id,
-            Assignment.created_at >= current_start,
-            Assignment.created_at <= current_end,
-        )
-    )
-    assignments = assignments_result.all()
-
-    # Get submissions for these assignments
-    assignment_ids = [a.id for a, _ in assignments]
-    submissions_result = await session.execute(
-        select(AssignmentStudent).where(
-            AssignmentStudent.assignment_id.in_(assignment_ids),
-            AssignmentStudent.status == AssignmentStatus.completed,
-        )
-    )
-    submissions = submissions_result.scalars().all()
+    # Stream per-assignment totals for the current period; only the
+    # per-assignment metrics and running totals are kept
+    total_assignments = 0
+    total_assigned = 0
+    total_completed = 0
+    scored_count = 0
+    score_sum = 0.0
+    assignment_metrics = []
+    activity_totals: dict[str, list[float]] = {}
+    async for row in stream_assignment_report_rows(
+        session,
+        Assignment.teacher_id == teacher_id,
+        Assignment.created_at >= current_start,
+        Assignment.created_at <= current_end,
+    ):
+        total_assignments += 1
+        total_assigned += row.total
+        total_completed += row.completed
+        scored_count += row.scored
+        score_sum += row.score_sum
+
+        if row.scored:
+            totals = activity_totals.setdefault(row.activity_type, [0, 0.0])
+            totals[0] += row.scored
+            totals[1] += row.score_sum
+
+        if row.completed:
+            assignment_metrics.append(
+                {
+                    "name": row.name,
+                    "avg_score": (
+                        round(row.score_sum / row.scored, 1) if row.scored else 0
+                    ),
+                    "completion_rate": round(row.completed / (row.total or 1), 2),
+                    "time_spent": (
+                        round(row.time_spent_sum / row.timed, 1) if row.timed else 0
+                    ),
+                    "activity_type": row.activity_type,
+                }
+            )
 
-    # Calculate current metrics
-    all_scores = [s.score for s in submissions if s.score is not None]
-    current_avg = sum(all_scores) / len(all_scores) if all_scores else 0
+    current_avg = score_sum / scored_count if scored_count else 0
 
     # Get previous period metrics
-    prev_assignments_result = await session.execute(
-        select(Assignment.id).where(
+    prev_avg_result = await session.execute(
+        select(func.avg(AssignmentStudent.score))
+        .join(Assignment, AssignmentStudent.assignment_id == Assignment.id)
+        .where(
             Assignment.teacher_id == teacher_id,
             Assignment.created_at >= previous_start,
             Assignment.created_at <= previous_end,
-        )
-    )
-    prev_assignment_ids = [a[0] for a in prev_assignments_result.all()]
-
-    prev_submissions_result = await session.execute(
-        select(AssignmentStudent.score).where(
-            AssignmentStudent.assignment_id.in_(prev_assignment_ids),
             AssignmentStudent.status == AssignmentStatus.completed,
             AssignmentStudent.score.isnot(None),
         )
     )
-    prev_scores = [s[0] for s in prev_submissions_result.all()]
-    prev_avg = sum(prev_scores) / len(prev_scores) if prev_scores else None
+    prev_avg = prev_avg_result.scalar_one()
+    prev_avg = float(prev_avg) if prev_avg is not None else None
 
     trend = calculate_trend(current_avg, prev_avg)
 
-    # Summary
-    total_assigned_result = await session.execute(
-        select(func.count(AssignmentStudent.id)).where(
-            AssignmentStudent.assignment_id.in_(assignment_ids)
-        )
-    )
-    total_assigned = total_assigned_result.scalar_one() or 0
-
     summary = ReportSummaryStats(
         avg_score=round(current_avg, 1),
-        total_completed=len(submissions),
+        total_completed=total_completed,
         completion_rate=(
-            round(len(submissions) / total_assigned, 2) if total_assigned > 0 else 0
+            round(total_completed / total_assigned, 2) if total_assigned > 0 else 0
         ),
         total_assigned=total_assigned,
     )
 
-    # Per-assignment metrics
-    assignment_metrics = []
-    for assignment, activity in assignments:
-        assignment_subs = [s for s in submissions if s.assignment_id == assignment.id]
-        if assignment_subs:
-            scores = [s.score for s in assignment_subs if s.score is not None]
-            avg = sum(scores) / len(scores) if scores else 0
-            times = [
-                s.time_spent_minutes for s in assignment_subs if s.time_spent_minutes
-            ]
-            avg_time = sum(times) / len(times) if times else 0
-
-            assigned_count_result = await session.execute(
-                select(func.count(AssignmentStudent.id)).where(
-                    AssignmentStudent.assignment_id == assignment.id
-                )
-            )
-            assigned_count = assigned_count_result.scalar_one() or 1
-
-            assignment_metrics.append(
-                {
-                    "name": assignment.name,
-                    "avg_score": round(avg, 1),
-                    "completion_rate": round(len(assignment_subs) / assigned_count, 2),
-                    "time_spent": round(avg_time, 1),
-                    "activity_type": activity.activity_type,
-                }
-            )
-
     # Sort for most/least successful
     sorted_by_score = sorted(
         assignment_metrics, key=lambda x: x["avg_score"], reverse=True
@@ -1098,30 +1028,21 @@ async def generate_assignment_report_data(
     least_successful = sorted_by_score[-3:][::-1] if len(sorted_by_score) > 3 else []
 
     # Activity type comparison
-    activity_scores: dict[str, list[int]] = {}
-    for assignment, activity in assignments:
-        assignment_subs = [s for s in submissions if s.assignment_id == assignment.id]
-        for sub in assignment_subs:
-            if sub.score is not None:
-                if activity.activity_type not in activity_scores:
-                    activity_scores[activity.activity_type] = []
-                activity_scores[activity.activity_type].append(sub.score)
-
     activity_comparison = [
         {
             "activity_type": act_type,
-            "avg_score": round(sum(scores) / len(scores), 1),
-            "count": len(scores),
+            "avg_score": round(type_score_sum / type_count, 1),
+            "count": type_count,
             "label": ACTIVITY_TYPE_LABELS.get(act_type, act_type),
         }
-        for act_type, scores in activity_scores.items()
+        for act_type, (type_count, type_score_sum) in activity_totals.items()
     ]
 
     data = AssignmentReportData(
         teacher_name=teacher_user.full_name or teacher_user.username or "Unknown",
         period_start=current_start.date().isoformat(),
         period_end=current_end.date().isoformat(),
-        total_assignments=len(assignments),
+        total_assignments=total_assignments,
         summary=summary,
         trend=trend,
         assignments=assignment_metrics,
@@ -1221,63 +1142,98 @@ def _infer_skill_from_name(name: str) -> str | None:
 
 def _calculate_skill_breakdown_from_assignments(assignments: list[dict]) -> list[dict]:
     """Calculate skill-based breakdown by inferring skill from assignment names."""
+    return _calculate_skill_breakdown(
+        (a["name"], 1, a["score"]) for a in assignments if a.get("score") is not None
+    )
+
+
+def _calculate_skill_breakdown(
+    totals: Iterable[tuple[str, int, float]],
+) -> list[dict]:
+    """Skill-based breakdown from (assignment name, scored count, score sum) totals."""
     breakdown: dict[str, list[float]] = {}
 
-    for a in assignments:
-        if a.get("score") is None:
+    for name, count, score_sum in totals:
+        if not count:
             continue
-        skill = _infer_skill_from_name(a["name"])
-        if skill not in breakdown:
-            breakdown[skill] = []
-        breakdown[skill].append(a["score"])
+        skill = _infer_skill_from_name(name)
+        skill_totals = breakdown.setdefault(skill, [0, 0.0])
+        skill_totals[0] += count
+        skill_totals[1] += score_sum
 
     result = [
         {
             "skill_name": skill,
-            "avg_score": round(sum(scores) / len(scores), 1),
-            "count": len(scores),
+            "avg_score": round(score_sum / count, 1),
+            "count": count,
         }
-        for skill, scores in breakdown.items()
-        if scores
+        for skill, (count, score_sum) in breakdown.items()
     ]
     # Sort by avg_score descending
     result.sort(key=lambda x: x["avg_score"], reverse=True)
     return result
 
 
-def _calculate_score_distribution(scores: list[int]) -> list[dict]:
-    """Calculate score distribution buckets."""
-    buckets = [
-        {"range_label": "0-59%", "min": 0, "max": 59, "count": 0},
-        {"range_label": "60-69%", "min": 60, "max": 69, "count": 0},
-        {"range_label": "70-79%", "min": 70, "max": 79, "count": 0},
-        {"range_label": "80-89%", "min": 80, "max": 89, "count": 0},
-        {"range_label": "90-100%", "min": 90, "max": 100, "count": 0},
+def _calculate_score_distribution(students: list[StudentScoreRow]) -> list[dict]:
+    """Calculate score distribution buckets from ranked student averages."""
+    return [
+        {"range_label": label, "min": min_score, "max": max_score, "count": count}
+        for (min_score, max_score, label), count in zip(
+            SCORE_BUCKETS, score_bucket_counts(students), strict=True
+        )
     ]
 
-    for score in scores:
-        for bucket in buckets:
-            if bucket["min"] <= score <= bucket["max"]:
-                bucket["count"] += 1
-                break
 
-    return buckets
+# Renders a report file: (format, data, report_type, template_type, file_path)
+ReportRenderer = Callable[[str, dict, str, str | None, str], Awaitable[None]]
+
+
+def render_report_file(
+    file_format: str,
+    data: dict,
+    report_type: str,
+    template_type: str | None,
+    file_path: str,
+) -> None:
+    """
+    Write a report file from its collected data.
+
+    CPU-bound and free of database access, so the worker can run it in a
+    process pool.
+
+    Args:
+        file_format: "pdf" or "xlsx"
+        data: Report data as produced by the generate_*_report_data functions
+        report_type: Report type value
+        template_type: Template type value, if any
+        file_path: Destination path
+    """
+    from app.services.excel_generator import generate_excel_report
+    from app.services.pdf_generator import generate_pdf_report
+
+    if file_format == ReportFormatEnum.pdf.value:
+        generate_pdf_report(data, report_type, template_type, file_path)
+    else:
+        generate_excel_report(data, report_type, template_type, file_path)
+
+
+async def _render_inline(*args) -> None:
+    render_report_file(*args)
 
 
 async def process_report_job(
     session: AsyncSession,
     job_id: uuid.UUID,
+    render: ReportRenderer = _render_inline,
 ) -> None:
     """
-    Main report processing logic. Called as background task.
+    Main report processing logic. Called by the report worker task.
 
     Args:
         session: Database session
         job_id: Report job UUID
+        render: Writes the report file; defaults to rendering in-process
     """
-    from app.services.excel_generator import generate_excel_report
-    from app.services.pdf_generator import generate_pdf_report
-
     job = await get_report_job(session, job_id)
     if not job:
         return
@@ -1306,35 +1262,26 @@ async def process_report_job(
         await update_job_progress(session, job, 30)
 
         if report_type == ReportTypeEnum.student.value:
-            report_data = await generate_student_report_data(
-                session,
-                uuid.UUID(config.target_id),
-                current_start,
-                current_end,
-                previous_start,
-                previous_end,
-            )
-            data_dict = report_data.model_dump()
+            generate_data = generate_student_report_data
+            cache_kind, target_id = "student", uuid.UUID(config.target_id)
         elif report_type == ReportTypeEnum.class_.value:
-            report_data = await generate_class_report_data(
-                session,
-                uuid.UUID(config.target_id),
-                current_start,
-                current_end,
-                previous_start,
-                previous_end,
-            )
-            data_dict = report_data.model_dump()
+            generate_data = generate_class_report_data
+            cache_kind, target_id = "class", uuid.UUID(config.target_id)
         else:  # ASSIGNMENT
-            report_data = await generate_assignment_report_data(
-                session,
-                teacher_id,
-                current_start,
-                current_end,
-                previous_start,
-                previous_end,
-            )
-            data_dict = report_data.model_dump()
+            generate_data = generate_assignment_report_data
+            cache_kind, target_id = "teacher", teacher_id
+
+        # The data does not depend on format or template; reuse it while the
+        # target's data version is unchanged
+        periods = (current_start, current_end, previous_start, previous_end)
+        cache_key = await report_data_key(cache_kind, target_id, report_type, periods)
+        data_dict = await cache_get(cache_key)
+        if data_dict is None:
+            report_data = await generate_data(session, target_id, *periods)
+            data_dict = report_data.model_dump(mode="json")
+            await cache_set(cache_key, data_dict, ttl=settings.REPORT_DATA_CACHE_TTL)
+        else:
+            logger.info(f"Report job {job_id_str} reuses cached report data")
 
         await update_job_progress(session, job, 60)
 
@@ -1348,20 +1295,7 @@ async def process_report_job(
 
         await update_job_progress(session, job, 80)
 
-        if config.format.value == ReportFormatEnum.pdf.value:
-            generate_pdf_report(
-                data_dict,
-                report_type,
-                template_type,
-                str(file_path),
-            )
-        else:
-            generate_excel_report(
-                data_dict,
-                report_type,
-                template_type,
-                str(file_path),
-            )
+        await render(file_format, data_dict, report_type, template_type, str(file_path))
 
         # Mark completed
         await complete_job(session, job, str(file_path))
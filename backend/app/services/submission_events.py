@@ -0,0 +1,99 @@
+"""
+Post-submission pipeline.
+
+Submitting an assignment commits the submission and then invalidates the
+student's cached assignments, progress and calendar inline
+("assignment_submitted", a few INCRs), so the student's next read already
+shows it submitted. The analytics rollups and report data invalidation
+ride along with the commit through their session hooks. The rest runs on
+the arq worker (``task_process_submission``), so it no longer adds to the
+student's submit latency:
+
+1. skill score attribution (Story 30.12) and its commit
+2. invalidation of the student's cached skill profile and badges, once the
+   new skill scores are visible
+
+Every consumer is idempotent: attribution replaces the submission's skill
+scores and invalidation bumps cache namespaces. The arq job id is derived
+from the submission and its completion time, so publishing the same event
+twice runs it once, while a reopened and resubmitted assignment runs again.
+A retried or duplicated job is therefore harmless.
+
+Without a worker queue (tests, scripts) or when enqueueing fails, the
+consumers run inline as before.
+"""
+
+import logging
+import uuid
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AssignmentStudent
+from app.services.cache_events import invalidate_for_event
+from app.services.skill_attribution_service import attribute_skill_scores
+
+if TYPE_CHECKING:
+    from arq import ArqRedis
+
+logger = logging.getLogger(__name__)
+
+
+def submission_job_id(assignment_student: AssignmentStudent) -> str:
+    """arq job id of a submission's post-submission event."""
+    completed_at = assignment_student.completed_at
+    suffix = f":{completed_at.timestamp()}" if completed_at else ""
+    return f"submission:{assignment_student.id}{suffix}"
+
+
+async def process_submission(
+    session: AsyncSession,
+    assignment_student_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> None:
+    """
+    Run the post-submission consumers for one submission.
+
+    Args:
+        session: Database session
+        assignment_student_id: The submitted AssignmentStudent record ID
+        user_id: The student's user ID (cache keys are per user)
+    """
+    await attribute_skill_scores(assignment_student_id, session)
+    await session.commit()
+    await invalidate_for_event("skill_scores_attributed", user_id=str(user_id))
+
+
+async def publish_submission_event(
+    arq_pool: "ArqRedis | None",
+    session: AsyncSession,
+    assignment_student: AssignmentStudent,
+    user_id: uuid.UUID,
+) -> None:
+    """
+    Hand a committed submission to the post-submission pipeline.
+
+    Enqueues ``task_process_submission``; falls back to running the
+    consumers inline when there is no queue or enqueueing fails. Never
+    raises: the submission itself is already committed. Callers invalidate
+    the "assignment_submitted" caches themselves, before responding.
+    """
+    if arq_pool is not None:
+        try:
+            await arq_pool.enqueue_job(
+                "task_process_submission",
+                str(assignment_student.id),
+                str(user_id),
+                _job_id=submission_job_id(assignment_student),
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                f"Could not enqueue post-submission event for "
+                f"{assignment_student.id}, running inline: {e}"
+            )
+
+    try:
+        await process_submission(session, assignment_student.id, user_id)
+    except Exception as e:
+        logger.warning(f"Post-submission processing failed (non-blocking): {e}")
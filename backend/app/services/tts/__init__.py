@@ -17,7 +17,9 @@ from app.services.tts.base import (
 )
 from app.services.tts.cache import (
     AudioCache,
+    AudioCacheBackend,
     AudioCacheKey,
+    RedisAudioCacheBackend,
     get_audio_cache,
     reset_audio_cache,
 )
@@ -56,7 +58,9 @@ __all__ = [
     "Voice",
     # Cache
     "AudioCache",
+    "AudioCacheBackend",
     "AudioCacheKey",
+    "RedisAudioCacheBackend",
     "get_audio_cache",
     "reset_audio_cache",
     # Configuration
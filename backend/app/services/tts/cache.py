@@ -1,22 +1,25 @@
 """
 TTS Audio Cache Service.
 
-In-memory cache for generated audio with TTL support.
-Redis caching can be added in Phase 2 for persistence.
+In-memory cache for generated audio with TTL support and a byte budget,
+optionally backed by a shared tier (Redis) so audio synthesised by one worker
+is reused by every other worker and survives restarts.
 """
 
 import hashlib
 import logging
-import threading
-import time
-from typing import NamedTuple
+from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, Field
 
+from app.services.local_cache import LocalLRUCache
+from app.services.redis_cache import cache_get_many_bytes, cache_set_bytes
 from app.services.tts.base import AudioFormat
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
 
 class AudioCacheKey(BaseModel):
     """Cache key components for audio lookup."""
@@ -52,33 +55,74 @@ class AudioCacheKey(BaseModel):
         )
 
 
-class CacheEntry(NamedTuple):
-    """Internal cache entry with data and expiration."""
+class AudioCacheBackend(ABC):
+    """
+    Shared storage tier behind the in-memory AudioCache.
+
+    Implementations must be binary-safe and must fail silently (a miss),
+    since the cache is an optimisation and never a source of truth.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Return audio for each key, or None where missing."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, audio_data: bytes, ttl_seconds: int) -> None:
+        """Store audio under key with a TTL."""
+        ...
+
 
-    audio_data: bytes
-    expires_at: float
+class RedisAudioCacheBackend(AudioCacheBackend):
+    """Stores audio as raw bytes in Redis, shared by all workers."""
+
+    KEY_PREFIX = "tts:audio:"
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await cache_get_many_bytes([self.KEY_PREFIX + k for k in keys])
+
+    async def set(self, key: str, audio_data: bytes, ttl_seconds: int) -> None:
+        await cache_set_bytes(self.KEY_PREFIX + key, audio_data, ttl_seconds)
 
 
 class AudioCache:
     """
     In-memory audio cache with TTL support.
 
-    Thread-safe implementation using a lock for concurrent access.
-    Automatically cleans up expired entries on access.
+    Backed by a thread-safe, byte-bounded LocalLRUCache: once the budget is
+    full, least recently used clips are evicted, and TinyLFU admission keeps
+    one-off phrases from displacing frequently requested ones. Expired
+    entries are cleaned up on access and by the periodic sweeper.
+
+    With a ``backend``, the async methods (get_async, get_many_async,
+    set_async) read through and write through to that shared tier, using
+    memory as L1. The sync get/set only touch memory.
     """
 
-    def __init__(self, default_ttl_hours: int = 24) -> None:
+    def __init__(
+        self,
+        default_ttl_hours: int = 24,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backend: AudioCacheBackend | None = None,
+    ) -> None:
         """
         Initialize the audio cache.
 
         Args:
             default_ttl_hours: Default TTL for cache entries in hours.
+            max_bytes: Memory budget for cached audio in bytes.
+            backend: Optional shared tier consulted on memory misses.
         """
-        self._cache: dict[str, CacheEntry] = {}
-        self._lock = threading.Lock()
+        self._backend = backend
+        self._shared_hit_count = 0
         self._default_ttl_seconds = default_ttl_hours * 3600
-        self._hit_count = 0
-        self._miss_count = 0
+        self._cache = LocalLRUCache(
+            max_bytes=max_bytes,
+            default_ttl=self._default_ttl_seconds,
+            name="tts_audio",
+            admission="tinylfu",
+        )
 
     @staticmethod
     def _hash_text(text: str) -> str:
@@ -132,24 +176,13 @@ class AudioCache:
         """
         key_str = key.to_string()
 
-        with self._lock:
-            entry = self._cache.get(key_str)
-
-            if entry is None:
-                self._miss_count += 1
-                logger.debug(f"Cache miss for key: {key_str[:50]}...")
-                return None
+        audio_data = self._cache.get(key_str)
+        if audio_data is None:
+            logger.debug(f"Cache miss for key: {key_str[:50]}...")
+            return None
 
-            # Check expiration
-            if time.time() > entry.expires_at:
-                del self._cache[key_str]
-                self._miss_count += 1
-                logger.debug(f"Cache expired for key: {key_str[:50]}...")
-                return None
-
-            self._hit_count += 1
-            logger.debug(f"Cache hit for key: {key_str[:50]}...")
-            return entry.audio_data
+        logger.debug(f"Cache hit for key: {key_str[:50]}...")
+        return audio_data
 
     def set(
         self,
@@ -167,17 +200,70 @@ class AudioCache:
         """
         key_str = key.to_string()
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl_seconds
-        expires_at = time.time() + ttl
 
-        with self._lock:
-            self._cache[key_str] = CacheEntry(
-                audio_data=audio_data,
-                expires_at=expires_at,
-            )
+        if self._cache.set(key_str, audio_data, size=len(audio_data), ttl=ttl):
             logger.debug(
                 f"Cached audio for key: {key_str[:50]}... "
                 f"(size: {len(audio_data)} bytes, ttl: {ttl}s)"
             )
+        else:
+            logger.debug(f"Audio not admitted to cache: {key_str[:50]}...")
+
+    async def get_async(self, key: AudioCacheKey) -> bytes | None:
+        """
+        Get audio data from memory, falling back to the shared tier.
+
+        Args:
+            key: Cache key to lookup.
+
+        Returns:
+            Audio data if found in either tier, None otherwise.
+        """
+        return (await self.get_many_async([key]))[0]
+
+    async def get_many_async(self, keys: list[AudioCacheKey]) -> list[bytes | None]:
+        """
+        Get audio data for several keys with one shared-tier round trip.
+
+        Shared-tier hits are copied into memory.
+
+        Args:
+            keys: Cache keys to lookup.
+
+        Returns:
+            Audio data (or None) for each key, in order.
+        """
+        results = [self.get(key) for key in keys]
+        missing = [i for i, audio in enumerate(results) if audio is None]
+        if self._backend is None or not missing:
+            return results
+
+        shared = await self._backend.get_many([keys[i].to_string() for i in missing])
+        for i, audio_data in zip(missing, shared, strict=True):
+            if audio_data is not None:
+                self._shared_hit_count += 1
+                self.set(keys[i], audio_data)
+                results[i] = audio_data
+        return results
+
+    async def set_async(
+        self,
+        key: AudioCacheKey,
+        audio_data: bytes,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """
+        Store audio data in memory and in the shared tier.
+
+        Args:
+            key: Cache key.
+            audio_data: Audio data to store.
+            ttl_seconds: Optional TTL override in seconds.
+        """
+        self.set(key, audio_data, ttl_seconds)
+        if self._backend is not None:
+            ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl_seconds
+            await self._backend.set(key.to_string(), audio_data, ttl)
 
     def delete(self, key: AudioCacheKey) -> bool:
         """
@@ -191,27 +277,24 @@ class AudioCache:
         """
         key_str = key.to_string()
 
-        with self._lock:
-            if key_str in self._cache:
-                del self._cache[key_str]
-                logger.debug(f"Deleted cache entry: {key_str[:50]}...")
-                return True
-            return False
+        if self._cache.invalidate(key_str):
+            logger.debug(f"Deleted cache entry: {key_str[:50]}...")
+            return True
+        return False
 
     def clear(self) -> int:
         """
-        Clear all cache entries.
+        Clear all in-memory cache entries (the shared tier is left intact).
 
         Returns:
             Number of entries cleared.
         """
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            self._hit_count = 0
-            self._miss_count = 0
-            logger.info(f"Cleared {count} cache entries")
-            return count
+        count = len(self._cache)
+        self._cache.clear()
+        self._cache.reset_stats()
+        self._shared_hit_count = 0
+        logger.info(f"Cleared {count} cache entries")
+        return count
 
     def cleanup_expired(self) -> int:
         """
@@ -220,47 +303,40 @@ class AudioCache:
         Returns:
             Number of entries removed.
         """
-        current_time = time.time()
-        removed = 0
-
-        with self._lock:
-            expired_keys = [
-                key
-                for key, entry in self._cache.items()
-                if current_time > entry.expires_at
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
-
-            if removed > 0:
-                logger.info(f"Cleaned up {removed} expired cache entries")
-
+        removed = self._cache.purge_expired()
+        if removed > 0:
+            logger.info(f"Cleaned up {removed} expired cache entries")
         return removed
 
     @property
     def size(self) -> int:
         """Get current number of cache entries."""
-        with self._lock:
-            return len(self._cache)
+        return len(self._cache)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get total bytes of cached audio."""
+        return self._cache.stats()["bytes"]
 
     @property
     def hit_count(self) -> int:
         """Get total cache hits."""
-        return self._hit_count
+        return self._cache.stats()["hits"]
 
     @property
     def miss_count(self) -> int:
         """Get total cache misses."""
-        return self._miss_count
+        return self._cache.stats()["misses"]
+
+    @property
+    def shared_hit_count(self) -> int:
+        """Get memory misses served by the shared tier."""
+        return self._shared_hit_count
 
     @property
     def hit_rate(self) -> float:
         """Get cache hit rate (0.0 to 1.0)."""
-        total = self._hit_count + self._miss_count
-        if total == 0:
-            return 0.0
-        return self._hit_count / total
+        return self._cache.stats()["hit_rate"]
 
     def get_stats(self) -> dict:
         """
@@ -269,11 +345,16 @@ class AudioCache:
         Returns:
             Dict with cache stats.
         """
+        stats = self._cache.stats()
         return {
-            "size": self.size,
-            "hit_count": self._hit_count,
-            "miss_count": self._miss_count,
-            "hit_rate": round(self.hit_rate, 4),
+            "size": stats["entries"],
+            "size_bytes": stats["bytes"],
+            "max_bytes": stats["max_bytes"],
+            "evictions": stats["evictions"],
+            "hit_count": stats["hits"],
+            "miss_count": stats["misses"],
+            "hit_rate": round(stats["hit_rate"], 4),
+            "shared_hit_count": self._shared_hit_count,
         }
 
 
@@ -281,19 +362,27 @@ class AudioCache:
 _audio_cache: AudioCache | None = None
 
 
-def get_audio_cache(ttl_hours: int = 24) -> AudioCache:
+def get_audio_cache(
+    ttl_hours: int = 24,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backend: AudioCacheBackend | None = None,
+) -> AudioCache:
     """
     Get global audio cache instance.
 
     Args:
         ttl_hours: Default TTL for cache entries.
+        max_bytes: Memory budget for cached audio in bytes.
+        backend: Optional shared tier behind the in-memory cache.
 
     Returns:
         AudioCache instance.
     """
     global _audio_cache
     if _audio_cache is None:
-        _audio_cache = AudioCache(default_ttl_hours=ttl_hours)
+        _audio_cache = AudioCache(
+            default_ttl_hours=ttl_hours, max_bytes=max_bytes, backend=backend
+        )
     return _audio_cache
 
 
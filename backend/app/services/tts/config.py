@@ -63,6 +63,18 @@ class TTSSettings(BaseSettings):
         le=720,  # Max 30 days
         description="Cache TTL in hours.",
     )
+    TTS_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024 * 1024,
+        description="Memory budget for cached audio per worker in bytes.",
+    )
+    TTS_CACHE_BACKEND: Literal["memory", "redis"] = Field(
+        default="redis",
+        description=(
+            "Shared tier behind the in-memory audio cache. 'redis' shares "
+            "audio across workers and restarts; 'memory' keeps it per process."
+        ),
+    )
 
     # Request Configuration
     TTS_REQUEST_TIMEOUT: int = Field(
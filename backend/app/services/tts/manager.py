@@ -9,6 +9,7 @@ import logging
 import time
 
 from app.services.tts.base import (
+    AudioFormat,
     AudioGenerationOptions,
     AudioResult,
     BatchAudioItem,
@@ -16,7 +17,12 @@ from app.services.tts.base import (
     TTSProvider,
     TTSProviderType,
 )
-from app.services.tts.cache import AudioCache, get_audio_cache
+from app.services.tts.cache import (
+    AudioCache,
+    AudioCacheKey,
+    RedisAudioCacheBackend,
+    get_audio_cache,
+)
 from app.services.tts.config import TTSSettings, get_tts_settings
 from app.services.tts.exceptions import (
     AllTTSProvidersFailedError,
@@ -57,7 +63,15 @@ class TTSManager:
             cache
             if cache is not None
             else (
-                get_audio_cache(self._settings.TTS_CACHE_TTL_HOURS)
+                get_audio_cache(
+                    self._settings.TTS_CACHE_TTL_HOURS,
+                    self._settings.TTS_CACHE_MAX_BYTES,
+                    backend=(
+                        RedisAudioCacheBackend()
+                        if self._settings.TTS_CACHE_BACKEND == "redis"
+                        else None
+                    ),
+                )
                 if self._settings.TTS_CACHE_ENABLED
                 else None
             )
@@ -137,6 +151,23 @@ class TTSManager:
 
         return providers
 
+    def _cache_key(
+        self,
+        text: str,
+        options: AudioGenerationOptions,
+        format: AudioFormat | None = None,
+    ) -> AudioCacheKey | None:
+        """Build the cache key for a request (None when caching is off)."""
+        if self._cache is None:
+            return None
+        # Use provided voice or "default" when none specified
+        return self._cache.get_cache_key(
+            text=text,
+            language=options.language,
+            voice=options.voice or "default",
+            format=format or options.format,
+        )
+
     async def generate_audio(
         self,
         text: str,
@@ -173,18 +204,12 @@ class TTSManager:
         options = options or AudioGenerationOptions()
 
         # Normalize voice for cache key consistency
-        # Use provided voice or "default" when none specified
         voice_for_cache = options.voice or "default"
 
-        # Check cache first
-        if self._cache is not None:
-            cache_key = self._cache.get_cache_key(
-                text=text,
-                language=options.language,
-                voice=voice_for_cache,
-                format=options.format,
-            )
-            cached_audio = self._cache.get(cache_key)
+        # Check cache first (memory, then the shared tier)
+        cache_key = self._cache_key(text, options)
+        if self._cache is not None and cache_key is not None:
+            cached_audio = await self._cache.get_async(cache_key)
             if cached_audio is not None:
                 logger.info(f"Cache hit for text: {text[:30]}...")
                 return AudioResult(
@@ -226,14 +251,9 @@ class TTSManager:
                 )
 
                 # Store in cache using same key as lookup
-                if self._cache is not None:
-                    cache_key = self._cache.get_cache_key(
-                        text=text,
-                        language=options.language,
-                        voice=voice_for_cache,
-                        format=result.format,
-                    )
-                    self._cache.set(cache_key, result.audio_data)
+                store_key = self._cache_key(text, options, result.format)
+                if self._cache is not None and store_key is not None:
+                    await self._cache.set_async(store_key, result.audio_data)
 
                 return result
 
@@ -265,6 +285,9 @@ class TTSManager:
         """
         Generate audio for multiple texts with automatic fallback.
 
+        Items already cached (in memory or the shared tier) are served from
+        cache; only the misses are sent to a provider.
+
         Args:
             items: List of text and options pairs.
 
@@ -296,6 +319,37 @@ class TTSManager:
                 failure_count=0,
             )
 
+        # Serve what we can from cache with one shared-tier round trip
+        cached: dict[int, AudioResult] = {}
+        cache_keys = [self._cache_key(item.text, item.options) for item in items]
+        if self._cache is not None:
+            hits = await self._cache.get_many_async(
+                [key for key in cache_keys if key is not None]
+            )
+            for i, audio_data in enumerate(hits):
+                if audio_data is not None:
+                    cached[i] = AudioResult(
+                        audio_data=audio_data,
+                        format=items[i].options.format,
+                        duration_ms=0,  # Unknown from cache
+                        voice_used=items[i].options.voice or "default",
+                        provider="cache",
+                        latency_ms=0,
+                        cached=True,
+                    )
+        if len(cached) == len(items):
+            logger.info(f"Batch served entirely from cache ({len(items)} items)")
+            return BatchAudioResult(
+                results=[cached[i] for i in range(len(items))],
+                total_duration_ms=0,
+                total_latency_ms=0,
+                provider="cache",
+                success_count=len(items),
+                failure_count=0,
+            )
+        pending = [i for i in range(len(items)) if i not in cached]
+        pending_items = [items[i] for i in pending]
+
         errors: list[tuple[str, TTSProviderError]] = []
         start_time = time.time()
 
@@ -303,41 +357,50 @@ class TTSManager:
             try:
                 logger.info(
                     f"Attempting batch TTS generation with provider: {provider.get_name()} "
-                    f"({len(items)} items)"
+                    f"({len(pending_items)} items, {len(cached)} cached)"
                 )
-                result = await provider.generate_audio_batch(items)
+                result = await provider.generate_audio_batch(pending_items)
                 total_latency = int((time.time() - start_time) * 1000)
 
-                # Update total latency if not set
-                if result.total_latency_ms == 0:
-                    result = BatchAudioResult(
-                        results=result.results,
-                        total_duration_ms=result.total_duration_ms,
-                        total_latency_ms=total_latency,
-                        provider=result.provider,
-                        success_count=result.success_count,
-                        failure_count=result.failure_count,
-                    )
-
                 logger.info(
                     f"Batch TTS generation successful with {provider.get_name()}: "
-                    f"{result.success_count}/{len(items)} items, {result.total_latency_ms}ms"
+                    f"{result.success_count}/{len(pending_items)} items, "
+                    f"{result.total_latency_ms or total_latency}ms"
                 )
 
-                # Cache successful results
-                if self._cache is not None:
-                    for i, audio_result in enumerate(result.results):
-                        if audio_result.audio_data:
-                            item = items[i]
-                            cache_key = self._cache.get_cache_key(
-                                text=item.text,
-                                language=item.options.language,
-                                voice=audio_result.voice_used,
-                                format=audio_result.format,
+                # Providers drop failed items from results, so positions only
+                # line up with the request when every item succeeded.
+                aligned = len(result.results) == len(pending_items)
+                if aligned:
+                    if self._cache is not None:
+                        for i, audio_result in zip(
+                            pending, result.results, strict=True
+                        ):
+                            store_key = self._cache_key(
+                                items[i].text, items[i].options, audio_result.format
                             )
-                            self._cache.set(cache_key, audio_result.audio_data)
-
-                return result
+                            if audio_result.audio_data and store_key is not None:
+                                await self._cache.set_async(
+                                    store_key, audio_result.audio_data
+                                )
+                    generated = dict(zip(pending, result.results, strict=True))
+                    results = [
+                        cached[i] if i in cached else generated[i]
+                        for i in range(len(items))
+                    ]
+                else:
+                    results = [
+                        cached[i] for i in range(len(items)) if i in cached
+                    ] + result.results
+
+                return BatchAudioResult(
+                    results=results,
+                    total_duration_ms=result.total_duration_ms,
+                    total_latency_ms=result.total_latency_ms or total_latency,
+                    provider=result.provider,
+                    success_count=result.success_count + len(cached),
+                    failure_count=result.failure_count,
+                )
 
             except TTSRateLimitError as e:
                 logger.warning(
@@ -12,6 +12,7 @@ from sqlalchemy import case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.core.pagination import decode_cursor, keyset_page, split_page
 from app.models import AIUsageLog, Teacher, User
 
 
@@ -332,21 +333,35 @@ class UsageAnalyticsService:
         from_date: datetime | None = None,
         to_date: datetime | None = None,
         limit: int = 100,
-    ) -> list[ErrorLog]:
+        cursor: str | None = None,
+    ) -> tuple[list[ErrorLog], str | None]:
+        """
+        Most recent failed requests, newest first.
+
+        Returns:
+            Tuple of (errors, cursor for the next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
         query = (
             select(AIUsageLog, User.full_name.label("teacher_name"))
             .join(Teacher, Teacher.id == AIUsageLog.teacher_id)
             .join(User, User.id == Teacher.user_id)
             .where(AIUsageLog.success == False)  # noqa: E712
-            .order_by(AIUsageLog.timestamp.desc())
-            .limit(limit)
         )
 
         query = self._apply_date_filters(query, from_date, to_date)
+        query = keyset_page(query, AIUsageLog.timestamp, AIUsageLog.id, after, limit)
         result = await self.db.execute(query)
-        rows = result.all()
+        rows, next_cursor = split_page(
+            result.all(),
+            limit,
+            lambda row: (row.AIUsageLog.timestamp, row.AIUsageLog.id),
+        )
 
-        return [
+        errors = [
             ErrorLog(
                 id=row.AIUsageLog.id,
                 timestamp=row.AIUsageLog.timestamp,
@@ -359,3 +374,4 @@ class UsageAnalyticsService:
             )
             for row in rows
         ]
+        return errors, next_cursor
@@ -0,0 +1,77 @@
+"""Background task for report generation."""
+
+import asyncio
+import logging
+import uuid
+from concurrent.futures import Executor
+from functools import partial
+
+from arq import Retry
+
+from app.core.config import settings
+from app.models import ReportJobStatusEnum
+from app.services.report_queue import (
+    acquire_teacher_slot,
+    mark_finished,
+    mark_running,
+    release_teacher_slot,
+)
+from app.services.report_service import (
+    get_report_job,
+    process_report_job,
+    render_report_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# A report waiting for its teacher's slot retries every
+# REPORT_SLOT_RETRY_DELAY seconds; on the last try it runs regardless
+REPORT_MAX_TRIES = 30
+
+_RUNNABLE = {ReportJobStatusEnum.pending.value, ReportJobStatusEnum.processing.value}
+
+
+async def _render_in_pool(executor: Executor, *args) -> None:
+    """Render a report file in the worker's process pool."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, render_report_file, *args)
+
+
+async def task_generate_report(ctx: dict, job_id: str) -> None:
+    """Generate a queued report in a background worker."""
+    job_uuid = uuid.UUID(job_id)
+    redis = ctx["redis"]
+
+    async with ctx["db_session_factory"]() as db:
+        job = await get_report_job(db, job_uuid)
+        if not job or job.status not in _RUNNABLE:
+            # Deleted, or already finished by an earlier try
+            await mark_finished(redis, job_uuid)
+            return
+        teacher_id = job.teacher_id
+
+        has_slot = await acquire_teacher_slot(redis, teacher_id)
+        if not has_slot:
+            if ctx["job_try"] < REPORT_MAX_TRIES:
+                raise Retry(defer=settings.REPORT_SLOT_RETRY_DELAY)
+            logger.warning(
+                f"Report {job_id} waited {REPORT_MAX_TRIES} tries for a slot "
+                f"of teacher {teacher_id}; running it anyway"
+            )
+
+        await mark_running(redis, job_uuid)
+        try:
+            await process_report_job(
+                db,
+                job_uuid,
+                render=partial(_render_in_pool, ctx["report_executor"]),
+            )
+            logger.info(f"Completed report job {job_id}")
+        except Exception as e:
+            # process_report_job has already marked the job failed
+            logger.error(f"Failed to generate report {job_id}: {e}", exc_info=True)
+            raise
+        finally:
+            if has_slot:
+                await release_teacher_slot(redis, teacher_id)
+            await mark_finished(redis, job_uuid)
@@ -0,0 +1,109 @@
+"""Periodic jobs run by the arq worker's cron scheduler.
+
+Every worker process schedules these, and arq's unique cron job ids make one
+of them claim each tick. A Redis lock additionally keeps a tick from
+overlapping the previous one while it is still running on another worker;
+such a tick is skipped and the next one picks up whatever is due, so ticks
+missed while no worker was up are caught up too.
+"""
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from redis.exceptions import LockError
+
+from app.core.config import settings
+from app.services.analytics_rollup import reconcile_rollups
+from app.services.assignment_scheduler import publish_scheduled_assignments
+from app.services.benchmark_snapshot_service import refresh_benchmark_snapshots
+from app.services.deadline_reminder_service import (
+    check_approaching_deadlines,
+    check_past_due_assignments,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Seconds a tick may hold its lock; a crashed holder is released this late
+PUBLISH_LOCK_TIMEOUT = 120
+DEADLINE_LOCK_TIMEOUT = 1800
+ROLLUP_LOCK_TIMEOUT = 3600
+BENCHMARK_LOCK_TIMEOUT = 1800
+
+
+@asynccontextmanager
+async def scheduler_lock(
+    redis: "Redis", name: str, timeout: int
+) -> AsyncIterator[bool]:
+    """
+    Hold ``scheduler:<name>:lock`` for the duration of the block if free.
+
+    Yields:
+        True if the lock was acquired, False if another tick holds it
+    """
+    lock = redis.lock(f"scheduler:{name}:lock", timeout=timeout, blocking=False)
+    acquired = await lock.acquire()
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except LockError:
+                logger.warning(f"Scheduler lock {name} expired before release")
+
+
+async def task_publish_scheduled_assignments(ctx: dict) -> int:
+    """Publish scheduled assignments whose publish date has passed."""
+    async with scheduler_lock(ctx["redis"], "publish", PUBLISH_LOCK_TIMEOUT) as held:
+        if not held:
+            logger.info("Previous publish tick still running; skipping")
+            return 0
+        async with ctx["db_session_factory"]() as db:
+            result = await publish_scheduled_assignments(db)
+        return result.assignments_published
+
+
+async def task_deadline_reminders(ctx: dict) -> int:
+    """Run the approaching-deadline and past-due checks."""
+    async with scheduler_lock(
+        ctx["redis"], "deadline-reminders", DEADLINE_LOCK_TIMEOUT
+    ) as held:
+        if not held:
+            logger.info("Deadline reminder checks already running; skipping")
+            return 0
+        async with ctx["db_session_factory"]() as db:
+            deadline_result = await check_approaching_deadlines(db)
+            past_due_result = await check_past_due_assignments(db)
+        return deadline_result.notifications_sent + past_due_result.notifications_sent
+
+
+async def task_reconcile_rollups(ctx: dict) -> int:
+    """Rebuild the last ROLLUP_RECONCILE_DAYS days of analytics rollups."""
+    async with scheduler_lock(ctx["redis"], "rollups", ROLLUP_LOCK_TIMEOUT) as held:
+        if not held:
+            logger.info("Rollup reconciliation already running; skipping")
+            return 0
+        since = (
+            datetime.now(UTC) - timedelta(days=settings.ROLLUP_RECONCILE_DAYS)
+        ).date()
+        async with ctx["db_session_factory"]() as db:
+            return await reconcile_rollups(db, since=since)
+
+
+async def task_refresh_benchmarks(ctx: dict) -> int:
+    """Rebuild the benchmark snapshots."""
+    async with scheduler_lock(
+        ctx["redis"], "benchmarks", BENCHMARK_LOCK_TIMEOUT
+    ) as held:
+        if not held:
+            logger.info("Benchmark refresh already running; skipping")
+            return 0
+        async with ctx["db_session_factory"]() as db:
+            result = await refresh_benchmark_snapshots(db)
+        return result.rows_written
@@ -0,0 +1,27 @@
+"""Background task for the post-submission pipeline."""
+
+import logging
+import uuid
+
+from app.services.submission_events import process_submission
+
+logger = logging.getLogger(__name__)
+
+
+async def task_process_submission(
+    ctx: dict,
+    assignment_student_id: str,
+    user_id: str,
+) -> None:
+    """Attribute skill scores and invalidate caches for a submission."""
+    try:
+        async with ctx["db_session_factory"]() as db:
+            await process_submission(
+                db, uuid.UUID(assignment_student_id), uuid.UUID(user_id)
+            )
+    except Exception as e:
+        logger.error(
+            f"Post-submission processing failed for {assignment_student_id}: {e}",
+            exc_info=True,
+        )
+        raise  # Let Arq handle retry
@@ -19,6 +19,17 @@ from app.main import app
 from app.models import School, Teacher, User, UserRole
 
 
+@pytest.fixture(autouse=True)
+def isolated_asset_cache(tmp_path, monkeypatch):
+    """Give each test its own on-disk asset cache directory."""
+    from app.services.asset_cache import reset_asset_cache
+
+    monkeypatch.setattr(settings, "ASSET_CACHE_DIR", str(tmp_path / "asset-cache"))
+    reset_asset_cache()
+    yield
+    reset_asset_cache()
+
+
 # Test database with file-based SQLite (shared between sync and async sessions)
 @pytest.fixture(name="db_path", scope="function")
 def db_path_fixture():
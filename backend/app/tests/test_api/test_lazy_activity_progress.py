@@ -0,0 +1,88 @@
+"""
+Tests for multi-activity assignments whose per-activity progress rows are
+created lazily.
+
+The assignment_with_activity fixture assigns the student without any
+AssignmentStudentActivity row, which is the state every student starts in
+when ASSIGNMENT_PROGRESS_LAZY is on.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.main import app
+from app.models import (
+    AssignmentStatus,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+    AssignmentStudentActivityStatus,
+)
+
+
+@pytest.mark.asyncio
+async def test_result_lists_unopened_activity_as_not_started(
+    session,
+    student_token: str,
+    assignment_with_activity,
+):
+    assignment, activity = assignment_with_activity
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"{settings.API_V1_STR}/assignments/{assignment.id}/students/me/result",
+            headers={"Authorization": f"Bearer {student_token}"},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_activities"] == 1
+    assert data["completed_activities"] == 0
+    [item] = data["activity_scores"]
+    assert item["activity_id"] == str(activity.id)
+    assert item["status"] == "not_started"
+    assert item["score"] is None
+
+
+@pytest.mark.asyncio
+async def test_force_submit_counts_unopened_activity_as_zero(
+    session,
+    student_token: str,
+    assignment_with_activity,
+):
+    assignment, activity = assignment_with_activity
+    assignment_student = session.execute(
+        select(AssignmentStudent).where(
+            AssignmentStudent.assignment_id == assignment.id
+        )
+    ).scalar_one()
+    assignment_student.status = AssignmentStatus.in_progress
+    session.add(assignment_student)
+    session.commit()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            f"{settings.API_V1_STR}/assignments/{assignment.id}/students/me/submit-multi",
+            json={"force_submit": True, "total_time_spent_minutes": 5},
+            headers={"Authorization": f"Bearer {student_token}"},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["combined_score"] == 0
+    assert data["total_activities"] == 1
+    assert data["completed_activities"] == 0
+
+    session.expire_all()
+    progress = session.execute(
+        select(AssignmentStudentActivity).where(
+            AssignmentStudentActivity.assignment_student_id == assignment_student.id
+        )
+    ).scalar_one()
+    assert progress.activity_id == activity.id
+    assert progress.status == AssignmentStudentActivityStatus.not_started
@@ -0,0 +1,62 @@
+"""
+Tests for handing submissions to the post-submission pipeline.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.main import app
+from app.models import AssignmentStatus, AssignmentStudent
+
+
+@pytest.mark.asyncio
+async def test_submit_enqueues_post_submission_event(
+    session,
+    student_token: str,
+    assignment_with_activity,
+    monkeypatch,
+):
+    assignment, _ = assignment_with_activity
+    assignment_student = session.execute(
+        select(AssignmentStudent).where(
+            AssignmentStudent.assignment_id == assignment.id
+        )
+    ).scalar_one()
+    assignment_student.status = AssignmentStatus.in_progress
+    session.add(assignment_student)
+    session.commit()
+
+    arq_pool = AsyncMock()
+    monkeypatch.setattr(app.state, "arq_pool", arq_pool, raising=False)
+    attribute = AsyncMock()
+    invalidate = AsyncMock()
+
+    with (
+        patch("app.services.submission_events.attribute_skill_scores", attribute),
+        patch("app.api.routes.assignments.invalidate_for_event", invalidate),
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                f"{settings.API_V1_STR}/assignments/{assignment.id}/students/me/submit-multi",
+                json={"force_submit": True, "total_time_spent_minutes": 5},
+                headers={"Authorization": f"Bearer {student_token}"},
+            )
+
+    assert response.status_code == 200
+    # The submission is committed before the event is published
+    session.expire_all()
+    assert session.get(AssignmentStudent, assignment_student.id).status == (
+        AssignmentStatus.completed
+    )
+    arq_pool.enqueue_job.assert_awaited_once()
+    args = arq_pool.enqueue_job.await_args.args
+    assert args[:2] == ("task_process_submission", str(assignment_student.id))
+    attribute.assert_not_awaited()
+    # The student's assignment list is invalidated before the response
+    invalidate.assert_awaited_once_with("assignment_submitted", user_id=args[2])
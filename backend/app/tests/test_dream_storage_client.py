@@ -6,6 +6,7 @@ response caching, and all API methods with mocked httpx responses.
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -499,14 +500,11 @@ async def test_cache_expiration_triggers_refresh(
         await client.get_books()
         assert mock_request.call_count == 1
 
-        # Manually expire cache
-        for key in client._cache:
-            client._cache[key]["expires_at"] = datetime.now(timezone.utc) - timedelta(
-                seconds=1
-            )
-
-        # Second call should refresh
-        await client.get_books()
+        # Move the cache clock past the 15 minute TTL
+        expired = time.monotonic() + 15 * 60 + 1
+        with patch("app.services.local_cache.time.monotonic", return_value=expired):
+            # Second call should refresh
+            await client.get_books()
         assert mock_request.call_count == 2
 
 
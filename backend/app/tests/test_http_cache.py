@@ -0,0 +1,112 @@
+"""
+Tests for conditional GET handling (ETag / If-None-Match / Last-Modified).
+"""
+
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.http_cache import ConditionalGetMiddleware, conditional_get, etag_matches
+
+app = FastAPI()
+app.add_middleware(ConditionalGetMiddleware)
+
+
+@app.get("/opted-in", dependencies=[Depends(conditional_get())])
+def opted_in() -> dict:
+    return {"pages": [1, 2, 3]}
+
+
+@app.get("/plain")
+def plain() -> dict:
+    return {"ok": True}
+
+
+@app.get("/with-etag")
+def with_etag() -> Response:
+    return Response(
+        content=b"image",
+        media_type="image/png",
+        headers={
+            "ETag": '"abc"',
+            "Cache-Control": "max-age=86400",
+            "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        },
+    )
+
+
+@app.get("/missing", dependencies=[Depends(conditional_get())])
+def missing() -> Response:
+    return Response(status_code=404)
+
+
+client = TestClient(app)
+
+
+def test_opted_in_json_gets_etag_and_revalidation_headers() -> None:
+    response = client.get("/opted-in")
+
+    assert response.status_code == 200
+    assert response.json() == {"pages": [1, 2, 3]}
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert response.headers["vary"] == "Authorization"
+
+
+def test_matching_if_none_match_returns_304_without_body() -> None:
+    etag = client.get("/opted-in").headers["etag"]
+
+    response = client.get("/opted-in", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "content-type" not in response.headers
+
+
+def test_stale_if_none_match_returns_full_body() -> None:
+    response = client.get("/opted-in", headers={"If-None-Match": '"old"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"pages": [1, 2, 3]}
+
+
+def test_endpoints_without_opt_in_are_untouched() -> None:
+    response = client.get("/plain", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_existing_etag_is_honoured() -> None:
+    response = client.get("/with-etag", headers={"If-None-Match": 'W/"abc", "x"'})
+
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "max-age=86400"
+
+
+def test_if_modified_since() -> None:
+    fresh = client.get(
+        "/with-etag", headers={"If-Modified-Since": "Thu, 02 Jan 2025 00:00:00 GMT"}
+    )
+    stale = client.get(
+        "/with-etag", headers={"If-Modified-Since": "Tue, 31 Dec 2024 00:00:00 GMT"}
+    )
+
+    assert fresh.status_code == 304
+    assert stale.status_code == 200
+    assert stale.content == b"image"
+
+
+def test_errors_are_not_converted() -> None:
+    response = client.get("/missing", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+def test_etag_matches() -> None:
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches(None, '"a"')
+    assert not etag_matches('"a"', '"b"')
@@ -0,0 +1,94 @@
+"""
+Tests for keyset (cursor) pagination helpers.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_cursor,
+    split_page,
+)
+from app.models import ReportJob, School, Teacher, User, UserRole
+from app.services.report_service import get_report_history
+
+
+def test_cursor_round_trip() -> None:
+    sort_value = datetime(2026, 10, 16, 9, 30, tzinfo=UTC)
+    row_id = uuid.uuid4()
+
+    cursor = decode_cursor(encode_cursor(sort_value, row_id))
+
+    assert (cursor.sort_value, cursor.id) == (sort_value, row_id)
+
+
+@pytest.mark.parametrize("raw", ["not-a-cursor", "", "%%%"])
+def test_malformed_cursor(raw: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(raw)
+    with pytest.raises(HTTPException) as exc_info:
+        parse_cursor(raw)
+    assert exc_info.value.status_code == 400
+
+
+def test_split_page_trims_look_ahead_row() -> None:
+    now = datetime.now(UTC)
+    rows = [(now - timedelta(minutes=i), uuid.uuid4()) for i in range(3)]
+
+    page, next_cursor = split_page(rows, 2, lambda row: row)
+    assert page == rows[:2]
+    assert decode_cursor(next_cursor).id == rows[1][1]
+
+    page, next_cursor = split_page(rows, 3, lambda row: row)
+    assert (page, next_cursor) == (rows, None)
+    assert split_page(rows, None, lambda row: row) == (rows, None)
+
+
+@pytest.mark.asyncio
+async def test_report_history_pages_by_cursor(async_session: AsyncSession) -> None:
+    school = School(name="Cursor School", dcs_publisher_id=1)
+    teacher_user = User(
+        username="cursorteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    async_session.add(teacher)
+    await async_session.flush()
+
+    # Two jobs share a timestamp, so the id has to break the tie
+    now = datetime.now(UTC)
+    created = [now, now, now - timedelta(hours=1), now - timedelta(hours=2)]
+    jobs = [
+        ReportJob(
+            teacher_id=teacher.id,
+            report_type="class",
+            config_json={"format": "pdf"},
+            created_at=created_at,
+            # Stored naive, as report_service compares it
+            expires_at=(created_at + timedelta(days=7)).replace(tzinfo=None),
+        )
+        for created_at in created
+    ]
+    async_session.add_all(jobs)
+    await async_session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = await get_report_history(
+            async_session, teacher.id, limit=3, cursor=cursor
+        )
+        seen.extend(item.id for item in page)
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 4
+    newest_first = sorted(jobs, key=lambda job: (job.created_at, job.id), reverse=True)
+    assert seen == [str(job.id) for job in newest_first]
@@ -0,0 +1,147 @@
+"""
+Tests for list-endpoint column projections.
+"""
+
+import re
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.projections import BLOB_COLUMNS, json_present, without_blobs
+from app.models import Assignment, School, Teacher, User, UserRole
+
+BLOB_COLUMN_NAMES = {
+    f"{column.class_.__tablename__}.{column.key}"
+    for columns in BLOB_COLUMNS.values()
+    for column in columns
+}
+
+PRESENCE_CHECK = re.compile(r"CAST\([\w.]+ AS TEXT\)|[\w.]+ IS NOT NULL")
+
+
+@contextmanager
+def capture_statements() -> Iterator[list[str]]:
+    """Collect the SQL of every statement any engine executes."""
+    statements: list[str] = []
+
+    def before_cursor_execute(
+        _conn, _cursor, statement, _params, _context, _executemany
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def blobs_selected(statements: list[str]) -> set[str]:
+    """
+    Blob columns read by any SELECT statement, subqueries included.
+
+    References made by json_present only test for a document and are ignored.
+    """
+    return {
+        name
+        for statement in statements
+        if statement.lstrip().upper().startswith("SELECT")
+        for name in BLOB_COLUMN_NAMES
+        if name in PRESENCE_CHECK.sub("", statement)
+    }
+
+
+async def _assignment(session: AsyncSession, **kwargs) -> Assignment:
+    school = School(name="Projection School", dcs_publisher_id=1)
+    teacher_user = User(
+        username=f"projection-{uuid.uuid4().hex[:8]}",
+        hashed_password="x",
+        role=UserRole.teacher,
+    )
+    session.add_all([school, teacher_user])
+    await session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    session.add(teacher)
+    await session.flush()
+    assignment = Assignment(
+        teacher_id=teacher.id, name="Projected", dcs_book_id=1, **kwargs
+    )
+    session.add(assignment)
+    await session.commit()
+    return assignment
+
+
+@pytest.mark.asyncio
+async def test_without_blobs_leaves_json_out_and_raises_on_access(
+    async_session: AsyncSession,
+) -> None:
+    assignment = await _assignment(
+        async_session,
+        activity_content={"questions": [{"q": "?"}]},
+        resources={"videos": []},
+    )
+    async_session.expunge_all()
+
+    with capture_statements() as statements:
+        loaded = (
+            await async_session.execute(
+                select(Assignment)
+                .where(Assignment.id == assignment.id)
+                .options(*without_blobs(Assignment))
+            )
+        ).scalar_one()
+
+    assert blobs_selected(statements) == set()
+    assert loaded.name == "Projected"
+    with pytest.raises(InvalidRequestError):
+        _ = loaded.activity_content
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content", "present"),
+    [(None, False), ({}, False), ({"questions": [{"q": "?"}]}, True)],
+)
+async def test_json_present(
+    async_session: AsyncSession, content: dict | None, present: bool
+) -> None:
+    assignment = await _assignment(async_session, activity_content=content)
+
+    result = await async_session.execute(
+        select(json_present(Assignment.activity_content)).where(
+            Assignment.id == assignment.id
+        )
+    )
+
+    assert bool(result.scalar_one()) is present
+
+
+def test_student_assignment_list_skips_blobs(
+    client: TestClient,
+    student_token: str,
+    assignment_with_activity: tuple,
+) -> None:
+    book_service = MagicMock()
+    book_service.get_books_batch = AsyncMock(return_value={})
+
+    with (
+        patch("app.api.routes.students.get_book_service", return_value=book_service),
+        capture_statements() as statements,
+    ):
+        response = client.get(
+            f"{settings.API_V1_STR}/students/me/assignments",
+            headers={"Authorization": f"Bearer {student_token}"},
+        )
+
+    assert response.status_code == 200
+    assert any("FROM assignment_students" in s for s in statements)
+    assert blobs_selected(statements) == set()
@@ -0,0 +1,120 @@
+"""
+Tests for per-request database statement statistics.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.query_stats import (
+    current_query_stats,
+    fingerprint,
+    instrument_engine,
+    track_queries,
+)
+from app.main import PrometheusMiddleware, RequestTimingMiddleware
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_ignores_parameters_and_list_lengths() -> None:
+    assert fingerprint(
+        "SELECT users.id FROM users\n  WHERE users.id = %(id_1)s AND name = 'x'"
+    ) == fingerprint("SELECT users.id FROM users WHERE users.id = ? AND name = 'y'")
+    assert fingerprint(
+        "SELECT 1 FROM t WHERE t.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+    ) == fingerprint("SELECT 1 FROM t WHERE t.id IN ($1)")
+    assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == (
+        "INSERT INTO t (a, b) VALUES (?)"
+    )
+    assert fingerprint("SELECT anon_1.id FROM anon_1 LIMIT 10") == (
+        "SELECT anon_1.id FROM anon_1 LIMIT ?"
+    )
+
+
+def test_track_queries_counts_statements_and_repeats(engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))  # not tracked
+        with track_queries() as stats:
+            for i in range(3):
+                conn.execute(text("SELECT :value"), {"value": i})
+            conn.execute(text("SELECT 42, 'other'"))
+
+    assert current_query_stats() is None
+    assert stats.statements == 4
+    assert stats.db_time > 0
+    assert stats.slowest_statement is not None
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+    assert stats.repeated(4) == []
+
+
+def test_failed_statement_does_not_skew_timing(engine) -> None:
+    with engine.connect() as conn, track_queries() as stats:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_stats_start"] == []
+
+    assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_async_engine_reports_into_current_request() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine.sync_engine)
+    try:
+        with track_queries() as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+    finally:
+        await engine.dispose()
+
+    assert stats.statements == 2
+
+
+def test_middleware_exports_metrics_and_logs_repeated_statements(
+    engine, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "DB_REPEATED_STATEMENT_THRESHOLD", 5)
+    app = FastAPI()
+
+    @app.get("/query-stats-probe")
+    def probe() -> dict:
+        with engine.connect() as conn:
+            for i in range(6):
+                conn.execute(text("SELECT :value"), {"value": i})
+        return {}
+
+    app.add_middleware(PrometheusMiddleware)
+    app.add_middleware(RequestTimingMiddleware)
+    labels = {"method": "GET", "endpoint": "/query-stats-probe"}
+    before = REGISTRY.get_sample_value("http_request_db_statements_sum", labels) or 0
+
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        response = TestClient(app).get("/query-stats-probe")
+
+    assert response.status_code == 200
+    after = REGISTRY.get_sample_value("http_request_db_statements_sum", labels)
+    assert after - before == 6
+    assert REGISTRY.get_sample_value(
+        "http_request_db_repeated_statements_total", labels
+    )
+    assert "N+1 GET /query-stats-probe: statement repeated 6 times" in caplog.text
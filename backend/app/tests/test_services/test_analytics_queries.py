@@ -0,0 +1,449 @@
+"""
+Tests for the SQL-side analytics aggregations.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import literal, literal_column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Activity,
+    ActivityType,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    Class,
+    ClassStudent,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services.analytics_queries import (
+    answer_counts,
+    answered_counts,
+    array_answer_counts,
+    assignment_stats,
+    average_score_by_period,
+    json_object_members,
+    score_bucket,
+    score_bucket_counts,
+    submission_period_totals,
+    submission_student_ranking,
+)
+from app.services.analytics_service import (
+    _analyze_activity_answers,
+    _detect_common_misconceptions,
+)
+from app.services.benchmark_service import (
+    get_admin_benchmark_overview,
+    get_benchmark_trend,
+)
+from app.services.report_service import (
+    generate_assignment_report_data,
+    generate_class_report_data,
+)
+
+NOW = datetime.now(UTC)
+
+
+@pytest_asyncio.fixture(name="classroom")
+async def classroom_fixture(async_session: AsyncSession) -> dict:
+    """A class of three students, an old and a new assignment with submissions."""
+    school = School(name="Query School", dcs_publisher_id=1)
+    teacher_user = User(
+        username="queryteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    async_session.add(teacher)
+    await async_session.flush()
+    class_obj = Class(name="6C", teacher_id=teacher.id, school_id=school.id)
+    async_session.add(class_obj)
+
+    students = []
+    for name in ("Ada", "Ben", "Cem"):
+        user = User(
+            username=f"query{name.lower()}",
+            full_name=name,
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        async_session.add(user)
+        await async_session.flush()
+        student = Student(user_id=user.id)
+        async_session.add(student)
+        await async_session.flush()
+        async_session.add(ClassStudent(class_id=class_obj.id, student_id=student.id))
+        students.append(student)
+
+    old = Assignment(
+        name="Reading - Old",
+        teacher_id=teacher.id,
+        dcs_book_id=1,
+        created_at=NOW - timedelta(days=40),
+    )
+    new = Assignment(
+        name="Listening - New",
+        teacher_id=teacher.id,
+        dcs_book_id=1,
+        created_at=NOW - timedelta(days=5),
+    )
+    async_session.add_all([old, new])
+    await async_session.flush()
+
+    ada, ben, cem = students
+    for assignment, student, score, days_ago in (
+        (old, ada, 50, 35),
+        (new, ada, 95, 2),
+        (new, ben, 59.5, 1),
+        (new, cem, None, 1),
+    ):
+        async_session.add(
+            AssignmentStudent(
+                assignment_id=assignment.id,
+                student_id=student.id,
+                status=AssignmentStatus.completed,
+                score=score,
+                completed_at=NOW - timedelta(days=days_ago),
+                time_spent_minutes=10,
+            )
+        )
+    await async_session.commit()
+    return {
+        "class": class_obj,
+        "students": students,
+        "old": old,
+        "new": new,
+    }
+
+
+def test_score_bucket_uses_width_bucket_on_postgres() -> None:
+    sql = str(
+        select(score_bucket(literal_column("avg"))).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert (
+        "width_bucket(CAST(avg AS double precision), "
+        "ARRAY[60, 70, 80, 90]::double precision[])"
+    ) in sql
+
+
+@pytest.mark.asyncio
+async def test_score_bucket_bands(async_session: AsyncSession) -> None:
+    values = [0, 59.5, 60, 89.99, 90, 100]
+    buckets = [
+        (await async_session.execute(select(score_bucket(literal(v))))).scalar()
+        for v in values
+    ]
+    assert buckets == [0, 0, 1, 3, 4, 4]
+
+
+@pytest.mark.asyncio
+async def test_student_ranking(async_session: AsyncSession, classroom: dict) -> None:
+    ranking = await submission_student_ranking(
+        async_session,
+        AssignmentStudent.student_id.in_(s.id for s in classroom["students"]),
+    )
+
+    assert [(r.name, r.avg_score, r.rank) for r in ranking] == [
+        ("Ada", 72.5, 1),
+        ("Ben", 59.5, 2),
+    ]
+    assert score_bucket_counts(ranking) == [1, 0, 1, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_assignment_stats(async_session: AsyncSession, classroom: dict) -> None:
+    rows = await assignment_stats(async_session, Assignment.id == classroom["new"].id)
+
+    (row,) = rows
+    assert (row.total, row.completed, row.scored) == (3, 3, 2)
+    assert row.score_sum == 154.5
+    assert (row.timed, row.time_spent_sum) == (3, 30)
+
+
+@pytest.mark.asyncio
+async def test_submission_period_totals(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    totals = await submission_period_totals(
+        async_session,
+        [s.id for s in classroom["students"]],
+        current=(NOW - timedelta(days=30), NOW),
+        previous=(NOW - timedelta(days=60), NOW - timedelta(days=30)),
+    )
+
+    assert totals.current_completed == 3
+    assert totals.current_avg == pytest.approx(77.25)
+    assert totals.current_assignments == 1
+    assert totals.previous_avg == 50
+
+
+@pytest.mark.asyncio
+async def test_average_score_by_period(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    boundaries = [NOW - timedelta(days=60), NOW - timedelta(days=30), NOW]
+    averages = await average_score_by_period(
+        async_session,
+        boundaries,
+        Class.id == classroom["class"].id,
+        through_classes=True,
+    )
+
+    assert averages == {0: 50, 1: pytest.approx(77.25)}
+
+
+@pytest.mark.asyncio
+async def test_class_report_data(async_session: AsyncSession, classroom: dict) -> None:
+    data = await generate_class_report_data(
+        async_session,
+        classroom["class"].id,
+        current_start=NOW - timedelta(days=30),
+        current_end=NOW,
+        previous_start=NOW - timedelta(days=60),
+        previous_end=NOW - timedelta(days=30),
+    )
+
+    assert data.student_count == 3
+    assert data.summary.total_completed == 3
+    assert data.summary.completion_rate == 1.0
+    assert [s["name"] for s in data.top_students] == ["Ada", "Ben"]
+    assert [s["name"] for s in data.struggling_students] == ["Ben"]
+    assert [b["count"] for b in data.score_distribution] == [1, 0, 0, 0, 1]
+    assert data.assignments == [
+        {"name": "Listening - New", "avg_score": 51.5, "completion_rate": 1.0}
+    ]
+    assert data.skill_breakdown == [
+        {"skill_name": "Listening", "avg_score": 77.2, "count": 2}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_assignment_report_data_streams_assignment_totals(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    activity = Activity(
+        module_name="Module 1",
+        page_number=1,
+        section_index=0,
+        activity_type=ActivityType.circle,
+        config_json={},
+        dcs_book_id=1,
+    )
+    async_session.add(activity)
+    await async_session.flush()
+    teacher_id = classroom["old"].teacher_id
+    circled, unassigned = (
+        Assignment(
+            name=name,
+            teacher_id=teacher_id,
+            activity_id=activity.id,
+            dcs_book_id=1,
+            created_at=NOW - timedelta(days=days_ago),
+        )
+        for name, days_ago in (("Circle - Week 1", 3), ("Circle - Week 2", 2))
+    )
+    async_session.add_all([circled, unassigned])
+    await async_session.flush()
+    ada, ben, cem = classroom["students"]
+    for student, status, score, minutes in (
+        (ada, AssignmentStatus.completed, 80, 10),
+        (ben, AssignmentStatus.completed, None, 0),
+        (cem, AssignmentStatus.not_started, None, 0),
+    ):
+        async_session.add(
+            AssignmentStudent(
+                assignment_id=circled.id,
+                student_id=student.id,
+                status=status,
+                score=score,
+                time_spent_minutes=minutes,
+            )
+        )
+    await async_session.commit()
+
+    data = await generate_assignment_report_data(
+        async_session,
+        teacher_id,
+        current_start=NOW - timedelta(days=30),
+        current_end=NOW,
+        previous_start=NOW - timedelta(days=60),
+        previous_end=NOW - timedelta(days=30),
+    )
+
+    # "Listening - New" has no activity and is left out of the overview
+    assert data.total_assignments == 2
+    assert data.summary.total_assigned == 3
+    assert data.summary.total_completed == 2
+    assert data.summary.completion_rate == 0.67
+    assert data.summary.avg_score == 80
+    assert data.trend.previous == 50
+    assert data.assignments == [
+        {
+            "name": "Circle - Week 1",
+            "avg_score": 80.0,
+            "completion_rate": 0.67,
+            "time_spent": 10.0,
+            "activity_type": ActivityType.circle,
+        }
+    ]
+    assert data.activity_type_comparison == [
+        {
+            "activity_type": ActivityType.circle,
+            "avg_score": 80.0,
+            "count": 1,
+            "label": "Circle the Answer",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_trend_and_overview(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    class_obj = classroom["class"]
+    trend = await get_benchmark_trend(
+        class_obj.id, class_obj.school_id, None, async_session, periods=8
+    )
+    assert len(trend) == 2
+    assert trend[-1].period_label == "Week 8"
+    assert trend[-1].class_average == 77.2
+
+    overview = await get_admin_benchmark_overview(async_session)
+    (summary,) = overview.school_summaries
+    assert (summary.class_count, summary.average_score) == (1, 68.2)
+
+
+def test_json_members_use_jsonb_functions_on_postgres() -> None:
+    members = json_object_members(AssignmentStudent.answers_json).table_valued(
+        "key", "value"
+    )
+    sql = str(select(members.c.key).compile(dialect=postgresql.dialect()))
+    assert "jsonb_each(CASE WHEN jsonb_typeof(" in sql
+
+
+async def _answered(
+    session: AsyncSession,
+    classroom: dict,
+    activity_type: ActivityType,
+    config: dict,
+    answers: list[dict | None],
+) -> Assignment:
+    """An assignment of the given activity with one submission per answer set."""
+    activity = Activity(
+        module_name="Module 1",
+        page_number=1,
+        section_index=0,
+        activity_type=activity_type,
+        config_json=config,
+        dcs_book_id=1,
+    )
+    session.add(activity)
+    await session.flush()
+    assignment = Assignment(
+        name=f"Answers - {activity_type.value}",
+        teacher_id=classroom["old"].teacher_id,
+        activity_id=activity.id,
+        dcs_book_id=1,
+    )
+    session.add(assignment)
+    await session.flush()
+    for student, answers_json in zip(classroom["students"], answers, strict=False):
+        session.add(
+            AssignmentStudent(
+                assignment_id=assignment.id,
+                student_id=student.id,
+                status=AssignmentStatus.completed,
+                answers_json=answers_json,
+            )
+        )
+    await session.commit()
+    return assignment
+
+
+MATCHING_CONFIG = {"pairs": [{"left": "cat", "right": "kedi"}]}
+
+
+@pytest.mark.asyncio
+async def test_answer_counts(async_session: AsyncSession, classroom: dict) -> None:
+    assignment = await _answered(
+        async_session,
+        classroom,
+        ActivityType.matchTheWords,
+        MATCHING_CONFIG,
+        [{"cat": "kopek"}, {"cat": "kopek", "dog": ""}, None],
+    )
+
+    rows = await answer_counts(
+        async_session, AssignmentStudent.assignment_id == assignment.id
+    )
+
+    assert sorted((r.question_id, r.answer, r.count) for r in rows) == [
+        ("cat", "kopek", 2),
+        ("dog", "", 1),
+    ]
+    assert await answered_counts(
+        async_session, AssignmentStudent.assignment_id == assignment.id
+    ) == {assignment.id: 2}
+
+
+@pytest.mark.asyncio
+async def test_misconception_from_counted_answers(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    assignment = await _answered(
+        async_session,
+        classroom,
+        ActivityType.matchTheWords,
+        MATCHING_CONFIG,
+        [{"cat": "kopek"}, {"cat": "kopek"}, {"cat": "kedi"}],
+    )
+
+    (insight,) = await _detect_common_misconceptions(
+        assignment.teacher_id, async_session
+    )
+
+    assert insight.id == f"misconception_{assignment.id}_cat"
+    assert insight.affected_count == 2
+    assert "chose 'kopek' instead of 'kedi'" in insight.recommended_action
+
+
+@pytest.mark.asyncio
+async def test_word_search_analysis(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    assignment = await _answered(
+        async_session,
+        classroom,
+        ActivityType.puzzleFindWords,
+        {"words": ["sun", "moon"]},
+        [{"words": ["sun", "moon"]}, {"words": ["sun"]}, {"words": "sun"}],
+    )
+    found = await array_answer_counts(
+        async_session, "words", AssignmentStudent.assignment_id == assignment.id
+    )
+    # The third submission's "words" is not an array and contributes nothing
+    assert sorted(found) == [("moon", 1), ("sun", 2)]
+
+    analysis = await _analyze_activity_answers(
+        async_session,
+        assignment.id,
+        "puzzleFindWords",
+        {"words": ["sun", "moon"]},
+    )
+
+    assert {
+        w.word: (w.found_count, w.total_attempts) for w in analysis.word_search
+    } == {
+        "sun": (2, 3),
+        "moon": (1, 3),
+    }
@@ -0,0 +1,266 @@
+"""
+Tests for the per-student daily rollups behind class analytics.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import (
+    ActivityType,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    Class,
+    ClassStudent,
+    School,
+    Student,
+    StudentDailyRollup,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services import analytics_rollup
+from app.services.analytics_rollup import reconcile_rollups, rollup_day
+from app.services.analytics_service import get_class_analytics
+
+
+@pytest_asyncio.fixture(name="classroom")
+async def classroom_fixture(async_session: AsyncSession) -> dict:
+    """A class with two enrolled students and two assignments."""
+    school = School(name="Rollup School", dcs_publisher_id=1)
+    teacher_user = User(
+        username="rollupteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    async_session.add(teacher)
+    await async_session.flush()
+    class_obj = Class(name="5A", teacher_id=teacher.id, school_id=school.id)
+    async_session.add(class_obj)
+
+    students = []
+    for name in ("Ada", "Ben"):
+        user = User(
+            username=f"rollup{name.lower()}",
+            full_name=name,
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        async_session.add(user)
+        await async_session.flush()
+        student = Student(user_id=user.id)
+        async_session.add(student)
+        await async_session.flush()
+        async_session.add(ClassStudent(class_id=class_obj.id, student_id=student.id))
+        students.append(student)
+
+    assignments = [
+        Assignment(
+            name=f"Homework {i}",
+            teacher_id=teacher.id,
+            dcs_book_id=1,
+            activity_type=activity_type,
+        )
+        for i, activity_type in enumerate(
+            (ActivityType.matchTheWords, ActivityType.listening_quiz)
+        )
+    ]
+    async_session.add_all(assignments)
+    await async_session.commit()
+    return {"class": class_obj, "students": students, "assignments": assignments}
+
+
+async def _rollups(session: AsyncSession) -> list[StudentDailyRollup]:
+    result = await session.execute(
+        select(StudentDailyRollup).execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+
+def _submit(
+    assignment: Assignment,
+    student: Student,
+    score: float | None,
+    completed_at: datetime,
+    minutes: int = 0,
+) -> AssignmentStudent:
+    return AssignmentStudent(
+        assignment_id=assignment.id,
+        student_id=student.id,
+        status=AssignmentStatus.completed,
+        score=score,
+        completed_at=completed_at,
+        time_spent_minutes=minutes,
+    )
+
+
+@pytest.mark.asyncio
+async def test_submission_updates_rollup(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    ada = classroom["students"][0]
+    first, second = classroom["assignments"]
+    now = datetime.now(UTC)
+    async_session.add(_submit(first, ada, 80, now, minutes=10))
+    async_session.add(_submit(second, ada, None, now))
+    await async_session.commit()
+
+    rows = {r.activity_type: r for r in await _rollups(async_session)}
+    assert set(rows) == {"matchTheWords", "listening_quiz"}
+    assert rows["matchTheWords"].day == rollup_day(now)
+    assert rows["matchTheWords"].completed_count == 1
+    assert rows["matchTheWords"].score_sum == 80
+    assert rows["matchTheWords"].time_spent_minutes_sum == 10
+    assert rows["listening_quiz"].completed_count == 1
+    assert rows["listening_quiz"].scored_count == 0
+
+
+@pytest.mark.asyncio
+async def test_regrade_and_reopen_recompute_rollup(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    ada = classroom["students"][0]
+    submission = _submit(classroom["assignments"][0], ada, 40, datetime.now(UTC))
+    async_session.add(submission)
+    await async_session.commit()
+
+    submission.score = 90
+    await async_session.commit()
+    (row,) = await _rollups(async_session)
+    assert (row.scored_count, row.score_sum) == (1, 90)
+
+    submission.status = AssignmentStatus.in_progress
+    submission.completed_at = None
+    await async_session.commit()
+    assert await _rollups(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_moved_completion_leaves_old_day(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    ada = classroom["students"][0]
+    now = datetime.now(UTC)
+    submission = _submit(classroom["assignments"][0], ada, 70, now - timedelta(days=3))
+    async_session.add(submission)
+    await async_session.commit()
+
+    submission.completed_at = now
+    await async_session.commit()
+
+    (row,) = await _rollups(async_session)
+    assert row.day == rollup_day(now)
+
+
+@pytest.mark.asyncio
+async def test_class_analytics_reads_rollups(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    ada, ben = classroom["students"]
+    first, second = classroom["assignments"]
+    now = datetime.now(UTC)
+    async_session.add_all(
+        [
+            _submit(first, ada, 90, now - timedelta(days=1), minutes=12),
+            _submit(second, ada, 100, now - timedelta(days=1), minutes=8),
+            _submit(first, ben, 50, now - timedelta(days=10)),
+            AssignmentStudent(
+                assignment_id=second.id,
+                student_id=ben.id,
+                status=AssignmentStatus.not_started,
+            ),
+        ]
+    )
+    await async_session.commit()
+
+    analytics = await get_class_analytics(
+        classroom["class"].id, "weekly", async_session
+    )
+
+    assert analytics.summary.avg_score == 80.0
+    assert analytics.summary.completion_rate == 0.75
+    assert analytics.summary.total_assignments == 2
+    assert analytics.summary.active_students == 1
+    assert [(s.name, s.avg_score) for s in analytics.leaderboard] == [
+        ("Ada", 95.0),
+        ("Ben", 50.0),
+    ]
+    assert [s.name for s in analytics.struggling_students] == ["Ben"]
+    assert [b.count for b in analytics.score_distribution] == [1, 0, 0, 0, 1]
+
+    performance = {p.name: p for p in analytics.assignment_performance}
+    assert performance["Homework 0"].avg_score == 70.0
+    assert performance["Homework 0"].completion_rate == 1.0
+    assert performance["Homework 0"].avg_time_spent == 12.0
+    assert performance["Homework 1"].completion_rate == 0.5
+
+    assert {t.metric_name: t.current_value for t in analytics.trends} == {
+        "Average Score": 95.0,
+        "Completions": 2.0,
+    }
+    assert sum(a.count for a in analytics.activity_type_performance) == 3
+
+
+@pytest.mark.asyncio
+async def test_unrelated_flush_leaves_rollups_alone(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    classroom["class"].name = "5B"
+    await async_session.commit()
+    assert await _rollups(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_failed_refreshes(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    ada, ben = classroom["students"]
+    now = datetime.now(UTC)
+    with patch.object(
+        analytics_rollup, "refresh_rollups", side_effect=RuntimeError("conflict")
+    ):
+        async_session.add(_submit(classroom["assignments"][0], ada, 60, now))
+        await async_session.commit()
+    assert await _rollups(async_session) == []
+
+    # A stale row with no completed work behind it is removed as well
+    async_session.add(
+        StudentDailyRollup(
+            student_id=ben.id,
+            day=rollup_day(now),
+            activity_type="matchTheWords",
+            completed_count=3,
+        )
+    )
+    await async_session.commit()
+
+    rebuilt = await reconcile_rollups(
+        async_session, since=rollup_day(now - timedelta(days=1))
+    )
+
+    assert rebuilt == 2
+    (row,) = await _rollups(async_session)
+    assert (row.student_id, row.completed_count, row.score_sum) == (ada.id, 1, 60)
+
+
+def test_refresh_locks_students_in_order_on_postgres() -> None:
+    connection = MagicMock(dialect=SimpleNamespace(name="postgresql"))
+    student_ids = [uuid.uuid4() for _ in range(3)]
+
+    analytics_rollup._lock_students(connection, student_ids)
+
+    keys = [
+        stmt.selected_columns[0].clauses.clauses[0].value
+        for (stmt,), _ in connection.execute.call_args_list
+    ]
+    assert keys == [
+        int.from_bytes(i.bytes[:8], "big", signed=True) for i in sorted(student_ids)
+    ]
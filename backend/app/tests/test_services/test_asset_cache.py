@@ -0,0 +1,185 @@
+"""
+Tests for the on-disk DCS asset cache.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.responses import FileResponse
+
+from app.services import asset_cache
+from app.services.asset_cache import AssetDiskCache, cached_asset_response
+
+
+class CountingFetch:
+    """Async fetch stand-in that counts DCS calls."""
+
+    def __init__(self, data: bytes, delay: float = 0.0) -> None:
+        self.data = data
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.data
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AssetDiskCache:
+    return AssetDiskCache(tmp_path, max_bytes=1000, ttl=3600)
+
+
+@pytest.mark.asyncio
+async def test_miss_fetches_once_then_serves_from_disk(cache: AssetDiskCache) -> None:
+    fetch = CountingFetch(b"page image")
+
+    first = await cache.get_or_fetch(1, "images/M1/7.png", fetch)
+    second = await cache.get_or_fetch(1, "images/M1/7.png", fetch)
+
+    assert fetch.calls == 1
+    assert first == second
+    assert first.path.read_bytes() == b"page image"
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(cache: AssetDiskCache) -> None:
+    fetch = CountingFetch(b"cover", delay=0.01)
+
+    results = await asyncio.gather(
+        *(cache.get_or_fetch(1, "images/book_cover.png", fetch) for _ in range(30))
+    )
+
+    assert fetch.calls == 1
+    assert {r.content_hash for r in results} == {results[0].content_hash}
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once(cache: AssetDiskCache) -> None:
+    a = await cache.get_or_fetch(1, "audio/a.mp3", CountingFetch(b"same"))
+    b = await cache.get_or_fetch(2, "audio/b.mp3", CountingFetch(b"same"))
+
+    assert a.path == b.path
+    assert a.etag == f'"{a.content_hash}"'
+
+
+@pytest.mark.asyncio
+async def test_writes_leave_no_temp_files(
+    cache: AssetDiskCache, tmp_path: Path
+) -> None:
+    await cache.get_or_fetch(1, "x.png", CountingFetch(b"data"))
+
+    leftovers = [p for p in tmp_path.rglob("*") if p.name.startswith(".tmp-")]
+    assert leftovers == []
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_blobs_over_budget(
+    cache: AssetDiskCache,
+) -> None:
+    old = await cache.get_or_fetch(1, "old.png", CountingFetch(b"o" * 400))
+    recent = await cache.get_or_fetch(1, "recent.png", CountingFetch(b"r" * 400))
+    past = time.time() - 3600
+    os.utime(old.path, (past, past))
+
+    await cache.get_or_fetch(1, "new.png", CountingFetch(b"n" * 400))
+
+    assert not old.path.exists()
+    assert recent.path.exists()
+    assert cache.lookup(1, "old.png") is None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_book_refetches_its_assets(cache: AssetDiskCache) -> None:
+    fetch = CountingFetch(b"v1")
+    other = CountingFetch(b"other")
+    await cache.get_or_fetch(1, "p.png", fetch)
+    await cache.get_or_fetch(2, "p.png", other)
+
+    await cache.invalidate_book(1)
+    fetch.data = b"v2"
+    refreshed = await cache.get_or_fetch(1, "p.png", fetch)
+    await cache.get_or_fetch(2, "p.png", other)
+
+    assert fetch.calls == 2
+    assert refreshed.path.read_bytes() == b"v2"
+    assert other.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_ref_is_refetched(tmp_path: Path) -> None:
+    cache = AssetDiskCache(tmp_path, max_bytes=1000, ttl=0)
+    fetch = CountingFetch(b"data")
+    await cache.get_or_fetch(1, "p.png", fetch)
+    time.sleep(0.01)
+    await cache.get_or_fetch(1, "p.png", fetch)
+
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_eviction_spares_recently_used_blobs(cache: AssetDiskCache) -> None:
+    # Over budget, but every blob may still be about to be served
+    first = await cache.get_or_fetch(1, "a.png", CountingFetch(b"a" * 600))
+    second = await cache.get_or_fetch(1, "b.png", CountingFetch(b"b" * 600))
+
+    assert first.path.exists()
+    assert second.path.exists()
+    assert cache.stats()["evictions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_serves_cached_blob_as_file(
+    cache: AssetDiskCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(asset_cache, "get_asset_cache", lambda: cache)
+
+    response = await cached_asset_response(
+        1, "p.png", CountingFetch(b"page bytes"), "image/png"
+    )
+
+    asset = cache.lookup(1, "p.png")
+    assert isinstance(response, FileResponse)
+    assert response.path == asset.path
+    assert response.headers["etag"] == asset.etag
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_is_answered_without_the_file(
+    cache: AssetDiskCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(asset_cache, "get_asset_cache", lambda: cache)
+    fetch = CountingFetch(b"page bytes")
+    etag = (await cache.get_or_fetch(1, "p.png", fetch)).etag
+
+    response = await cached_asset_response(
+        1, "p.png", fetch, "image/png", if_none_match=etag
+    )
+
+    assert response.status_code == 304
+    assert not isinstance(response, FileResponse)
+    assert response.headers["etag"] == etag
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_failure_reuses_the_fetched_bytes(
+    cache: AssetDiskCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(asset_cache, "get_asset_cache", lambda: cache)
+    fetch = CountingFetch(b"page bytes")
+
+    def disk_full(*args):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(cache, "_store_sync", disk_full)
+    response = await cached_asset_response(1, "p.png", fetch, "image/png")
+
+    assert response.body == b"page bytes"
+    assert fetch.calls == 1
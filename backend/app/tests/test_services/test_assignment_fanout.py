@@ -0,0 +1,197 @@
+"""
+Tests for bulk assignment fan-out.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import (
+    Activity,
+    ActivityType,
+    Assignment,
+    AssignmentActivity,
+    AssignmentStatus,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+    AssignmentStudentActivityStatus,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services.assignment_fanout import fan_out_assignment
+
+
+async def _setup(
+    session: AsyncSession, student_count: int, activity_count: int
+) -> tuple[Assignment, list[Student], list[Activity]]:
+    school = School(name="Fanout School", dcs_publisher_id=1)
+    teacher_user = User(
+        username=f"fanout-{uuid.uuid4().hex[:8]}",
+        hashed_password="x",
+        role=UserRole.teacher,
+    )
+    student_users = [
+        User(
+            username=f"fanout-student-{i}",
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        for i in range(student_count)
+    ]
+    session.add_all([school, teacher_user, *student_users])
+    await session.flush()
+
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    students = [Student(user_id=user.id) for user in student_users]
+    activities = [
+        Activity(
+            dcs_book_id=1,
+            module_name="Module 1",
+            page_number=i + 1,
+            section_index=0,
+            activity_type=ActivityType.matchTheWords,
+            config_json={},
+            order_index=i,
+        )
+        for i in range(activity_count)
+    ]
+    session.add_all([teacher, *students, *activities])
+    await session.flush()
+
+    assignment = Assignment(teacher_id=teacher.id, name="Fanned out", dcs_book_id=1)
+    session.add(assignment)
+    await session.flush()
+    return assignment, students, activities
+
+
+@pytest.mark.asyncio
+async def test_fan_out_creates_links_students_and_progress(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "ASSIGNMENT_PROGRESS_LAZY", False)
+    assignment, students, activities = await _setup(async_session, 3, 2)
+    # Reversed so the stored order follows the argument, not insertion order
+    activity_ids = [a.id for a in reversed(activities)]
+
+    created = await fan_out_assignment(
+        async_session, assignment.id, [s.id for s in students], activity_ids
+    )
+    await async_session.commit()
+
+    links = (
+        await async_session.execute(
+            select(AssignmentActivity.activity_id, AssignmentActivity.order_index)
+            .where(AssignmentActivity.assignment_id == assignment.id)
+            .order_by(AssignmentActivity.order_index)
+        )
+    ).all()
+    assert [row.activity_id for row in links] == activity_ids
+    assert [row.order_index for row in links] == [0, 1]
+
+    rows = (
+        await async_session.execute(
+            select(AssignmentStudent).where(
+                AssignmentStudent.assignment_id == assignment.id
+            )
+        )
+    ).scalars()
+    assert {row.student_id: row.id for row in rows} == created
+    assert set(created) == {s.id for s in students}
+
+    progress = (
+        await async_session.execute(
+            select(AssignmentStudentActivity).where(
+                AssignmentStudentActivity.assignment_student_id.in_(created.values())
+            )
+        )
+    ).scalars()
+    pairs = {}
+    for row in progress:
+        assert row.status == AssignmentStudentActivityStatus.not_started
+        assert row.max_score == 100.0
+        pairs[(row.assignment_student_id, row.activity_id)] = row
+    assert set(pairs) == {
+        (assignment_student_id, activity_id)
+        for assignment_student_id in created.values()
+        for activity_id in activity_ids
+    }
+
+
+@pytest.mark.asyncio
+async def test_fan_out_leaves_progress_rows_to_first_start_when_lazy(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "ASSIGNMENT_PROGRESS_LAZY", True)
+    assignment, students, activities = await _setup(async_session, 3, 2)
+
+    created = await fan_out_assignment(
+        async_session,
+        assignment.id,
+        [s.id for s in students],
+        [a.id for a in activities],
+    )
+    await async_session.commit()
+
+    assert set(created) == {s.id for s in students}
+    link_count = (
+        await async_session.execute(
+            select(func.count(AssignmentActivity.id)).where(
+                AssignmentActivity.assignment_id == assignment.id
+            )
+        )
+    ).scalar_one()
+    assert link_count == 2
+    progress_count = (
+        await async_session.execute(select(func.count(AssignmentStudentActivity.id)))
+    ).scalar_one()
+    assert progress_count == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_without_activities_creates_students_only(
+    async_session: AsyncSession,
+) -> None:
+    assignment, students, _ = await _setup(async_session, 2, 0)
+
+    await fan_out_assignment(async_session, assignment.id, [s.id for s in students])
+    await async_session.commit()
+
+    statuses = (
+        await async_session.execute(
+            select(
+                AssignmentStudent.status, AssignmentStudent.time_spent_minutes
+            ).where(AssignmentStudent.assignment_id == assignment.id)
+        )
+    ).all()
+    assert statuses == [(AssignmentStatus.not_started, 0)] * 2
+    progress_count = (
+        await async_session.execute(select(func.count(AssignmentStudentActivity.id)))
+    ).scalar_one()
+    assert progress_count == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_rolls_back_with_the_assignment(
+    async_session: AsyncSession,
+) -> None:
+    assignment, students, activities = await _setup(async_session, 2, 1)
+    await async_session.commit()
+
+    await fan_out_assignment(
+        async_session,
+        assignment.id,
+        [s.id for s in students],
+        [a.id for a in activities],
+    )
+    await async_session.rollback()
+
+    student_count = (
+        await async_session.execute(select(func.count(AssignmentStudent.id)))
+    ).scalar_one()
+    assert student_count == 0
@@ -0,0 +1,222 @@
+"""
+Tests for the precomputed benchmark snapshots.
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Activity,
+    ActivityType,
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    BenchmarkSnapshot,
+    Class,
+    ClassStudent,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services.benchmark_service import (
+    calculate_activity_type_benchmarks,
+    calculate_publisher_benchmark,
+    calculate_school_benchmark,
+    get_admin_benchmark_overview,
+    get_period_start,
+)
+from app.services.benchmark_snapshot_service import (
+    load_benchmark_snapshot,
+    refresh_benchmark_snapshots,
+)
+
+PUBLISHER_ID = 7
+
+
+@pytest_asyncio.fixture(name="school")
+async def school_fixture(async_session: AsyncSession) -> dict:
+    """A school with six classes of one student, each with a scored submission."""
+    school = School(name="Snapshot School", dcs_publisher_id=PUBLISHER_ID)
+    teacher_user = User(
+        username="snapshotteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    activity = Activity(
+        dcs_book_id=1,
+        module_name="Module 1",
+        page_number=1,
+        section_index=0,
+        activity_type=ActivityType.matchTheWords,
+        config_json={},
+    )
+    async_session.add_all([teacher, activity])
+    await async_session.flush()
+    assignment = Assignment(
+        name="Matching",
+        teacher_id=teacher.id,
+        dcs_book_id=1,
+        activity_id=activity.id,
+    )
+    async_session.add(assignment)
+
+    classes = []
+    for i in range(6):
+        class_obj = Class(name=f"Class {i}", teacher_id=teacher.id, school_id=school.id)
+        user = User(
+            username=f"snapshotstudent{i}",
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        async_session.add_all([class_obj, user])
+        await async_session.flush()
+        student = Student(user_id=user.id)
+        async_session.add(student)
+        await async_session.flush()
+        async_session.add_all(
+            [
+                ClassStudent(class_id=class_obj.id, student_id=student.id),
+                AssignmentStudent(
+                    assignment_id=assignment.id,
+                    student_id=student.id,
+                    status=AssignmentStatus.completed,
+                    score=50 + 10 * i,
+                    completed_at=datetime.now(UTC) - timedelta(days=1),
+                ),
+            ]
+        )
+        classes.append(class_obj)
+    await async_session.commit()
+    return {"school": school, "classes": classes, "assignment": assignment}
+
+
+@pytest.fixture(autouse=True)
+def publisher_books():
+    """DCS lists book 1 for the publisher."""
+    service = AsyncMock()
+    service.list_books = AsyncMock(return_value=[SimpleNamespace(id=1)])
+    with (
+        patch(
+            "app.services.benchmark_snapshot_service.get_book_service",
+            return_value=service,
+        ),
+        patch("app.services.benchmark_service.get_book_service", return_value=service),
+    ):
+        yield service
+
+
+@pytest.mark.asyncio
+async def test_snapshot_matches_live_benchmarks(
+    async_session: AsyncSession, school: dict
+) -> None:
+    school_id = school["school"].id
+    excluded = school["classes"][0].id
+    live_school = await calculate_school_benchmark(
+        school_id, "all", async_session, exclude_class_id=excluded
+    )
+    live_publisher = await calculate_publisher_benchmark(
+        PUBLISHER_ID, "all", async_session, exclude_class_id=excluded
+    )
+
+    result = await refresh_benchmark_snapshots(async_session)
+    assert (result.schools, result.publishers) == (1, 1)
+
+    assert live_school.is_available
+    assert (live_school.average_score, live_school.sample_size) == (80.0, 5)
+    assert (
+        await calculate_school_benchmark(
+            school_id, "all", async_session, exclude_class_id=excluded
+        )
+        == live_school
+    )
+    assert (
+        await calculate_publisher_benchmark(
+            PUBLISHER_ID, "all", async_session, exclude_class_id=excluded
+        )
+        == live_publisher
+    )
+
+
+@pytest.mark.asyncio
+async def test_excluding_a_class_subtracts_its_share(
+    async_session: AsyncSession, school: dict
+) -> None:
+    await refresh_benchmark_snapshots(async_session)
+    key = str(school["school"].id)
+    start = get_period_start("semester")
+
+    totals = await load_benchmark_snapshot(
+        async_session, "school", key, "semester", start
+    )
+    without_last = await load_benchmark_snapshot(
+        async_session, "school", key, "semester", start, school["classes"][5].id
+    )
+
+    assert (totals["all"].class_count, totals["all"].score_sum) == (6, 450)
+    assert (without_last["all"].class_count, without_last["all"].score_sum) == (5, 350)
+    assert without_last["matchTheWords"].average_score == 70
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_served_until_stale(
+    async_session: AsyncSession, school: dict
+) -> None:
+    await refresh_benchmark_snapshots(async_session)
+    school_id = school["school"].id
+    # A re-grade after the refresh only reaches the live query
+    await async_session.execute(
+        update(AssignmentStudent).where(AssignmentStudent.score == 50).values(score=20)
+    )
+    await async_session.commit()
+
+    served = await calculate_school_benchmark(school_id, "all", async_session)
+    assert served.average_score == 75.0
+
+    await async_session.execute(
+        update(BenchmarkSnapshot).values(
+            refreshed_at=datetime.now(UTC) - timedelta(days=2)
+        )
+    )
+    await async_session.commit()
+    assert (
+        await load_benchmark_snapshot(
+            async_session, "school", str(school_id), "all", get_period_start("all")
+        )
+        is None
+    )
+    live = await calculate_school_benchmark(school_id, "all", async_session)
+    assert live.average_score == 70.0
+
+
+@pytest.mark.asyncio
+async def test_activity_types_and_overview_from_snapshot(
+    async_session: AsyncSession, school: dict
+) -> None:
+    class_id = school["classes"][0].id
+    school_id = school["school"].id
+    live_activity = await calculate_activity_type_benchmarks(
+        class_id, school_id, "all", async_session
+    )
+    live_overview = await get_admin_benchmark_overview(async_session)
+
+    await refresh_benchmark_snapshots(async_session)
+
+    (benchmark,) = await calculate_activity_type_benchmarks(
+        class_id, school_id, "all", async_session
+    )
+    assert benchmark == live_activity[0]
+    assert (benchmark.class_average, benchmark.benchmark_average) == (50.0, 80.0)
+
+    overview = await get_admin_benchmark_overview(async_session)
+    assert overview.system_average_score == live_overview.system_average_score == 75
+    assert overview.activity_type_stats == live_overview.activity_type_stats
+    assert overview.school_summaries == live_overview.school_summaries
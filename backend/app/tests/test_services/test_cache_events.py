@@ -0,0 +1,216 @@
+"""
+Tests for versioned cache namespaces and event-driven invalidation.
+
+Invalidation of a key family must be a single version bump, never a
+keyspace SCAN.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import redis_cache
+from app.services.cache_events import invalidate_for_event
+from app.services.local_cache import LocalLRUCache
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in covering the commands the cache uses."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.scan_calls = 0
+        self.published: list[tuple[str, bytes]] = []
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, nx: bool = False, **_: Any) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = str(value)
+        return True
+
+    async def setex(self, key: str, _ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+    async def eval(self, _script: str, _numkeys: int, key: str, seed: str) -> int:
+        # Mirrors _BUMP_NAMESPACE_SCRIPT
+        value = int(self.store.get(key, seed)) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        self.published.append((channel, message))
+        return 1
+
+    async def scan(self, *_: Any, **__: Any) -> tuple[int, list[str]]:
+        self.scan_calls += 1
+        return 0, []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    client = FakeRedis()
+    monkeypatch.setattr(redis_cache, "_redis_client", client)
+    monkeypatch.setattr(
+        redis_cache, "_l1_cache", LocalLRUCache(max_bytes=1024 * 1024, default_ttl=5)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_namespace_key_is_stable_until_bumped(fake_redis: FakeRedis) -> None:
+    first = await redis_cache.cache_namespace_key("student:1:assignments", "all:20:0")
+    second = await redis_cache.cache_namespace_key("student:1:assignments", "all:20:0")
+    assert first == second
+    assert first.startswith("student:1:assignments:v")
+    assert first.endswith(":all:20:0")
+
+    await redis_cache.cache_bump_namespace("student:1:assignments")
+    third = await redis_cache.cache_namespace_key("student:1:assignments", "all:20:0")
+    assert third != first
+
+
+@pytest.mark.asyncio
+async def test_bumped_namespace_hides_old_entries(fake_redis: FakeRedis) -> None:
+    key = await redis_cache.cache_namespace_key("student:1:assignments", "all:20:0")
+    await redis_cache.cache_set(key, {"items": [1]})
+    assert await redis_cache.cache_get(key) == {"items": [1]}
+
+    await redis_cache.cache_bump_namespace("student:1:assignments")
+    new_key = await redis_cache.cache_namespace_key("student:1:assignments", "all:20:0")
+    assert await redis_cache.cache_get(new_key) is None
+
+
+@pytest.mark.asyncio
+async def test_bump_does_not_affect_other_namespaces(fake_redis: FakeRedis) -> None:
+    other = await redis_cache.cache_namespace_key("student:2:assignments", "x")
+    await redis_cache.cache_bump_namespace("student:1:assignments")
+    assert await redis_cache.cache_namespace_key("student:2:assignments", "x") == other
+
+
+@pytest.mark.asyncio
+async def test_invalidate_for_event_bumps_without_scan(fake_redis: FakeRedis) -> None:
+    assignments = await redis_cache.cache_namespace_key("student:42:assignments")
+    progress = await redis_cache.cache_namespace_key("student:42:progress", "week")
+    fake_redis.store["student:42:badges"] = "[]"
+
+    await invalidate_for_event("assignment_submitted", user_id="42")
+
+    assert fake_redis.scan_calls == 0
+    assert await redis_cache.cache_namespace_key("student:42:assignments") != (
+        assignments
+    )
+    assert (
+        await redis_cache.cache_namespace_key("student:42:progress", "week") != progress
+    )
+    # Skill profile and badges wait for skill attribution
+    assert "student:42:badges" in fake_redis.store
+
+    await invalidate_for_event("skill_scores_attributed", user_id="42")
+    assert "student:42:badges" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_namespace_key_without_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_cache, "_redis_client", None)
+    key = await redis_cache.cache_namespace_key("books", "teacher:1")
+    assert key == "books:v0:teacher:1"
+    # Bump is a no-op without Redis
+    await redis_cache.cache_bump_namespace("books")
+
+
+@pytest.mark.asyncio
+async def test_l1_serves_hot_keys_without_redis(fake_redis: FakeRedis) -> None:
+    await redis_cache.cache_set("auth:user:1", {"id": "1"})
+    # Remove from Redis: a hit must now come from the in-process tier
+    fake_redis.store.pop("auth:user:1")
+    assert await redis_cache.cache_get("auth:user:1") == {"id": "1"}
+    assert redis_cache.l1_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_l1_ignores_non_hot_keys(fake_redis: FakeRedis) -> None:
+    await redis_cache.cache_set("admin:dashboard:stats", {"n": 1})
+    fake_redis.store.pop("admin:dashboard:stats")
+    assert await redis_cache.cache_get("admin:dashboard:stats") is None
+
+
+@pytest.mark.asyncio
+async def test_event_broadcasts_l1_invalidation(fake_redis: FakeRedis) -> None:
+    await redis_cache.cache_set("auth:user:7", {"id": "7"})
+
+    await invalidate_for_event("user_profile_updated", user_id="7")
+
+    assert await redis_cache.cache_get("auth:user:7") is None
+    assert len(fake_redis.published) == 1
+    channel, message = fake_redis.published[0]
+    assert channel == redis_cache.L1_INVALIDATION_CHANNEL
+    assert b"auth:user:7" in message
+
+
+@pytest.mark.asyncio
+async def test_applying_broadcast_drops_l1_entries(fake_redis: FakeRedis) -> None:
+    books_key = await redis_cache.cache_namespace_key("books", "teacher:1")
+    await redis_cache.cache_set(books_key, {"items": []})
+    await redis_cache.cache_set("auth:user:9", {"id": "9"})
+
+    # Simulate another worker bumping "books" and updating user 9
+    fake_redis.store.pop("auth:user:9")
+    await fake_redis.eval("", 1, "__ns__:books", "0")
+    await redis_cache._dispatch_invalidation(
+        redis_cache.L1_INVALIDATION_CHANNEL,
+        b'{"keys": ["auth:user:9"], "namespaces": ["books"], "origin": "other"}',
+    )
+
+    assert await redis_cache.cache_get("auth:user:9") is None
+    assert await redis_cache.cache_namespace_key("books", "teacher:1") != books_key
+
+
+class FlakyPubSub:
+    """Pub/sub stand-in whose first subscription drops the connection."""
+
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    async def subscribe(self, *_: str) -> None:
+        if "subscribed" not in self.events:
+            self.events.append("subscribed")
+            raise ConnectionError("connection reset")
+        self.events.append("resubscribed")
+
+    async def get_message(self, **_: Any) -> None:
+        raise asyncio.CancelledError
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_clears_every_consumer(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: list[str] = []
+    fake_redis.pubsub = lambda **_: FlakyPubSub(events)
+    monkeypatch.setattr(redis_cache.asyncio, "sleep", AsyncMock())
+    monkeypatch.setattr(redis_cache, "_invalidation_handlers", {"a": None, "b": None})
+
+    async def clear_b() -> None:
+        events.append("cleared b")
+
+    monkeypatch.setattr(
+        redis_cache,
+        "_invalidation_resyncs",
+        {"a": lambda: events.append("cleared a"), "b": clear_b},
+    )
+    with pytest.raises(asyncio.CancelledError):
+        await redis_cache._invalidation_listener_loop()
+
+    # Consumers are cleared only once the subscription is back
+    assert events == ["subscribed", "resubscribed", "cleared a", "cleared b"]
@@ -0,0 +1,217 @@
+"""
+Tests for the access-driven DCS cache warmup.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from app.services import cache_warmup
+from app.services.dcs_cache import CacheKeys, DCSCache
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def zincrby(self, *args: Any) -> None:
+        self.ops.append(("zincrby", args))
+
+    def zremrangebyrank(self, *args: Any) -> None:
+        self.ops.append(("zremrangebyrank", args))
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self.client, op)(*args) for op, args in self.ops]
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in with sorted-set commands."""
+
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.store: dict[str, Any] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def zincrby(self, name: str, amount: float, member: str) -> float:
+        zset = self.zsets.setdefault(name, {})
+        zset[member] = zset.get(member, 0) + amount
+        return zset[member]
+
+    async def zremrangebyrank(self, name: str, start: int, end: int) -> int:
+        ranked = sorted(self.zsets.get(name, {}).items(), key=lambda i: i[1])
+        stop = len(ranked) + end + 1 if end < 0 else end + 1
+        removed = ranked[start:stop]
+        for member, _ in removed:
+            del self.zsets[name][member]
+        return len(removed)
+
+    async def zrevrange(self, name: str, start: int, end: int) -> list[str]:
+        ranked = sorted(self.zsets.get(name, {}).items(), key=lambda i: -i[1])
+        return [member for member, _ in ranked[start : end + 1]]
+
+    async def zunionstore(self, dest: str, keys: dict[str, float]) -> int:
+        ((source, weight),) = keys.items()
+        self.zsets[dest] = {m: s * weight for m, s in self.zsets[source].items()}
+        return len(self.zsets[dest])
+
+    async def set(self, key: str, value: Any, nx: bool = False, **_: Any) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeRedis]:
+    client = FakeRedis()
+
+    async def get_redis() -> FakeRedis:
+        return client
+
+    monkeypatch.setattr(cache_warmup, "get_redis", get_redis)
+    cache_warmup._pending.clear()
+    yield client
+    cache_warmup._pending.clear()
+
+
+@pytest.fixture
+def warmed(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    """Replace the registered warmers with recorders."""
+    calls: list[tuple[str, ...]] = []
+
+    async def warm(*args: str) -> None:
+        calls.append(args)
+
+    monkeypatch.setattr(
+        cache_warmup,
+        "_warmers",
+        [(pattern, warm) for pattern, _ in cache_warmup._warmers],
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_tracked_cache_records_lookups(fake_redis: FakeRedis) -> None:
+    fake_redis.store[cache_warmup._DECAY_LOCK_KEY] = 1  # decayed recently
+    cache = DCSCache(track_access=True)
+    await cache.get(CacheKeys.book_config("7"))
+    await cache.get(CacheKeys.book_config("7"))
+    await cache.get_or_fetch(CacheKeys.ai_modules(3), _fetch_none)
+    # No warmer for presigned audio URLs, so they are not ranked
+    await cache.get(CacheKeys.ai_audio_url(3, "en", "cat"))
+
+    assert await cache_warmup.flush_access_counts() == 2
+    assert fake_redis.zsets[cache_warmup.HOT_KEYS_KEY] == {
+        "dcs:books:config:7": 2,
+        "dcs:ai:modules:3": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_untracked_cache_records_nothing(fake_redis: FakeRedis) -> None:
+    await DCSCache().get(CacheKeys.book_config("7"))
+    assert await cache_warmup.flush_access_counts() == 0
+
+
+@pytest.mark.asyncio
+async def test_decay_runs_once_per_interval(fake_redis: FakeRedis) -> None:
+    for _ in range(4):
+        cache_warmup.record_access("dcs:books:id:1")
+    await cache_warmup.flush_access_counts()
+    assert fake_redis.zsets[cache_warmup.HOT_KEYS_KEY]["dcs:books:id:1"] == 2
+
+    for _ in range(4):
+        cache_warmup.record_access("dcs:books:id:1")
+    await cache_warmup.flush_access_counts()
+    assert fake_redis.zsets[cache_warmup.HOT_KEYS_KEY]["dcs:books:id:1"] == 6
+
+
+@pytest.mark.asyncio
+async def test_warmup_prefetches_hottest_keys(
+    fake_redis: FakeRedis, warmed: list[tuple[str, ...]]
+) -> None:
+    fake_redis.zsets[cache_warmup.HOT_KEYS_KEY] = {
+        "dcs:books:config:1": 50,
+        "dcs:ai:vocabulary:1:4": 40,
+        "dcs:ai:modules:metadata:2": 30,
+        "dcs:books:id:9": 1,
+        "dcs:unknown:key": 45,
+    }
+
+    result = await cache_warmup.warm_dcs_cache(top_n=4, concurrency=2)
+
+    assert result == {"warmed": 4, "failed": 0, "skipped": 1}
+    # The publisher list is always warmed; the coldest key is past top_n
+    assert sorted(warmed) == [(), ("1",), ("1", "4"), ("2",)]
+
+
+@pytest.mark.asyncio
+async def test_warmup_bounds_concurrency_and_survives_failures(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_redis.zsets[cache_warmup.HOT_KEYS_KEY] = {
+        f"dcs:books:id:{i}": float(i) for i in range(10)
+    }
+    active = 0
+    peak = 0
+
+    async def warm(book_id: str = "0") -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if book_id == "3":
+            raise RuntimeError("DCS down")
+
+    monkeypatch.setattr(
+        cache_warmup, "_warmers", [(p, warm) for p, _ in cache_warmup._warmers]
+    )
+
+    result = await cache_warmup.warm_dcs_cache(top_n=10, concurrency=3)
+
+    assert peak == 3
+    assert result == {"warmed": 10, "failed": 1, "skipped": 0}
+
+
+@pytest.mark.asyncio
+async def test_warmup_does_not_count_its_own_lookups(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = DCSCache(track_access=True)
+
+    async def warm(*_: str) -> None:
+        await cache.get(CacheKeys.PUBLISHER_LIST)
+
+    monkeypatch.setattr(
+        cache_warmup, "_warmers", [(p, warm) for p, _ in cache_warmup._warmers]
+    )
+
+    await cache_warmup.warm_dcs_cache(top_n=10, concurrency=1)
+
+    assert await cache_warmup.flush_access_counts() == 0
+
+
+@pytest.mark.asyncio
+async def test_without_redis_warmup_falls_back_to_publishers(
+    monkeypatch: pytest.MonkeyPatch, warmed: list[tuple[str, ...]]
+) -> None:
+    async def get_redis() -> None:
+        return None
+
+    monkeypatch.setattr(cache_warmup, "get_redis", get_redis)
+    cache_warmup.record_access("dcs:books:id:1")
+
+    assert await cache_warmup.flush_access_counts() == 0
+    result = await cache_warmup.warm_dcs_cache(top_n=10, concurrency=2)
+    assert result == {"warmed": 1, "failed": 0, "skipped": 0}
+    assert warmed == [()]
+
+
+async def _fetch_none() -> None:
+    return None
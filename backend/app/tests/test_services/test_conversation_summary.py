@@ -0,0 +1,175 @@
+"""
+Tests for the conversation summaries behind the message inbox.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import ConversationSummary, DirectMessage, User, UserRole
+from app.services.message_service import get_conversations, get_unread_messages_count
+
+
+@pytest_asyncio.fixture(name="users")
+async def users_fixture(async_session: AsyncSession) -> list[User]:
+    """A teacher and three students."""
+    users = [
+        User(username="inboxteacher", hashed_password="x", role=UserRole.teacher)
+    ] + [
+        User(
+            username=f"inbox{name.lower()}",
+            full_name=name,
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        for name in ("Ada", "Ben", "Cem")
+    ]
+    async_session.add_all(users)
+    await async_session.commit()
+    return users
+
+
+async def _summary(
+    session: AsyncSession, user: User, partner: User
+) -> ConversationSummary | None:
+    result = await session.execute(
+        select(ConversationSummary)
+        .where(
+            ConversationSummary.user_id == user.id,
+            ConversationSummary.partner_id == partner.id,
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+def _message(
+    sender: User, recipient: User, body: str, sent_at: datetime
+) -> DirectMessage:
+    return DirectMessage(
+        sender_id=sender.id, recipient_id=recipient.id, body=body, sent_at=sent_at
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_updates_both_sides(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    teacher, ada = users[0], users[1]
+    now = datetime.now(UTC)
+    async_session.add(_message(teacher, ada, "Hello", now - timedelta(minutes=5)))
+    async_session.add(_message(ada, teacher, "Hi! " + "x" * 200, now))
+    await async_session.commit()
+
+    teacher_side = await _summary(async_session, teacher, ada)
+    ada_side = await _summary(async_session, ada, teacher)
+    assert teacher_side.last_message_preview == ada_side.last_message_preview
+    assert teacher_side.last_message_preview.startswith("Hi! ")
+    assert len(teacher_side.last_message_preview) == 100
+    assert (teacher_side.unread_count, ada_side.unread_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_read_state_recounts_unread(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    teacher, ada = users[0], users[1]
+    messages = [
+        _message(ada, teacher, f"Question {i}", datetime.now(UTC)) for i in range(3)
+    ]
+    async_session.add_all(messages)
+    await async_session.commit()
+    assert await get_unread_messages_count(async_session, teacher.id) == 3
+
+    messages[0].is_read = True
+    await async_session.commit()
+    assert (await _summary(async_session, teacher, ada)).unread_count == 2
+    assert await get_unread_messages_count(async_session, teacher.id) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_messages_create_one_summary_per_recipient(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    teacher, students = users[0], users[1:]
+    now = datetime.now(UTC)
+    async_session.add_all(
+        [
+            DirectMessage(
+                sender_id=teacher.id,
+                recipient_id=student.id,
+                body="New assignment",
+                sent_at=now,
+                is_system=True,
+            )
+            for student in students
+        ]
+    )
+    await async_session.commit()
+
+    _, total, total_unread, _ = await get_conversations(async_session, teacher.id)
+    assert total == 3
+    assert total_unread == 0
+    for student in students:
+        assert await get_unread_messages_count(async_session, student.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_deleted_message_rebuilds_summary(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    teacher, ada = users[0], users[1]
+    now = datetime.now(UTC)
+    older = _message(teacher, ada, "First", now - timedelta(hours=1))
+    newer = _message(ada, teacher, "Second", now)
+    async_session.add_all([older, newer])
+    await async_session.commit()
+
+    await async_session.delete(newer)
+    await async_session.commit()
+    summary = await _summary(async_session, teacher, ada)
+    assert (summary.last_message_preview, summary.unread_count) == ("First", 0)
+
+    await async_session.delete(older)
+    await async_session.commit()
+    assert await _summary(async_session, teacher, ada) is None
+    assert await _summary(async_session, ada, teacher) is None
+
+
+@pytest.mark.asyncio
+async def test_conversations_keyset_pagination(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    teacher, students = users[0], users[1:]
+    now = datetime.now(UTC)
+    async_session.add_all(
+        [
+            _message(student, teacher, f"From {student.full_name}", now - timedelta(i))
+            for i, student in enumerate(students)
+        ]
+    )
+    await async_session.commit()
+
+    first_page, total, total_unread, cursor = await get_conversations(
+        async_session, teacher.id, limit=2
+    )
+    assert [c.participant_name for c in first_page] == ["Ada", "Ben"]
+    assert (total, total_unread) == (3, 3)
+    assert cursor is not None
+
+    second_page, _, _, next_cursor = await get_conversations(
+        async_session, teacher.id, limit=2, cursor=cursor
+    )
+    assert [c.participant_name for c in second_page] == ["Cem"]
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected(
+    async_session: AsyncSession, users: list[User]
+) -> None:
+    with pytest.raises(ValueError):
+        await get_conversations(async_session, users[0].id, cursor="not-a-cursor")
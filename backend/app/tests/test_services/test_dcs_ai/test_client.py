@@ -21,6 +21,7 @@ from app.services.dcs_ai.exceptions import (
     DCSAIDataAuthError,
     DCSAIDataConnectionError,
 )
+from app.services.dcs_cache import NOT_FOUND, CacheKeys
 from app.services.dream_storage_client import (
     DreamStorageAuthError,
     DreamStorageNotFoundError,
@@ -45,7 +46,9 @@ def mock_cache():
     """Mock DCSCache for testing."""
     cache = MagicMock()
     cache.get = AsyncMock(return_value=None)
+    cache.lookup = AsyncMock(return_value=None)
     cache.set = AsyncMock()
+    cache.set_not_found = AsyncMock()
     cache.invalidate = AsyncMock(return_value=True)
     cache.invalidate_pattern = AsyncMock(return_value=0)
     return cache
@@ -187,6 +190,23 @@ async def test_get_processing_status_returns_none_for_404(
 
     # Assert
     assert result is None
+    mock_cache.set_not_found.assert_awaited_once_with(CacheKeys.ai_metadata(999))
+
+
+@pytest.mark.asyncio
+async def test_get_processing_status_tombstone_skips_dcs(
+    dcs_ai_client, mock_dcs_client, mock_cache
+):
+    """Test that a cached 404 is answered without calling DCS."""
+    # Arrange
+    mock_cache.lookup.return_value = NOT_FOUND
+
+    # Act
+    result = await dcs_ai_client.get_processing_status(book_id=999)
+
+    # Assert
+    assert result is None
+    mock_dcs_client._make_request.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -203,7 +223,7 @@ async def test_get_processing_status_uses_cache(
 
     # Simulate cache hit
     cached_metadata = ProcessingMetadata(**sample_metadata_response)
-    mock_cache.get.return_value = cached_metadata
+    mock_cache.lookup.return_value = cached_metadata
 
     # Act - second call should use cache
     result = await dcs_ai_client.get_processing_status(book_id=123)
@@ -461,6 +481,49 @@ async def test_get_audio_url_returns_none_for_404(
     assert result is None
 
 
+# ============================================================================
+# check_audio_exists Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_check_audio_exists_remembers_missing_audio(
+    dcs_ai_client, mock_dcs_client, mock_cache
+):
+    """Test that missing word audio is tombstoned and not re-requested."""
+    # Arrange
+    mock_dcs_client._make_request.side_effect = DreamStorageNotFoundError("Not found")
+
+    # Act
+    first = await dcs_ai_client.check_audio_exists(123, "en", "missing")
+    mock_cache.lookup.return_value = NOT_FOUND
+    second = await dcs_ai_client.check_audio_exists(123, "en", "missing")
+
+    # Assert
+    assert first is False
+    assert second is False
+    mock_cache.set_not_found.assert_awaited_once_with(
+        CacheKeys.ai_audio_url(123, "en", "missing")
+    )
+    assert mock_dcs_client._make_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_check_audio_exists_does_not_tombstone_errors(
+    dcs_ai_client, mock_dcs_client, mock_cache
+):
+    """Test that transient DCS errors are not cached as missing audio."""
+    # Arrange
+    mock_dcs_client._make_request.side_effect = DreamStorageServerError("Down")
+
+    # Act
+    result = await dcs_ai_client.check_audio_exists(123, "en", "word")
+
+    # Assert
+    assert result is False
+    mock_cache.set_not_found.assert_not_called()
+
+
 # ============================================================================
 # is_book_processed Tests
 # ============================================================================
@@ -5,11 +5,13 @@ Story 24.1: LMS Caching Infrastructure
 """
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.services.dcs_cache import (
+    NOT_FOUND,
     CacheEntry,
     CacheKeys,
     DCSCache,
@@ -237,6 +239,221 @@ class TestDCSCache:
 
         assert results == ["value1", "value2", "value3"]
 
+    @pytest.mark.asyncio
+    async def test_memory_budget_evicts_least_recently_used(self) -> None:
+        """Test that entries are evicted once the byte budget is exceeded."""
+        cache = DCSCache(default_ttl=60, max_bytes=20_000)
+        for i in range(10):
+            await cache.set(f"dcs:books:id:{i}", {"config": "x" * 5000})
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 20_000
+        assert stats["evictions"] > 0
+        assert await cache.get("dcs:books:id:0") is None
+        assert await cache.get("dcs:books:id:9") is not None
+
+
+class TestCoalescingAndStaleWhileRevalidate:
+    """Tests for single-flight fetches and soft/hard TTL handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Concurrent get_or_fetch calls for a key trigger one fetch."""
+        cache = DCSCache(default_ttl=300)
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "fresh"
+
+        waiters = [
+            asyncio.ensure_future(cache.get_or_fetch("books", fetch)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert results == ["fresh"] * 5
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 4
+        assert cache.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_fetch_keeps_a_newer_inflight_entry(self) -> None:
+        """A completed fetch does not unregister the fetch that replaced it."""
+        cache = DCSCache(default_ttl=300)
+        first, second = asyncio.Event(), asyncio.Event()
+
+        def fetch(release: asyncio.Event) -> Callable[[], Awaitable[str]]:
+            async def run() -> str:
+                await release.wait()
+                return "fresh"
+
+            return run
+
+        older = cache._start_fetch("books", fetch(first), None)
+        newer = cache._start_fetch("books", fetch(second), None)
+        first.set()
+        await older
+        await asyncio.sleep(0)
+
+        assert cache._inflight["books"] is newer
+        second.set()
+        await newer
+        await asyncio.sleep(0)
+        assert cache.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates_to_all_waiters(self) -> None:
+        """A failed shared fetch raises for every waiter and is not cached."""
+        cache = DCSCache(default_ttl=300)
+        fetch_fn = AsyncMock(side_effect=RuntimeError("DCS down"))
+
+        results = await asyncio.gather(
+            cache.get_or_fetch("books", fetch_fn),
+            cache.get_or_fetch("books", fetch_fn),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        fetch_fn.assert_called_once()
+        assert await cache.get("books") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self) -> None:
+        """After the soft TTL the stale value is returned and refreshed once."""
+        cache = DCSCache(default_ttl=300, stale_ttl=60)
+        await cache.set("books", "old", ttl=1)
+        await asyncio.sleep(1.1)
+
+        refreshed = asyncio.Event()
+
+        async def fetch() -> str:
+            refreshed.set()
+            return "new"
+
+        assert await cache.get_or_fetch("books", fetch) == "old"
+        assert await cache.get_or_fetch("books", fetch) == "old"
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert await cache.get_or_fetch("books", fetch) == "new"
+        stats = cache.stats()
+        assert stats["stale_hits"] == 2
+        assert stats["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self) -> None:
+        """A failing background refresh is counted and keeps the old value."""
+        cache = DCSCache(default_ttl=300, stale_ttl=60)
+        await cache.set("books", "old", ttl=1)
+        await asyncio.sleep(1.1)
+        fetch_fn = AsyncMock(side_effect=RuntimeError("DCS down"))
+
+        assert await cache.get_or_fetch("books", fetch_fn) == "old"
+        await asyncio.sleep(0.01)
+
+        assert cache.stats()["refresh_failures"] == 1
+        assert await cache.get_or_fetch("books", AsyncMock()) == "old"
+
+    @pytest.mark.asyncio
+    async def test_without_stale_window_expired_value_is_refetched(self) -> None:
+        """With stale_ttl=0 an expired entry blocks on a fresh fetch."""
+        cache = DCSCache(default_ttl=300)
+        await cache.set("books", "old", ttl=1)
+        await asyncio.sleep(1.1)
+        fetch_fn = AsyncMock(return_value="new")
+
+        assert await cache.get_or_fetch("books", fetch_fn) == "new"
+        fetch_fn.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_discards_result(self) -> None:
+        """A fetch started before an invalidation does not repopulate the key."""
+        cache = DCSCache(default_ttl=300)
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "outdated"
+
+        waiter = asyncio.ensure_future(cache.get_or_fetch("books", fetch))
+        await asyncio.sleep(0)
+        await cache.invalidate("books")
+        release.set()
+
+        assert await waiter == "outdated"
+        assert await cache.get("books") is None
+
+
+class TestNegativeCaching:
+    """Tests for not-found tombstones."""
+
+    @pytest.mark.asyncio
+    async def test_not_found_result_is_tombstoned(self) -> None:
+        """A None result is remembered and DCS is not asked again."""
+        cache = DCSCache(negative_ttl=60)
+        fetch = AsyncMock(return_value=None)
+
+        assert await cache.get_or_fetch("book", fetch, cache_not_found=True) is None
+        assert await cache.get_or_fetch("book", fetch, cache_not_found=True) is None
+
+        fetch.assert_awaited_once()
+        assert cache.stats()["negative_hits"] == 1
+        assert await cache.lookup("book") is NOT_FOUND
+        assert await cache.get("book") is None
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_tombstoned_by_default(self) -> None:
+        """Without cache_not_found a None result is fetched again."""
+        cache = DCSCache()
+        fetch = AsyncMock(return_value=None)
+
+        await cache.get_or_fetch("book", fetch)
+        await cache.get_or_fetch("book", fetch)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tombstones_count_against_the_memory_budget(self) -> None:
+        """Many misses are evicted under the byte budget like real entries."""
+        cache = DCSCache(max_bytes=5_000)
+        for i in range(200):
+            await cache.set_not_found(f"dcs:ai:audio:1:en:word{i}")
+
+        stats = cache.stats()
+        assert 0 < stats["bytes"] <= 5_000
+        assert stats["entries"] < 200
+
+    @pytest.mark.asyncio
+    async def test_tombstone_expires_after_negative_ttl(self) -> None:
+        """Tombstones use the short negative TTL and get no stale window."""
+        cache = DCSCache(default_ttl=300, stale_ttl=600, negative_ttl=1)
+        fetch = AsyncMock(side_effect=[None, "book"])
+
+        await cache.get_or_fetch("book", fetch, cache_not_found=True)
+        await asyncio.sleep(1.1)
+
+        assert await cache.get_or_fetch("book", fetch, cache_not_found=True) == "book"
+
+    @pytest.mark.asyncio
+    async def test_clear_tombstones_keeps_real_entries(self) -> None:
+        """Clearing tombstones leaves cached values alone."""
+        cache = DCSCache()
+        await cache.set_not_found(CacheKeys.book_by_id("1"))
+        await cache.set_not_found(CacheKeys.ai_metadata(1))
+        await cache.set(CacheKeys.book_by_id("2"), "book")
+
+        assert await cache.clear_tombstones("dcs:books:") == 1
+        assert await cache.lookup(CacheKeys.book_by_id("1")) is None
+        assert await cache.lookup(CacheKeys.ai_metadata(1)) is NOT_FOUND
+
+        assert await cache.clear_tombstones() == 1
+        assert await cache.get(CacheKeys.book_by_id("2")) == "book"
+
 
 class TestCacheKeys:
     """Tests for CacheKeys helper class."""
@@ -7,10 +7,18 @@ Tests that cache invalidation patterns work correctly for webhook events.
 """
 
 import uuid
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from app.services.dcs_cache import CacheKeys, DCSCache, get_dcs_cache, reset_dcs_cache
+from app.services.dcs_cache import (
+    DCS_INVALIDATION_CHANNEL,
+    CacheKeys,
+    DCSCache,
+    get_dcs_cache,
+    reset_dcs_cache,
+)
 
 
 @pytest.fixture
@@ -248,3 +256,72 @@ class TestCacheKeyConsistency:
         assert book_id in CacheKeys.book_by_id(book_id)
         assert book_id in CacheKeys.book_config(book_id)
         assert pub_id in CacheKeys.books_by_publisher(pub_id)
+
+
+class TestCrossWorkerInvalidation:
+    """Invalidations on one worker's cache reach the other workers."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_is_applied_on_other_worker(self) -> None:
+        """A key invalidated on worker A is dropped from worker B."""
+        worker_a = DCSCache(broadcast=True)
+        worker_b = DCSCache(broadcast=True)
+        await worker_a.set(CacheKeys.BOOK_LIST, ["book1"])
+        await worker_b.set(CacheKeys.BOOK_LIST, ["book1"])
+        await worker_b.set(CacheKeys.books_by_publisher("pub-1"), ["book1"])
+
+        published: list[tuple[str, dict[str, Any]]] = []
+
+        async def fake_publish(channel: str, payload: dict[str, Any]) -> None:
+            published.append((channel, payload))
+            await worker_b.apply_remote_invalidation(payload)
+
+        with patch("app.services.dcs_cache.publish_invalidation", fake_publish):
+            await worker_a.invalidate(CacheKeys.BOOK_LIST)
+            await worker_a.invalidate_pattern("dcs:books:publisher:")
+
+        assert [channel for channel, _ in published] == [
+            DCS_INVALIDATION_CHANNEL,
+            DCS_INVALIDATION_CHANNEL,
+        ]
+        assert await worker_a.get(CacheKeys.BOOK_LIST) is None
+        assert await worker_b.get(CacheKeys.BOOK_LIST) is None
+        assert await worker_b.get(CacheKeys.books_by_publisher("pub-1")) is None
+
+    @pytest.mark.asyncio
+    async def test_clear_is_applied_on_other_worker(self) -> None:
+        """Clearing one worker's cache clears the others."""
+        worker_b = DCSCache()
+        await worker_b.set(CacheKeys.PUBLISHER_LIST, ["pub"])
+
+        await worker_b.apply_remote_invalidation({"clear": True})
+
+        assert await worker_b.get(CacheKeys.PUBLISHER_LIST) is None
+
+    @pytest.mark.asyncio
+    async def test_tombstones_are_cleared_on_other_worker(self) -> None:
+        """Clearing tombstones on worker A clears them on worker B."""
+        worker_a = DCSCache(broadcast=True)
+        worker_b = DCSCache(broadcast=True)
+        await worker_b.set_not_found(CacheKeys.ai_metadata(7))
+
+        async def fake_publish(channel: str, payload: dict[str, Any]) -> None:
+            await worker_b.apply_remote_invalidation(payload)
+
+        with patch("app.services.dcs_cache.publish_invalidation", fake_publish):
+            await worker_a.clear_tombstones()
+
+        assert await worker_b.lookup(CacheKeys.ai_metadata(7)) is None
+
+    @pytest.mark.asyncio
+    async def test_non_broadcast_cache_does_not_publish(self) -> None:
+        """Ad-hoc caches stay local to their owner."""
+        cache = DCSCache()
+        with patch("app.services.dcs_cache.publish_invalidation") as publish:
+            await cache.invalidate(CacheKeys.BOOK_LIST)
+            await cache.clear()
+        publish.assert_not_called()
+
+    def test_singleton_broadcasts(self, fresh_cache: DCSCache) -> None:
+        """The shared singleton is wired to the invalidation bus."""
+        assert fresh_cache._broadcast is True
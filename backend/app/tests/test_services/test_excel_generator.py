@@ -0,0 +1,94 @@
+"""
+Tests for the write-only Excel report generator.
+"""
+
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from app.services.excel_generator import (
+    ALT_ROW_FILL,
+    HEADER_FILL,
+    generate_excel_report,
+)
+
+CLASS_DATA = {
+    "class_name": "6C",
+    "teacher_name": "Ms Teacher",
+    "student_count": 3,
+    "period_start": "2026-09-01",
+    "period_end": "2026-09-30",
+    "summary": {
+        "avg_score": 77.25,
+        "total_completed": 3,
+        "completion_rate": 1.0,
+        "total_assigned": 3,
+    },
+    "trend": {"direction": "up", "change": 5.0, "current": 77.2, "previous": 72.2},
+    "score_distribution": [
+        {"range_label": "0-59%", "count": 1},
+        {"range_label": "90-100%", "count": 1},
+    ],
+    "top_students": [{"rank": 1, "name": "Ada", "avg_score": 95}],
+    "struggling_students": [],
+    "assignments": [
+        {"name": f"Reading - {i}", "avg_score": 70 + i, "completion_rate": 0.5}
+        for i in range(3)
+    ],
+    "skill_breakdown": [{"skill_name": "Reading", "avg_score": 71, "count": 3}],
+    "narrative": "Steady progress.",
+}
+
+
+def test_class_report_layout(tmp_path: Path) -> None:
+    path = tmp_path / "report.xlsx"
+    generate_excel_report(CLASS_DATA, "class", None, str(path))
+
+    wb = load_workbook(path)
+    assert wb.sheetnames == ["Summary", "Details", "Charts"]
+
+    summary = wb["Summary"]
+    assert summary["A1"].value == "Class Report"
+    assert {str(r) for r in summary.merged_cells.ranges} == {"A1:D1", "A23:D23"}
+    assert summary["A23"].value == "Steady progress."
+    assert summary["A23"].alignment.wrap_text
+    assert summary.column_dimensions["B"].width == 35
+
+    details = wb["Details"]
+    rows = list(details.iter_rows(values_only=True))
+    assert rows[:4] == [
+        ("Score Distribution", None, None),
+        ("Score Range", "Number of Students", None),
+        ("0-59%", 1, None),
+        ("90-100%", 1, None),
+    ]
+    assert rows[-4:] == [
+        ("Assignment", "Average Score", "Completion Rate"),
+        ("Reading - 0", "70.0%", "50%"),
+        ("Reading - 1", "71.0%", "50%"),
+        ("Reading - 2", "72.0%", "50%"),
+    ]
+    assert details["A2"].fill.fgColor.rgb == HEADER_FILL.fgColor.rgb
+    assert details["A4"].fill.fgColor.rgb == ALT_ROW_FILL.fgColor.rgb
+    assert details["A3"].fill.fill_type is None
+    assert details["A3"].border.left.style == "thin"
+
+
+def test_charts_reference_their_data(tmp_path: Path) -> None:
+    path = tmp_path / "report.xlsx"
+    generate_excel_report(CLASS_DATA, "class", None, str(path))
+
+    charts = load_workbook(path)["Charts"]
+    assert [c.value for c in charts["A"]][:4] == [
+        "Average Score by Skill",
+        None,
+        "Skill",
+        "Reading",
+    ]
+    # Score distribution table starts three rows after the skill table
+    assert charts["A8"].value == "Score Distribution"
+    assert charts["A10"].value == "Score Range"
+    assert [c.value for c in charts["B"]][10:12] == [1, 1]
+    skill_chart, distribution_chart = charts._charts
+    assert skill_chart.series[0].val.numRef.f == "'Charts'!$B$4"
+    assert distribution_chart.series[0].val.numRef.f == "'Charts'!$B$11:$B$12"
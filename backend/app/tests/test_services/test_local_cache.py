@@ -0,0 +1,144 @@
+"""
+Tests for the bounded in-process LocalLRUCache.
+"""
+
+import time
+
+from app.services.local_cache import (
+    LocalLRUCache,
+    estimate_size,
+    sweep_registered_caches,
+)
+
+
+def test_get_set_roundtrip() -> None:
+    cache = LocalLRUCache(max_bytes=1024, default_ttl=60)
+    cache.set("a", {"x": 1}, size=10)
+    assert cache.get("a") == {"x": 1}
+    assert cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] == 10
+
+
+def test_expired_entries_are_dropped() -> None:
+    cache = LocalLRUCache(max_bytes=1024, default_ttl=60)
+    cache.set("a", 1, size=1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_evicts_least_recently_used_over_budget() -> None:
+    cache = LocalLRUCache(max_bytes=30, default_ttl=60)
+    cache.set("a", "a", size=10)
+    cache.set("b", "b", size=10)
+    cache.set("c", "c", size=10)
+    # Touch "a" so "b" becomes the LRU entry
+    assert cache.get("a") == "a"
+
+    cache.set("d", "d", size=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("d") == "d"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 30
+
+
+def test_oversized_value_is_not_cached() -> None:
+    cache = LocalLRUCache(max_bytes=10, default_ttl=60)
+    cache.set("big", "x" * 100, size=100)
+    assert cache.get("big") is None
+
+
+def test_overwrite_updates_byte_accounting() -> None:
+    cache = LocalLRUCache(max_bytes=100, default_ttl=60)
+    cache.set("a", "v1", size=40)
+    cache.set("a", "v2", size=20)
+    assert cache.get("a") == "v2"
+    assert cache.stats()["bytes"] == 20
+
+
+def test_invalidate_many() -> None:
+    cache = LocalLRUCache(max_bytes=100, default_ttl=60)
+    cache.set("a", 1, size=1)
+    cache.set("b", 2, size=1)
+    cache.set("c", 3, size=1)
+    assert cache.invalidate_many(["a", "b", "zzz"]) == 2
+    assert cache.get("c") == 3
+    assert cache.invalidate("c") is True
+    assert cache.invalidate("c") is False
+
+
+def test_invalidate_prefix() -> None:
+    cache = LocalLRUCache(max_bytes=100, default_ttl=60)
+    cache.set("dcs:books:1", 1, size=1)
+    cache.set("dcs:books:2", 2, size=1)
+    cache.set("dcs:publishers:1", 3, size=1)
+    assert cache.invalidate_prefix("dcs:books:") == 2
+    assert cache.keys() == ["dcs:publishers:1"]
+    assert cache.stats()["bytes"] == 1
+
+
+def test_purge_expired_frees_memory_without_access() -> None:
+    cache = LocalLRUCache(max_bytes=100, default_ttl=60)
+    cache.set("short", 1, size=10, ttl=0.01)
+    cache.set("long", 2, size=10)
+    time.sleep(0.02)
+    assert cache.purge_expired() == 1
+    assert "short" not in cache
+    assert len(cache) == 1
+    assert cache.stats()["bytes"] == 10
+    assert cache.stats()["expirations"] == 1
+
+
+def test_size_is_estimated_when_not_given() -> None:
+    cache = LocalLRUCache(max_bytes=10_000, default_ttl=60)
+    cache.set("small", "x")
+    small = cache.stats()["bytes"]
+    cache.set("large", {"items": ["x" * 1000, "y" * 1000]})
+    assert cache.stats()["bytes"] - small > 2000
+
+
+def test_estimate_size_grows_with_content() -> None:
+    assert estimate_size(b"x" * 500) > estimate_size(b"x" * 10)
+    assert estimate_size({"a": ["x" * 300]}) > 300
+    assert estimate_size([{"n": i} for i in range(100)]) > estimate_size([{"n": 1}])
+
+
+def test_tinylfu_keeps_frequent_keys_over_one_off_keys() -> None:
+    cache = LocalLRUCache(max_bytes=30, default_ttl=60, admission="tinylfu")
+    for key in ("a", "b", "c"):
+        cache.set(key, key, size=10)
+        for _ in range(5):
+            cache.get(key)
+
+    # A scan of one-off keys must not flush the hot working set
+    for i in range(20):
+        cache.set(f"scan:{i}", i, size=10)
+
+    assert sorted(cache.keys()) == ["a", "b", "c"]
+    assert cache.stats()["rejections"] == 20
+
+
+def test_tinylfu_admits_key_once_it_becomes_popular() -> None:
+    cache = LocalLRUCache(max_bytes=10, default_ttl=60, admission="tinylfu")
+    cache.set("old", 1, size=10)
+    for _ in range(3):
+        cache.get("new")
+
+    assert cache.set("new", 2, size=10) is True
+    assert cache.get("new") == 2
+    assert "old" not in cache
+
+
+def test_sweep_registered_caches_purges_named_caches() -> None:
+    cache = LocalLRUCache(max_bytes=100, default_ttl=60, name="test_sweep")
+    cache.set("a", 1, size=1, ttl=0.01)
+    time.sleep(0.02)
+    assert sweep_registered_caches() >= 1
+    assert len(cache) == 0
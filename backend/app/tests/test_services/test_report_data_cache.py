@@ -0,0 +1,265 @@
+"""
+Tests for reusing report data between report jobs.
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Assignment,
+    AssignmentStatus,
+    AssignmentStudent,
+    Class,
+    ClassStudent,
+    ReportJobStatusEnum,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.schemas.reports import ReportGenerateRequest
+from app.services import report_data_cache
+from app.services.assignment_fanout import fan_out_assignment
+from app.services.report_data_cache import report_data_namespace
+from app.services.report_service import (
+    create_report_job,
+    generate_class_report_data,
+    get_report_job,
+    process_report_job,
+)
+
+
+@pytest_asyncio.fixture(name="classroom")
+async def classroom_fixture(async_session: AsyncSession) -> dict:
+    """A class with one enrolled student, another student and an assignment."""
+    school = School(name="Cache School", dcs_publisher_id=1)
+    teacher_user = User(
+        username="cacheteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    async_session.add(teacher)
+    await async_session.flush()
+    class_obj = Class(name="7B", teacher_id=teacher.id, school_id=school.id)
+    async_session.add(class_obj)
+
+    students = []
+    for name in ("Ada", "Ben"):
+        user = User(
+            username=f"cache{name.lower()}",
+            full_name=name,
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        async_session.add(user)
+        await async_session.flush()
+        student = Student(user_id=user.id)
+        async_session.add(student)
+        students.append(student)
+    await async_session.flush()
+    async_session.add(ClassStudent(class_id=class_obj.id, student_id=students[0].id))
+
+    assignment = Assignment(name="Reading 1", teacher_id=teacher.id, dcs_book_id=1)
+    async_session.add(assignment)
+    await async_session.commit()
+    return {
+        "teacher": teacher,
+        "class": class_obj,
+        "students": students,
+        "assignment": assignment,
+    }
+
+
+@pytest.fixture(name="bumped")
+def bumped_fixture():
+    """Namespaces bumped after commit."""
+    bumped: list[str] = []
+
+    async def bump(namespace: str) -> None:
+        bumped.append(namespace)
+
+    with patch.object(report_data_cache, "cache_bump_namespace", bump):
+        yield bumped
+
+
+async def _committed(session: AsyncSession) -> None:
+    await session.commit()
+    await asyncio.gather(*report_data_cache._bump_tasks)
+
+
+@pytest.mark.asyncio
+async def test_submission_bumps_student_class_and_teacher(
+    async_session: AsyncSession, classroom: dict, bumped: list[str]
+) -> None:
+    ada = classroom["students"][0]
+    async_session.add(
+        AssignmentStudent(
+            assignment_id=classroom["assignment"].id,
+            student_id=ada.id,
+            status=AssignmentStatus.completed,
+            score=90,
+            completed_at=datetime.now(UTC),
+        )
+    )
+    await _committed(async_session)
+
+    assert sorted(bumped) == sorted(
+        [
+            report_data_namespace("student", ada.id),
+            report_data_namespace("class", classroom["class"].id),
+            report_data_namespace("teacher", classroom["teacher"].id),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_progress_autosave_keeps_report_data(
+    async_session: AsyncSession, classroom: dict, bumped: list[str]
+) -> None:
+    ada = classroom["students"][0]
+    row = AssignmentStudent(
+        assignment_id=classroom["assignment"].id,
+        student_id=ada.id,
+        status=AssignmentStatus.in_progress,
+    )
+    async_session.add(row)
+    await _committed(async_session)
+    bumped.clear()
+
+    row.time_spent_minutes = 7
+    await _committed(async_session)
+    assert bumped == []
+
+    row.status = AssignmentStatus.completed
+    row.score = 80
+    await _committed(async_session)
+    assert report_data_namespace("student", ada.id) in bumped
+
+
+@pytest.mark.asyncio
+async def test_enrollment_and_bulk_assignment_bump_the_class(
+    async_session: AsyncSession, classroom: dict, bumped: list[str]
+) -> None:
+    ben = classroom["students"][1]
+    async_session.add(ClassStudent(class_id=classroom["class"].id, student_id=ben.id))
+    await _committed(async_session)
+    assert report_data_namespace("class", classroom["class"].id) in bumped
+
+    bumped.clear()
+    await fan_out_assignment(async_session, classroom["assignment"].id, [ben.id])
+    await _committed(async_session)
+    assert sorted(bumped) == sorted(
+        [
+            report_data_namespace("student", ben.id),
+            report_data_namespace("class", classroom["class"].id),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_does_not_abort_the_write(
+    async_session: AsyncSession, classroom: dict, bumped: list[str]
+) -> None:
+    ada = classroom["students"][0]
+    with patch.object(
+        report_data_cache, "_student_class_ids", side_effect=RuntimeError("boom")
+    ):
+        row = AssignmentStudent(
+            assignment_id=classroom["assignment"].id,
+            student_id=ada.id,
+            status=AssignmentStatus.completed,
+            score=70,
+        )
+        async_session.add(row)
+        await _committed(async_session)
+
+    assert bumped == []
+    async_session.expunge(row)
+    stored = await async_session.get(AssignmentStudent, row.id)
+    assert stored is not None and stored.score == 70
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_changes_bump_nothing(
+    async_session: AsyncSession, classroom: dict, bumped: list[str]
+) -> None:
+    classroom["class"].name = "7C"
+    await async_session.flush()
+    await async_session.rollback()
+    await _committed(async_session)
+
+    assert bumped == []
+
+
+@pytest.mark.asyncio
+async def test_report_data_is_reused_across_formats(
+    async_session: AsyncSession, classroom: dict
+) -> None:
+    cache: dict[str, object] = {}
+
+    async def cache_get(key: str) -> object:
+        return cache.get(key)
+
+    async def cache_set(key: str, value: object, ttl: int) -> None:
+        cache[key] = value
+
+    rendered = []
+
+    async def render(file_format, data, *_args) -> None:
+        rendered.append((file_format, data))
+
+    generate = AsyncMock(wraps=generate_class_report_data)
+    with (
+        patch("app.services.report_service.cache_get", cache_get),
+        patch("app.services.report_service.cache_set", cache_set),
+        patch("app.services.report_service.generate_class_report_data", generate),
+    ):
+        for file_format in ("pdf", "excel"):
+            job = await create_report_job(
+                async_session,
+                classroom["teacher"].id,
+                ReportGenerateRequest(
+                    report_type="class",
+                    period="month",
+                    target_id=str(classroom["class"].id),
+                    format=file_format,
+                ),
+            )
+            await process_report_job(async_session, job.id, render=render)
+            job = await get_report_job(async_session, job.id)
+            assert job.status == ReportJobStatusEnum.completed.value
+
+    generate.assert_awaited_once()
+    (pdf_format, pdf_data), (excel_format, excel_data) = rendered
+    assert (pdf_format, excel_format) == ("pdf", "excel")
+    assert pdf_data == excel_data
+    assert pdf_data["class_name"] == "7B"
+
+
+@pytest.mark.asyncio
+async def test_report_data_key_embeds_version_and_day() -> None:
+    target_id = uuid.uuid4()
+    # Bounds are keyed by day: a rolling period requested later that day hits
+    morning = [datetime(2026, 9, 1, 8, tzinfo=UTC)]
+    evening = [datetime(2026, 9, 1, 17, tzinfo=UTC)]
+
+    with patch.object(
+        report_data_cache,
+        "cache_namespace_key",
+        AsyncMock(side_effect=lambda ns, suffix: f"{ns}:v1:{suffix}"),
+    ):
+        key = await report_data_cache.report_data_key(
+            "class", target_id, "class", morning
+        )
+        assert key == await report_data_cache.report_data_key(
+            "class", target_id, "class", evening
+        )
+    assert key == f"class:{target_id}:report-data:v1:class:2026-09-01"
@@ -0,0 +1,128 @@
+"""
+Tests for report generation on the arq worker.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq import Retry
+
+from app.core.config import settings
+from app.models import ReportJobStatusEnum
+from app.services.report_queue import QUEUED_KEY, acquire_teacher_slot, enqueue_report
+from app.tasks.reports import REPORT_MAX_TRIES, task_generate_report
+
+TEACHER_ID = uuid.uuid4()
+
+
+def _ctx(job_try: int = 1) -> dict:
+    @asynccontextmanager
+    async def session_factory():
+        yield AsyncMock()
+
+    return {
+        "redis": AsyncMock(),
+        "db_session_factory": session_factory,
+        "report_executor": ThreadPoolExecutor(max_workers=1),
+        "job_try": job_try,
+    }
+
+
+@pytest.fixture(name="queue")
+def queue_fixture():
+    """Patch the Redis bookkeeping and the job itself out of the task."""
+    job = SimpleNamespace(
+        status=ReportJobStatusEnum.pending.value, teacher_id=TEACHER_ID
+    )
+    with (
+        patch("app.tasks.reports.get_report_job", AsyncMock(return_value=job)),
+        patch("app.tasks.reports.process_report_job", AsyncMock()) as process,
+        patch("app.tasks.reports.acquire_teacher_slot", AsyncMock()) as acquire,
+        patch("app.tasks.reports.release_teacher_slot", AsyncMock()) as release,
+        patch("app.tasks.reports.mark_running", AsyncMock()),
+        patch("app.tasks.reports.mark_finished", AsyncMock()) as finished,
+    ):
+        yield SimpleNamespace(
+            job=job,
+            process=process,
+            acquire=acquire,
+            release=release,
+            finished=finished,
+        )
+
+
+@pytest.mark.asyncio
+async def test_task_renders_in_the_process_pool(queue) -> None:
+    queue.acquire.return_value = True
+    job_id = uuid.uuid4()
+    ctx = _ctx()
+
+    await task_generate_report(ctx, str(job_id))
+
+    queue.process.assert_awaited_once()
+    render = queue.process.await_args.kwargs["render"]
+    with patch("app.tasks.reports.render_report_file") as render_file:
+        await render("pdf", {"a": 1}, "student", None, "/tmp/x.pdf")
+    render_file.assert_called_once_with("pdf", {"a": 1}, "student", None, "/tmp/x.pdf")
+    queue.release.assert_awaited_once_with(ctx["redis"], TEACHER_ID)
+    queue.finished.assert_awaited_once_with(ctx["redis"], job_id)
+
+
+@pytest.mark.asyncio
+async def test_task_defers_when_teacher_has_no_free_slot(queue) -> None:
+    queue.acquire.return_value = False
+
+    with pytest.raises(Retry):
+        await task_generate_report(_ctx(), str(uuid.uuid4()))
+
+    queue.process.assert_not_awaited()
+    queue.release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_task_runs_on_last_try_without_a_slot(queue) -> None:
+    queue.acquire.return_value = False
+
+    await task_generate_report(_ctx(job_try=REPORT_MAX_TRIES), str(uuid.uuid4()))
+
+    queue.process.assert_awaited_once()
+    queue.release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_task_skips_finished_jobs(queue) -> None:
+    queue.job.status = ReportJobStatusEnum.completed.value
+
+    await task_generate_report(_ctx(), str(uuid.uuid4()))
+
+    queue.acquire.assert_not_awaited()
+    queue.process.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_teacher_slot_limit() -> None:
+    redis = AsyncMock()
+    redis.incr.return_value = settings.REPORT_MAX_CONCURRENT_PER_TEACHER
+    assert await acquire_teacher_slot(redis, TEACHER_ID) is True
+    redis.decr.assert_not_awaited()
+
+    redis.incr.return_value = settings.REPORT_MAX_CONCURRENT_PER_TEACHER + 1
+    assert await acquire_teacher_slot(redis, TEACHER_ID) is False
+    redis.decr.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_leaves_no_queued_entry() -> None:
+    arq_pool = AsyncMock()
+    arq_pool.enqueue_job.side_effect = ConnectionError("down")
+    job_id = uuid.uuid4()
+
+    with pytest.raises(ConnectionError):
+        await enqueue_report(arq_pool, job_id)
+
+    arq_pool.zadd.assert_awaited_once()
+    arq_pool.zrem.assert_awaited_once_with(QUEUED_KEY, str(job_id))
@@ -0,0 +1,197 @@
+"""
+Tests for the scheduled jobs run on the arq worker.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Assignment,
+    AssignmentPublishStatus,
+    AssignmentStudent,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services import report_data_cache
+from app.services.assignment_scheduler import publish_scheduled_assignments
+from app.services.report_data_cache import report_data_namespace
+from app.tasks.scheduler import (
+    task_publish_scheduled_assignments,
+    task_refresh_benchmarks,
+)
+from app.worker import WorkerSettings
+
+
+@pytest_asyncio.fixture(name="school")
+async def school_fixture(async_session: AsyncSession) -> SimpleNamespace:
+    """A teacher with two students and a helper to schedule assignments."""
+    school = School(name="Scheduler School", dcs_publisher_id=1)
+    teacher_user = User(
+        username="schedteacher", hashed_password="x", role=UserRole.teacher
+    )
+    async_session.add_all([school, teacher_user])
+    await async_session.flush()
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    async_session.add(teacher)
+
+    student_users = [
+        User(username=f"sched{name}", hashed_password="x", role=UserRole.student)
+        for name in ("ada", "ben")
+    ]
+    async_session.add_all(student_users)
+    await async_session.flush()
+    students = [Student(user_id=user.id) for user in student_users]
+    async_session.add_all(students)
+    await async_session.commit()
+
+    async def schedule(
+        name: str, publish_in: timedelta, students: list[Student]
+    ) -> Assignment:
+        assignment = Assignment(
+            name=name,
+            teacher_id=teacher.id,
+            dcs_book_id=1,
+            status=AssignmentPublishStatus.scheduled,
+            scheduled_publish_date=datetime.now(UTC) + publish_in,
+        )
+        async_session.add(assignment)
+        await async_session.flush()
+        async_session.add_all(
+            AssignmentStudent(assignment_id=assignment.id, student_id=s.id)
+            for s in students
+        )
+        await async_session.commit()
+        return assignment
+
+    return SimpleNamespace(
+        teacher_user=teacher_user,
+        teacher=teacher,
+        student_users=student_users,
+        students=students,
+        schedule=schedule,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_flips_due_assignments_and_batches_invalidation(
+    async_session: AsyncSession, school: SimpleNamespace
+) -> None:
+    ada, ben = school.students
+    due = [
+        await school.schedule("Due 1", timedelta(minutes=-5), [ada, ben]),
+        await school.schedule("Due 2", timedelta(seconds=-1), [ada]),
+    ]
+    future = await school.schedule("Later", timedelta(hours=2), [ada])
+
+    bumped: list[str] = []
+
+    async def bump(namespace: str) -> None:
+        bumped.append(namespace)
+
+    invalidate = AsyncMock()
+    with (
+        patch("app.services.assignment_scheduler.invalidate_for_events", invalidate),
+        patch.object(report_data_cache, "cache_bump_namespace", bump),
+    ):
+        result = await publish_scheduled_assignments(async_session)
+        await asyncio.gather(*report_data_cache._bump_tasks)
+
+    assert result.assignments_published == 2
+    for assignment in due:
+        await async_session.refresh(assignment)
+        assert assignment.status == AssignmentPublishStatus.published
+    await async_session.refresh(future)
+    assert future.status == AssignmentPublishStatus.scheduled
+
+    # One batch per event, each student once however many assignments went live
+    assert invalidate.await_count == 2
+    students_call, teachers_call = invalidate.await_args_list
+    assert students_call.args[0] == "assignment_assigned"
+    assert sorted(ctx["user_id"] for ctx in students_call.args[1]) == sorted(
+        str(user.id) for user in school.student_users
+    )
+    assert teachers_call.args == (
+        "teacher_assignment_changed",
+        [{"user_id": str(school.teacher_user.id)}],
+    )
+    # The bulk UPDATE still invalidates report data
+    assert report_data_namespace("teacher", school.teacher.id) in bumped
+    assert report_data_namespace("student", ada.id) in bumped
+
+    # A second tick finds nothing left to publish
+    invalidate.reset_mock()
+    with patch("app.services.assignment_scheduler.invalidate_for_events", invalidate):
+        result = await publish_scheduled_assignments(async_session)
+    assert result.assignments_published == 0
+    invalidate.assert_not_awaited()
+
+
+def _ctx(lock_acquired: bool) -> dict:
+    lock = SimpleNamespace(
+        acquire=AsyncMock(return_value=lock_acquired), release=AsyncMock()
+    )
+    redis = MagicMock()
+    redis.lock.return_value = lock
+
+    @asynccontextmanager
+    async def session_factory():
+        yield AsyncMock()
+
+    return {"redis": redis, "db_session_factory": session_factory, "lock": lock}
+
+
+@pytest.mark.asyncio
+async def test_publish_task_holds_the_scheduler_lock() -> None:
+    ctx = _ctx(lock_acquired=True)
+    publish = AsyncMock(return_value=SimpleNamespace(assignments_published=3))
+    with patch("app.tasks.scheduler.publish_scheduled_assignments", publish):
+        assert await task_publish_scheduled_assignments(ctx) == 3
+
+    publish.assert_awaited_once()
+    ctx["redis"].lock.assert_called_once()
+    assert ctx["redis"].lock.call_args.args == ("scheduler:publish:lock",)
+    ctx["lock"].release.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_task_skips_while_another_tick_runs() -> None:
+    ctx = _ctx(lock_acquired=False)
+    publish = AsyncMock()
+    with patch("app.tasks.scheduler.publish_scheduled_assignments", publish):
+        assert await task_publish_scheduled_assignments(ctx) == 0
+
+    publish.assert_not_awaited()
+    ctx["lock"].release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_benchmark_refresh_runs_under_its_own_lock() -> None:
+    ctx = _ctx(lock_acquired=True)
+    refresh = AsyncMock(return_value=SimpleNamespace(rows_written=12))
+    with patch("app.tasks.scheduler.refresh_benchmark_snapshots", refresh):
+        assert await task_refresh_benchmarks(ctx) == 12
+
+    assert ctx["redis"].lock.call_args.args == ("scheduler:benchmarks:lock",)
+    ctx["lock"].release.assert_awaited_once()
+
+
+def test_worker_schedules_publish_and_deadline_jobs() -> None:
+    jobs = {job.name: job for job in WorkerSettings.cron_jobs}
+    publish = jobs["cron:task_publish_scheduled_assignments"]
+    assert publish.run_at_startup
+    assert publish.second == {0, 15, 30, 45}
+    assert jobs["cron:task_deadline_reminders"].hour == 8
+    assert "cron:task_reconcile_rollups" in jobs
+    benchmarks = jobs["cron:task_refresh_benchmarks"]
+    assert benchmarks.run_at_startup
+    assert benchmarks.minute == 5
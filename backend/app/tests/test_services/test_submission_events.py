@@ -0,0 +1,120 @@
+"""
+Tests for the post-submission pipeline.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from app.services.submission_events import (
+    process_submission,
+    publish_submission_event,
+    submission_job_id,
+)
+from app.tasks.submissions import task_process_submission
+
+USER_ID = uuid.uuid4()
+
+
+def _submission(completed_at: datetime | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), completed_at=completed_at or datetime.now(UTC)
+    )
+
+
+@pytest.fixture(name="consumers")
+def consumers_fixture():
+    """Record the consumers' calls, in order, on one mock."""
+    calls = MagicMock()
+    calls.attribute = AsyncMock()
+    calls.invalidate = AsyncMock()
+    with (
+        patch("app.services.submission_events.attribute_skill_scores", calls.attribute),
+        patch("app.services.submission_events.invalidate_for_event", calls.invalidate),
+    ):
+        yield calls
+
+
+@pytest.mark.asyncio
+async def test_publish_enqueues_the_event(consumers) -> None:
+    arq_pool = AsyncMock()
+    submission = _submission()
+
+    await publish_submission_event(arq_pool, AsyncMock(), submission, USER_ID)
+
+    arq_pool.enqueue_job.assert_awaited_once_with(
+        "task_process_submission",
+        str(submission.id),
+        str(USER_ID),
+        _job_id=submission_job_id(submission),
+    )
+    consumers.attribute.assert_not_awaited()
+    consumers.invalidate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "arq_pool",
+    [None, AsyncMock(enqueue_job=AsyncMock(side_effect=ConnectionError("down")))],
+    ids=["no-queue", "enqueue-fails"],
+)
+async def test_publish_falls_back_to_inline(consumers, arq_pool) -> None:
+    session = AsyncMock()
+    submission = _submission()
+
+    await publish_submission_event(arq_pool, session, submission, USER_ID)
+
+    consumers.attribute.assert_awaited_once_with(submission.id, session)
+    session.commit.assert_awaited_once()
+    consumers.invalidate.assert_awaited_once_with(
+        "skill_scores_attributed", user_id=str(USER_ID)
+    )
+
+
+@pytest.mark.asyncio
+async def test_consumers_invalidate_after_attribution_commits(consumers) -> None:
+    session = AsyncMock()
+    consumers.attach_mock(session.commit, "commit")
+    submission_id = uuid.uuid4()
+
+    # Running twice (a retried job) repeats the same idempotent steps
+    for _ in range(2):
+        await process_submission(session, submission_id, USER_ID)
+
+    assert consumers.mock_calls == 2 * [
+        call.attribute(submission_id, session),
+        call.commit(),
+        call.invalidate("skill_scores_attributed", user_id=str(USER_ID)),
+    ]
+
+
+def test_job_id_changes_only_on_resubmission() -> None:
+    submission = _submission(datetime(2026, 9, 1, 8, tzinfo=UTC))
+    job_id = submission_job_id(submission)
+    assert job_id == submission_job_id(submission)
+
+    submission.completed_at = datetime(2026, 9, 2, 8, tzinfo=UTC)
+    assert submission_job_id(submission) != job_id
+
+
+@pytest.mark.asyncio
+async def test_task_runs_the_consumers() -> None:
+    session = AsyncMock()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    submission_id = uuid.uuid4()
+    with patch("app.tasks.submissions.process_submission", AsyncMock()) as process:
+        await task_process_submission(
+            {"db_session_factory": session_factory},
+            str(submission_id),
+            str(USER_ID),
+        )
+
+    process.assert_awaited_once_with(session, submission_id, USER_ID)
@@ -7,6 +7,7 @@ import pytest
 from app.services.tts.base import AudioFormat
 from app.services.tts.cache import (
     AudioCache,
+    AudioCacheBackend,
     AudioCacheKey,
     get_audio_cache,
     reset_audio_cache,
@@ -263,6 +264,60 @@ class TestAudioCache:
         assert stats["miss_count"] == 0
         assert stats["hit_rate"] == 1.0
 
+    def test_memory_budget_evicts_least_recently_used(self) -> None:
+        """Test that cached audio never exceeds the byte budget."""
+        cache = AudioCache(max_bytes=3000)
+        keys = [
+            cache.get_cache_key(f"word {i}", "en", "jenny", AudioFormat.MP3)
+            for i in range(3)
+        ]
+        cache.set(keys[0], b"a" * 1000)
+        cache.set(keys[1], b"b" * 1000)
+        cache.get(keys[0])
+        cache.get(keys[2])
+        cache.get(keys[2])
+        cache.set(keys[2], b"c" * 1500)
+
+        assert cache.size_bytes <= 3000
+        assert cache.get(keys[0]) == b"a" * 1000
+        assert cache.get(keys[1]) is None
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestSharedBackend:
+    """Tests for the shared tier behind the in-memory cache."""
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_is_copied_into_memory(self) -> None:
+        """Test a memory miss is served by the backend and then kept locally."""
+        store: dict[str, bytes] = {}
+
+        class DictBackend(AudioCacheBackend):
+            async def get_many(self, keys: list[str]) -> list[bytes | None]:
+                return [store.get(k) for k in keys]
+
+            async def set(self, key: str, audio_data: bytes, ttl_seconds: int) -> None:
+                store[key] = audio_data
+
+        writer = AudioCache(backend=DictBackend())
+        key = writer.get_cache_key("Hello", "en", "jenny", AudioFormat.MP3)
+        await writer.set_async(key, b"audio")
+        assert store == {key.to_string(): b"audio"}
+
+        reader = AudioCache(backend=DictBackend())
+        assert await reader.get_async(key) == b"audio"
+        assert reader.shared_hit_count == 1
+        assert reader.get(key) == b"audio"
+
+    @pytest.mark.asyncio
+    async def test_without_backend_async_uses_memory_only(self) -> None:
+        """Test async accessors work without a shared tier."""
+        cache = AudioCache()
+        key = cache.get_cache_key("Hello", "en", "jenny", AudioFormat.MP3)
+        assert await cache.get_async(key) is None
+        await cache.set_async(key, b"audio")
+        assert await cache.get_async(key) == b"audio"
+
 
 class TestGlobalCache:
     """Tests for global cache accessor functions."""
@@ -12,7 +12,7 @@ from app.services.tts.base import (
     TTSProviderType,
     Voice,
 )
-from app.services.tts.cache import AudioCache, reset_audio_cache
+from app.services.tts.cache import AudioCache, AudioCacheBackend, reset_audio_cache
 from app.services.tts.config import TTSSettings, reset_tts_settings
 from app.services.tts.exceptions import (
     AllTTSProvidersFailedError,
@@ -106,6 +106,34 @@ class MockTTSProvider(TTSProvider):
         return language in self.get_supported_languages()
 
 
+class RecordingBatchProvider(MockTTSProvider):
+    """Mock provider that records the texts of each batch request."""
+
+    def __init__(self, name: str = "mock") -> None:
+        super().__init__(name=name)
+        self.batch_texts: list[list[str]] = []
+
+    async def generate_audio_batch(
+        self,
+        items: list[BatchAudioItem],
+    ) -> BatchAudioResult:
+        self.batch_texts.append([item.text for item in items])
+        return await super().generate_audio_batch(items)
+
+
+class InMemoryBackend(AudioCacheBackend):
+    """Shared audio tier stand-in (what Redis provides across workers)."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, audio_data: bytes, ttl_seconds: int) -> None:
+        self.store[key] = audio_data
+
+
 class TestTTSManagerInit:
     """Tests for TTSManager initialization."""
 
@@ -473,6 +501,50 @@ class TestCacheIntegration:
         # Check cache has entry
         assert cache.size == 1
 
+    @pytest.mark.asyncio
+    async def test_shared_tier_serves_other_workers(self) -> None:
+        """Test audio generated by one worker is reused by another."""
+        settings = TTSSettings(TTS_PRIMARY_PROVIDER="edge", TTS_CACHE_ENABLED=True)
+        backend = InMemoryBackend()
+        first = TTSManager(settings=settings, cache=AudioCache(backend=backend))
+        first.register_provider(TTSProviderType.EDGE, MockTTSProvider(name="edge"))
+        await first.generate_audio("Hello")
+
+        second_provider = MockTTSProvider(name="edge")
+        second = TTSManager(settings=settings, cache=AudioCache(backend=backend))
+        second.register_provider(TTSProviderType.EDGE, second_provider)
+        result = await second.generate_audio("Hello")
+
+        assert result.cached is True
+        assert second_provider._generate_called is False
+
+    @pytest.mark.asyncio
+    async def test_batch_only_generates_cache_misses(self) -> None:
+        """Test batch generation skips items that are already cached."""
+        settings = TTSSettings(TTS_PRIMARY_PROVIDER="edge", TTS_CACHE_ENABLED=True)
+        cache = AudioCache()
+        manager = TTSManager(settings=settings, cache=cache)
+        provider = RecordingBatchProvider(name="edge")
+        manager.register_provider(TTSProviderType.EDGE, provider)
+        await manager.generate_audio("World")
+
+        items = [BatchAudioItem(text=t) for t in ("Hello", "World", "Test")]
+        result = await manager.generate_audio_batch(items)
+
+        assert provider.batch_texts == [["Hello", "Test"]]
+        assert [r.audio_data for r in result.results] == [
+            b"audio for: Hello",
+            b"audio for: World",
+            b"audio for: Test",
+        ]
+        assert result.results[1].cached is True
+        assert result.success_count == 3
+
+        # Everything is cached now; the provider is not called again
+        again = await manager.generate_audio_batch(items)
+        assert again.provider == "cache"
+        assert len(provider.batch_texts) == 1
+
     @pytest.mark.asyncio
     async def test_no_cache_when_disabled(self) -> None:
         """Test no caching when TTS_CACHE_ENABLED=False."""
@@ -1,5 +1,9 @@
 """arq worker settings for background task processing."""
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from arq import cron, func
 from arq.connections import RedisSettings
 
 from app.core.config import settings
@@ -9,9 +13,20 @@ REDIS_SETTINGS = RedisSettings.from_dsn(settings.REDIS_URL.replace("/0", "/1"))
 
 
 async def startup(ctx: dict) -> None:
-    """Worker startup — create async DB engine + session factory."""
+    """Worker startup — cache, async DB engine + session factory, report pool."""
     from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+    from app.services.conversation_summary import register_summary_maintenance
+    from app.services.redis_cache import init_redis
+    from app.services.report_data_cache import register_report_data_invalidation
+
+    # System messages are written here, so the inbox summaries must follow
+    register_summary_maintenance()
+    # Report jobs reuse collected report data from the cache; any report
+    # input written here must invalidate it
+    await init_redis()
+    register_report_data_invalidation()
+
     engine = create_async_engine(
         str(settings.SQLALCHEMY_DATABASE_URI),
         pool_size=settings.WORKER_DB_POOL_SIZE,
@@ -21,10 +36,21 @@ async def startup(ctx: dict) -> None:
     ctx["db_engine"] = engine
     ctx["db_session_factory"] = async_sessionmaker(engine, expire_on_commit=False)
 
+    # PDF/Excel rendering is CPU-bound; keep it off the worker's event loop.
+    # Spawned (not forked) so children do not inherit the loop or DB pool.
+    ctx["report_executor"] = ProcessPoolExecutor(
+        max_workers=settings.REPORT_RENDER_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
 
 async def shutdown(ctx: dict) -> None:
-    """Worker shutdown — dispose DB engine."""
+    """Worker shutdown — dispose DB engine, stop report pool, close cache."""
+    from app.services.redis_cache import close_redis
+
+    ctx["report_executor"].shutdown(wait=True, cancel_futures=True)
     await ctx["db_engine"].dispose()
+    await close_redis()
 
 
 class WorkerSettings:
@@ -34,8 +60,59 @@ class WorkerSettings:
         task_create_system_message,
         task_create_system_messages_bulk,
     )
+    from app.tasks.reports import REPORT_MAX_TRIES, task_generate_report
+    from app.tasks.scheduler import (
+        BENCHMARK_LOCK_TIMEOUT,
+        DEADLINE_LOCK_TIMEOUT,
+        PUBLISH_LOCK_TIMEOUT,
+        ROLLUP_LOCK_TIMEOUT,
+        task_deadline_reminders,
+        task_publish_scheduled_assignments,
+        task_reconcile_rollups,
+        task_refresh_benchmarks,
+    )
+    from app.tasks.submissions import task_process_submission
 
-    functions = [task_create_system_message, task_create_system_messages_bulk]
+    functions = [
+        task_create_system_message,
+        task_create_system_messages_bulk,
+        func(
+            task_generate_report,
+            timeout=settings.REPORT_JOB_TIMEOUT,
+            max_tries=REPORT_MAX_TRIES,
+        ),
+        task_process_submission,
+    ]
+    cron_jobs = [
+        # Run at startup too, to publish what came due while no worker was up
+        cron(
+            task_publish_scheduled_assignments,
+            second=set(range(0, 60, settings.SCHEDULER_PUBLISH_INTERVAL)),
+            run_at_startup=True,
+            timeout=PUBLISH_LOCK_TIMEOUT,
+        ),
+        cron(
+            task_deadline_reminders,
+            hour=settings.DEADLINE_REMINDER_HOUR,
+            minute=0,
+            timeout=DEADLINE_LOCK_TIMEOUT,
+        ),
+        # Hourly, well within BENCHMARK_SNAPSHOT_MAX_AGE and just after each
+        # period starts; at startup too so a fresh deployment has snapshots
+        cron(
+            task_refresh_benchmarks,
+            minute=5,
+            run_at_startup=True,
+            timeout=BENCHMARK_LOCK_TIMEOUT,
+        ),
+        # Repairs rollup refreshes that failed at submission time
+        cron(
+            task_reconcile_rollups,
+            hour=3,
+            minute=30,
+            timeout=ROLLUP_LOCK_TIMEOUT,
+        ),
+    ]
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = REDIS_SETTINGS
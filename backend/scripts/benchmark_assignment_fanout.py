@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark assignment fan-out: ORM unit of work vs bulk INSERTs.
+
+Creates one assignment per round for the given number of students and
+activities, first by adding ORM objects (how the assignment routes used to
+build their rows), then with app.services.assignment_fanout, and prints
+rows/sec for each. A last pass leaves the per-activity progress rows to be
+created lazily (ASSIGNMENT_PROGRESS_LAZY), as the routes do by default.
+
+Usage: python scripts/benchmark_assignment_fanout.py [--url URL]
+           [--students N] [--activities N] [--rounds N]
+Note: By default runs against a throwaway SQLite file. A --url database gets
+the schema created in it; point it at a scratch database only.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.models import (
+    Activity,
+    ActivityType,
+    Assignment,
+    AssignmentActivity,
+    AssignmentStatus,
+    AssignmentStudent,
+    AssignmentStudentActivity,
+    AssignmentStudentActivityStatus,
+    School,
+    Student,
+    Teacher,
+    User,
+    UserRole,
+)
+from app.services.assignment_fanout import fan_out_assignment
+
+
+async def seed(
+    session: AsyncSession, student_count: int, activity_count: int
+) -> tuple[uuid.UUID, list[uuid.UUID], list[uuid.UUID]]:
+    """Create a teacher, students and activities to assign."""
+    suffix = uuid.uuid4().hex[:8]
+    school = School(name=f"Benchmark {suffix}", dcs_publisher_id=1)
+    teacher_user = User(
+        username=f"bench-teacher-{suffix}", hashed_password="x", role=UserRole.teacher
+    )
+    student_users = [
+        User(
+            username=f"bench-student-{suffix}-{i}",
+            hashed_password="x",
+            role=UserRole.student,
+        )
+        for i in range(student_count)
+    ]
+    session.add_all([school, teacher_user, *student_users])
+    await session.flush()
+
+    teacher = Teacher(user_id=teacher_user.id, school_id=school.id)
+    students = [Student(user_id=user.id) for user in student_users]
+    activities = [
+        Activity(
+            dcs_book_id=1,
+            module_name="Benchmark",
+            page_number=i + 1,
+            section_index=0,
+            activity_type=ActivityType.matchTheWords,
+            config_json={},
+            order_index=i,
+        )
+        for i in range(activity_count)
+    ]
+    session.add_all([teacher, *students, *activities])
+    await session.commit()
+    return teacher.id, [s.id for s in students], [a.id for a in activities]
+
+
+async def create_with_orm(
+    session: AsyncSession,
+    assignment_id: uuid.UUID,
+    student_ids: list[uuid.UUID],
+    activity_ids: list[uuid.UUID],
+) -> None:
+    """The per-object path the assignment routes used before the bulk fan-out."""
+    for order_index, activity_id in enumerate(activity_ids):
+        session.add(
+            AssignmentActivity(
+                assignment_id=assignment_id,
+                activity_id=activity_id,
+                order_index=order_index,
+            )
+        )
+    assignment_students = []
+    for student_id in student_ids:
+        assignment_student = AssignmentStudent(
+            assignment_id=assignment_id,
+            student_id=student_id,
+            status=AssignmentStatus.not_started,
+            time_spent_minutes=0,
+        )
+        session.add(assignment_student)
+        assignment_students.append(assignment_student)
+    await session.flush()
+    for assignment_student in assignment_students:
+        for activity_id in activity_ids:
+            session.add(
+                AssignmentStudentActivity(
+                    assignment_student_id=assignment_student.id,
+                    activity_id=activity_id,
+                    status=AssignmentStudentActivityStatus.not_started,
+                    max_score=100.0,
+                )
+            )
+
+
+async def run(url: str, student_count: int, activity_count: int, rounds: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        teacher_id, student_ids, activity_ids = await seed(
+            session, student_count, activity_count
+        )
+
+    eager_rows = activity_count + student_count * (1 + activity_count)
+    lazy_rows = activity_count + student_count
+    print(f"{student_count} students x {activity_count} activities, {rounds} rounds")
+    passes = (
+        ("orm", create_with_orm, False, eager_rows),
+        ("bulk", fan_out_assignment, False, eager_rows),
+        ("lazy", fan_out_assignment, True, lazy_rows),
+    )
+    for label, create, lazy, rows_per_round in passes:
+        settings.ASSIGNMENT_PROGRESS_LAZY = lazy
+        elapsed = 0.0
+        for _ in range(rounds):
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                assignment = Assignment(
+                    teacher_id=teacher_id, name=f"Benchmark {label}", dcs_book_id=1
+                )
+                session.add(assignment)
+                await session.flush()
+                started = time.perf_counter()
+                await create(session, assignment.id, student_ids, activity_ids)
+                await session.commit()
+                elapsed += time.perf_counter() - started
+        print(
+            f"{label:>5}: {elapsed / rounds * 1000:8.1f} ms/assignment, "
+            f"{rows_per_round:6d} rows/assignment, "
+            f"{rows_per_round * rounds / elapsed:10.0f} rows/sec"
+        )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Async database URL (default: temp SQLite)")
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--activities", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run(args.url, args.students, args.activities, args.rounds))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'benchmark.db')}"
+        asyncio.run(run(url, args.students, args.activities, args.rounds))
+
+
+if __name__ == "__main__":
+    main()